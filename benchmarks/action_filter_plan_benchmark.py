@@ -0,0 +1,47 @@
+"""
+Micro-benchmark of the @action validation wrapper, with and without a compiled FilterPlan.
+
+Usage: python benchmarks/action_filter_plan_benchmark.py
+"""
+import timeit
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.switch import Light
+from zone_api.core.event_info import EventInfo
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+
+ITERATIONS = 100000
+
+
+@action(events=[ZoneEvent.MOTION], devices=[MotionSensor], levels=[Level.FIRST_FLOOR, Level.SECOND_FLOOR],
+        zone_name_pattern='.*Room.*', internal=True, external=True)
+class BenchmarkAction(Action):
+    def on_action(self, event_info):
+        return True
+
+
+def main():
+    motion_item = pe.create_switch_item('FF_GreatRoom_MotionSensor')
+    devices = [Light(pe.create_switch_item(f'FF_GreatRoom_Light{i}'), 5) for i in range(10)]
+    devices.append(MotionSensor(motion_item))
+
+    benchmark_action = BenchmarkAction(MapParameters({}))
+    zone = Zone('GreatRoom', devices, Level.FIRST_FLOOR).add_action(benchmark_action)
+    event_info = EventInfo(ZoneEvent.MOTION, motion_item, zone, None, object(), zone, devices[-1])
+
+    uncompiled = timeit.timeit(lambda: benchmark_action.on_action(event_info), number=ITERATIONS)
+
+    benchmark_action.compile_filter_plan(zone)
+    compiled = timeit.timeit(lambda: benchmark_action.on_action(event_info), number=ITERATIONS)
+
+    print(f"validate wrapper, uncompiled: {uncompiled / ITERATIONS * 1e6:.2f} us/call")
+    print(f"validate wrapper, compiled:   {compiled / ITERATIONS * 1e6:.2f} us/call")
+    print(f"speed-up: {uncompiled / compiled:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
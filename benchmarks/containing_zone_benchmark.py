@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of the device -> zone and action -> zone look-ups, linear scan vs the reverse indexes built in
+ImmutableZoneManager.start().
+
+Usage: python benchmarks/containing_zone_benchmark.py
+"""
+import timeit
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.switch import Light
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+ZONE_COUNTS = [10, 100, 1000]
+ITERATIONS = 1000
+
+
+@action(events=[ZoneEvent.MOTION])
+class BenchmarkAction(Action):
+    def on_action(self, event_info):
+        return True
+
+
+def main():
+    pe.set_in_unit_tests()  # no scheduler thread on start()
+
+    for zone_count in ZONE_COUNTS:
+        zm = ZoneManager()
+        for i in range(zone_count):
+            devices = [Light(pe.create_switch_item(f'FF_Zone{i}_Light'), 5),
+                       MotionSensor(pe.create_switch_item(f'FF_Zone{i}_MotionSensor'))]
+            zm.add_zone(Zone(f'Zone{i}', devices, Level.FIRST_FLOOR).add_action(BenchmarkAction(MapParameters({}))))
+
+        immutable_zm = zm.get_immutable_instance()
+        last_zone = immutable_zm.get_zones()[-1]
+        device = last_zone.get_devices()[-1]
+        action_obj = last_zone.get_actions(ZoneEvent.MOTION)[0]
+
+        def look_up():
+            immutable_zm.get_containing_zone(device)
+            action_obj.get_containing_zone(immutable_zm)
+
+        scan = timeit.timeit(look_up, number=ITERATIONS)
+
+        immutable_zm.start()
+        indexed = timeit.timeit(look_up, number=ITERATIONS)
+        immutable_zm.stop()
+
+        print(f"{zone_count:5} zones: scan {scan / ITERATIONS * 1e6:9.2f} us, "
+              f"index {indexed / ITERATIONS * 1e6:6.2f} us, speed-up {scan / indexed:.0f}x")
+
+
+if __name__ == '__main__':
+    main()
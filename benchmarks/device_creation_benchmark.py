@@ -0,0 +1,64 @@
+"""
+Benchmark of the device creation of zone_parser.parse(), sequential vs with a thread pool, against a local fake
+OpenHab REST API answering each item request after a fixed latency (the metadata is not prefetched).
+
+Usage: python benchmarks/device_creation_benchmark.py
+"""
+import time
+
+from HABApp.openhab.definitions.rest import ItemResp
+
+from zone_api import platform_encapsulator as pe
+from zone_api import zone_parser as zp
+from zone_api.item_classifier import ItemClassifier
+from zone_api.item_metadata_cache import ItemMetadataCache
+
+ZONE_COUNT = 50
+REST_LATENCY_IN_SECONDS = 0.002
+WORKER_COUNTS = [1, 4, 8, 16]
+
+
+class FakeOpenHab:
+    """ Answers the item requests of the REST API after a fixed latency. """
+
+    def __init__(self, latency_in_seconds: float):
+        self._latency_in_seconds = latency_in_seconds
+
+    def get_items(self):
+        return ()
+
+    def get_item(self, item_name: str) -> ItemResp:
+        time.sleep(self._latency_in_seconds)
+        return ItemResp.model_validate({'type': 'Switch', 'name': item_name, 'tags': [], 'groupNames': [],
+                                        'state': 'OFF', 'metadata': {'durationInMinutes': {'value': '10'}}})
+
+
+def main():
+    pe.set_in_unit_tests()  # local item registry
+
+    items = []
+    for i in range(ZONE_COUNT):
+        items += [pe.create_switch_item(f'FF_Zone{i}_LightSwitch'), pe.create_switch_item(f'FF_Zone{i}_FanSwitch'),
+                  pe.create_switch_item(f'FF_Zone{i}_MotionSensor')]
+
+    classifier = ItemClassifier(zp.get_device_mappings())
+    fake_open_hab = FakeOpenHab(REST_LATENCY_IN_SECONDS)
+
+    sequential_time = None
+    for worker_count in WORKER_COUNTS:
+        # a new cache each time, so that every item goes through the REST API.
+        pe.prefetch_item_metadata(ItemMetadataCache(fake_open_hab.get_items, fake_open_hab.get_item))
+
+        start_time = time.perf_counter()
+        item_devices = zp.create_devices(None, items, classifier, worker_count)
+        elapsed_time = time.perf_counter() - start_time
+
+        pe.clear_item_metadata()
+
+        sequential_time = sequential_time or elapsed_time
+        print(f"{worker_count:3} worker(s): {len(item_devices)} items in {elapsed_time * 1e3:7.1f} ms, "
+              f"speed-up {sequential_time / elapsed_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
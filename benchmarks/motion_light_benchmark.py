@@ -0,0 +1,78 @@
+"""
+Benchmark of the motion -> light latency, from the openHAB event to the command turning on the light, through the
+precomputed MotionLightPath built in ImmutableZoneManager.start(). Fails if the p99 latency is above the budget.
+
+Usage: python benchmarks/motion_light_benchmark.py
+"""
+import time
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.actions.turn_on_switch import TurnOnSwitch
+from zone_api.core.devices.illuminance_sensor import IlluminanceSensor
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.switch import Light
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.neighbor import Neighbor, NeighborType
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+ZONE_COUNT = 100
+ITERATIONS = 2000
+P99_BUDGET_IN_SECONDS = 0.005
+
+
+def main():
+    pe.set_in_unit_tests()  # no scheduler thread on start(); commands are applied synchronously
+
+    zm = ZoneManager()
+    items = []
+    lights = []
+    sensors = []
+    for i in range(ZONE_COUNT):
+        illuminance_item = pe.create_number_item(f'FF_Zone{i}_Illuminance')
+        pe.set_number_value(illuminance_item, 5)
+
+        light = Light(pe.create_switch_item(f'FF_Zone{i}_Light'), 5, 10)
+        sensor = MotionSensor(pe.create_switch_item(f'FF_Zone{i}_MotionSensor'))
+        zone = Zone(f'Zone{i}', [light, sensor, IlluminanceSensor(illuminance_item)], Level.FIRST_FLOOR) \
+            .add_action(TurnOnSwitch(MapParameters({})))
+        if i > 0:
+            zone = zone.add_neighbor(Neighbor(f'first-floor_zone{i - 1}', NeighborType.OPEN_SPACE))
+
+        zm.add_zone(zone)
+        items += [illuminance_item, light.get_item(), sensor.get_item()]
+        lights.append(light)
+        sensors.append(sensor)
+
+    for item in items:
+        pe.register_test_item(item)
+
+    immutable_zm = zm.get_immutable_instance()
+    immutable_zm.start()
+
+    events = pe.get_event_dispatcher()
+    for i in range(ITERATIONS):
+        light = lights[i % ZONE_COUNT]
+        sensor = sensors[i % ZONE_COUNT]
+
+        immutable_zm.dispatch_event(ZoneEvent.MOTION, events, sensor, sensor.get_item(), time.perf_counter())
+
+        light._cancel_timer()
+        pe.set_switch_state(light.get_item(), False)
+
+    immutable_zm.stop()
+    for item in items:
+        pe.unregister_test_item(item)
+
+    histogram = immutable_zm.get_motion_light_latency()
+    print(f"{ZONE_COUNT} zones, {ITERATIONS} motion events: {histogram}")
+
+    p99 = histogram.get_percentile(99)
+    if p99 > P99_BUDGET_IN_SECONDS:
+        raise AssertionError(f"p99 latency {p99 * 1e3:.3f}ms is above the budget of "
+                             f"{P99_BUDGET_IN_SECONDS * 1e3:.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
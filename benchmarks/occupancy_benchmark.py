@@ -0,0 +1,76 @@
+"""
+Micro-benchmark of Zone.is_occupied on a synthetic house, device scan vs the OccupancyTracker. Each zone has two
+lights, a motion sensor, a plug with a power reading, a network presence device and a few sensors that never indicate
+occupancy; all devices are off and the motion sensors were activated an hour ago, the worst case for the scan.
+
+Usage: python benchmarks/occupancy_benchmark.py
+"""
+import timeit
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.devices.contact import Door, Window
+from zone_api.core.devices.humidity_sensor import HumiditySensor
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.network_presence import NetworkPresence
+from zone_api.core.devices.plug import Plug
+from zone_api.core.devices.switch import Light
+from zone_api.core.devices.temperature_sensor import TemperatureSensor
+from zone_api.core.zone import Zone, Level
+
+ZONE_COUNTS = [10, 100, 500]
+ITERATIONS = 20
+IGNORED_DEVICE_TYPES = [NetworkPresence]
+
+
+def scan_is_occupied(zone: Zone, ignored_device_types, seconds_from_last_event=5 * 60):
+    """ The implementation of Zone.is_occupied before the OccupancyTracker. """
+    for device in zone.get_devices():
+        if not any(isinstance(device, deviceType) for deviceType in ignored_device_types):
+            if device.is_occupied(seconds_from_last_event):
+                return True, device
+
+    return False, None
+
+
+def create_zone(i: int) -> Zone:
+    motion_sensor = MotionSensor(pe.create_switch_item(f'FF_Zone{i}_MotionSensor'))
+    motion_sensor.last_activated_timestamp = pe.get_clock().time() - 3600
+
+    devices = [TemperatureSensor(pe.create_number_item(f'FF_Zone{i}_Temperature')),
+               HumiditySensor(pe.create_number_item(f'FF_Zone{i}_Humidity')),
+               Door(pe.create_switch_item(f'FF_Zone{i}_Door')),
+               Window(pe.create_switch_item(f'FF_Zone{i}_Window')),
+               Light(pe.create_switch_item(f'FF_Zone{i}_Light1'), 5),
+               Light(pe.create_switch_item(f'FF_Zone{i}_Light2'), 5),
+               motion_sensor,
+               Plug(pe.create_switch_item(f'FF_Zone{i}_Plug'), pe.create_number_item(f'FF_Zone{i}_Plug_Power')),
+               NetworkPresence(pe.create_switch_item(f'FF_Zone{i}_Presence'))]
+
+    return Zone(f'Zone{i}', devices, Level.FIRST_FLOOR)
+
+
+def main():
+    pe.set_in_unit_tests()
+
+    for zone_count in ZONE_COUNTS:
+        zones = [create_zone(i) for i in range(zone_count)]
+
+        def scan_all():
+            for z in zones:
+                scan_is_occupied(z, IGNORED_DEVICE_TYPES)
+
+        def track_all():
+            for z in zones:
+                z.is_occupied(IGNORED_DEVICE_TYPES)
+
+        assert all(scan_is_occupied(z, IGNORED_DEVICE_TYPES) == z.is_occupied(IGNORED_DEVICE_TYPES) for z in zones)
+
+        scan = timeit.timeit(scan_all, number=ITERATIONS)
+        tracked = timeit.timeit(track_all, number=ITERATIONS)
+
+        print(f"{zone_count:5} zones: scan {scan / ITERATIONS * 1e3:8.3f} ms, "
+              f"tracker {tracked / ITERATIONS * 1e3:8.3f} ms, speed-up {scan / tracked:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+import ast
+import hashlib
+import json
+import os
+import pkgutil
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from zone_api import platform_encapsulator as pe
+
+"""
+The manifest of the action classes of an actions package, built without importing the action modules (some of them
+import heavy libraries such as feedparser or holidays). Each module is parsed into an AST; a module declares an action
+if it defines a top level class named after the module (e.g. 'ManagePlugs' in 'manage_plugs.py') that is decorated
+with @action or extends Action.
+
+The manifest is cached in memory and in a JSON file of the user cache directory (see :meth:`set_cache_directory`), and
+rebuilt when a module is added, removed or modified (based on the file names, sizes and modification times).
+"""
+
+MANIFEST_FILE_PREFIX = 'action-manifest-'
+_MANIFEST_VERSION = 1
+
+
+class ActionManifestEntry(NamedTuple):
+    """ An action class declared in an actions package. """
+    module_name: str
+    class_name: str
+
+
+_manifests: Dict[Tuple, List[ActionManifestEntry]] = {}
+_lock = threading.Lock()
+_cache_directory: Union[str, None] = None
+
+
+def set_cache_directory(directory: Union[str, None]):
+    """
+    Sets the directory of the manifest files; None restores the default, the 'zone_apis' folder of the user cache
+    directory ($XDG_CACHE_HOME, or ~/.cache).
+    """
+    global _cache_directory
+    _cache_directory = directory
+
+
+def get_cache_directory() -> str:
+    """ Returns the directory of the manifest files; see :meth:`set_cache_directory`. """
+    if _cache_directory is not None:
+        return _cache_directory
+
+    user_cache_directory = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(user_cache_directory, 'zone_apis')
+
+
+def get_action_manifest(actions_path: Iterable[str], manifest_file: Union[str, None] = None) \
+        -> List[ActionManifestEntry]:
+    """
+    Returns the action classes declared in the modules of the given package paths, in module order.
+
+    :param actions_path: the paths of the actions package (see the package's __path__).
+    :param manifest_file: the JSON file caching the manifest across restarts; defaults to a file of the cache
+        directory (see :meth:`set_cache_directory`) named after the first path, or to no file if that path isn't an
+        existing directory. The file is optional: any error reading or writing it is ignored.
+    """
+    actions_path = list(actions_path)
+    modules = [(module_info.module_finder.path, module_info.name)
+               for module_info in pkgutil.iter_modules(actions_path) if not module_info.ispkg]
+    signature = _get_signature(modules)
+
+    with _lock:
+        manifest = _manifests.get(signature)
+        if manifest is not None:
+            return manifest
+
+        if manifest_file is None and len(actions_path) > 0 and os.path.isdir(actions_path[0]):
+            path_hash = hashlib.sha1(os.path.abspath(actions_path[0]).encode('utf-8')).hexdigest()[:16]
+            manifest_file = os.path.join(get_cache_directory(), f'{MANIFEST_FILE_PREFIX}{path_hash}.json')
+
+        manifest = _read_manifest_file(manifest_file, signature)
+        if manifest is None:
+            manifest = [entry for entry in (_scan_module(path, name) for path, name in modules) if entry is not None]
+            _write_manifest_file(manifest_file, signature, manifest)
+
+        _manifests[signature] = manifest
+        return manifest
+
+
+def _get_signature(modules: List[Tuple[str, str]]) -> Tuple:
+    """ Returns the (file path, size, modification time) of each module. """
+    signature = []
+    for path, module_name in modules:
+        file_path = os.path.join(path, module_name + '.py')
+        try:
+            stat = os.stat(file_path)
+            signature.append((file_path, stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append((file_path, -1, -1))
+
+    return tuple(signature)
+
+
+def _scan_module(path: str, module_name: str) -> Union[ActionManifestEntry, None]:
+    """ Returns the action class declared in the module, or None if there is none. """
+    try:
+        with open(os.path.join(path, module_name + '.py'), 'r', encoding='utf-8') as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    normalized_module_name = module_name.replace('_', '').lower()
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name.lower() == normalized_module_name \
+                and (any(_is_action_decorator(d) for d in node.decorator_list)
+                     or any(_get_name(b) == 'Action' for b in node.bases)):
+            return ActionManifestEntry(module_name, node.name)
+
+    return None
+
+
+def _is_action_decorator(decorator: ast.expr) -> bool:
+    """ Returns True for '@action', '@action(...)' and their qualified forms (e.g. '@core.action.action(...)'). """
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+
+    return _get_name(decorator) == 'action'
+
+
+def _get_name(node: ast.expr) -> Union[str, None]:
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        return node.attr
+    else:
+        return None
+
+
+def _read_manifest_file(manifest_file: Union[str, None], signature: Tuple) -> Union[List[ActionManifestEntry], None]:
+    """ Returns the manifest stored in the file if it matches the signature; otherwise returns None. """
+    if manifest_file is None:
+        return None
+
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as file:
+            content = json.load(file)
+
+        if content.get('version') != _MANIFEST_VERSION \
+                or tuple(tuple(s) for s in content.get('signature')) != signature:
+            return None
+
+        return [ActionManifestEntry(module_name, class_name) for module_name, class_name in content.get('entries')]
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _write_manifest_file(manifest_file: Union[str, None], signature: Tuple, manifest: List[ActionManifestEntry]):
+    if manifest_file is None:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+        with open(manifest_file, 'w', encoding='utf-8') as file:
+            json.dump({'version': _MANIFEST_VERSION, 'signature': signature, 'entries': manifest}, file)
+    except OSError as e:
+        pe.log_debug(f"Can't write the action manifest '{manifest_file}': {e}")
@@ -1,5 +1,4 @@
 import time
-from threading import Timer
 from typing import TYPE_CHECKING, List, Any, Hashable, Union
 
 from zone_api.alert import Alert
@@ -8,6 +7,7 @@ from zone_api.core.devices.activity_times import ActivityTimes
 from zone_api.core.devices.astro_sensor import AstroSensor
 from zone_api.core.devices.chromecast_audio_sink import ChromeCastAudioSink
 from zone_api.core.devices.switch import Light
+from zone_api.core.timer_service import Timer
 
 if TYPE_CHECKING:
     from zone_api.core.immutable_zone_manager import ImmutableZoneManager
@@ -161,10 +161,10 @@ class AlertManager:
 
             if alert.get_module() in self._moduleTimestamps:
                 previous_time = self._moduleTimestamps[alert.get_module()]
-                if (time.time() - previous_time) < interval_in_seconds:
+                if (pe.get_clock().time() - previous_time) < interval_in_seconds:
                     return True
 
-            self._moduleTimestamps[alert.get_module()] = time.time()
+            self._moduleTimestamps[alert.get_module()] = pe.get_clock().time()
 
         return False
 
@@ -197,10 +197,10 @@ class AlertManager:
                 for cast in casts:
                     cast.play_message(alert.get_subject(), volume)
 
-        timer1 = Timer(30, send_alert)
+        timer1 = Timer(30, send_alert, blocking=True)
         timer1.start()
 
-        timer2 = Timer(60, send_alert)
+        timer2 = Timer(60, send_alert, blocking=True)
         timer2.start()
 
     @staticmethod
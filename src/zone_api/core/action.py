@@ -1,11 +1,13 @@
 import re
-from typing import Any, List, TYPE_CHECKING
+import weakref
+from typing import Any, List, TYPE_CHECKING, Union
 
 from zone_api.core.devices.activity_times import ActivityType, ActivityTimes
 
 if TYPE_CHECKING:
     from zone_api.alert import Alert
     from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+    from zone_api.core.zone import Zone
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.event_info import EventInfo
@@ -54,9 +56,11 @@ class Action(object):
         self._zone_name_pattern = None
         self._filtering_disabled = False
         self._priority = 10
+        self._blocking = False
         self._activity_types = None
         self._excluded_activity_types = None
         self._parameters = parameters
+        self._filter_plans = weakref.WeakKeyDictionary()
 
     def parameters(self) -> Parameters:
         """ Returns the injected parameters implementation. """
@@ -99,11 +103,7 @@ class Action(object):
         :return: the first zone containing this action or None.
         :rtype: Zone
         """
-        for z in zm.get_zones():
-            if z.has_action(self):
-                return z
-
-        return None
+        return zm.get_zone_by_action(self)
 
     def create_timer_event_info(self, event_info: EventInfo, custom_parameter: Any = None):
         """ Helper method to return the TIMER event info. """
@@ -185,6 +185,16 @@ class Action(object):
         """ Returns the specified priority order. Actions with lower order value is executed first. """
         return self._priority
 
+    @property
+    def blocking(self) -> bool:
+        """
+        Returns true if the action may block for a long time (e.g. playing an audio message). When the async dispatch
+        engine is enabled, such actions run on a separate thread pool so that they don't delay the other actions.
+        Any action sending an alert (see :meth:`send_notification`) must be declared blocking, as the alert manager
+        sends emails and plays the warning alerts on the audio sinks.
+        """
+        return self._blocking
+
     @property
     def activity_types(self) -> List[ActivityType]:
         """
@@ -205,6 +215,21 @@ class Action(object):
         self._filtering_disabled = True
         return self
 
+    def compile_filter_plan(self, zone: 'Zone') -> 'FilterPlan':
+        """
+        Compiles and caches the :class:`FilterPlan` of this action for the given zone. The cached plan is used by the
+        validation wrapper whenever the action is invoked with an event dispatched to that zone. The zone is weakly
+        referenced, so that the plan is discarded along with the zone.
+        """
+        plan = FilterPlan(self, zone)
+        self._filter_plans[zone] = plan
+
+        return plan
+
+    def get_filter_plan(self, zone: 'Zone') -> Union['FilterPlan', None]:
+        """ Returns the compiled filter plan for the given zone, or None if the plan hasn't been compiled. """
+        return self._filter_plans.get(zone)
+
     def log_debug(self, message: str):
         """ Log a debug message with the action name prefix. """
         pe.log_debug(f"{self.__class__.__name__}: {message}")
@@ -236,7 +261,7 @@ class Action(object):
 def action(devices=None, events=None, internal=True, external=False, levels=None,
            unique_instance=False, zone_name_pattern: str = None, external_events=None,
            priority: int = 10, activity_types: List[ActivityType] = None,
-           excluded_activity_types: List[ActivityType] = None):
+           excluded_activity_types: List[ActivityType] = None, blocking: bool = False):
     """
     A decorator that accepts an action class and do the followings:
       - Create a subclass that extends the decorated class and Action.
@@ -264,6 +289,7 @@ def action(devices=None, events=None, internal=True, external=False, levels=None
         time range of one of these activities, the action won't trigger.
     :param excluded_activity_types: the list of ActivityType that the action won't trigger. If the current time is in
         the time range of one of these activities, the action won't trigger.
+    :param boolean blocking: if set, the action may block for a long time; see :meth:`Action.blocking`.
     """
 
     if levels is None:
@@ -293,8 +319,10 @@ def action(devices=None, events=None, internal=True, external=False, levels=None
             self._external_events = external_events
             self._filtering_disabled = False
             self._priority = priority
+            self._blocking = blocking
             self._activity_types = activity_types
             self._excluded_activity_types = excluded_activity_types
+            self._filter_plans = weakref.WeakKeyDictionary()
 
         subclass = type(clazz.__name__, (clazz, Action), dict(__init__=init))
         subclass.on_action = validate(clazz.on_action)
@@ -310,6 +338,8 @@ def validate(function):
       - The zone contains the expected device.
       - The zone's internal or external attributes matches the action's specification.
       - The zone's level matches the action's specification.
+
+    If the action has a compiled :class:`FilterPlan` for the zone, the plan is used instead.
     """
 
     def wrapper(*args, **kwargs):
@@ -321,6 +351,10 @@ def validate(function):
         if obj.filtering_disabled:
             return function(*args, **kwargs)
 
+        plan = obj.get_filter_plan(zone) if isinstance(obj, Action) else None
+        if plan is not None:
+            return function(*args, **kwargs) if plan(event_info) else False
+
         # Activity types are special. They are not dependent on the device type or whether it belongs to the right zone
         if len(obj.activity_types) > 0:
             activity: ActivityTimes = zone_manager.get_first_device_by_type(ActivityTimes)
@@ -373,3 +407,81 @@ def validate(function):
         return function(*args, **kwargs)
 
     return wrapper
+
+
+class FilterPlan:
+    """
+    The filtering criteria of the validation wrapper, pre-computed for a specific (action, zone) pair.
+
+    As zones are immutable, the criteria depending only on the zone (the required devices, internal/external zone,
+    levels and zone name pattern) are evaluated once at construction. Only the event type, the activity times and
+    whether the zone contains the triggering item are checked for each event.
+    """
+
+    def __init__(self, action_obj: Action, zone: 'Zone'):
+        self._action = action_obj
+        # Weak, as the plan is cached by the action and keyed weakly by the zone; see Action.compile_filter_plan.
+        self._zone_ref = weakref.ref(zone)
+        self._required_events = frozenset(action_obj.required_events)
+        self._external_events = frozenset(action_obj.external_events)
+        self._activity_types = tuple(action_obj.activity_types)
+        self._excluded_activity_types = tuple(action_obj.excluded_activity_types)
+        self._zone_matched = FilterPlan._is_zone_matched(action_obj, zone)
+
+    @staticmethod
+    def _is_zone_matched(action_obj: Action, zone: 'Zone') -> bool:
+        """ Returns True if the zone satisfies the action's static criteria. """
+        if len(action_obj.required_devices) > 0 \
+                and not any(len(zone.get_devices_by_type(cls)) > 0 for cls in action_obj.required_devices):
+            return False
+        elif zone.is_internal() and not action_obj.applicable_to_internal_zone:
+            return False
+        elif zone.is_external() and not action_obj.applicable_to_external_zone:
+            return False
+        elif len(action_obj.applicable_levels) > 0 \
+                and not any(zone.get_level() == level for level in action_obj.applicable_levels):
+            return False
+        elif action_obj.applicable_zone_name_pattern is not None:
+            if not re.search(action_obj.applicable_zone_name_pattern, zone.get_name()):
+                return False
+
+        return True
+
+    @property
+    def zone_matched(self) -> bool:
+        """ Returns True if the zone satisfies the action's static criteria. """
+        return self._zone_matched
+
+    def accepts_event_type(self, zone_event: ZoneEvent, contains_item: bool) -> bool:
+        """
+        Returns True if the action accepts the event type.
+
+        :param ZoneEvent zone_event:
+        :param bool contains_item: True if the zone contains the item that generated the event; False if the event
+            comes from another zone.
+        """
+        if contains_item:
+            return self._zone_matched and (len(self._required_events) == 0 or zone_event in self._required_events)
+        else:
+            return zone_event in self._external_events
+
+    def __call__(self, event_info: EventInfo) -> bool:
+        """ Returns True if the action should be invoked for the event. """
+        if len(self._activity_types) > 0 or len(self._excluded_activity_types) > 0:
+            activity: ActivityTimes = event_info.get_zone_manager().get_first_device_by_type(ActivityTimes)
+            if activity is None:
+                self._action.log_error('Missing ActivityTimes.')
+                return False
+
+            if len(self._activity_types) > 0 \
+                    and not any(activity.is_at_activity_time(a) for a in self._activity_types):
+                return False
+
+            if any(activity.is_at_activity_time(a) for a in self._excluded_activity_types):
+                return False
+
+        zone_event = event_info.get_event_type()
+        if zone_event == ZoneEvent.TIMER:
+            return True
+
+        return self.accepts_event_type(zone_event, self._zone_ref().contains_open_hab_item(event_info.get_item()))
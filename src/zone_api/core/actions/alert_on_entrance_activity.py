@@ -15,7 +15,7 @@ from zone_api import platform_encapsulator as pe
 
 @action(events=[ZoneEvent.STARTUP, ZoneEvent.MOTION],
         external_events=[ZoneEvent.PARTITION_ARMED_AWAY, ZoneEvent.PARTITION_DISARMED_FROM_AWAY],
-        devices=[Camera], internal=False, external=True)
+        devices=[Camera], internal=False, external=True, blocking=True)
 class AlertOnEntranceActivity(Action):
     """
     The alert is triggered from a PIR motion sensor. The motion sensor sometimes generate false
@@ -54,7 +54,7 @@ class AlertOnEntranceActivity(Action):
 
             return True
         else:
-            current_epoch = time.time()
+            current_epoch = pe.get_clock().time()
 
             door_open_period_in_seconds = 10
             for door in zone.get_devices_by_type(Door):
@@ -78,7 +78,7 @@ class AlertOnEntranceActivity(Action):
             attachment_paths = camera.get_snapshot_images(current_epoch, max_number_of_seconds, offset_seconds)
 
             if len(attachment_paths) > 0:
-                time_struct = time.localtime()
+                time_struct = pe.get_clock().localtime()
                 hour = time_struct[3]
 
                 subject = 'Activity detected at the {} area.'.format(zone.get_name())
@@ -1,4 +1,3 @@
-from threading import Timer
 from typing import List
 
 from zone_api.alert import Alert
@@ -6,10 +5,11 @@ from zone_api.core.parameters import Parameters, ParameterConstraint, positive_n
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
 from zone_api.core.devices.contact import Door
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.DOOR_OPEN, ZoneEvent.DOOR_CLOSED],
-        devices=[Door], internal=False, external=True)
+        devices=[Door], internal=False, external=True, blocking=True)
 class AlertOnExternalDoorLeftOpen(Action):
     """
     Send an warning alert if a door on an external zone has been left open for
@@ -48,7 +48,7 @@ class AlertOnExternalDoorLeftOpen(Action):
                     timer.cancel()
                     del self.timers[door]
 
-                timer = Timer(self.maxElapsedTimeInSeconds, send_alert)
+                timer = Timer(self.maxElapsedTimeInSeconds, send_alert, blocking=True)
                 timer.start()
                 self.timers[door] = timer
             else:
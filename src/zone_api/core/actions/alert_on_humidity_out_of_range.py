@@ -9,7 +9,7 @@ from zone_api.core.devices.humidity_sensor import HumiditySensor
 
 
 @action(events=[ZoneEvent.HUMIDITY_CHANGED], devices=[HumiditySensor], internal=True,
-        levels=[Level.FIRST_FLOOR], unique_instance=True)
+        levels=[Level.FIRST_FLOOR], unique_instance=True, blocking=True)
 class AlertOnHumidityOutOfRange(Action):
     """
     Send an warning alert if the humidity is outside the range.
@@ -1,9 +1,9 @@
 from enum import unique, Enum
-from threading import Timer
 from typing import List
 
 from zone_api.alert import Alert
 from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
 from zone_api.core.devices.deferred_auto_report_notification import DeferredAutoReportNotification
 from zone_api.core.devices.flash_message import FlashMessage
 from zone_api.core.event_info import EventInfo
@@ -11,10 +11,11 @@ from zone_api.core.immutable_zone_manager import ImmutableZoneManager
 from zone_api.core.parameters import ParameterConstraint, positive_number_validator, Parameters
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.TIMER, ZoneEvent.DEFERRED_NOTIFICATION_DEVICE_NAME_CHANGED], devices=[],
-        zone_name_pattern='.*Virtual.*')
+        zone_name_pattern='.*Virtual.*', blocking=True)
 class AlertOnInactiveDevices(Action):
     """
     Send an admin info alert if a battery-powered or an auto-report device hasn't got any update in the specified
@@ -22,6 +23,9 @@ class AlertOnInactiveDevices(Action):
     There are different thresholds for these types of devices as battery-powered devices tend to not auto-report (cause
     rapid battery drain). As such, the inactivity timer for those devices are much bigger than for auto-report devices.
     This action also handles the UI interface to defer auto-report devices for a specific period.
+
+    The inactive devices are read from the inactivity index of the zone manager, shared with the auto-report
+    watchdog; see :meth:`ImmutableZoneManager.get_inactivity_index`.
     """
 
     @unique
@@ -152,15 +156,10 @@ class AlertOnInactiveDevices(Action):
         """
         :rtype: list(str) the list of inactive devices
         """
-        inactive_device_name = []
-        for z in zone_manager.get_zones():
-            battery_devices = [d for d in z.get_devices() if d.is_battery_powered()]
-
-            for d in battery_devices:
-                if not d.was_recently_activated(threshold_in_seconds):
-                    inactive_device_name.append(f"{z.get_name()}: {d.get_item_name()}")
+        inactive_devices = zone_manager.get_inactivity_index().get_inactive_devices(
+            threshold_in_seconds, Device.is_battery_powered)
 
-        return inactive_device_name
+        return [self._get_device_name(zone_manager, d) for d in inactive_devices]
 
     # noinspection PyMethodMayBeStatic
     def get_inactive_auto_report_devices(self, zone_manager, threshold_in_seconds):
@@ -168,13 +167,13 @@ class AlertOnInactiveDevices(Action):
         :rtype: list(str) the list of auto-reported devices that haven't
             sent anything in the specified number of seconds.
         """
-        inactive_device_name = []
-        for z in zone_manager.get_zones():
-            auto_report_devices = [d for d in z.get_devices() if d.is_auto_report()]
+        inactive_devices = zone_manager.get_inactivity_index().get_inactive_devices(
+            threshold_in_seconds, Device.is_auto_report)
 
-            for d in auto_report_devices:
-                if not d.was_recently_activated(threshold_in_seconds) \
-                        and d.get_item_name() not in self._deferred_auto_report_devices.keys():
-                    inactive_device_name.append(f"{z.get_name()}: {d.get_item_name()}")
+        return [self._get_device_name(zone_manager, d) for d in inactive_devices
+                if d.get_item_name() not in self._deferred_auto_report_devices.keys()]
 
-        return inactive_device_name
+    # noinspection PyMethodMayBeStatic
+    def _get_device_name(self, zone_manager, device: Device) -> str:
+        zone = zone_manager.get_containing_zone(device)
+        return f"{zone.get_name()}: {device.get_item_name()}" if zone is not None else device.get_item_name()
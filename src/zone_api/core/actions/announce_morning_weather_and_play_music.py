@@ -1,5 +1,4 @@
 import random
-from threading import Timer
 from typing import Union, List
 
 from zone_api.audio_manager import Genre, get_music_streams_by_genres, get_floor_audio_sink
@@ -10,10 +9,12 @@ from zone_api.core.action import action, Action
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.devices.activity_times import ActivityType
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.MOTION], external_events=[ZoneEvent.DOOR_CLOSED],
-        devices=[MotionSensor], activity_types=[ActivityType.WAKE_UP], zone_name_pattern='.*Kitchen.*')
+        devices=[MotionSensor], activity_types=[ActivityType.WAKE_UP], zone_name_pattern='.*Kitchen.*',
+        blocking=True)
 class AnnounceMorningWeatherAndPlayMusic(Action):
     """
     Announces the current weather and plays a random music stream twice during the wakeup period.
@@ -1,4 +1,3 @@
-from threading import Timer
 from typing import List
 
 from zone_api.alert import Alert
@@ -11,9 +10,10 @@ from zone_api.core.action import action, Action
 from zone_api.core.devices.alarm_partition import AlarmPartition
 from zone_api.core.devices.contact import Door
 from zone_api import platform_encapsulator as pe
+from zone_api.core.timer_service import Timer
 
 
-@action(events=[ZoneEvent.DOOR_CLOSED], devices=[Door], internal=False, external=True)
+@action(events=[ZoneEvent.DOOR_CLOSED], devices=[Door], internal=False, external=True, blocking=True)
 class ArmAfterFrontDoorClosed(Action):
     """
     Automatically arm the house if a front door was closed and there was no
@@ -82,7 +82,7 @@ class ArmAfterFrontDoorClosed(Action):
                         alert = Alert.create_warning_alert(msg)
                         self.send_notification(zone_manager, alert)
 
-                self.timer = Timer(self.max_elapsed_time_in_seconds, arm_and_send_alert)
+                self.timer = Timer(self.max_elapsed_time_in_seconds, arm_and_send_alert, blocking=True)
                 self.timer.start()
 
         return True
@@ -1,17 +1,22 @@
 from typing import List
 
+from zone_api import platform_encapsulator as pe
 from zone_api import security_manager as sm
 from zone_api.core.devices.activity_times import ActivityType
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.devices.network_presence import NetworkPresence
 from zone_api.core.event_info import EventInfo
 from zone_api.core.parameters import positive_number_validator, ParameterConstraint, Parameters
+from zone_api.core.timer_service import Timer
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
 from zone_api.core.devices.alarm_partition import AlarmPartition
 
 
-@action(events=[ZoneEvent.TIMER], devices=[AlarmPartition, MotionSensor],
+@action(events=[ZoneEvent.TIMER, ZoneEvent.ACTIVITY_TIME_CHANGED, ZoneEvent.PARTITION_DISARMED_FROM_STAY,
+                ZoneEvent.PARTITION_DISARMED_FROM_AWAY],
+        external_events=[ZoneEvent.ACTIVITY_TIME_CHANGED],
+        devices=[AlarmPartition, MotionSensor],
         excluded_activity_types=[ActivityType.AUTO_ARM_STAY])
 class ArmIfNoMovement(Action):
     """
@@ -19,6 +24,9 @@ class ArmIfNoMovement(Action):
     Use case: user is at home but perhaps taking a nap. Accompanied disarm rule will automatically
     disarm on internal motion sensor.
     If the house is on vacation mode, arm away instead.
+
+    Rather than polling, the occupancy is checked when the unoccupied duration after the last occupancy event
+    elapses, x minutes after the house is disarmed, and when the auto-arm-stay period ends.
     """
 
     @staticmethod
@@ -30,22 +38,44 @@ class ArmIfNoMovement(Action):
         super().__init__(parameters)
 
         self._unoccupied_duration_in_minutes = self.parameters().get(self, self.supported_parameters()[-1].name(), 30)
+        self._startup_event_info = None
+        self._timer = None
 
     def on_startup(self, event_info: EventInfo):
-        scheduler = event_info.get_zone_manager().get_scheduler()
-        scheduler.every(15).minutes.do(lambda: self.on_action(self.create_timer_event_info(event_info)))
+        # The action may be shared by multiple zones; a single timer is needed.
+        if self._startup_event_info is None:
+            self._startup_event_info = event_info
+            self._start_timer(self._unoccupied_duration_in_minutes * 60)
+
+    def on_destroy(self, event_info: EventInfo):
+        self._startup_event_info = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
     def on_action(self, event_info):
+        if event_info.get_event_type() in [ZoneEvent.PARTITION_DISARMED_FROM_STAY,
+                                           ZoneEvent.PARTITION_DISARMED_FROM_AWAY]:
+            self._start_timer(self._unoccupied_duration_in_minutes * 60)
+            return True
+
         events = event_info.get_event_dispatcher()
         zone_manager = event_info.get_zone_manager()
 
         if not sm.is_unarmed(zone_manager):
             return False
 
+        unoccupied_duration_in_seconds = self._unoccupied_duration_in_minutes * 60
         for z in zone_manager.get_zones():
             if z.is_internal():
-                (occupied, device) = z.is_occupied([NetworkPresence], self._unoccupied_duration_in_minutes * 60)
+                (occupied, device) = z.is_occupied([NetworkPresence], unoccupied_duration_in_seconds)
                 if occupied:
+                    # Check again when the occupancy event of that device expires. If the device is occupied
+                    # because of its state (e.g. a light is on), there is no known expiry; check again later.
+                    timestamp = device.get_last_activated_timestamp()
+                    remaining_time = unoccupied_duration_in_seconds - (pe.get_clock().time() - timestamp) \
+                        if timestamp is not None else 0
+                    self._start_timer(remaining_time if remaining_time > 0 else unoccupied_duration_in_seconds)
                     return False
 
         if zone_manager.is_in_vacation():
@@ -56,3 +86,16 @@ class ArmIfNoMovement(Action):
             self.log_info("Armed stay (no occupancy event)")
 
         return True
+
+    def _start_timer(self, delay_in_seconds: float):
+        """ (Re)starts the timer checking the occupancy; no-op if the action hasn't been started. """
+        if self._startup_event_info is None:
+            return
+
+        if self._timer is not None and self._timer.is_scheduled():
+            self._timer.renew(delay_in_seconds)
+        else:
+            startup_event_info = self._startup_event_info
+            self._timer = Timer(delay_in_seconds,
+                                lambda: self.on_action(self.create_timer_event_info(startup_event_info)))
+            self._timer.start()
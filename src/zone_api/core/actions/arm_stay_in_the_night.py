@@ -1,33 +1,45 @@
-
 from zone_api import security_manager as sm
 from zone_api.core.devices.activity_times import ActivityType
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.event_info import EventInfo
+from zone_api.core.parameters import Parameters
+from zone_api.core.timer_service import Timer
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
 from zone_api.core.devices.alarm_partition import AlarmPartition
 
 
-@action(events=[ZoneEvent.TIMER], devices=[AlarmPartition, MotionSensor], activity_types=[ActivityType.AUTO_ARM_STAY])
+@action(events=[ZoneEvent.ACTIVITY_TIME_CHANGED, ZoneEvent.PARTITION_DISARMED_FROM_STAY],
+        external_events=[ZoneEvent.ACTIVITY_TIME_CHANGED],
+        devices=[AlarmPartition, MotionSensor], activity_types=[ActivityType.AUTO_ARM_STAY])
 class ArmStayInTheNight(Action):
     """
-    Automatically arm-stay the house when the current time is within an auto-arm period. Continue to
-    check every 15' and arm-stay (if necessary) during that period.
+    Automatically arm-stay the house when the current time enters an auto-arm period. During that period, the house is
+    checked again every 15' and arm-stayed if it is unarmed (e.g. the arm command failed, or the house was disarmed).
+    If the house is disarmed from arm-stay, it is arm-stayed again 15' after the disarm.
     """
 
-    def on_startup(self, event_info: EventInfo):
+    REARM_DELAY_IN_SECONDS = 15 * 60
 
-        # start timer here. Main logic remains in on_action.
-        def timer_handler():
-            self.on_action(self.create_timer_event_info(event_info))
+    def __init__(self, parameters: Parameters):
+        super().__init__(parameters)
+        self._timer = None
 
-        scheduler = event_info.get_zone_manager().get_scheduler()
-        scheduler.every().hour.at(':00').do(timer_handler)
-        scheduler.every().hour.at(':15').do(timer_handler)
-        scheduler.every().hour.at(':30').do(timer_handler)
-        scheduler.every().hour.at(':45').do(timer_handler)
+    def on_startup(self, event_info: EventInfo):
+        # Arm-stay right away if the system starts during the auto-arm period.
+        self.on_action(self.create_timer_event_info(event_info))
+
+    def on_destroy(self, event_info: EventInfo):
+        self._cancel_timer()
 
     def on_action(self, event_info):
+        # This method is only invoked during the auto-arm period (see the activity_types of the decorator); the timer
+        # is thus no longer restarted once the period is over.
+        self._start_timer(event_info)
+
+        if event_info.get_event_type() == ZoneEvent.PARTITION_DISARMED_FROM_STAY:
+            return True
+
         events = event_info.get_event_dispatcher()
         zone_manager = event_info.get_zone_manager()
 
@@ -36,3 +48,17 @@ class ArmStayInTheNight(Action):
 
         sm.arm_stay(zone_manager, events)
         return True
+
+    def _start_timer(self, event_info: EventInfo):
+        """ Starts the timer checking the house again in 15'; a pending timer is cancelled. """
+        def timer_handler():
+            self.on_action(self.create_timer_event_info(event_info))
+
+        self._cancel_timer()
+        self._timer = Timer(ArmStayInTheNight.REARM_DELAY_IN_SECONDS, timer_handler)
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None and self._timer.is_alive():
+            self._timer.cancel()
+            self._timer = None
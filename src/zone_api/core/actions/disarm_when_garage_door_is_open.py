@@ -1,4 +1,3 @@
-from threading import Timer
 from typing import List
 
 from zone_api import security_manager as sm
@@ -7,6 +6,7 @@ from zone_api.core.devices.network_presence import NetworkPresence
 from zone_api.core.parameters import positive_number_validator, ParameterConstraint, Parameters
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.DOOR_OPEN], devices=[GarageDoor], external=True)
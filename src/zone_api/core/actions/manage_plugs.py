@@ -2,32 +2,39 @@ from zone_api.core.devices.activity_times import ActivityTimes
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.devices.plug import Plug
 from zone_api.core.event_info import EventInfo
+from zone_api.core.parameters import Parameters
+from zone_api.core.timer_service import Timer
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
 from zone_api.core.devices.alarm_partition import AlarmPartition
 
 
-@action(events=[ZoneEvent.TIMER, ZoneEvent.MOTION, ZoneEvent.PARTITION_ARMED_AWAY,
+@action(events=[ZoneEvent.ACTIVITY_TIME_CHANGED, ZoneEvent.MOTION, ZoneEvent.PARTITION_ARMED_AWAY,
                 ZoneEvent.PARTITION_DISARMED_FROM_AWAY],
+        external_events=[ZoneEvent.ACTIVITY_TIME_CHANGED],
         devices=[AlarmPartition, MotionSensor])
 class ManagePlugs(Action):
     """
-    Turns off the plugs if the house is armed-away or if it is evening time (via ActivityTimes).
+    Turns off the plugs if the house is armed-away or when the turn-off-plugs time period starts (via ActivityTimes).
     Turn on the internal plugs on the first motion sensor trigger during wake-up time period, or when
     the house is disarmed (from armed-away) NOT during the turn-off-plugs time period.
+
+    The plugs of an occupied zone are not turned off; while the turn-off-plugs period lasts, they are checked again
+    every 15' until the zone is no longer occupied.
     """
 
-    def on_startup(self, event_info: EventInfo):
+    RECHECK_DELAY_IN_SECONDS = 15 * 60
 
-        # start timer here. Main logic remains in on_action.
-        def timer_handler():
-            self.on_action(self.create_timer_event_info(event_info))
+    def __init__(self, parameters: Parameters):
+        super().__init__(parameters)
+        self._timer = None
 
-        scheduler = event_info.get_zone_manager().get_scheduler()
-        scheduler.every().hour.at(':00').do(timer_handler)
-        scheduler.every().hour.at(':15').do(timer_handler)
-        scheduler.every().hour.at(':30').do(timer_handler)
-        scheduler.every().hour.at(':45').do(timer_handler)
+    def on_startup(self, event_info: EventInfo):
+        # Turn off the plugs right away if the system starts during the turn-off-plugs period.
+        self.on_action(self.create_timer_event_info(event_info))
+
+    def on_destroy(self, event_info: EventInfo):
+        self._cancel_timer()
 
     def on_action(self, event_info: EventInfo):
         events = event_info.get_event_dispatcher()
@@ -41,15 +48,26 @@ class ManagePlugs(Action):
         activity: ActivityTimes = activities[0]
         zone_event = event_info.get_event_type()
 
-        if zone_event == ZoneEvent.TIMER:
+        if zone_event in [ZoneEvent.TIMER, ZoneEvent.ACTIVITY_TIME_CHANGED]:
             if activity.is_turn_off_plugs_time():
+                zone_skipped = False
                 for z in zm.get_zones():
+                    # The reversed plugs are managed by the security armed / disarmed event.
+                    plugs = [p for p in z.get_devices_by_type(Plug) if not p.is_always_on() and not p.is_reversed()]
+                    if len(plugs) == 0:
+                        continue
+
                     occupied, device = z.is_occupied([Plug])
-                    if not occupied:
-                        for p in z.get_devices_by_type(Plug):  # type: Plug
-                            if not p.is_always_on() \
-                                    and not p.is_reversed():  # managed by the security armed / disarmed event
-                                p.turn_off(events)
+                    if occupied:
+                        zone_skipped = True
+                    else:
+                        for p in plugs:
+                            p.turn_off(events)
+
+                if zone_skipped:
+                    self._start_recheck_timer(event_info)
+                else:
+                    self._cancel_timer()
 
             return True
         elif zone_event == ZoneEvent.MOTION:
@@ -84,3 +102,17 @@ class ManagePlugs(Action):
 
         else:
             return False
+
+    def _start_recheck_timer(self, event_info: EventInfo):
+        """ Checks the plugs of the occupied zones again later; the timer is not started again after the period. """
+        def timer_handler():
+            self.on_action(self.create_timer_event_info(event_info))
+
+        self._cancel_timer()
+        self._timer = Timer(ManagePlugs.RECHECK_DELAY_IN_SECONDS, timer_handler)
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None and self._timer.is_alive():
+            self._timer.cancel()
+            self._timer = None
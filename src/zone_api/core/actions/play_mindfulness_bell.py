@@ -11,7 +11,7 @@ from zone_api.core.zone_event import ZoneEvent
 
 
 @action(events=[ZoneEvent.TIMER], devices=[ChromeCastAudioSink], levels=[Level.FIRST_FLOOR],
-        excluded_activity_types=[ActivityType.SLEEP])
+        excluded_activity_types=[ActivityType.SLEEP], blocking=True)
 class PlayMindfulnessBell(Action):
     """
     Play a bell sound every x minutes. This is a Zen Buddhist practice. When the bell rings, stop if
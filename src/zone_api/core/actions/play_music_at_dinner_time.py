@@ -1,5 +1,4 @@
 import random
-from threading import Timer
 from typing import List
 
 from zone_api.audio_manager import Genre, get_music_streams_by_genres, get_floor_audio_sink
@@ -9,6 +8,7 @@ from zone_api.core.event_info import EventInfo
 from zone_api.core.parameters import positive_number_validator, ParameterConstraint, Parameters
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.devices.activity_times import ActivityType
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.MOTION], devices=[MotionSensor], activity_types=[ActivityType.DINNER],
@@ -1,6 +1,5 @@
 from _curses import init_color
 from random import randint
-from threading import Timer
 from typing import List
 
 from zone_api.core.action import action, Action
@@ -8,6 +7,7 @@ from zone_api.core.devices.switch import ColorLight
 from zone_api.core.event_info import EventInfo
 from zone_api.core.parameters import Parameters, ParameterConstraint, positive_number_validator
 from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.SWITCH_TURNED_ON], devices=[ColorLight], internal=True, external=True)
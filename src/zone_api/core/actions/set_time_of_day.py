@@ -1,10 +1,11 @@
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from typing import List
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.devices.astro_sensor import AstroSensor
 from zone_api.core.event_info import EventInfo
 from zone_api.core.parameters import ParameterConstraint, no_op_validator, Parameters, positive_number_validator
+from zone_api.core.timer_service import Timer
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.action import action, Action
 
@@ -15,13 +16,24 @@ class SetTimeOfDay(Action):
     Set the time of day based on the sun position.
     The code below is based on https://community.openhab.org/t/design-pattern-time-of-day/15407/622.
     @depend Astro binding.
+
+    Instead of polling, a timer is started for the start of the next period. The timer delay is capped at
+    'maxCheckDelayInMinutes' (default 60) so that the updates of the sunrise/sunset items are picked up. The optional
+    'checkPeriodInMinutes' parameter keeps its meaning: if set, the time of day is also checked every that many
+    minutes. It is no longer set by default, as the timer already fires at the start of each period.
     """
 
+    MORNING_START = time(hour=6)
+    BED_START = time(hour=0)
+    NIGHT_START = time(hour=23)
+
     SUNRISE_TIME_ITEM: ParameterConstraint = ParameterConstraint.optional('sunriseTimeItemName', no_op_validator)
     SUNSET_TIME_ITEM: ParameterConstraint = ParameterConstraint.optional('sunsetTimeItemName', no_op_validator)
     EVENING_TIME_ITEM: ParameterConstraint = ParameterConstraint.optional('eveningTimeItemName', no_op_validator)
     CHECK_PERIOD: ParameterConstraint = ParameterConstraint.optional(
         'checkPeriodInMinutes', positive_number_validator, "must be positive")
+    MAX_CHECK_DELAY: ParameterConstraint = ParameterConstraint.optional(
+        'maxCheckDelayInMinutes', positive_number_validator, "must be positive")
 
     def __init__(self, parameters: Parameters):
         super().__init__(parameters)
@@ -33,38 +45,79 @@ class SetTimeOfDay(Action):
         self._evening_time_item_name = self.parameters().get(
             self, SetTimeOfDay.EVENING_TIME_ITEM.name(), 'vEvening_Time')
 
-        self._check_period_in_minutes = self.parameters().get(self, SetTimeOfDay.CHECK_PERIOD.name(), 1)
+        self._check_period_in_minutes = self.parameters().get(self, SetTimeOfDay.CHECK_PERIOD.name(), None)
+        self._max_check_delay_in_minutes = self.parameters().get(self, SetTimeOfDay.MAX_CHECK_DELAY.name(), 60)
+        self._timer = None
 
     @staticmethod
     def supported_parameters() -> List[ParameterConstraint]:
         return Action.supported_parameters() + \
                [SetTimeOfDay.SUNRISE_TIME_ITEM, SetTimeOfDay.SUNSET_TIME_ITEM, SetTimeOfDay.EVENING_TIME_ITEM,
-                SetTimeOfDay.CHECK_PERIOD]
+                SetTimeOfDay.CHECK_PERIOD, SetTimeOfDay.MAX_CHECK_DELAY]
 
-    # noinspection PyMethodMayBeStatic
     def on_startup(self, event_info: EventInfo):
         self._set_time_of_day(event_info.get_zone_manager())
+        self._start_timer(event_info)
 
-        def handle_timer_event():
-            self.on_action(self.create_timer_event_info(event_info))
-
-        scheduler = event_info.get_zone_manager().get_scheduler()
-        scheduler.every(self._check_period_in_minutes).minutes.do(handle_timer_event)
+    def on_destroy(self, event_info: EventInfo):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
     def on_action(self, event_info):
         self._set_time_of_day(event_info.get_zone_manager())
 
-    def _set_time_of_day(self, zm):
-        morning_start = time(hour=6)
-        bed_start = time(hour=0)
-        night_start = time(hour=23)
-
+    def _start_timer(self, event_info: EventInfo):
+        """ Starts the timer for the start of the next period; a pending timer is cancelled. """
+        def handle_timer_event():
+            try:
+                self.on_action(self.create_timer_event_info(event_info))
+            finally:
+                self._start_timer(event_info)
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = Timer(self._get_next_check_delay_in_seconds(), handle_timer_event)
+        self._timer.start()
+
+    def _get_next_check_delay_in_seconds(self) -> float:
+        """
+        Returns the number of seconds until the start of the next period, capped at the maximum check delay and at
+        the check period (if set).
+        """
+        now = pe.get_clock().now()
+        day_start, afternoon_start, evening_start = self._get_astro_times()
+
+        start_times = [datetime.combine(now.date(), t) for t in
+                       [SetTimeOfDay.BED_START, SetTimeOfDay.MORNING_START, day_start, afternoon_start, evening_start,
+                        SetTimeOfDay.NIGHT_START]]
+        start_times = [t for t in start_times if t > now]
+        next_start = min(start_times) if len(start_times) > 0 \
+            else datetime.combine(now.date() + timedelta(days=1), SetTimeOfDay.BED_START)
+
+        delays = [(next_start - now).total_seconds(), self._max_check_delay_in_minutes * 60]
+        if self._check_period_in_minutes is not None:
+            delays.append(self._check_period_in_minutes * 60)
+
+        return min(delays)
+
+    def _get_astro_times(self):
+        """ Returns the start times of the DAY, AFTERNOON and EVENING periods. """
         day_start = pe.get_datetime_value(self._sunrise_time_item_name).time()
-        evening_start = pe.get_datetime_value(self._sunset_time_item_name).time()
         afternoon_start = pe.get_datetime_value(self._evening_time_item_name).time()
+        evening_start = pe.get_datetime_value(self._sunset_time_item_name).time()
+
+        return day_start, afternoon_start, evening_start
+
+    def _set_time_of_day(self, zm):
+        morning_start = SetTimeOfDay.MORNING_START
+        bed_start = SetTimeOfDay.BED_START
+        night_start = SetTimeOfDay.NIGHT_START
+
+        day_start, afternoon_start, evening_start = self._get_astro_times()
 
         current_value = ''
-        now = datetime.now().time()
+        now = pe.get_clock().now().time()
         if morning_start <= now < day_start:
             current_value = "MORNING"
         elif day_start <= now < afternoon_start:
@@ -1,5 +1,4 @@
 import random
-from threading import Timer
 from typing import List
 
 from zone_api import platform_encapsulator as pe
@@ -10,6 +9,7 @@ from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.parameters import ParameterConstraint, percentage_validator, positive_number_validator, Parameters
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.devices.activity_times import ActivityType
+from zone_api.core.timer_service import Timer
 
 
 @action(events=[ZoneEvent.MOTION], devices=[MotionSensor], internal=False, external=True,
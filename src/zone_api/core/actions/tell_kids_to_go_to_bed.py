@@ -1,7 +1,8 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 import holidays
 from enum import unique, Enum
 
+from zone_api import platform_encapsulator as pe
 from zone_api.audio_manager import get_nearby_audio_sink
 from zone_api.core.action import action, Action
 from zone_api.core.devices.switch import Light
@@ -10,7 +11,7 @@ from zone_api.core.immutable_zone_manager import ImmutableZoneManager
 from zone_api.core.zone_event import ZoneEvent
 
 
-@action(events=[ZoneEvent.TIMER], zone_name_pattern='.*Kitchen.*')
+@action(events=[ZoneEvent.TIMER], zone_name_pattern='.*Kitchen.*', blocking=True)
 class TellKidsToGoToBed(Action):
     """
     If there is one or more lights turned on on the first floor, the first audio message asks kids
@@ -47,7 +48,7 @@ class TellKidsToGoToBed(Action):
             self.log_warning(f"{zone.get_name()}: Missing audio device; can't play music.")
             return False
 
-        time_str = datetime.now().strftime("%I:%M")
+        time_str = pe.get_clock().now().strftime("%I:%M")
 
         if event_info.get_custom_parameter() == TellKidsToGoToBed.Type.FIRST_NOTICE:
             sink.play_message(
@@ -72,9 +73,9 @@ class TellKidsToGoToBed(Action):
     # noinspection PyMethodMayBeStatic
     def _is_applicable(self):
         """ Returns true if the next day is a school day. """
-        now = datetime.now()
+        now = pe.get_clock().now()
         if (0 <= now.weekday() < 4) or now.weekday() == 6:  # Mon - Thursday and Sunday
-            tomorrow = datetime.now() + timedelta(days=1)
+            tomorrow = now + timedelta(days=1)
             tomorrow_is_holiday = tomorrow.date() in holidays.country_holidays("CA")
             if tomorrow_is_holiday:
                 return False
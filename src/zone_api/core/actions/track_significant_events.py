@@ -1,7 +1,6 @@
 from collections import deque
 import datetime
 import json
-from threading import Timer
 from typing import Any, Dict, List
 from zone_api import platform_encapsulator as pe
 from zone_api.core.action import action, Action
@@ -10,6 +9,7 @@ from zone_api.core.devices.alarm_partition import AlarmPartition
 from zone_api.core.event_info import EventInfo
 from zone_api.core.parameters import ParameterConstraint, Parameters, no_op_validator, positive_number_validator
 from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.timer_service import Timer
 
 EVENTS = [ZoneEvent.PARTITION_ARMED_AWAY, ZoneEvent.PARTITION_ARMED_STAY, ZoneEvent.PARTITION_DISARMED_FROM_AWAY,
                 ZoneEvent.PARTITION_DISARMED_FROM_STAY, ZoneEvent.PARTITION_IN_ALARM_STATE_CHANGED,
@@ -1,10 +1,8 @@
-import time
-from functools import reduce
+from typing import List, Sequence, Tuple, TYPE_CHECKING, Union
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.action import action, Action
 from zone_api.core.event_info import EventInfo
-from zone_api.core.immutable_zone_manager import ImmutableZoneManager
 from zone_api.core.zone_event import ZoneEvent
 from zone_api.core.neighbor import NeighborType
 from zone_api.core.devices.switch import Light, Switch, Fan
@@ -12,6 +10,10 @@ from zone_api.core.devices.motion_sensor import MotionSensor
 
 from zone_api.core.actions.turn_off_adjacent_zones import TurnOffAdjacentZones
 
+if TYPE_CHECKING:
+    from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+    from zone_api.core.zone import Zone
+
 DEBUG = False
 
 
@@ -45,11 +47,44 @@ class TurnOnSwitch(Action):
     again.
     """
 
+    OPEN_SPACE_NEIGHBOR_TYPES = [NeighborType.OPEN_SPACE, NeighborType.OPEN_SPACE_MASTER,
+                                 NeighborType.OPEN_SPACE_SLAVE]
+
     # noinspection PyMethodMayBeStatic
     def on_action(self, event_info: EventInfo):
-        events = event_info.get_event_dispatcher()
         zone = event_info.get_zone()
-        zone_manager: ImmutableZoneManager = event_info.get_zone_manager()
+        zone_manager: 'ImmutableZoneManager' = event_info.get_zone_manager()
+
+        zone_switches, their_switches, master_zones = TurnOnSwitch.get_switches_and_neighbors(zone, zone_manager)
+        return self.turn_on_switches(event_info, event_info.get_event_dispatcher(), zone_switches, their_switches,
+                                     master_zones)
+
+    @staticmethod
+    def get_switches_and_neighbors(zone: 'Zone', zone_manager: 'ImmutableZoneManager') \
+            -> Tuple[Sequence[Switch], List[Switch], Sequence['Zone']]:
+        """
+        Returns the switches of the zone, the switches of the open space neighbors sharing a motion sensor with the
+        zone, and the open space master zones. They don't depend on the event; see :class:`.MotionLightPath`.
+        """
+        topology = zone_manager.get_zone_topology()
+        shared_motion_sensor_zones = topology.get_neighbor_zones_sharing_sensor(
+            zone, MotionSensor, TurnOnSwitch.OPEN_SPACE_NEIGHBOR_TYPES)
+        their_switches = [s for z in shared_motion_sensor_zones for s in z.get_devices_by_type(Switch)]
+        master_zones = topology.get_neighbor_zones(zone, [NeighborType.OPEN_SPACE_MASTER])
+
+        return zone.get_devices_by_type(Switch), their_switches, master_zones
+
+    def turn_on_switches(self, event_info: EventInfo, events, zone_switches: Sequence[Switch],
+                         their_switches: Sequence[Switch], master_zones: Sequence['Zone'],
+                         turn_off_action: Union[TurnOffAdjacentZones, None] = None) -> bool:
+        """
+        Processes the motion event with the values returned by :meth:`get_switches_and_neighbors`.
+
+        :param events: the event dispatcher used to send the commands.
+        :param turn_off_action: the unfiltered action turning off the adjacent zones' lights; created if None.
+        """
+        zone = event_info.get_zone()
+        zone_manager: 'ImmutableZoneManager' = event_info.get_zone_manager()
         # noinspection PyTypeChecker
         motion_sensor: MotionSensor = event_info.get_device()
 
@@ -59,7 +94,6 @@ class TurnOnSwitch(Action):
         zone_illuminance = zone.get_illuminance_level()
 
         switch = None
-        zone_switches = zone.get_devices_by_type(Switch)
         for switch in zone_switches:
             if switch.is_on():
                 switch.turn_on(events)  # renew the timer if a switch is already on
@@ -80,7 +114,7 @@ class TurnOnSwitch(Action):
 
             # Break if switch was just turned off.
             if switch.get_last_off_timestamp_in_seconds() is not None:
-                if (time.time() - switch.get_last_off_timestamp_in_seconds()) <= \
+                if (pe.get_clock().time() - switch.get_last_off_timestamp_in_seconds()) <= \
                         TurnOnSwitch.DELAY_AFTER_LAST_OFF_TIME_IN_SECONDS:
                     if DEBUG:
                         pe.log_info("{}: rejected - switch was just turned off".format(
@@ -89,14 +123,7 @@ class TurnOnSwitch(Action):
 
             # Break if the switch of a neighbor sharing the motion sensor was
             # just turned off.
-            open_space_zones = [zone_manager.get_zone_by_id(n.get_zone_id())
-                                for n in zone.get_neighbors() if n.is_open_space()]
-            shared_motion_sensor_zones = [z for z in open_space_zones
-                                          if zone.share_sensor_with(z, MotionSensor)]
-            their_switches = reduce(lambda a, b: a + b,
-                                    [z.get_devices_by_type(Switch) for z in shared_motion_sensor_zones],
-                                    [])
-            if any(time.time() - s.get_last_off_timestamp_in_seconds() <=
+            if any(pe.get_clock().time() - s.get_last_off_timestamp_in_seconds() <=
                    TurnOnSwitch.DELAY_AFTER_LAST_OFF_TIME_IN_SECONDS
                    for s in their_switches):
                 if DEBUG:
@@ -108,10 +135,7 @@ class TurnOnSwitch(Action):
                 if light_on_time or switch.is_low_illuminance(zone_illuminance):
                     is_processed = True
 
-                if is_processed and zone_manager is not None:
-                    master_zones = [zone_manager.get_zone_by_id(n.get_zone_id())
-                                    for n in zone.get_neighbors()
-                                    if NeighborType.OPEN_SPACE_MASTER == n.get_type()]
+                if is_processed:
                     if any(z.is_light_on() for z in master_zones):
                         is_processed = False
 
@@ -144,8 +168,9 @@ class TurnOnSwitch(Action):
                     switch.get_item_name()))
             off_event_info = EventInfo(ZoneEvent.SWITCH_TURNED_ON,
                                        event_info.get_item(), event_info.get_zone(),
-                                       event_info.get_zone_manager(), event_info.get_event_dispatcher())
-            turn_off_action = TurnOffAdjacentZones(self.parameters()).disable_filtering()
+                                       event_info.get_zone_manager(), events)
+            if turn_off_action is None:
+                turn_off_action = TurnOffAdjacentZones(self.parameters()).disable_filtering()
             turn_off_action.on_action(off_event_info)
 
         return is_processed
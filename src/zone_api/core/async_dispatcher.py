@@ -0,0 +1,154 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import Action
+from zone_api.core.device import Device
+from zone_api.core.event_info import EventInfo
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+
+if TYPE_CHECKING:
+    from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+
+
+class AsyncDispatcher:
+    """
+    An optional event dispatch engine that runs the event routing and filtering on an asyncio event loop, in a
+    dedicated thread, instead of in the thread that delivered the event.
+
+    Actions declared with ``@action(blocking=True)`` (e.g. those playing an audio message or downloading camera
+    snapshots) are run on a bounded thread pool; the other actions are run inline on the event loop. A slow blocking
+    action thus never delays the dispatching of subsequent events, such as a motion event turning on a light. To keep
+    the priority order of the actions of a zone, the actions following a blocking one in the zone are run after it,
+    on the same pool thread.
+
+    Events that can't be routed (see :meth:`ImmutableZoneManager._get_event_route`) are broadcast on the thread pool.
+    """
+
+    DEFAULT_MAX_BLOCKING_WORKERS = 4
+
+    def __init__(self, zone_manager: 'ImmutableZoneManager', max_blocking_workers: int = DEFAULT_MAX_BLOCKING_WORKERS):
+        """
+        :param ImmutableZoneManager zone_manager: the zone manager providing the routing table
+        :param int max_blocking_workers: the maximum number of threads running blocking actions
+        """
+        if max_blocking_workers <= 0:
+            raise ValueError('max_blocking_workers must be positive')
+
+        self._zone_manager = zone_manager
+        self._max_blocking_workers = max_blocking_workers
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._thread: Union[threading.Thread, None] = None
+        self._executor: Union[ThreadPoolExecutor, None] = None
+
+    def start(self):
+        """ Starts the event loop thread and the blocking action thread pool. This method is idempotent. """
+        if self.is_running():
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=self._max_blocking_workers,
+                                            thread_name_prefix='ZoneApisBlockingAction')
+        self._loop = asyncio.new_event_loop()
+
+        loop_started = threading.Event()
+
+        def run_loop():
+            asyncio.set_event_loop(self._loop)
+            self._loop.call_soon(loop_started.set)
+            self._loop.run_forever()
+
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run_loop, name='ZoneApisDispatcher', daemon=True)
+        self._thread.start()
+        loop_started.wait()
+
+        pe.log_info("Started the async event dispatcher.")
+
+    def stop(self):
+        """ Stops the event loop thread; pending dispatches are cancelled. """
+        if not self.is_running():
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._executor.shutdown(wait=False)
+
+        self._loop = None
+        self._thread = None
+        self._executor = None
+
+        pe.log_info("Stopped the async event dispatcher.")
+
+    def is_running(self) -> bool:
+        """ Returns True if the event loop thread is running. """
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> Future:
+        """
+        Schedules the dispatching of the event on the event loop and returns immediately.
+
+        :return: a future resolving to True if at least one action processed the event.
+        :raise RuntimeError: if the dispatcher isn't running.
+        """
+        if not self.is_running():
+            raise RuntimeError('The async dispatcher is not running.')
+
+        return asyncio.run_coroutine_threadsafe(
+            self._dispatch(zone_event, open_hab_events, device, item), self._loop)
+
+    async def _dispatch(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> bool:
+        zm = self._zone_manager
+        loop = asyncio.get_running_loop()
+
+        # noinspection PyProtectedMember
+        route = zm._get_event_route(zone_event, pe.get_item_name(item))
+        if route is None:
+            # noinspection PyProtectedMember
+            return await loop.run_in_executor(
+                self._executor, zm._broadcast_event, zone_event, open_hab_events, device, item)
+
+        owning_zone = zm.get_zone_by_item_name(pe.get_item_name(item))
+
+        processed = False
+        offloaded = []
+        event_info = None
+        offloaded_actions = None
+        for zone, a in route:
+            if event_info is None or event_info.get_zone() is not zone:
+                event_info = EventInfo(zone_event, item, zone, zm, open_hab_events, owning_zone, device)
+                offloaded_actions = None
+
+            if offloaded_actions is None and isinstance(a, Action) and a.blocking:
+                offloaded_actions = []
+                offloaded.append((offloaded_actions, event_info))
+
+            if offloaded_actions is not None:
+                offloaded_actions.append(a)
+            elif Zone.invoke_action(a, event_info):
+                processed = True
+
+        if len(offloaded) > 0:
+            results = await asyncio.gather(
+                *[loop.run_in_executor(self._executor, AsyncDispatcher._invoke_actions, actions, info)
+                  for actions, info in offloaded])
+            processed = processed or any(results)
+
+        return processed
+
+    @staticmethod
+    def _invoke_actions(actions: list, event_info: EventInfo) -> bool:
+        """ Invokes the actions in order; returns True if at least one of them processed the event. """
+        processed = False
+        for a in actions:
+            if Zone.invoke_action(a, event_info):
+                processed = True
+
+        return processed
@@ -0,0 +1,142 @@
+import datetime
+import time
+from time import struct_time
+from typing import List, Union
+
+from schedule import Scheduler
+
+from zone_api.core.timer_service import TimerService, VirtualTimerService
+
+
+class Clock:
+    """
+    The source of the current time, and of the :class:`TimerService` running the one-shot timers. The devices,
+    actions and services read the time through the clock returned by ``platform_encapsulator.get_clock()`` rather
+    than through the time module, so that a :class:`VirtualClock` can be installed for the tests and the simulations.
+    """
+
+    def time(self) -> float:
+        """ Returns the current time in seconds since the epoch; see time.time(). """
+        raise NotImplementedError
+
+    def monotonic(self) -> float:
+        """ Returns the value of a clock that cannot go backward; see time.monotonic(). """
+        raise NotImplementedError
+
+    def now(self, tz: Union[datetime.tzinfo, None] = None) -> datetime.datetime:
+        """ Returns the current local date and time; see datetime.datetime.now(). """
+        return datetime.datetime.fromtimestamp(self.time(), tz)
+
+    def localtime(self, epoch_seconds: Union[float, None] = None) -> struct_time:
+        """ Returns the local time of the given epoch seconds, or of the current time; see time.localtime(). """
+        return time.localtime(epoch_seconds if epoch_seconds is not None else self.time())
+
+    def get_timer_service(self) -> TimerService:
+        """ Returns the TimerService running the timers created without an explicit service. """
+        raise NotImplementedError
+
+
+class RealClock(Clock):
+    """ The wall clock; the timers are run by a threaded :class:`TimerService`. """
+
+    def __init__(self):
+        self._timer_service = TimerService()
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self, tz: Union[datetime.tzinfo, None] = None) -> datetime.datetime:
+        return datetime.datetime.now(tz)
+
+    def localtime(self, epoch_seconds: Union[float, None] = None) -> struct_time:
+        return time.localtime(epoch_seconds)
+
+    def get_timer_service(self) -> TimerService:
+        return self._timer_service
+
+
+class VirtualClock(Clock):
+    """
+    A clock that only moves when it is advanced (see :meth:`advance` and :meth:`advance_to`). The timers and the
+    jobs of the attached schedulers (see :meth:`add_scheduler`) that are due while the clock is advanced run
+    synchronously on the calling thread, in deadline order, with the clock set to their deadline. A whole simulated
+    day thus runs deterministically, in the time it takes to run the triggered code.
+
+    The monotonic time is the same as the epoch time, as the virtual clock never goes backward.
+    """
+
+    def __init__(self, start_time: Union[datetime.datetime, float, None] = None):
+        """
+        :param start_time: the initial time, as a naive local datetime or as epoch seconds; defaults to the current
+            wall clock time.
+        """
+        self._time = VirtualClock._to_epoch_seconds(start_time) if start_time is not None else time.time()
+        self._timer_service = VirtualTimerService(self.monotonic)
+        self._schedulers: List[Scheduler] = []
+
+    def time(self) -> float:
+        return self._time
+
+    def monotonic(self) -> float:
+        return self._time
+
+    def get_timer_service(self) -> TimerService:
+        return self._timer_service
+
+    def add_scheduler(self, scheduler: Scheduler):
+        """ Runs the pending jobs of the scheduler whenever the clock is advanced. """
+        if scheduler not in self._schedulers:
+            self._schedulers.append(scheduler)
+
+    def advance(self, seconds: float):
+        """ Moves the clock forward by the given number of seconds; see :meth:`advance_to`. """
+        if seconds < 0:
+            raise ValueError('seconds must not be negative')
+
+        self.advance_to(self._time + seconds)
+
+    def advance_to(self, end_time: Union[datetime.datetime, float]):
+        """
+        Moves the clock forward to the given time, running the due timers and scheduler jobs on the way.
+
+        :param end_time: a naive local datetime, or epoch seconds.
+        :raise ValueError: if the time is in the past.
+        """
+        end_time = VirtualClock._to_epoch_seconds(end_time)
+        if end_time < self._time:
+            raise ValueError('The virtual clock cannot go backward.')
+
+        while True:
+            self._run_due_tasks()
+
+            deadline = self._get_next_deadline()
+            if deadline is None or deadline > end_time:
+                break
+
+            # A scheduler job may not be due yet because of the microsecond rounding of its next run time.
+            self._time = deadline if deadline > self._time else self._time + 0.000001
+
+        self._time = end_time
+        self._run_due_tasks()
+
+    def _run_due_tasks(self):
+        self._timer_service.run_expired_timers()
+        for scheduler in self._schedulers:
+            scheduler.run_pending()
+
+    def _get_next_deadline(self) -> Union[float, None]:
+        deadlines = [self._timer_service.get_next_deadline()]
+        deadlines += [s.next_run.timestamp() for s in self._schedulers if s.next_run is not None]
+        deadlines = [d for d in deadlines if d is not None]
+
+        return min(deadlines) if len(deadlines) > 0 else None
+
+    @staticmethod
+    def _to_epoch_seconds(value: Union[datetime.datetime, float]) -> float:
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+
+        return float(value)
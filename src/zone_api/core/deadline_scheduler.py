@@ -0,0 +1,250 @@
+import datetime
+import random
+import threading
+import time
+
+import schedule
+from schedule import CancelJob, Job, Scheduler, ScheduleError, ScheduleValueError
+
+from zone_api import platform_encapsulator as pe
+
+
+class JobStatistics:
+    """ The run duration and lateness of the jobs sharing a tag (or a function if the jobs have no tag). """
+
+    def __init__(self):
+        self._run_count = 0
+        self._total_duration_in_seconds = 0.0
+        self._max_duration_in_seconds = 0.0
+        self._total_lateness_in_seconds = 0.0
+        self._max_lateness_in_seconds = 0.0
+
+    @property
+    def run_count(self) -> int:
+        return self._run_count
+
+    @property
+    def average_duration_in_seconds(self) -> float:
+        return self._total_duration_in_seconds / self._run_count if self._run_count > 0 else 0.0
+
+    @property
+    def max_duration_in_seconds(self) -> float:
+        return self._max_duration_in_seconds
+
+    @property
+    def average_lateness_in_seconds(self) -> float:
+        """ Returns the average time between the scheduled time of a run and its actual start. """
+        return self._total_lateness_in_seconds / self._run_count if self._run_count > 0 else 0.0
+
+    @property
+    def max_lateness_in_seconds(self) -> float:
+        return self._max_lateness_in_seconds
+
+    def add_run(self, duration_in_seconds: float, lateness_in_seconds: float):
+        self._run_count += 1
+        self._total_duration_in_seconds += duration_in_seconds
+        self._max_duration_in_seconds = max(self._max_duration_in_seconds, duration_in_seconds)
+        self._total_lateness_in_seconds += lateness_in_seconds
+        self._max_lateness_in_seconds = max(self._max_lateness_in_seconds, lateness_in_seconds)
+
+    def __str__(self):
+        return f"runs: {self.run_count}, avg duration: {self.average_duration_in_seconds:.3f}s, " \
+               f"max duration: {self.max_duration_in_seconds:.3f}s, " \
+               f"avg lateness: {self.average_lateness_in_seconds:.3f}s, " \
+               f"max lateness: {self.max_lateness_in_seconds:.3f}s"
+
+
+class _WakingJobList(list):
+    """
+    The job list of a DeadlineScheduler; wakes the run loop when a job is added or removed, including through
+    Scheduler.clear() (``del jobs[:]`` and ``jobs[:] = ...``).
+    """
+
+    def __init__(self, wake_fcn):
+        super().__init__()
+        self._wake_fcn = wake_fcn
+
+    def append(self, job):
+        super().append(job)
+        self._wake_fcn()
+
+    def remove(self, job):
+        super().remove(job)
+        self._wake_fcn()
+
+    def clear(self):
+        super().clear()
+        self._wake_fcn()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._wake_fcn()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._wake_fcn()
+
+
+class _ClockJob(Job):
+    """
+    A Job reading the current time from the clock of the platform encapsulator instead of datetime.datetime.now(),
+    so that it follows a virtual clock. With the wall clock, the behavior is the same as the one of the base class.
+    """
+
+    @property
+    def should_run(self) -> bool:
+        return pe.get_clock().now() >= self.next_run
+
+    def run(self):
+        if self._is_overdue(pe.get_clock().now()):
+            return CancelJob
+
+        ret = self.job_func()
+        self.last_run = pe.get_clock().now()
+        self._schedule_next_run()
+
+        if self._is_overdue(self.next_run):
+            return CancelJob
+
+        return ret
+
+    def _schedule_next_run(self):
+        """ Same as the base class, except that the current time is read from the clock. """
+        if self.unit not in ('seconds', 'minutes', 'hours', 'days', 'weeks'):
+            raise ScheduleValueError(
+                'Invalid unit (valid units are `seconds`, `minutes`, `hours`, `days`, and `weeks`)')
+
+        if self.latest is not None:
+            if not (self.latest >= self.interval):
+                raise ScheduleError('`latest` is greater than `interval`')
+            interval = random.randint(self.interval, self.latest)
+        else:
+            interval = self.interval
+
+        now = pe.get_clock().now(self.at_time_zone)
+        next_run = now
+
+        if self.start_day is not None:
+            if self.unit != 'weeks':
+                raise ScheduleValueError("`unit` should be 'weeks'")
+            # noinspection PyProtectedMember
+            next_run = schedule._move_to_next_weekday(next_run, self.start_day)
+
+        if self.at_time is not None:
+            next_run = self._move_to_at_time(next_run)
+
+        period = datetime.timedelta(**{self.unit: interval})
+        if interval != 1:
+            next_run += period
+
+        while next_run <= now:
+            next_run += period
+
+        next_run = self._correct_utc_offset(next_run, fixate_time=(self.at_time is not None))
+
+        if self.at_time_zone is not None:
+            # Like the base class, next_run is a naive local datetime.
+            next_run = next_run.astimezone().replace(tzinfo=None)
+
+        self.next_run = next_run
+
+
+class DeadlineScheduler(Scheduler):
+    """
+    A Scheduler whose run loop (see :meth:`run_until`) sleeps until the deadline of the next job instead of polling.
+    The loop is woken up early when a job is added or cancelled.
+
+    The run duration and lateness of each job are recorded per job tag; see :meth:`get_job_statistics`.
+
+    The jobs are scheduled in the time of the clock of the platform encapsulator; with a
+    :class:`~zone_api.core.clock.VirtualClock`, the jobs run when the clock is advanced, not in the run loop.
+    """
+
+    # The maximum sleep time, so that the loop catches up with wall clock adjustments (the jobs are scheduled in
+    # wall clock time).
+    MAX_SLEEP_TIME_IN_SECONDS = 5 * 60
+
+    def __init__(self):
+        super().__init__()
+        self._condition = threading.Condition()
+        self._wake_pending = False
+        self.jobs = _WakingJobList(self.wake)
+
+        self._statistics_lock = threading.Lock()
+        self._job_statistics: dict[str, JobStatistics] = {}
+
+    def every(self, interval: int = 1) -> Job:
+        """ Same as the base class, but the job reads the current time from the clock of the platform encapsulator. """
+        return _ClockJob(interval, self)
+
+    @property
+    def idle_seconds(self):
+        next_run = self.next_run
+        if not next_run:
+            return None
+
+        return (next_run - pe.get_clock().now()).total_seconds()
+
+    def wake(self):
+        """ Wakes up the run loop so that it re-evaluates the next deadline. """
+        with self._condition:
+            self._wake_pending = True
+            self._condition.notify_all()
+
+    def run_until(self, stop_event: threading.Event):
+        """
+        Runs the pending jobs, then sleeps until the next deadline, until the event is set. The caller must invoke
+        :meth:`wake` after setting the event.
+        """
+        while not stop_event.is_set():
+            self.run_pending()
+
+            with self._condition:
+                if self._wake_pending or stop_event.is_set():
+                    self._wake_pending = False
+                    continue
+
+                idle_seconds = self.idle_seconds
+                if idle_seconds is None:
+                    self._condition.wait(DeadlineScheduler.MAX_SLEEP_TIME_IN_SECONDS)
+                elif idle_seconds > 0:
+                    self._condition.wait(min(idle_seconds, DeadlineScheduler.MAX_SLEEP_TIME_IN_SECONDS))
+
+                self._wake_pending = False
+
+    def get_job_statistics(self) -> dict[str, JobStatistics]:
+        """ Returns the statistics by job tag. A job without tags is keyed by the qualified name of its function. """
+        with self._statistics_lock:
+            return dict(self._job_statistics)
+
+    def log_job_statistics(self):
+        """ Logs the statistics of each job. """
+        for key, statistics in sorted(self.get_job_statistics().items()):
+            pe.log_info(f"Job {key}: {statistics}")
+
+    def _run_job(self, job: Job):
+        lateness = 0.0
+        if job.next_run is not None:
+            lateness = max(0.0, (pe.get_clock().now() - job.next_run).total_seconds())
+
+        start_time = time.monotonic()
+        try:
+            super()._run_job(job)
+        finally:
+            duration = time.monotonic() - start_time
+
+            key = self._get_statistics_key(job)
+            with self._statistics_lock:
+                statistics = self._job_statistics.get(key)
+                if statistics is None:
+                    statistics = JobStatistics()
+                    self._job_statistics[key] = statistics
+                statistics.add_run(duration, lateness)
+
+    @staticmethod
+    def _get_statistics_key(job: Job) -> str:
+        if len(job.tags) > 0:
+            return ','.join(sorted(str(tag) for tag in job.tags))
+
+        fcn = getattr(job.job_func, 'func', job.job_func)
+        return getattr(fcn, '__qualname__', repr(fcn))
@@ -1,6 +1,6 @@
 import datetime
+import weakref
 from copy import copy
-import time
 from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
@@ -14,6 +14,10 @@ class Device(object):
     The base class that all other sensors and switches derive from.
     """
 
+    # Indicates if an event in the last few minutes (see :meth:`was_recently_activated`) makes :meth:`is_occupied`
+    # return True, in addition to the state of the device.
+    OCCUPIED_WHEN_RECENTLY_ACTIVATED = False
+
     def __init__(self, openhab_item, additional_items=None, battery_powered=False, wifi=False, auto_report=False,
                  battery_percentage_item=None):
         """
@@ -37,7 +41,8 @@ class Device(object):
         self.battery_percentage_item = battery_percentage_item
         self.wifi = wifi
         self.auto_report = auto_report
-        self.last_activated_timestamp = None
+        self._activation_listeners = weakref.WeakSet()
+        self._last_activated_timestamp: Union[float, None] = None
         self.zone_manager = None
         self.channel = None
         self._additional_items = [i for i in additional_items if i is not None]
@@ -45,16 +50,18 @@ class Device(object):
         if battery_percentage_item is not None and battery_percentage_item not in self._additional_items:
             self._additional_items.append(battery_percentage_item)
 
+        # The items are fixed at construction; index their names for contains_item.
+        self._item_names = frozenset(pe.get_item_name(i) for i in self.get_all_items())
+
     def contains_item(self, item):
         """
         Returns true if this device contains the specified item.
         """
-        their_name = pe.get_item_name(item)
-        for item in self.get_all_items():
-            if pe.get_item_name(item) == their_name:
-                return True
+        return pe.get_item_name(item) in self._item_names
 
-        return False
+    def get_all_item_names(self) -> frozenset:
+        """ Returns the names of all items in this device. """
+        return self._item_names
 
     def get_item(self):
         """
@@ -87,6 +94,14 @@ class Device(object):
         """ Return a list of all items in this device. """
         return [self.item] + self._additional_items
 
+    def __copy__(self):
+        """ Shallow copy used by the set_xxx methods; the copy doesn't inherit the activation listeners. """
+        new_obj = self.__class__.__new__(self.__class__)
+        new_obj.__dict__.update(self.__dict__)
+        new_obj._activation_listeners = weakref.WeakSet()
+
+        return new_obj
+
     def set_channel(self, channel: str):
         """
         Set the OpenHab channel string (configured in the item metadata).
@@ -195,6 +210,29 @@ class Device(object):
         """
         return False
 
+    @property
+    def last_activated_timestamp(self) -> Union[float, None]:
+        return self._last_activated_timestamp
+
+    @last_activated_timestamp.setter
+    def last_activated_timestamp(self, timestamp: Union[float, None]):
+        self._last_activated_timestamp = timestamp
+
+        if timestamp is not None:
+            for listener in list(self._activation_listeners):
+                listener.on_device_activated(self, timestamp)
+
+    def add_activation_listener(self, listener):
+        """
+        Registers an object whose on_device_activated(device, timestamp) method is invoked when the last activated
+        timestamp changes (e.g. :class:`.InactivityIndex`). The device only holds a weak reference to the listener.
+        """
+        self._activation_listeners.add(listener)
+
+    def remove_activation_listener(self, listener):
+        """ Unregisters a listener added with :meth:`add_activation_listener`; no-op if it isn't registered. """
+        self._activation_listeners.discard(listener)
+
     def get_last_activated_timestamp(self):
         """
         Returns the timestamp in epoch seconds of the last event generated by
@@ -229,11 +267,11 @@ class Device(object):
         if prev_timestamp is None:
             return False
         else:
-            return (time.time() - prev_timestamp) <= seconds
+            return (pe.get_clock().time() - prev_timestamp) <= seconds
 
     def update_last_activated_timestamp(self):
         """ Set the lastActivatedTimestamp field to the current epoch second. """
-        self.last_activated_timestamp = time.time()
+        self.last_activated_timestamp = pe.get_clock().time()
 
     def __str__(self):
         value = u"{}: {}".format(self.__class__.__name__, self.get_item_name())
@@ -253,7 +291,7 @@ class Device(object):
             value += ", auto report"
 
         if self.last_activated_timestamp is not None:
-            diff_in_seconds = time.time() - self.last_activated_timestamp
+            diff_in_seconds = pe.get_clock().time() - self.last_activated_timestamp
             value += ", last activated: {} ({})".format(self.last_activated_timestamp,
                                                         str(datetime.timedelta(seconds=diff_in_seconds)))
 
@@ -1,8 +1,9 @@
 from enum import unique, Enum
+from typing import List, Union
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.device import Device
-from zone_api import time_utilities
+from zone_api.time_utilities import TimeRangeSet
 
 
 @unique
@@ -44,6 +45,7 @@ class ActivityTimes(Device):
                 raise TypeError('Invalid time range key {}'.format(key))
 
         self.timeRangeMap = time_range_map
+        self._time_range_sets = {key: TimeRangeSet(value) for key, value in time_range_map.items()}
 
     @property
     def number_of_activities(self) -> int:
@@ -88,9 +90,34 @@ class ActivityTimes(Device):
     def is_turn_off_plugs_time(self, epoch_seconds=None):
         return self._is_in_time_range(ActivityType.TURN_OFF_PLUGS, epoch_seconds)
 
+    def get_active_activity_types(self, epoch_seconds=None) -> List[ActivityType]:
+        """ Returns the configured activity types whose time range contains the current time. """
+        return [key for key in self._time_range_sets.keys() if self._is_in_time_range(key, epoch_seconds)]
+
+    def get_next_transition_time(self, activity_type: Union[ActivityType, None] = None,
+                                 epoch_seconds=None) -> Union[int, None]:
+        """
+        Returns the epoch second at which the current time next enters or leaves the time range of the given activity
+        type, or of any configured activity type if activity_type is None. Returns None if there is no such transition
+        (the activity isn't configured, or its time range covers the whole day).
+        """
+        if activity_type is not None:
+            keys = [activity_type] if activity_type in self._time_range_sets.keys() else []
+        else:
+            keys = self._time_range_sets.keys()
+
+        transition_times = [self._time_range_sets[key].next_transition(epoch_seconds) for key in keys]
+        transition_times = [t for t in transition_times if t is not None]
+
+        return min(transition_times) if len(transition_times) > 0 else None
+
+    def get_time_range_set(self, activity_type: ActivityType) -> Union[TimeRangeSet, None]:
+        """ Returns the compiled time range of the activity type, or None if the activity isn't configured. """
+        return self._time_range_sets.get(activity_type)
+
     def _is_in_time_range(self, key, epoch_seconds):
-        if key not in self.timeRangeMap.keys():
+        time_range_set = self._time_range_sets.get(key)
+        if time_range_set is None:
             return False
 
-        time_range_string = self.timeRangeMap[key]
-        return time_utilities.is_in_time_range(time_range_string, epoch_seconds)
+        return time_range_set.contains(epoch_seconds)
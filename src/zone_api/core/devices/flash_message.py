@@ -1,7 +1,6 @@
-from threading import Timer
-
 from zone_api.core.device import Device
 from zone_api import platform_encapsulator as pe
+from zone_api.core.timer_service import Timer
 
 
 class FlashMessage(Device):
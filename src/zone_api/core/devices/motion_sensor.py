@@ -8,6 +8,8 @@ class MotionSensor(SecurityAwareMixin, Device):
     Represents a motion sensor; the underlying OpenHab object is a SwitchItem.
     """
 
+    OCCUPIED_WHEN_RECENTLY_ACTIVATED = True
+
     def __init__(self, switch_item, can_trigger_switches=True, security_tripped_item=None,
                  battery_percentage_item=None):
         """
@@ -9,6 +9,8 @@ class NetworkPresence(Device):
     zone.
     """
 
+    OCCUPIED_WHEN_RECENTLY_ACTIVATED = True
+
     def __init__(self, switch_item):
         """
         :param SwitchItem switch_item:
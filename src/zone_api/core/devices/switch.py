@@ -1,11 +1,10 @@
-import time
 from random import randint
-from threading import Timer
 from typing import List
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.device import Device
 from zone_api import time_utilities
+from zone_api.core.timer_service import Timer
 
 
 class Switch(Device):
@@ -61,14 +60,17 @@ class Switch(Device):
                 pe.log_debug("{}: {} is in use by {}.".format(
                     zone.get_name(), self.get_item_name(), device))
 
-        self._cancel_timer()  # cancel the previous timer, if any.
-
         duration = self.duration_in_minutes * 60
-        if (time.time() - self.get_last_off_timestamp_in_seconds()) <= Switch.STICKY_SWITCH_DURATION_IN_SECS:
+        if (pe.get_clock().time() - self.get_last_off_timestamp_in_seconds()) <= Switch.STICKY_SWITCH_DURATION_IN_SECS:
             duration = duration * Switch.EXTENDED_TIMER_DURATION_FACTOR
 
-        self.timer = Timer(duration, turn_off_switch)
-        self.timer.start()
+        if self.timer is not None and self.timer.is_scheduled():
+            self.timer.renew(duration)  # motion renewal; push the deadline of the pending timer.
+        else:
+            self._cancel_timer()  # cancel the previous timer, if any.
+
+            self.timer = Timer(duration, turn_off_switch)
+            self.timer.start()
 
     def _cancel_timer(self):
         """
@@ -139,7 +141,7 @@ class Switch(Device):
         """
         is_processed = (self.get_item_name() == item_name)
         if is_processed:
-            self.lastOffTimestampInSeconds = time.time()
+            self.lastOffTimestampInSeconds = pe.get_clock().time()
             self._cancel_timer()
 
         return is_processed
@@ -182,6 +184,8 @@ class Light(Switch):
         Switch.__init__(self, switch_item, duration_in_minutes)
         self.illuminance_level = illuminance_level
         self.no_premature_turn_off_time_range = no_premature_turn_off_time_range
+        self._no_premature_turn_off_time_range_set = time_utilities.TimeRangeSet(no_premature_turn_off_time_range) \
+            if no_premature_turn_off_time_range is not None else None
 
     def get_illuminance_threshold(self):
         """
@@ -215,10 +219,10 @@ class Light(Switch):
 
         :rtype: bool
         """
-        if self.no_premature_turn_off_time_range is None:
+        if self._no_premature_turn_off_time_range_set is None:
             return True
 
-        if time_utilities.is_in_time_range(self.no_premature_turn_off_time_range):
+        if self._no_premature_turn_off_time_range_set.contains():
             return False
 
         return True
@@ -1,9 +1,9 @@
 import random
-from threading import Timer
 from typing import Dict
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.devices.switch import Light
+from zone_api.core.timer_service import Timer
 
 
 class Wled(Light):
@@ -0,0 +1,245 @@
+import threading
+from typing import Any, Callable, Dict, Tuple, Type, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
+from zone_api.core.timer_service import get_timer_service
+from zone_api.core.zone_event import ZoneEvent
+
+
+class CoalescingPolicy:
+    """
+    Determines which value change events of a numeric item are dispatched right away, and which ones are held back.
+
+    An event is dispatched right away if at least ``min_interval_in_seconds`` have elapsed since the last dispatched
+    event of the same item, and its value differs from the last dispatched one by at least ``deadband``. Otherwise,
+    the event replaces the held back one (if any), which is flushed (trailing edge) ``flush_delay_in_seconds`` after
+    the last dispatched event; the latest value is thus always delivered eventually. A held back event whose value is
+    outside the deadband is flushed as soon as ``min_interval_in_seconds`` have elapsed instead.
+    """
+
+    def __init__(self, min_interval_in_seconds: float = 0, deadband: float = 0, flush_delay_in_seconds: float = 60):
+        if min_interval_in_seconds < 0:
+            raise ValueError('min_interval_in_seconds must not be negative')
+        if deadband < 0:
+            raise ValueError('deadband must not be negative')
+        if flush_delay_in_seconds <= 0:
+            raise ValueError('flush_delay_in_seconds must be positive')
+
+        self._min_interval_in_seconds = min_interval_in_seconds
+        self._deadband = deadband
+        self._flush_delay_in_seconds = max(flush_delay_in_seconds, min_interval_in_seconds)
+
+    @property
+    def min_interval_in_seconds(self) -> float:
+        return self._min_interval_in_seconds
+
+    @property
+    def deadband(self) -> float:
+        return self._deadband
+
+    @property
+    def flush_delay_in_seconds(self) -> float:
+        """ Returns the delay, counted from the last dispatched event, after which a held back event is flushed. """
+        return self._flush_delay_in_seconds
+
+    @staticmethod
+    def from_config(config: Dict[str, Any]) -> 'CoalescingPolicy':
+        """
+        Returns the policy specified by the optional 'minIntervalInSeconds', 'deadband' and 'flushDelayInSeconds'
+        values of the config, which is either the 'eventCoalescing' item metadata config or an entry of the
+        'event-coalescing' system configuration.
+        """
+        config = config if config is not None else {}
+        return CoalescingPolicy(float(config.get('minIntervalInSeconds', 0)), float(config.get('deadband', 0)),
+                                float(config.get('flushDelayInSeconds', 60)))
+
+    def __str__(self):
+        return f"min interval: {self.min_interval_in_seconds}s, deadband: {self.deadband}, " \
+               f"flush delay: {self.flush_delay_in_seconds}s"
+
+
+class _ItemState:
+    """ The coalescing state of a (ZoneEvent, item name) pair. """
+
+    def __init__(self):
+        self.last_value: Union[float, None] = None
+        self.last_dispatched_time: Union[float, None] = None
+        self.pending_event: Union[Tuple[ZoneEvent, Any, Device, Any], None] = None
+        self.flush_timer = None
+        self.flush_time: Union[float, None] = None
+
+
+class EventCoalescer:
+    """
+    A stage between the item value change listeners and :meth:`ImmutableZoneManager.dispatch_event` that coalesces
+    the events of high-frequency numeric sensors according to a :class:`CoalescingPolicy`.
+
+    The policy of an item is looked up by item name first (see :meth:`set_item_policy`, usually from the
+    ``eventCoalescing`` item metadata), then by device class name (see :meth:`set_device_policy`, usually from the
+    ``event-coalescing`` system configuration). Coalescing is opt-in: the events of the items without a policy are
+    dispatched right away.
+
+    The clock and the timer used for the trailing-edge flush are injectable, so that the class can be unit tested
+    with a virtual clock.
+    """
+
+    def __init__(self, dispatch_fcn: Callable[[ZoneEvent, Any, Device, Any], bool],
+                 clock_fcn: Union[Callable[[], float], None] = None,
+                 start_timer_fcn: Union[Callable[[float, Callable[[], None]], Any], None] = None):
+        """
+        :param dispatch_fcn: the function dispatching an event; it accepts the zone event, the open hab events, the
+            device and the item.
+        :param clock_fcn: returns the current time in seconds. The default implementation uses the monotonic time
+            of the platform clock.
+        :param start_timer_fcn: starts a timer invoking the given callback after the given delay in seconds, and
+            returns an object with a cancel() method. The default implementation uses the blocking timers of the shared
+            TimerService, as the flushed events are dispatched to the actions.
+        """
+        self._dispatch_fcn = dispatch_fcn
+        self._clock_fcn = clock_fcn if clock_fcn is not None else lambda: pe.get_clock().monotonic()
+        self._start_timer_fcn = start_timer_fcn if start_timer_fcn is not None \
+            else get_timer_service().schedule_blocking
+
+        self._device_policies: dict[str, CoalescingPolicy] = {}
+        self._item_policies: dict[str, CoalescingPolicy] = {}
+        self._states: dict[Tuple[ZoneEvent, str], _ItemState] = {}
+        self._lock = threading.Lock()
+
+    def set_dispatch_fcn(self, dispatch_fcn: Callable[[ZoneEvent, Any, Device, Any], bool]):
+        """ Sets the function dispatching the events, including the held back ones flushed from now on. """
+        self._dispatch_fcn = dispatch_fcn
+
+    def set_device_policy(self, device_cls: Union[Type, str], policy: Union[CoalescingPolicy, None]):
+        """
+        Sets the policy for the devices of the given class (and subclasses); None removes the policy.
+
+        :param device_cls: the device class, or its name (e.g. 'TemperatureSensor').
+        """
+        name = device_cls if isinstance(device_cls, str) else device_cls.__name__
+        if policy is None:
+            self._device_policies.pop(name, None)
+        else:
+            self._device_policies[name] = policy
+
+    def set_item_policy(self, item_name: str, policy: Union[CoalescingPolicy, None]):
+        """ Sets the policy for the given item; it takes precedence over the device policy. """
+        if policy is None:
+            self._item_policies.pop(item_name, None)
+        else:
+            self._item_policies[item_name] = policy
+
+    def get_policy(self, device: Device, item_name: str) -> Union[CoalescingPolicy, None]:
+        """ Returns the policy applicable to the item of the device, or None if its events are not coalesced. """
+        policy = self._item_policies.get(item_name)
+        if policy is not None:
+            return policy
+
+        for cls in type(device).__mro__:
+            policy = self._device_policies.get(cls.__name__)
+            if policy is not None:
+                return policy
+
+        return None
+
+    def on_event(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> bool:
+        """
+        Dispatches the event right away, or holds it back for a later flush.
+
+        :return: True if the event was dispatched right away and at least one action processed it; False otherwise.
+        """
+        item_name = pe.get_item_name(item)
+        policy = self.get_policy(device, item_name)
+        if policy is None:
+            return self._dispatch_fcn(zone_event, open_hab_events, device, item)
+
+        value = self._get_value(item)
+        with self._lock:
+            now = self._clock_fcn()
+            state = self._states.setdefault((zone_event, item_name), _ItemState())
+
+            if self._is_significant(policy, state, value, now):
+                self._cancel_flush(state)
+                state.pending_event = None
+                state.last_value = value
+                state.last_dispatched_time = now
+                dispatch_now = True
+            else:
+                state.pending_event = (zone_event, open_hab_events, device, item)
+                if self._is_outside_deadband(policy, state, value):
+                    flush_time = state.last_dispatched_time + policy.min_interval_in_seconds
+                else:
+                    flush_time = state.last_dispatched_time + policy.flush_delay_in_seconds
+
+                if state.flush_timer is None or flush_time < state.flush_time:
+                    self._cancel_flush(state)
+                    state.flush_time = flush_time
+                    state.flush_timer = self._start_timer_fcn(
+                        max(flush_time - now, 0), lambda: self._flush(zone_event, item_name))
+                dispatch_now = False
+
+        if dispatch_now:
+            return self._dispatch_fcn(zone_event, open_hab_events, device, item)
+
+        return False
+
+    def flush(self):
+        """ Dispatches all the held back events right away. """
+        with self._lock:
+            keys = [key for key, state in self._states.items() if state.pending_event is not None]
+
+        for zone_event, item_name in keys:
+            self._flush(zone_event, item_name)
+
+    def cancel(self):
+        """ Cancels the pending flush timers and discards the held back events. """
+        with self._lock:
+            for state in self._states.values():
+                self._cancel_flush(state)
+                state.pending_event = None
+
+    def _flush(self, zone_event: ZoneEvent, item_name: str):
+        with self._lock:
+            state = self._states.get((zone_event, item_name))
+            if state is None or state.pending_event is None:
+                return
+
+            self._cancel_flush(state)
+            event = state.pending_event
+            state.pending_event = None
+            state.last_value = self._get_value(event[3])
+            state.last_dispatched_time = self._clock_fcn()
+
+        self._dispatch_fcn(*event)
+
+    @staticmethod
+    def _is_significant(policy: CoalescingPolicy, state: _ItemState, value: Union[float, None], now: float) -> bool:
+        if state.last_dispatched_time is None:
+            return True
+
+        if now - state.last_dispatched_time < policy.min_interval_in_seconds:
+            return False
+
+        return EventCoalescer._is_outside_deadband(policy, state, value)
+
+    @staticmethod
+    def _is_outside_deadband(policy: CoalescingPolicy, state: _ItemState, value: Union[float, None]) -> bool:
+        if value is None or state.last_value is None:
+            return True
+
+        return abs(value - state.last_value) >= policy.deadband
+
+    @staticmethod
+    def _cancel_flush(state: _ItemState):
+        if state.flush_timer is not None:
+            state.flush_timer.cancel()
+            state.flush_timer = None
+            state.flush_time = None
+
+    @staticmethod
+    def _get_value(item) -> Union[float, None]:
+        value = item.get_value(None)
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        return None
@@ -0,0 +1,188 @@
+import heapq
+import itertools
+import threading
+import traceback
+from enum import unique, Enum
+from typing import Callable, List, Tuple, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
+from zone_api.core.zone_event import EventPriority, ZoneEvent
+
+
+@unique
+class SheddingMode(Enum):
+    """ Determines what the :class:`EventQueue` does with low-priority events when it is backlogged. """
+
+    NONE = 'none'  # Never shed; every event is dispatched.
+    COALESCE = 'coalesce'  # Merge a value change event into the pending one for the same item.
+    DROP = 'drop'  # Coalesce, and drop the value change events that can't be coalesced.
+
+
+class SheddingPolicy:
+    """
+    Specifies when and how the :class:`EventQueue` sheds the :attr:`EventPriority.VALUE_CHANGE` events. The events of
+    the other priority classes, and in particular the :attr:`EventPriority.SAFETY` ones, are never shed.
+    """
+
+    def __init__(self, mode: SheddingMode = SheddingMode.COALESCE, backlog_threshold: int = 50):
+        """
+        :param SheddingMode mode: the shedding behavior.
+        :param int backlog_threshold: the number of pending events at or above which the queue is considered
+            backlogged and starts shedding.
+        """
+        if backlog_threshold < 0:
+            raise ValueError('backlog_threshold must not be negative')
+
+        self._mode = mode
+        self._backlog_threshold = backlog_threshold
+
+    @property
+    def mode(self) -> SheddingMode:
+        return self._mode
+
+    @property
+    def backlog_threshold(self) -> int:
+        return self._backlog_threshold
+
+
+class EventQueue:
+    """
+    A priority queue in front of :meth:`ImmutableZoneManager.dispatch_event`. A single worker thread dispatches the
+    queued events, the :attr:`EventPriority.SAFETY` ones first, then the :attr:`EventPriority.NORMAL` ones and lastly
+    the :attr:`EventPriority.VALUE_CHANGE` ones; the events of the same priority class are dispatched in FIFO order.
+
+    The worker waits for the dispatch of an event to complete before taking the next one. With the async dispatch
+    engine enabled (see :meth:`ImmutableZoneManager.set_async_dispatch`), the dispatch returns once the event is
+    handed over to the engine and the actions declared with ``@action(blocking=True)`` run on its thread pool, so a
+    slow action never delays the safety events queued after it.
+
+    When the queue is backlogged, value change events are shed according to the :class:`SheddingPolicy`. A value
+    change event superseded by a newer one for the same item can safely be coalesced as the actions read the current
+    item state rather than the state at the time of the event.
+    """
+
+    def __init__(self, dispatch_fcn: Callable[[ZoneEvent, object, Device, object], bool],
+                 policy: Union[SheddingPolicy, None] = None):
+        """
+        :param dispatch_fcn: the function dispatching a dequeued event; it accepts the zone event, the open hab
+            events, the device and the item.
+        :param SheddingPolicy policy: the shedding policy; the default is to coalesce under backlog.
+        """
+        self._dispatch_fcn = dispatch_fcn
+        self._policy = policy if policy is not None else SheddingPolicy()
+
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[int, int, list]] = []
+        self._sequence = itertools.count()
+        # map from (zone event, item name) to the pending heap entry, for the value change events.
+        self._pending_value_changes: dict[Tuple[ZoneEvent, str], list] = {}
+        self._coalesced_counts: dict[ZoneEvent, int] = {}
+        self._dropped_counts: dict[ZoneEvent, int] = {}
+
+        self._thread: Union[threading.Thread, None] = None
+        self._stopping = False
+
+    def start(self):
+        """ Starts the worker thread. Events put before this call are dispatched in priority order. """
+        with self._condition:
+            if self._thread is not None:
+                return
+
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='ZoneApisEventQueue', daemon=True)
+            self._thread.start()
+
+        pe.log_info("Started the event queue.")
+
+    def stop(self):
+        """ Stops the worker thread once the event being dispatched (if any) is done; pending events are discarded. """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+
+            self._stopping = True
+            self._heap.clear()
+            self._pending_value_changes.clear()
+            self._condition.notify_all()
+
+        thread.join()
+        self._thread = None
+
+        pe.log_info("Stopped the event queue.")
+
+    def is_running(self) -> bool:
+        """ Returns True if the worker thread is running. """
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def put(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> bool:
+        """
+        Queues the event.
+
+        :return: False if the event was dropped by the shedding policy; True otherwise (including when it was
+            coalesced into a pending event).
+        """
+        priority = zone_event.priority
+        with self._condition:
+            if priority == EventPriority.VALUE_CHANGE and self._is_backlogged():
+                key = (zone_event, pe.get_item_name(item))
+                pending_entry = self._pending_value_changes.get(key)
+                if pending_entry is not None:
+                    pending_entry[1:] = [open_hab_events, device, item]
+                    self._coalesced_counts[zone_event] = self._coalesced_counts.get(zone_event, 0) + 1
+                    return True
+
+                if self._policy.mode == SheddingMode.DROP:
+                    self._dropped_counts[zone_event] = self._dropped_counts.get(zone_event, 0) + 1
+                    return False
+
+            entry = [zone_event, open_hab_events, device, item]
+            heapq.heappush(self._heap, (priority.value, next(self._sequence), entry))
+            if priority == EventPriority.VALUE_CHANGE:
+                self._pending_value_changes[(zone_event, pe.get_item_name(item))] = entry
+
+            self._condition.notify()
+
+        return True
+
+    def get_pending_count(self) -> int:
+        """ Returns the number of events waiting to be dispatched. """
+        with self._condition:
+            return len(self._heap)
+
+    def get_coalesced_counts(self) -> dict[ZoneEvent, int]:
+        """ Returns the number of events merged into a pending event, by event type. """
+        with self._condition:
+            return dict(self._coalesced_counts)
+
+    def get_dropped_counts(self) -> dict[ZoneEvent, int]:
+        """ Returns the number of events dropped, by event type. """
+        with self._condition:
+            return dict(self._dropped_counts)
+
+    def _is_backlogged(self) -> bool:
+        return self._policy.mode != SheddingMode.NONE and len(self._heap) >= self._policy.backlog_threshold
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while len(self._heap) == 0 and not self._stopping:
+                    self._condition.wait()
+
+                if self._stopping:
+                    break
+
+                entry = heapq.heappop(self._heap)[2]
+                zone_event, open_hab_events, device, item = entry
+                if zone_event.priority == EventPriority.VALUE_CHANGE:
+                    key = (zone_event, pe.get_item_name(item))
+                    if self._pending_value_changes.get(key) is entry:
+                        del self._pending_value_changes[key]
+
+            try:
+                if not self._dispatch_fcn(zone_event, open_hab_events, device, item):
+                    pe.log_debug(f'Event {zone_event} for item {pe.get_item_name(item)} is not processed.')
+            except Exception:
+                pe.log_error("EventQueue: " + traceback.format_exc())
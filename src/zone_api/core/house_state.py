@@ -0,0 +1,120 @@
+import threading
+from typing import Iterable, NamedTuple, Union
+
+from zone_api.core.device import Device
+from zone_api.core.devices.alarm_partition import AlarmPartition, AlarmState
+from zone_api.core.devices.astro_sensor import AstroSensor
+from zone_api.core.devices.vacation import Vacation
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+
+
+class HouseStateSnapshot(NamedTuple):
+    """ The house-wide states at a point in time. """
+
+    in_vacation: bool
+    """ True if at least one :class:`Vacation` device indicates that the house is in vacation mode. """
+
+    light_on_time: Union[bool, None]
+    """ True if at least one :class:`AstroSensor` indicates light-on time; None if there is no astro sensor. """
+
+    arm_mode: Union[AlarmState, None]
+    """ The arm mode of the alarm partition; None if there is no security system. """
+
+
+class HouseState:
+    """
+    Keeps the vacation mode, the light-on time and the arm mode of the house current through the VACATION_MODE_*,
+    ASTRO_* and PARTITION_* events, so that the actions don't look for the devices and read their items on every
+    event.
+
+    The singleton devices are resolved once (see :meth:`resolve`). The states are held in an immutable
+    :class:`HouseStateSnapshot` that is replaced on each change; the getters read a single attribute and never block,
+    and :meth:`get_snapshot` returns the three states as of the same event.
+    """
+
+    def __init__(self, vacation_devices: Iterable[Vacation], astro_sensors: Iterable[AstroSensor],
+                 partition: Union[AlarmPartition, None]):
+        self._partition = partition
+        self._lock = threading.Lock()
+
+        self._vacation_item_names = {d.get_item_name() for d in vacation_devices if d.is_in_vacation()} # type: ignore
+
+        astro_sensors = list(astro_sensors)
+        self._astro_item_names = {s.get_item_name() for s in astro_sensors}
+        self._light_on_item_names = {s.get_item_name() for s in astro_sensors if s.is_light_on_time()}
+
+        arm_mode = partition.get_arm_mode() if partition is not None else None
+        self._snapshot = self._create_snapshot(arm_mode)
+
+    @staticmethod
+    def resolve(zones: Iterable[Zone]) -> 'HouseState':
+        """ Looks up the vacation devices, the astro sensors and the first alarm partition of the zones. """
+        vacation_devices = []
+        astro_sensors = []
+        partition = None
+        for z in zones:
+            vacation_devices.extend(z.get_devices_by_type(Vacation))
+            astro_sensors.extend(z.get_devices_by_type(AstroSensor))
+            if partition is None:
+                partitions = z.get_devices_by_type(AlarmPartition)
+                if len(partitions) > 0:
+                    partition = partitions[0]
+
+        return HouseState(vacation_devices, astro_sensors, partition) # type: ignore
+
+    def get_snapshot(self) -> HouseStateSnapshot:
+        return self._snapshot
+
+    def is_in_vacation(self) -> bool:
+        return self._snapshot.in_vacation
+
+    def is_light_on_time(self) -> Union[bool, None]:
+        return self._snapshot.light_on_time
+
+    def get_arm_mode(self) -> Union[AlarmState, None]:
+        return self._snapshot.arm_mode
+
+    def get_partition(self) -> Union[AlarmPartition, None]:
+        return self._partition
+
+    def on_event(self, zone_event: ZoneEvent, device: Device):
+        """ Updates the states from the event; no-op if the event doesn't change a house state. """
+        if zone_event not in _HANDLED_EVENTS:
+            return
+
+        with self._lock:
+            arm_mode = self._snapshot.arm_mode
+            item_name = device.get_item_name()
+
+            if zone_event == ZoneEvent.VACATION_MODE_ON:
+                self._vacation_item_names.add(item_name)
+            elif zone_event == ZoneEvent.VACATION_MODE_OFF:
+                self._vacation_item_names.discard(item_name)
+            elif zone_event in (ZoneEvent.ASTRO_LIGHT_ON, ZoneEvent.ASTRO_BED_TIME):
+                self._astro_item_names.add(item_name)
+                self._light_on_item_names.add(item_name)
+            elif zone_event == ZoneEvent.ASTRO_LIGHT_OFF:
+                self._astro_item_names.add(item_name)
+                self._light_on_item_names.discard(item_name)
+            else:
+                arm_mode = _ARM_MODES_BY_EVENT[zone_event]
+
+            self._snapshot = self._create_snapshot(arm_mode)
+
+    def _create_snapshot(self, arm_mode: Union[AlarmState, None]) -> HouseStateSnapshot:
+        light_on_time = len(self._light_on_item_names) > 0 if len(self._astro_item_names) > 0 else None
+        return HouseStateSnapshot(len(self._vacation_item_names) > 0, light_on_time, arm_mode)
+
+
+# The PARTITION_RECEIVE_ARM_* events are the arm commands; the arm mode changes on the following PARTITION_ARMED_*.
+_ARM_MODES_BY_EVENT: dict[ZoneEvent, AlarmState] = {
+    ZoneEvent.PARTITION_ARMED_AWAY: AlarmState.ARM_AWAY,
+    ZoneEvent.PARTITION_ARMED_STAY: AlarmState.ARM_STAY,
+    ZoneEvent.PARTITION_DISARMED_FROM_AWAY: AlarmState.UNARMED,
+    ZoneEvent.PARTITION_DISARMED_FROM_STAY: AlarmState.UNARMED,
+}
+
+_HANDLED_EVENTS: frozenset = frozenset(
+    [ZoneEvent.VACATION_MODE_ON, ZoneEvent.VACATION_MODE_OFF,
+     ZoneEvent.ASTRO_LIGHT_ON, ZoneEvent.ASTRO_LIGHT_OFF, ZoneEvent.ASTRO_BED_TIME] + list(_ARM_MODES_BY_EVENT.keys()))
@@ -1,21 +1,32 @@
 import threading
-import time
-from typing import Type, List, Any, Hashable, TYPE_CHECKING, Union
-
-from schedule import Scheduler
+from typing import Type, List, Any, Hashable, TYPE_CHECKING, Union, Tuple
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core import action
 from zone_api.core.actions.track_significant_events import TrackSignificantEvents
+from zone_api.core.async_dispatcher import AsyncDispatcher
+from zone_api.core.deadline_scheduler import DeadlineScheduler
+from zone_api.core.event_coalescer import CoalescingPolicy, EventCoalescer
+from zone_api.core.event_queue import EventQueue, SheddingPolicy
+from zone_api.core.house_state import HouseState
+from zone_api.core.inactivity_index import InactivityIndex
+from zone_api.core.latency_histogram import LatencyHistogram
+from zone_api.core.motion_light_path import MotionLightPath
+from zone_api.core.sharded_dispatcher import ShardedDispatcher, ShardStatistics
+from zone_api.core.timer_service import Timer, TimerService, get_timer_service
 from zone_api.core.devices.activity_times import ActivityTimes, ActivityType
 from zone_api.core.devices.astro_sensor import AstroSensor
+from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.devices.vacation import Vacation
+from zone_api.core.event_info import EventInfo
 from zone_api.core.zone import Zone
 from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_topology import ZoneTopology
 from zone_api.core.device import Device
 
 if TYPE_CHECKING:
     from zone_api.alert_manager import AlertManager
+    from zone_api.core.action import Action
 
 
 class EmailSettings:
@@ -66,14 +77,40 @@ class ImmutableZoneManager:
       - stop() should be called when the object is no longer used.
     """
 
+    # The maximum delay of the activity transition timer, so that the timer catches up with wall clock adjustments.
+    MAX_ACTIVITY_TRANSITION_DELAY_IN_SECONDS = 60 * 60
+
     def __init__(self, get_zones_fcn, get_zone_by_id_fcn, get_devices_by_type_fcn,
                  alert_manager: Union['AlertManager', None] = None, email_settings: Union[EmailSettings, None] = None,
-                 activity_times: Union[ActivityTimes, None] = None, label_mappings: Union[dict[str, str], None] = None):
+                 activity_times: Union[ActivityTimes, None] = None, label_mappings: Union[dict[str, str], None] = None,
+                 get_internal_zones_fcn=None, get_zones_version_fcn=None, async_dispatch_workers: int = 0,
+                 dispatch_shards: int = 0, event_queue_policy: Union[SheddingPolicy, None] = None,
+                 get_inactivity_index_fcn=None, event_coalescer: Union[EventCoalescer, None] = None):
         self.get_zones_fcn = get_zones_fcn
         self.get_zone_by_id_fcn = get_zone_by_id_fcn
         self.get_devices_by_type_fcn = get_devices_by_type_fcn
+        self.get_internal_zones_fcn = get_internal_zones_fcn
+        self.get_zones_version_fcn = get_zones_version_fcn
+        self.get_inactivity_index_fcn = get_inactivity_index_fcn
+        self._inactivity_index: Union[Tuple[int, InactivityIndex], None] = None
+        self._async_dispatch_workers = async_dispatch_workers
+        self._async_dispatcher: Union[AsyncDispatcher, None] = None
+        self._dispatch_shards = dispatch_shards
+        self._sharded_dispatcher: Union[ShardedDispatcher, None] = None
+        self._event_queue_policy = event_queue_policy
+        self._event_queue: Union[EventQueue, None] = None
         self.alert_manager = alert_manager
-        self.scheduler = Scheduler()
+        self.scheduler = DeadlineScheduler()
+        self._timer_service = get_timer_service()
+        # The coalescer is carried over by the set_* methods, along with its policies and held back events; the
+        # latter are then dispatched by the new instance.
+        if event_coalescer is None:
+            self._event_coalescer = EventCoalescer(self.dispatch_event)
+        else:
+            self._event_coalescer = event_coalescer
+            self._event_coalescer.set_dispatch_fcn(self.dispatch_event)
+        self._activity_transition_timer: Union[Timer, None] = None
+        self._active_activity_types: Union[List[ActivityType], None] = None
 
         self._email_settings: Union[EmailSettings, None] = email_settings
         self._activity_times = activity_times
@@ -86,48 +123,151 @@ class ImmutableZoneManager:
         self.item_name_to_zone = {}
         self.fully_initialized = False
 
+        # (zones version, event routing table, item name -> (zone, device) pairs). Built in start() and rebuilt when
+        # the zones version changes; see _get_routing_tables(). The item map covers any item of any device, not just
+        # the primary one, with the pairs in zone order. When the tables are None, the topology is unknown and events
+        # are broadcast to all zones.
+        self._routing_tables: Union[Tuple[int, Union[dict, None], Union[dict, None]], None] = None
+        # Guards the insertion of the lazily computed routes, as the dispatch engines look them up concurrently.
+        self._routes_lock = threading.Lock()
+        # (zones version, id(device) -> zone, id(action) -> zone) for O(1) containing zone look-ups. Built in
+        # start() and rebuilt when the zones version changes; see _get_reverse_indexes().
+        self._reverse_indexes: Union[Tuple[int, dict[int, Zone], dict[int, Zone]], None] = None
+        # (zones version, vacation mode, light-on time and arm mode); resolved in start(), kept current by
+        # dispatch_event() and resolved again when the zones version changes.
+        self._house_state: Union[Tuple[int, HouseState], None] = None
+        # (zones version, neighbor graph); built in start() and rebuilt when the zones version changes.
+        self._zone_topology: Union[Tuple[int, ZoneTopology], None] = None
+        # (zones version, item name -> motion light paths of the motion sensor); built in start() and rebuilt when the
+        # zones version changes, see MotionLightPath.
+        self._motion_light_paths: Union[Tuple[int, dict[str, Tuple[MotionLightPath, ...]]], None] = None
+        self._motion_light_latency = LatencyHistogram()
+
     def start(self):
         """
         Indicates that the zones are fully populated. The following actions will take place:
           1. Map device item name to zone.
-          2. Start scheduler (if not in a unit test).
-          3. Send event ZoneEvent.STARTUP to each action.
+          2. Compile the action filter plans of each zone.
+          3. Build the event routing table, the device/action to zone indexes and the zone topology.
+          4. Build the motion light paths and the inactivity index, and resolve the house state (see
+             :meth:`get_house_state`).
+          5. Start scheduler (if not in a unit test).
+          6. Start the sharded or async dispatch engine (if enabled).
+          7. Start the event queue (if enabled).
+          8. Send event ZoneEvent.STARTUP to each action.
+          9. Start the activity time transition timer (if not in a unit test).
         """
         for z in self.get_zones():
             for d in z.get_devices():
                 self.item_name_to_zone[d.get_item_name()] = z
 
+            z.compile_action_filter_plans()
+
+        self._routing_tables = self._build_routing_tables()
+        self._reverse_indexes = self._build_reverse_indexes()
+        self._zone_topology = (self.get_zones_version(), ZoneTopology(self.get_zones()))
+        self._motion_light_paths = self._build_motion_light_paths()
+        self._house_state = (self.get_zones_version(), HouseState.resolve(self.get_zones()))
+        self.get_inactivity_index()
+
         if not pe.is_in_unit_tests():
             self._start_scheduler()
 
+        if self._dispatch_shards > 0 and self._sharded_dispatcher is None:
+            self._sharded_dispatcher = ShardedDispatcher(self, self._dispatch_shards)
+            self._sharded_dispatcher.start()
+        elif self._async_dispatch_workers > 0 and self._async_dispatcher is None:
+            self._async_dispatcher = AsyncDispatcher(self, self._async_dispatch_workers)
+            self._async_dispatcher.start()
+
+        if self._event_queue_policy is not None and self._event_queue is None:
+            self._event_queue = EventQueue(self._dispatch_event_now, self._event_queue_policy)
+            self._event_queue.start()
+
         self.fully_initialized = True
 
         for z in self.get_zones():
             z.dispatch_event(ZoneEvent.STARTUP, pe.get_event_dispatcher(), None, None, self)
 
+        if not pe.is_in_unit_tests():
+            self._schedule_activity_transition()
+
     def stop(self):
         """
         Indicates that this object is no longer being used.
         """
         self._cancel_scheduler()
+        self._cancel_activity_transition()
+        self._event_coalescer.cancel()
+        if self._event_queue is not None:
+            self._event_queue.stop()
+            self._event_queue = None
+        if self._async_dispatcher is not None:
+            self._async_dispatcher.stop()
+            self._async_dispatcher = None
+        if self._sharded_dispatcher is not None:
+            self._sharded_dispatcher.stop()
+            self._sharded_dispatcher = None
+
+        self._routing_tables = None
+        self._reverse_indexes = None
+        self._house_state = None
+        self._motion_light_paths = None
         self.fully_initialized = False
 
     def set_alert_manager(self, alert_manager: 'AlertManager'):
         """ Sets the alert manager and returns a new instance of this class. """
+        return ImmutableZoneManager(**self._copy_params(alert_manager=alert_manager))
 
-        params = {'get_zones_fcn': self.get_zones_fcn,
-                  'get_zone_by_id_fcn': self.get_zone_by_id_fcn,
-                  'get_devices_by_type_fcn': self.get_devices_by_type_fcn,
-                  'email_settings': self.email_settings,
-                  'activity_times': self.activity_times,
-                  'label_mappings': self._label_mappings,
-                  'alert_manager': alert_manager}
-        return ImmutableZoneManager(**params)
+    def set_async_dispatch(self, max_blocking_workers: int = AsyncDispatcher.DEFAULT_MAX_BLOCKING_WORKERS):
+        """
+        Enables the :class:`.AsyncDispatcher` engine, started in :meth:`start`, and returns a new instance of this
+        class. A value of 0 disables the engine; events are then dispatched in the calling thread.
+
+        :param int max_blocking_workers: the maximum number of threads running actions declared as blocking.
+        """
+        return ImmutableZoneManager(**self._copy_params(async_dispatch_workers=max_blocking_workers))
+
+    def set_sharded_dispatch(self, number_of_shards: int = ShardedDispatcher.DEFAULT_NUMBER_OF_SHARDS):
+        """
+        Enables the :class:`.ShardedDispatcher` engine, started in :meth:`start`, and returns a new instance of this
+        class. A value of 0 disables the engine. If enabled, this engine takes precedence over the async one (see
+        :meth:`set_async_dispatch`).
+
+        :param int number_of_shards: the number of worker threads; the zones are distributed among them.
+        """
+        return ImmutableZoneManager(**self._copy_params(dispatch_shards=number_of_shards))
+
+    def set_event_queue(self, policy: Union[SheddingPolicy, None]):
+        """
+        Enables the priority :class:`.EventQueue` in front of :meth:`dispatch_event`, started in :meth:`start`, and
+        returns a new instance of this class. A value of None disables the queue.
+
+        :param SheddingPolicy policy: determines how value change events are shed when the queue is backlogged.
+        """
+        return ImmutableZoneManager(**self._copy_params(event_queue_policy=policy))
+
+    def get_event_queue(self) -> Union[EventQueue, None]:
+        """ Returns the priority event queue, or None if it isn't enabled or the zone manager isn't started. """
+        return self._event_queue
+
+    def get_dispatch_statistics(self) -> List[ShardStatistics]:
+        """
+        Returns the queue depth and latency of each shard of the sharded dispatch engine; an empty list if the
+        engine isn't running.
+        """
+        dispatcher = self._sharded_dispatcher
+        if dispatcher is None:
+            return []
+
+        return dispatcher.get_statistics()
 
     def set_system_config(self, config: dict[Hashable, Any]):
         """
         Sets the system configuration. This method will construct various settings object from the ``config``. They are
-        accessible via the various properties.
+        accessible via the various properties. The optional 'event-coalescing' section sets the coalescing policy of
+        the device classes (see :class:`.EventCoalescer`). Note that the event coalescer is shared by this instance
+        and the returned one (see :meth:`get_event_coalescer`); the policies are thus set on both.
 
         :param dict[Hashable, Any] config: the value read from a yaml file via `yaml.safe_load(file)`.
         """
@@ -144,15 +284,36 @@ class ImmutableZoneManager:
         activity_times = self._create_activity_times(config)
         pe.log_info(f"Configured {activity_times.number_of_activities} activities.")
 
+        coalescing_config = config['system'].get('event-coalescing') or {}
+        for device_class_name, policy_config in coalescing_config.items():
+            policy = CoalescingPolicy.from_config(policy_config)
+            self._event_coalescer.set_device_policy(device_class_name, policy)
+            pe.log_info(f"Event coalescing policy for {device_class_name}: {policy}")
+
+        return ImmutableZoneManager(**self._copy_params(email_settings=email_settings, activity_times=activity_times,
+                                                        label_mappings=label_mappings))
+
+    def _copy_params(self, **overrides) -> dict[str, Any]:
+        """
+        Returns the constructor parameters of a copy of this instance, with the given parameters replaced; used by the
+        set_* methods.
+        """
         params = {'get_zones_fcn': self.get_zones_fcn,
                   'get_zone_by_id_fcn': self.get_zone_by_id_fcn,
                   'get_devices_by_type_fcn': self.get_devices_by_type_fcn,
                   'alert_manager': self.alert_manager,
-                  'email_settings': email_settings,
-                  'activity_times': activity_times,
-                  'label_mappings': label_mappings,
-                  }
-        return ImmutableZoneManager(**params)
+                  'email_settings': self.email_settings,
+                  'activity_times': self.activity_times,
+                  'label_mappings': self._label_mappings,
+                  'get_internal_zones_fcn': self.get_internal_zones_fcn,
+                  'get_zones_version_fcn': self.get_zones_version_fcn,
+                  'get_inactivity_index_fcn': self.get_inactivity_index_fcn,
+                  'async_dispatch_workers': self._async_dispatch_workers,
+                  'dispatch_shards': self._dispatch_shards,
+                  'event_queue_policy': self._event_queue_policy,
+                  'event_coalescer': self._event_coalescer}
+        params.update(overrides)
+        return params
 
     @staticmethod
     def _create_activity_times(config: dict[Hashable, Any]) -> ActivityTimes:
@@ -185,19 +346,31 @@ class ImmutableZoneManager:
     def get_alert_manager(self) -> 'AlertManager':
         return self.alert_manager # type: ignore
 
-    def get_scheduler(self) -> Scheduler:
-        """ Returns the Scheduler instance """
+    def get_scheduler(self) -> DeadlineScheduler:
+        """ Returns the Scheduler instance; see :class:`.DeadlineScheduler` for the job statistics. """
         return self.scheduler
 
-    def _start_scheduler(self, interval_in_seconds=1) -> threading.Event:
-        """ Runs the scheduler in a separate thread. """
+    def get_timer_service(self) -> TimerService:
+        """
+        Returns the TimerService instance running the one-shot timers (see :class:`.timer_service.Timer`). The instance
+        is shared with the devices and the actions, so it isn't stopped by :meth:`stop`.
+        """
+        return self._timer_service
+
+    def get_event_coalescer(self) -> EventCoalescer:
+        """
+        Returns the EventCoalescer instance fronting :meth:`dispatch_event` for the numeric sensors. The instance is
+        shared with the copies made by the set_* methods, and dispatches to the most recent one.
+        """
+        return self._event_coalescer
+
+    def _start_scheduler(self) -> threading.Event:
+        """ Runs the scheduler in a separate thread; the thread sleeps until the deadline of the next job. """
 
         class ScheduleThread(threading.Thread):
             @classmethod
             def run(cls): # type: ignore
-                while not self.cease_continuous_run.is_set():
-                    self.scheduler.run_pending()
-                    time.sleep(interval_in_seconds)
+                self.scheduler.run_until(self.cease_continuous_run)
 
                 pe.log_info("Cancelled the scheduler service.")
 
@@ -214,6 +387,59 @@ class ImmutableZoneManager:
         """ Cancel the scheduler thread if it was started. """
         if self.cease_continuous_run is not None:
             self.cease_continuous_run.set()
+            self.scheduler.wake()
+
+    def _schedule_activity_transition(self):
+        """
+        Starts a one-shot timer firing when the current time next enters or leaves the time range of an
+        :class:`ActivityTimes` activity. When the timer fires, :attr:`ZoneEvent.ACTIVITY_TIME_CHANGED` is dispatched
+        with the ActivityTimes device (if the current activities have changed), and the timer is rescheduled.
+        """
+        activity: ActivityTimes = self.get_first_device_by_type(ActivityTimes)
+        if activity is None:
+            return
+
+        now = pe.get_clock().time()
+        if self._active_activity_types is None:
+            self._active_activity_types = activity.get_active_activity_types(now)
+
+        transition_time = activity.get_next_transition_time(epoch_seconds=now)
+        if transition_time is None:
+            return
+
+        delay = min(transition_time - now, ImmutableZoneManager.MAX_ACTIVITY_TRANSITION_DELAY_IN_SECONDS)
+        if self._activity_transition_timer is not None:
+            self._activity_transition_timer.cancel()
+        self._activity_transition_timer = self._timer_service.schedule_blocking(delay, self._on_activity_transition)
+
+    def _on_activity_transition(self):
+        """
+        Invoked by the activity transition timer. The timer is always rescheduled, unless it has been cancelled by
+        :meth:`stop` in the meantime.
+        """
+        try:
+            activity: ActivityTimes = self.get_first_device_by_type(ActivityTimes)
+            if activity is None or not self.fully_initialized:
+                return
+
+            active_activity_types = activity.get_active_activity_types()
+            if active_activity_types != self._active_activity_types:
+                self._active_activity_types = active_activity_types
+                pe.log_info(f"Current activities: {[a.value for a in active_activity_types]}")
+
+                self.dispatch_event(ZoneEvent.ACTIVITY_TIME_CHANGED, pe.get_event_dispatcher(), activity,
+                                    activity.get_item())
+        finally:
+            if self._activity_transition_timer is not None:
+                self._schedule_activity_transition()
+
+    def _cancel_activity_transition(self):
+        """ Cancels the activity transition timer if it was started. """
+        if self._activity_transition_timer is not None:
+            self._activity_transition_timer.cancel()
+            self._activity_transition_timer = None
+
+        self._active_activity_types = None
 
     def get_containing_zone(self, device):
         """
@@ -226,28 +452,131 @@ class ImmutableZoneManager:
         if device is None:
             raise ValueError('device must not be None')
 
+        indexes = self._get_reverse_indexes()
+        if indexes is not None:
+            return indexes[1].get(id(device))
+
         for zone in self.get_zones():
             if zone.has_device(device):
                 return zone
 
         return None
 
-    def get_zones(self) -> List[Zone]:
+    def get_zone_by_action(self, action_obj: 'Action'):
         """
-        Returns a new list contains all zone.
+        Returns the first zone containing the action or None if the action does not belong to a zone.
 
-        :rtype: list(Zone)
+        :param Action action_obj: the action
+        :rtype: Zone or None
+        """
+        indexes = self._get_reverse_indexes()
+        if indexes is not None:
+            return indexes[2].get(id(action_obj))
+
+        for zone in self.get_zones():
+            if zone.has_action(action_obj):
+                return zone
+
+        return None
+
+    def _get_reverse_indexes(self) -> Union[Tuple[int, dict[int, Zone], dict[int, Zone]], None]:
+        """
+        Returns the device/action to zone indexes, rebuilding them if the zones have changed since they were built.
+        Returns None if the zone manager hasn't been started.
+        """
+        indexes = self._reverse_indexes
+        if indexes is None:
+            return None
+
+        if indexes[0] != self.get_zones_version():
+            indexes = self._build_reverse_indexes()
+            self._reverse_indexes = indexes
+
+        return indexes
+
+    def _build_reverse_indexes(self) -> Tuple[int, dict[int, Zone], dict[int, Zone]]:
+        """
+        Builds the identity-keyed maps from device and action to the first zone (in zone order) containing them.
+        The keys are object ids; the zones hold references to the devices and actions, so the ids stay valid for
+        as long as the zones version doesn't change.
+        """
+        version = self.get_zones_version()
+        device_to_zone: dict[int, Zone] = {}
+        action_to_zone: dict[int, Zone] = {}
+        for z in self.get_zones():
+            for d in z.get_devices():
+                device_to_zone.setdefault(id(d), z)
+
+            for action_list in z.actions.values():
+                for a in action_list:
+                    action_to_zone.setdefault(id(a), z)
+
+        return version, device_to_zone, action_to_zone
+
+    def get_zones(self) -> Tuple[Zone, ...]:
+        """
+        Returns a read-only tuple of all zones, sorted by display order.
+
+        :rtype: tuple(Zone)
         """
         return self.get_zones_fcn()
 
-    def get_internal_zones(self) -> List[Zone]:
+    def get_internal_zones(self) -> Tuple[Zone, ...]:
         """
-        Returns a new list of all internal zones
+        Returns a read-only tuple of all internal zones, sorted by display order.
 
-        :rtype: list(Zone)
+        :rtype: tuple(Zone)
         """
-        zones = [z for z in self.get_zones() if z.is_internal()]
-        return zones
+        if self.get_internal_zones_fcn is not None:
+            return self.get_internal_zones_fcn()
+
+        return tuple(z for z in self.get_zones() if z.is_internal())
+
+    def get_zones_version(self) -> int:
+        """
+        Returns a counter that changes each time the set of zones changes; see :meth:`ZoneManager.get_version`.
+        Returns 0 if the zone container doesn't track versions.
+        """
+        if self.get_zones_version_fcn is None:
+            return 0
+
+        return self.get_zones_version_fcn()
+
+    def get_inactivity_index(self) -> InactivityIndex:
+        """
+        Returns the index of the auto-report and battery-powered devices ordered by last activation; see
+        :meth:`ZoneManager.get_inactivity_index`. If the zone container doesn't provide one, the index is built from
+        the zones in :meth:`start` (or on first use) and updated when the zones version changes.
+        """
+        if self.get_inactivity_index_fcn is not None:
+            return self.get_inactivity_index_fcn()
+
+        version = self.get_zones_version()
+        index = self._inactivity_index
+        if index is None or index[0] != version:
+            devices = [d for z in self.get_zones() for d in z.get_devices()
+                       if d.is_auto_report() or d.is_battery_powered()]
+            if index is None:
+                index = (version, InactivityIndex(devices))
+            else:
+                index[1].set_devices(devices)
+                index = (version, index[1])
+            self._inactivity_index = index
+
+        return index[1]
+
+    def get_zone_topology(self) -> ZoneTopology:
+        """
+        Returns the neighbor graph of the zones, with the neighbor ids resolved to the zones. It is built in
+        :meth:`start` (or on first use) and rebuilt when the zones version changes.
+        """
+        version = self.get_zones_version()
+        topology = self._zone_topology
+        if topology is None or topology[0] != version:
+            topology = (version, ZoneTopology(self.get_zones()))
+            self._zone_topology = topology
+
+        return topology[1]
 
     def get_zone_by_id(self, zone_id):
         """
@@ -271,15 +600,35 @@ class ImmutableZoneManager:
 
     def get_devices_by_type(self, cls: Type):
         """
-        Returns a list of devices in all zones matching the given type.
+        Returns a read-only tuple of the devices in all zones matching the given type.
 
         :param Device cls: the device type
-        :rtype: list(Device)
+        :rtype: tuple(Device)
         """
         return self.get_devices_by_type_fcn(cls)
 
+    def get_house_state(self) -> Union[HouseState, None]:
+        """
+        Returns the event-maintained house state, resolving it again if the zones have changed since it was resolved.
+        Returns None if the zone manager hasn't been started.
+        """
+        house_state = self._house_state
+        if house_state is None:
+            return None
+
+        version = self.get_zones_version()
+        if house_state[0] != version:
+            house_state = (version, HouseState.resolve(self.get_zones()))
+            self._house_state = house_state
+
+        return house_state[1]
+
     def is_in_vacation(self):
         """ Returns true if at least one device indicates that the house is in vacation mode, vie Vacation class. """
+        house_state = self.get_house_state()
+        if house_state is not None:
+            return house_state.is_in_vacation()
+
         for z in self.get_zones():
             for d in z.get_devices_by_type(Vacation):
                 if d.is_in_vacation(): # type: ignore
@@ -294,6 +643,10 @@ class ImmutableZoneManager:
 
         :rtype: bool or None
         """
+        house_state = self.get_house_state()
+        if house_state is not None:
+            return house_state.is_light_on_time()
+
         has_astro_sensors = False
         for z in self.get_zones():
             astro_sensors = z.get_devices_by_type(AstroSensor)
@@ -317,18 +670,63 @@ class ImmutableZoneManager:
         devices = self.get_devices_by_type(cls)
         return devices[0] if len(devices) > 0 else None
 
-    def dispatch_event(self, zone_event: ZoneEvent, open_hab_events, device: Device, item):
+    def dispatch_event(self, zone_event: ZoneEvent, open_hab_events, device: Device, item,
+                       received_time: Union[float, None] = None):
         """
         Dispatches the event to the zones.
 
+        If the event queue is running (see :meth:`set_event_queue`), the event is queued and the method returns
+        right away; the return value is then False only if the event was dropped by the shedding policy.
+
         :param Device device: the device containing the triggered item; a device may contain multiple items.
         :param Any item: the triggered item.
         :param ZoneEvent zone_event:
         :param events open_hab_events:
+        :param float received_time: the time (see time.perf_counter) the openHAB event was received, if known; the
+            motion to light latency is measured from that time (see :meth:`get_motion_light_latency`).
         """
         # noinspection PyProtectedMember
         device.update_last_activated_timestamp()
 
+        if zone_event == ZoneEvent.MOTION:
+            for path in self._get_motion_light_paths(pe.get_item_name(item)):
+                path.mark_received(received_time)
+
+        house_state = self.get_house_state()
+        if house_state is not None:
+            house_state.on_event(zone_event, device)
+
+        event_queue = self._event_queue
+        if event_queue is not None and event_queue.is_running():
+            return event_queue.put(zone_event, open_hab_events, device, item)
+
+        return self._dispatch_event_now(zone_event, open_hab_events, device, item)
+
+    def _dispatch_event_now(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> bool:
+        """
+        Dispatches the event without going through the event queue.
+
+        If the sharded or async dispatch engine is running (see :meth:`set_sharded_dispatch` and
+        :meth:`set_async_dispatch`), the event is queued to the engine and the method returns True right away.
+        """
+        sharded_dispatcher = self._sharded_dispatcher
+        if sharded_dispatcher is not None and sharded_dispatcher.is_running():
+            sharded_dispatcher.submit(zone_event, open_hab_events, device, item)
+            return True
+
+        dispatcher = self._async_dispatcher
+        if dispatcher is not None and dispatcher.is_running():
+            dispatcher.submit(zone_event, open_hab_events, device, item)
+            return True
+
+        route = self._get_event_route(zone_event, pe.get_item_name(item))
+        if route is not None:
+            return self._dispatch_event_to_route(route, zone_event, open_hab_events, device, item)
+
+        return self._broadcast_event(zone_event, open_hab_events, device, item)
+
+    def _broadcast_event(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> bool:
+        """ Dispatches the event to every zone, starting with the zone owning the item. """
         return_values = []
 
         # Small optimization: dispatch directly to the applicable zone first if we can determine
@@ -347,6 +745,190 @@ class ImmutableZoneManager:
 
         return any(return_values)
 
+    def _get_routing_tables(self) -> Union[Tuple[int, Union[dict, None], Union[dict, None]], None]:
+        """
+        Returns the event routing tables, rebuilding them if the zones have changed since they were built. Returns
+        None if the zone manager hasn't been started.
+        """
+        tables = self._routing_tables
+        if tables is None:
+            return None
+
+        if tables[0] != self.get_zones_version():
+            tables = self._build_routing_tables()
+            self._routing_tables = tables
+
+        return tables
+
+    def _build_routing_tables(self) -> Tuple[int, Union[dict, None], Union[dict, None]]:
+        """
+        Builds the data needed by the event routing table. The routes themselves are computed lazily per
+        (ZoneEvent, item name) key on the first dispatch, as most items only ever generate a couple of event types.
+
+        If a zone overrides one of the dispatching methods of :class:`Zone`, the topology is considered unknown and
+        the tables are None; all events are then broadcast to every zone.
+        """
+        version = self.get_zones_version()
+        zones = self.get_zones()
+        if any(type(z).dispatch_event is not Zone.dispatch_event
+               or type(z).on_switch_turned_on is not Zone.on_switch_turned_on
+               or type(z).on_switch_turned_off is not Zone.on_switch_turned_off for z in zones):
+            return version, None, None
+
+        item_name_to_zone_devices: dict[str, Tuple[Tuple[Zone, Device], ...]] = {}
+        for z in zones:
+            for d in z.get_devices():
+                for item_name in d.get_all_item_names():
+                    item_name_to_zone_devices[item_name] = item_name_to_zone_devices.get(item_name, ()) + ((z, d),)
+
+        return version, {}, item_name_to_zone_devices
+
+    def get_zone_devices_by_item_name(self, item_name: str) -> Union[Tuple[Tuple[Zone, Device], ...], None]:
+        """
+        Returns the (zone, device) pairs containing the item with the given name, in zone order. Returns None if the
+        zone manager hasn't been started, or the topology is unknown.
+        """
+        tables = self._get_routing_tables()
+        if tables is None or tables[2] is None:
+            return None
+
+        return tables[2].get(item_name, ())
+
+    def _get_containing_zones(self, item_name: str) -> Union[List[Zone], None]:
+        """ Returns the unique zones containing the item, in zone order, or None if the topology is unknown. """
+        zone_devices = self.get_zone_devices_by_item_name(item_name)
+        if zone_devices is None:
+            return None
+
+        zones = []
+        for z, d in zone_devices:
+            if not any(z is added_zone for added_zone in zones):
+                zones.append(z)
+
+        return zones
+
+    def _get_event_route(self, zone_event: ZoneEvent, item_name: str) \
+            -> Union[Tuple[Tuple[Zone, 'Action'], ...], None]:
+        """
+        Returns the ordered (zone, action) pairs that can accept the event generated by the given item, or None if the
+        event must be broadcast to all zones (the routing table has not been built, or the event type isn't routable).
+        The pairs follow the broadcast order: the owning zone first, then the other zones in display order; within
+        each zone, the actions are in priority order.
+        """
+        tables = self._get_routing_tables()
+        if tables is None or tables[1] is None \
+                or zone_event in [ZoneEvent.STARTUP, ZoneEvent.DESTROY, ZoneEvent.TIMER]:
+            return None
+
+        routes = tables[1]
+
+        key = (zone_event, item_name)
+        route = routes.get(key)
+        if route is None:
+            owning_zone = self.get_zone_by_item_name(item_name)
+            containing_zones = self._get_containing_zones(item_name)
+            if containing_zones is None:
+                return None
+
+            zones = self.get_zones()
+            if owning_zone is not None:
+                zones = [owning_zone] + [z for z in zones if z is not owning_zone]
+
+            motion_light_paths = ()
+            if zone_event == ZoneEvent.MOTION:
+                motion_light_paths = self._get_motion_light_paths(item_name)
+
+            pairs = []
+            for z in zones:
+                contains_item = any(cz is z for cz in containing_zones)
+                for a in z.get_actions(zone_event):
+                    if self._can_accept_event(a, z, zone_event, contains_item):
+                        path = next((p for p in motion_light_paths if p.zone is z and p.action is a), None)
+                        pairs.append((z, path if path is not None else a))
+
+            with self._routes_lock:
+                route = routes.setdefault(key, tuple(pairs))
+
+        return route
+
+    @staticmethod
+    def _can_accept_event(a: 'Action', zone: Zone, zone_event: ZoneEvent, contains_item: bool) -> bool:
+        """
+        Returns False if the action's validation wrapper would reject the event outright; this mirrors the event
+        type checks in :meth:`action.validate`, and the zone checks if the action has a compiled filter plan for the
+        zone. Actions without the wrapper always accept the event.
+
+        :param bool contains_item: True if the zone contains the item that generated the event.
+        """
+        if not isinstance(a, action.Action) or a.filtering_disabled or a.required_events is None:
+            return True
+
+        plan = a.get_filter_plan(zone)
+        if plan is not None:
+            return plan.accepts_event_type(zone_event, contains_item)
+
+        if contains_item:
+            return len(a.required_events) == 0 or zone_event in a.required_events
+        else:
+            return zone_event in a.external_events
+
+    def _get_motion_light_paths(self, item_name: str) -> Tuple[MotionLightPath, ...]:
+        """
+        Returns the motion light paths of the motion sensor item, rebuilding the paths if the zones have changed since
+        they were built. Returns an empty tuple if the zone manager hasn't been started.
+        """
+        paths = self._motion_light_paths
+        if paths is None:
+            return ()
+
+        if paths[0] != self.get_zones_version():
+            paths = self._build_motion_light_paths()
+            self._motion_light_paths = paths
+
+        return paths[1].get(item_name, ())
+
+    def _build_motion_light_paths(self) -> Tuple[int, dict[str, Tuple[MotionLightPath, ...]]]:
+        """
+        Creates a :class:`MotionLightPath` for each motion sensor of the zones with a TurnOnSwitch action. The filter
+        plans of the zones added after :meth:`start` are compiled here, as the paths require them.
+        """
+        version = self.get_zones_version()
+        paths: dict[str, Tuple[MotionLightPath, ...]] = {}
+        for z in self.get_zones():
+            for a in z.get_actions(ZoneEvent.MOTION):
+                if isinstance(a, action.Action) and a.get_filter_plan(z) is None:
+                    a.compile_filter_plan(z)
+
+                if MotionLightPath.can_replace(a, z):
+                    path = MotionLightPath(z, a, self, self._motion_light_latency)
+                    for sensor in z.get_devices_by_type(MotionSensor):
+                        paths[sensor.get_item_name()] = paths.get(sensor.get_item_name(), ()) + (path,)
+
+        return version, paths
+
+    def get_motion_light_latency(self) -> LatencyHistogram:
+        """
+        Returns the histogram of the time from a motion event to the command turning on a light, for the events
+        dispatched with a received time; see :class:`MotionLightPath`.
+        """
+        return self._motion_light_latency
+
+    def _dispatch_event_to_route(self, route: Tuple[Tuple[Zone, 'Action'], ...], zone_event: ZoneEvent,
+                                 open_hab_events, device: Device, item) -> bool:
+        """ Dispatches the event to the (zone, action) pairs of a route returned by :meth:`_get_event_route`. """
+        owning_zone = self.get_zone_by_item_name(pe.get_item_name(item))
+
+        processed = False
+        event_info = None
+        for zone, a in route:
+            if event_info is None or event_info.get_zone() is not zone:
+                event_info = EventInfo(zone_event, item, zone, self, open_hab_events, owning_zone, device)
+
+            if Zone.invoke_action(a, event_info):
+                processed = True
+
+        return processed
+
     # noinspection PyUnusedLocal,PyMethodMayBeStatic
     def on_network_device_connected(self, events, device, item):
         """
@@ -370,7 +952,11 @@ class ImmutableZoneManager:
         # noinspection PyProtectedMember
         device.update_last_activated_timestamp()
 
-        return_values = [z.on_switch_turned_on(events, item, self) for z in self.get_zones()]
+        zones = self._get_containing_zones(pe.get_item_name(item))
+        if zones is None:
+            zones = self.get_zones()
+
+        return_values = [z.on_switch_turned_on(events, item, self) for z in zones]
         return any(return_values)
 
     # noinspection PyUnusedLocal
@@ -381,8 +967,12 @@ class ImmutableZoneManager:
         :return: True if at least one zone processed the event; False otherwise
         :rtype: bool
         """
+        zones = self._get_containing_zones(pe.get_item_name(item))
+        if zones is None:
+            zones = self.get_zones()
+
         return_values = []
-        for z in self.get_zones():
+        for z in zones:
             return_values.append(z.on_switch_turned_off(events, item, self))
         return any(return_values)
 
@@ -417,8 +1007,4 @@ class ImmutableZoneManager:
             return None
 
     def __str__(self):
-        value = u""
-        for z in self.get_zones():
-            value = f"{value}\n{str(z)}"
-
-        return value
+        return u"".join(f"\n{str(z)}" for z in self.get_zones())
@@ -0,0 +1,228 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
+from zone_api.core.timer_service import Timer
+
+# The activation time of the devices that have never been activated; they are inactive for any threshold.
+_NEVER_ACTIVATED = float('-inf')
+
+
+class InactivityWatch:
+    """
+    Invokes a callback with the devices that haven't been activated for a threshold, at the time they cross the
+    threshold; see :meth:`InactivityIndex.add_watch`. A device is reported again only if it is activated then crosses
+    the threshold again.
+    """
+
+    def __init__(self, index: 'InactivityIndex', threshold_in_seconds: float,
+                 callback: Callable[[List[Device]], None], predicate: Union[Callable[[Device], bool], None],
+                 initial_delay_in_seconds: float = 0):
+        self._index = index
+        self._threshold_in_seconds = threshold_in_seconds
+        # No device is reported before that time.
+        self._start_time = pe.get_clock().time() + initial_delay_in_seconds
+        self._callback = callback
+        self._predicate = predicate
+
+        # The devices last activated at or before that time have been reported; None means no device has.
+        self._reported_cutoff: Union[float, None] = None
+        self._timer: Union[Timer, None] = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """ Stops the watch; the callback won't be invoked anymore. """
+        with self._lock:
+            self._cancelled = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        # noinspection PyProtectedMember
+        self._index._remove_watch(self)
+
+    def _schedule(self):
+        """ (Re)starts the timer firing when the next device crosses the threshold. """
+        # noinspection PyProtectedMember
+        activation_time = self._index._get_next_activation_time(self._reported_cutoff, self._predicate)
+
+        with self._lock:
+            if self._cancelled:
+                return
+
+            if activation_time is None:
+                if self._timer is not None:
+                    self._timer.cancel()
+                return
+
+            delay = max(0.0, self._start_time - pe.get_clock().time(),
+                        activation_time + self._threshold_in_seconds - pe.get_clock().time())
+            if self._timer is None:
+                self._timer = Timer(delay, self._on_timer)
+                self._timer.start()
+            else:
+                self._timer.renew(delay)
+
+    def _is_scheduled(self) -> bool:
+        timer = self._timer
+        return timer is not None and timer.is_scheduled()
+
+    def _on_timer(self):
+        cutoff = pe.get_clock().time() - self._threshold_in_seconds
+        # noinspection PyProtectedMember
+        devices = self._index._get_devices_activated_between(self._reported_cutoff, cutoff, self._predicate)
+        self._reported_cutoff = cutoff
+
+        try:
+            if len(devices) > 0:
+                self._callback(devices)
+        finally:
+            self._schedule()
+
+
+class InactivityIndex:
+    """
+    Orders a set of devices by their last activation time, oldest first. The devices that haven't been activated for
+    a given threshold are then a prefix of the order, and the next device to cross the threshold is the one right
+    after that prefix; the queries never scan the active devices, whatever the threshold. An activation moves the
+    device to the end of the order in constant time (see :meth:`Device.update_last_activated_timestamp`).
+
+    A device that has never been activated is inactive for any threshold; it comes first in the order.
+    """
+
+    def __init__(self, devices: Iterable[Device] = ()):
+        self._lock = threading.Lock()
+        self._timestamps: OrderedDict[Device, float] = OrderedDict()
+        self._watches: List[InactivityWatch] = []
+
+        self.set_devices(devices)
+
+    def set_devices(self, devices: Iterable[Device]):
+        """ Replaces the indexed devices. """
+        devices = list(dict.fromkeys(devices))
+
+        with self._lock:
+            previous_timestamps = self._timestamps
+
+            entries = []
+            for d in devices:
+                timestamp = d.get_last_activated_timestamp()
+                entries.append((timestamp if timestamp is not None else _NEVER_ACTIVATED, d))
+
+            entries.sort(key=lambda e: e[0])
+            self._timestamps = OrderedDict((d, timestamp) for timestamp, d in entries)
+
+        for d in previous_timestamps.keys():
+            if d not in self._timestamps:
+                d.remove_activation_listener(self)
+
+        for d in devices:
+            d.add_activation_listener(self)
+
+        self._reschedule_watches()
+
+    def get_devices(self) -> List[Device]:
+        """ Returns the indexed devices, least recently activated first. """
+        with self._lock:
+            return list(self._timestamps.keys())
+
+    def on_device_activated(self, device: Device, timestamp: float):
+        """ Records the activation of the device; no-op if the device isn't indexed. """
+        with self._lock:
+            timestamps = self._timestamps
+            if device not in timestamps:
+                return
+
+            if timestamp >= next(reversed(timestamps.values())):
+                timestamps[device] = timestamp
+                timestamps.move_to_end(device)
+
+                # The deadlines of the scheduled watches can only move later; they are re-evaluated when they fire.
+                # noinspection PyProtectedMember
+                watches = [w for w in self._watches if not w._is_scheduled()]
+            else:
+                # The activation is older than the most recent one (e.g. the clock was set back); re-sort.
+                timestamps[device] = timestamp
+                self._timestamps = OrderedDict(sorted(timestamps.items(), key=lambda e: e[1]))
+                watches = list(self._watches)
+
+        for watch in watches:
+            # noinspection PyProtectedMember
+            watch._schedule()
+
+    def get_inactive_devices(self, threshold_in_seconds: float,
+                             predicate: Union[Callable[[Device], bool], None] = None) -> List[Device]:
+        """
+        Returns the devices that haven't been activated in the last threshold_in_seconds, least recently activated
+        first; the devices never activated come first.
+
+        :param predicate: if specified, only the devices for which it returns True are returned.
+        """
+        return self._get_devices_activated_between(None, pe.get_clock().time() - threshold_in_seconds, predicate)
+
+    def add_watch(self, threshold_in_seconds: float, callback: Callable[[List[Device]], None],
+                  predicate: Union[Callable[[Device], bool], None] = None,
+                  initial_delay_in_seconds: float = 0) -> InactivityWatch:
+        """
+        Invokes the callback with the devices that haven't been activated in the last threshold_in_seconds, when they
+        cross that threshold. The devices already inactive (including those never activated) are reported right away,
+        or after the initial delay. The callback is invoked on the timer service thread.
+
+        :param predicate: if specified, only the devices for which it returns True are watched.
+        :param initial_delay_in_seconds: the time before the first report, e.g. to give the devices a chance to
+            report after a restart.
+        :return: the watch; see :meth:`InactivityWatch.cancel`.
+        """
+        if threshold_in_seconds <= 0:
+            raise ValueError('threshold_in_seconds must be positive')
+
+        if initial_delay_in_seconds < 0:
+            raise ValueError('initial_delay_in_seconds must not be negative')
+
+        watch = InactivityWatch(self, threshold_in_seconds, callback, predicate, initial_delay_in_seconds)
+        with self._lock:
+            self._watches.append(watch)
+
+        # noinspection PyProtectedMember
+        watch._schedule()
+        return watch
+
+    def _remove_watch(self, watch: InactivityWatch):
+        with self._lock:
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+    def _reschedule_watches(self):
+        with self._lock:
+            watches = list(self._watches)
+
+        for watch in watches:
+            # noinspection PyProtectedMember
+            watch._schedule()
+
+    def _get_devices_activated_between(self, start_time: Union[float, None], end_time: float,
+                                       predicate: Union[Callable[[Device], bool], None]) -> List[Device]:
+        """ Returns the devices last activated after start_time (if not None) and at or before end_time. """
+        devices = []
+        with self._lock:
+            for d, timestamp in self._timestamps.items():
+                if timestamp > end_time:
+                    break
+
+                if (start_time is None or timestamp > start_time) and (predicate is None or predicate(d)):
+                    devices.append(d)
+
+        return devices
+
+    def _get_next_activation_time(self, start_time: Union[float, None],
+                                  predicate: Union[Callable[[Device], bool], None]) -> Union[float, None]:
+        """ Returns the earliest activation time after start_time (if not None), or None if there is none. """
+        with self._lock:
+            for d, timestamp in self._timestamps.items():
+                if (start_time is None or timestamp > start_time) and (predicate is None or predicate(d)):
+                    return timestamp
+
+        return None
@@ -0,0 +1,91 @@
+import math
+import threading
+from typing import List
+
+
+class LatencyHistogram:
+    """
+    A thread-safe histogram of latencies with logarithmic buckets, from 1 microsecond to 100 seconds. The percentiles
+    are the upper bound of the bucket holding the requested rank, capped at the largest recorded latency; the relative
+    error is below 13% with the default of 20 buckets per decade.
+    """
+
+    MIN_LATENCY_IN_SECONDS = 1e-6
+    MAX_LATENCY_IN_SECONDS = 100.0
+
+    def __init__(self, buckets_per_decade: int = 20):
+        if buckets_per_decade <= 0:
+            raise ValueError('buckets_per_decade must be positive')
+
+        self._buckets_per_decade = buckets_per_decade
+        number_of_decades = math.log10(LatencyHistogram.MAX_LATENCY_IN_SECONDS /
+                                       LatencyHistogram.MIN_LATENCY_IN_SECONDS)
+        self._counts: List[int] = [0] * (int(round(number_of_decades * buckets_per_decade)) + 1)
+        self._count = 0
+        self._max_latency = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency_in_seconds: float):
+        """ Adds a latency; the values outside of the bucket range are counted in the first or last bucket. """
+        index = self._get_bucket_index(latency_in_seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._max_latency = max(self._max_latency, latency_in_seconds)
+
+    def get_count(self) -> int:
+        """ Returns the number of recorded latencies. """
+        return self._count
+
+    def get_max(self) -> float:
+        """ Returns the largest recorded latency in seconds, or 0 if there is none. """
+        return self._max_latency
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Returns the latency in seconds at or below which the given percentage of the recorded latencies fall, or 0
+        if there is none.
+
+        :param float percentile: a value in ]0, 100].
+        """
+        if percentile <= 0 or percentile > 100:
+            raise ValueError('percentile must be in ]0, 100]')
+
+        with self._lock:
+            if self._count == 0:
+                return 0.0
+
+            rank = math.ceil(self._count * percentile / 100.0)
+            cumulative_count = 0
+            for index, count in enumerate(self._counts):
+                cumulative_count += count
+                if cumulative_count >= rank:
+                    if index == len(self._counts) - 1:  # the overflow bucket has no upper bound
+                        return self._max_latency
+
+                    return min(self._get_bucket_upper_bound(index), self._max_latency)
+
+            return self._max_latency
+
+    def reset(self):
+        """ Discards the recorded latencies. """
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self._count = 0
+            self._max_latency = 0.0
+
+    def _get_bucket_index(self, latency_in_seconds: float) -> int:
+        if latency_in_seconds <= LatencyHistogram.MIN_LATENCY_IN_SECONDS:
+            return 0
+
+        index = math.ceil(math.log10(latency_in_seconds / LatencyHistogram.MIN_LATENCY_IN_SECONDS)
+                          * self._buckets_per_decade)
+        return min(index, len(self._counts) - 1)
+
+    def _get_bucket_upper_bound(self, index: int) -> float:
+        return LatencyHistogram.MIN_LATENCY_IN_SECONDS * 10 ** (index / self._buckets_per_decade)
+
+    def __str__(self):
+        return f"count: {self.get_count()}, p50: {self.get_percentile(50) * 1e3:.3f}ms, " \
+               f"p99: {self.get_percentile(99) * 1e3:.3f}ms, max: {self.get_max() * 1e3:.3f}ms" \
+            if self.get_count() > 0 else "count: 0"
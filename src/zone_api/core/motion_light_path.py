@@ -0,0 +1,101 @@
+import time
+from typing import TYPE_CHECKING, Any, FrozenSet, Union
+
+from zone_api.core.action import Action
+from zone_api.core.actions.turn_off_adjacent_zones import TurnOffAdjacentZones
+from zone_api.core.actions.turn_on_switch import TurnOnSwitch
+from zone_api.core.event_info import EventInfo
+from zone_api.core.latency_histogram import LatencyHistogram
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+
+if TYPE_CHECKING:
+    from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+
+
+class MotionLightPath:
+    """
+    The :class:`TurnOnSwitch` processing of the MOTION events of a motion sensor in a zone, with everything that
+    doesn't depend on the event resolved at :meth:`ImmutableZoneManager.start`: the target switches, the switches of
+    the neighbors sharing the motion sensor, the master zones blocking the switches, and the action turning off the
+    adjacent zones. It takes the place of the (zone, TurnOnSwitch) pair in the event route of the sensor item, so the
+    action order and the dispatch engines are unchanged; only the validation wrapper and the per-event look-ups are
+    skipped.
+
+    The time from the openHAB event (see :meth:`mark_received`) to the first command sent to one of the zone's
+    switches is recorded in the zone manager's latency histogram.
+    """
+
+    def __init__(self, zone: Zone, action: TurnOnSwitch, zone_manager: 'ImmutableZoneManager',
+                 latency_histogram: LatencyHistogram):
+        self._zone = zone
+        self._action = action
+        self._zone_switches, self._their_switches, self._master_zones = \
+            TurnOnSwitch.get_switches_and_neighbors(zone, zone_manager)
+        self._switch_item_names = frozenset(s.get_item_name() for s in self._zone_switches)
+        self._turn_off_action = TurnOffAdjacentZones(action.parameters()).disable_filtering()
+        self._latency_histogram = latency_histogram
+        self._received_time: Union[float, None] = None
+
+    @staticmethod
+    def can_replace(action_obj: Any, zone: Zone) -> bool:
+        """
+        Returns True if the action is a TurnOnSwitch whose validation wrapper accepts all the MOTION events from the
+        items of the zone, based on its compiled filter plan.
+        """
+        if not isinstance(action_obj, TurnOnSwitch) or not isinstance(action_obj, Action):
+            return False
+
+        if len(action_obj.activity_types) > 0 or len(action_obj.excluded_activity_types) > 0:
+            return False
+
+        plan = action_obj.get_filter_plan(zone)
+        return plan is not None and plan.accepts_event_type(ZoneEvent.MOTION, True)
+
+    @property
+    def zone(self) -> Zone:
+        return self._zone
+
+    @property
+    def action(self) -> TurnOnSwitch:
+        return self._action
+
+    def mark_received(self, received_time: Union[float, None] = None):
+        """
+        Records the time (see time.perf_counter) the triggering openHAB event was received; the latency is measured
+        from that time on the next :meth:`on_action`.
+        """
+        self._received_time = received_time if received_time is not None else time.perf_counter()
+
+    def on_action(self, event_info: EventInfo) -> bool:
+        """ Same as :meth:`TurnOnSwitch.on_action`, for an event from the motion sensor of this path. """
+        events = event_info.get_event_dispatcher()
+
+        received_time = self._received_time
+        if received_time is not None:
+            self._received_time = None
+            events = _LatencyRecordingDispatcher(events, received_time, self._switch_item_names,
+                                                 self._latency_histogram)
+
+        return self._action.turn_on_switches(event_info, events, self._zone_switches, self._their_switches,
+                                             self._master_zones, self._turn_off_action)
+
+
+class _LatencyRecordingDispatcher:
+    """ Delegates to an event dispatcher, recording the latency of the first command sent to one of the items. """
+
+    def __init__(self, events, received_time: float, item_names: FrozenSet[str], histogram: LatencyHistogram):
+        self._events = events
+        self._received_time: Union[float, None] = received_time
+        self._item_names = item_names
+        self._histogram = histogram
+
+    def send_command(self, item_name: str, command: Any):
+        if self._received_time is not None and item_name in self._item_names:
+            self._histogram.record(time.perf_counter() - self._received_time)
+            self._received_time = None
+
+        self._events.send_command(item_name, command)
+
+    def __getattr__(self, name):
+        return getattr(self._events, name)
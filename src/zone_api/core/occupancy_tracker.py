@@ -0,0 +1,91 @@
+import threading
+from typing import Iterable, List, Tuple, Type, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
+
+
+class OccupancyTracker:
+    """
+    Answers :meth:`Zone.is_occupied` for the devices of a zone from a per device type table.
+
+    - Only the device types overriding :meth:`Device.is_occupied` are kept; the other devices (e.g. the temperature
+      sensors) never indicate occupancy and are not visited.
+    - For the types whose recent events indicate occupancy (see :attr:`Device.OCCUPIED_WHEN_RECENTLY_ACTIVATED`), the
+      table holds the last activated device of the type. It is updated as the activation events arrive, so that a
+      recent event is found without visiting the devices.
+    - Otherwise, the occupancy depends on the state of the items (e.g. a light is on); only the remaining devices
+      are asked.
+
+    The ignored device types are resolved once per distinct list.
+    """
+
+    def __init__(self, devices: Iterable[Device]):
+        devices_by_type: dict[Type, Tuple[Device, ...]] = {}
+        for d in devices:
+            if getattr(type(d), 'is_occupied', None) is not Device.is_occupied:
+                devices_by_type[type(d)] = devices_by_type.get(type(d), ()) + (d,)
+
+        self._devices_by_type = devices_by_type
+        self._lock = threading.Lock()
+
+        # map from device type to the (timestamp, device) of the last activated device of that type.
+        self._last_activations: dict[Type, Tuple[float, Device]] = {}
+        for device_type, type_devices in devices_by_type.items():
+            if getattr(device_type, 'OCCUPIED_WHEN_RECENTLY_ACTIVATED', False) is True:
+                for d in type_devices:
+                    d.add_activation_listener(self)
+                self._update_last_activation(device_type)
+
+        # map from the tuple of ignored device types to the device types to check.
+        self._types_by_ignored_types: dict[Tuple[Type, ...], Tuple[Type, ...]] = {}
+
+    def is_occupied(self, ignored_device_types: Union[List[Type], None] = None,
+                    seconds_from_last_event: float = 5 * 60) -> Tuple[bool, Union[Device, None]]:
+        """ See :meth:`Zone.is_occupied`; a recently activated device is returned ahead of a device in use. """
+        device_types = self._get_device_types(ignored_device_types)
+
+        now = pe.get_clock().time()
+        for device_type in device_types:
+            last_activation = self._last_activations.get(device_type)
+            if last_activation is not None and (now - last_activation[0]) <= seconds_from_last_event:
+                return True, last_activation[1]
+
+        for device_type in device_types:
+            for d in self._devices_by_type[device_type]:
+                if d.is_occupied(seconds_from_last_event):
+                    return True, d
+
+        return False, None
+
+    def on_device_activated(self, device: Device, timestamp: float):
+        """ Invoked by the devices; see :meth:`Device.add_activation_listener`. """
+        device_type = type(device)
+        if device not in self._devices_by_type.get(device_type, ()):
+            return
+
+        with self._lock:
+            last_activation = self._last_activations.get(device_type)
+            if last_activation is None or timestamp >= last_activation[0]:
+                self._last_activations[device_type] = (timestamp, device)
+            elif last_activation[1] is device:
+                # The timestamp of the last activated device was set back; look for the new last activated device.
+                self._update_last_activation(device_type)
+
+    def _update_last_activation(self, device_type: Type):
+        activations = [(d.get_last_activated_timestamp(), d) for d in self._devices_by_type[device_type]
+                       if d.get_last_activated_timestamp() is not None]
+        if len(activations) > 0:
+            self._last_activations[device_type] = max(activations, key=lambda a: a[0])
+        else:
+            self._last_activations.pop(device_type, None)
+
+    def _get_device_types(self, ignored_device_types: Union[List[Type], None]) -> Tuple[Type, ...]:
+        key = tuple(ignored_device_types) if ignored_device_types is not None else ()
+
+        device_types = self._types_by_ignored_types.get(key)
+        if device_types is None:
+            device_types = tuple(t for t in self._devices_by_type.keys() if not issubclass(t, key))
+            self._types_by_ignored_types[key] = device_types
+
+        return device_types
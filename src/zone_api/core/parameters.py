@@ -1,5 +1,5 @@
 from numbers import Number
-from typing import Any, TYPE_CHECKING, Callable, List, Tuple, Type
+from typing import Any, TYPE_CHECKING, Callable, Collection, List, Tuple, Type
 
 if TYPE_CHECKING:
     from zone_api.core.action import Action
@@ -37,12 +37,15 @@ class Parameters(object):
 
         return self.get_by_type(action.__class__, name, default)
 
-    def validate(self, action_types: List[Type]) -> Tuple[bool, List[str]]:
+    def validate(self, action_types: List[Type], skipped_action_type_names: Collection[str] = ()) \
+            -> Tuple[bool, List[str]]:
         """
         Validates if the values contained in this object are supported by the provided action types. Specifically, If a
         value is specified, it must be supported by the action action_type::supported_parameters() and it must pass the
         validation.
 
+        :param skipped_action_type_names: the names of the valid action types whose values are not validated (e.g.
+            the disabled actions, which are not loaded).
         :return: a tuple of boolean value and a list of errors
         """
         error_messages = []
@@ -53,7 +56,7 @@ class Parameters(object):
 
         # Scan for keys in invalid actions
         defined_unique_type_names = self.unique_action_type_names()
-        provided_unique_type_names = set([a.__name__ for a in action_types])
+        provided_unique_type_names = set([a.__name__ for a in action_types]) | set(skipped_action_type_names)
 
         invalid_type_names = [d for d in defined_unique_type_names if d not in provided_unique_type_names]
         if len(invalid_type_names) > 0:
@@ -0,0 +1,292 @@
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, List, Tuple, Union
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
+from zone_api.core.event_info import EventInfo
+from zone_api.core.motion_light_path import MotionLightPath
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+
+if TYPE_CHECKING:
+    from zone_api.core.action import Action
+    from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+
+
+class ShardStatistics:
+    """ A snapshot of the work processed by a shard of the :class:`ShardedDispatcher`. """
+
+    def __init__(self, queue_depth: int, processed_count: int, total_latency_in_seconds: float,
+                 max_latency_in_seconds: float):
+        self._queue_depth = queue_depth
+        self._processed_count = processed_count
+        self._total_latency_in_seconds = total_latency_in_seconds
+        self._max_latency_in_seconds = max_latency_in_seconds
+
+    @property
+    def queue_depth(self) -> int:
+        """ Returns the number of deliveries waiting in the shard's queue. """
+        return self._queue_depth
+
+    @property
+    def processed_count(self) -> int:
+        """ Returns the number of deliveries processed by the shard. """
+        return self._processed_count
+
+    @property
+    def average_latency_in_seconds(self) -> float:
+        """ Returns the average time between the queuing of a delivery and its completion. """
+        if self._processed_count == 0:
+            return 0.0
+
+        return self._total_latency_in_seconds / self._processed_count
+
+    @property
+    def max_latency_in_seconds(self) -> float:
+        """ Returns the longest time between the queuing of a delivery and its completion. """
+        return self._max_latency_in_seconds
+
+    def __str__(self):
+        return f"depth: {self.queue_depth}, processed: {self.processed_count}, " \
+               f"avg latency: {self.average_latency_in_seconds:.3f}s, max latency: {self.max_latency_in_seconds:.3f}s"
+
+
+class _Shard:
+    """ A worker thread processing the deliveries of its zones in FIFO order. """
+
+    def __init__(self, index: int):
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._processed_count = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._thread = threading.Thread(target=self._run, name=f'ZoneApisShard-{index}', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """ Waits for the queued deliveries to be processed, then stops the thread. """
+        self._queue.put(None)
+        self._thread.join()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def put(self, fcn: Callable[[], bool]) -> Future:
+        future: Future = Future()
+        self._queue.put((fcn, future, time.monotonic()))
+        return future
+
+    def get_statistics(self) -> ShardStatistics:
+        with self._lock:
+            return ShardStatistics(self._queue.qsize(), self._processed_count, self._total_latency,
+                                   self._max_latency)
+
+    def _run(self):
+        while True:
+            work = self._queue.get()
+            if work is None:
+                break
+
+            fcn, future, queued_time = work
+            try:
+                future.set_result(fcn())
+            except Exception as e:
+                pe.log_error("ShardedDispatcher: " + traceback.format_exc())
+                future.set_exception(e)
+
+            latency = time.monotonic() - queued_time
+            with self._lock:
+                self._processed_count += 1
+                self._total_latency += latency
+                self._max_latency = max(self._max_latency, latency)
+
+
+class ShardedDispatcher:
+    """
+    An optional event dispatch engine that shards the deliveries by zone onto a fixed number of worker threads.
+
+    Each zone is assigned to exactly one shard, and each shard processes its queue in order, so the actions of a zone
+    see the events in the order they were submitted, in the priority order of the route. Deliveries to different
+    zones run in parallel. An event accepted by several zones (e.g. via ``external_events``) is split per zone, and
+    each part is queued to the shard of the receiving zone.
+
+    An action instance may be shared by several zones (see zone_parser.add_actions), and thus by several shards; each
+    invocation holds a lock of the action instance (a :class:`MotionLightPath` uses the lock of its action), so an
+    action is never invoked concurrently.
+    """
+
+    DEFAULT_NUMBER_OF_SHARDS = 4
+
+    def __init__(self, zone_manager: 'ImmutableZoneManager', number_of_shards: int = DEFAULT_NUMBER_OF_SHARDS):
+        """
+        :param ImmutableZoneManager zone_manager: the zone manager providing the routing table
+        :param int number_of_shards: the number of worker threads
+        """
+        if number_of_shards <= 0:
+            raise ValueError('number_of_shards must be positive')
+
+        self._zone_manager = zone_manager
+        self._number_of_shards = number_of_shards
+        self._shards: Union[List[_Shard], None] = None
+
+        # map from zone id to shard index; zones are assigned round-robin on first use.
+        self._zone_id_to_shard: dict[str, int] = {}
+        # map from action id to the lock serializing the invocations of the action; created on first use.
+        self._action_locks: dict[int, threading.RLock] = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """ Starts the shard threads. This method is idempotent. """
+        if self.is_running():
+            return
+
+        shards = [_Shard(i) for i in range(self._number_of_shards)]
+        for shard in shards:
+            shard.start()
+        self._shards = shards
+
+        pe.log_info(f"Started the sharded event dispatcher with {self._number_of_shards} shards.")
+
+    def stop(self):
+        """ Processes the queued deliveries, then stops the shard threads. """
+        if not self.is_running():
+            return
+
+        shards = self._shards
+        self._shards = None
+        for shard in shards:
+            shard.stop()
+
+        pe.log_info("Stopped the sharded event dispatcher.")
+
+    def is_running(self) -> bool:
+        """ Returns True if the shard threads are running. """
+        shards = self._shards
+        return shards is not None and all(s.is_alive() for s in shards)
+
+    def get_shard_index(self, zone: Zone) -> int:
+        """ Returns the index of the shard processing the deliveries to the given zone. """
+        index = self._zone_id_to_shard.get(zone.get_id())
+        if index is None:
+            with self._lock:
+                index = self._zone_id_to_shard.setdefault(
+                    zone.get_id(), len(self._zone_id_to_shard) % self._number_of_shards)
+
+        return index
+
+    def get_action_lock(self, action: Union['Action', MotionLightPath]) -> threading.RLock:
+        """
+        Returns the lock held while the given action instance is invoked, in any zone. A :class:`MotionLightPath`
+        uses the lock of its action.
+        """
+        if isinstance(action, MotionLightPath):
+            action = action.action
+
+        key = id(action)
+        lock = self._action_locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._action_locks.setdefault(key, threading.RLock())
+
+        return lock
+
+    def get_queue_depths(self) -> List[int]:
+        """ Returns the number of deliveries waiting in each shard's queue. """
+        return [s.queue_depth for s in self.get_statistics()]
+
+    def get_statistics(self) -> List[ShardStatistics]:
+        """ Returns the statistics of each shard; an empty list if the dispatcher isn't running. """
+        shards = self._shards
+        if shards is None:
+            return []
+
+        return [s.get_statistics() for s in shards]
+
+    def submit(self, zone_event: ZoneEvent, open_hab_events, device: Device, item) -> List[Future]:
+        """
+        Queues the event to the shards of the zones that may accept it and returns immediately.
+
+        :return: one future per receiving zone, resolving to True if at least one action of that zone processed the
+            event.
+        :raise RuntimeError: if the dispatcher isn't running.
+        """
+        shards = self._shards
+        if shards is None:
+            raise RuntimeError('The sharded dispatcher is not running.')
+
+        zm = self._zone_manager
+        owning_zone = zm.get_zone_by_item_name(pe.get_item_name(item))
+
+        # noinspection PyProtectedMember
+        route = zm._get_event_route(zone_event, pe.get_item_name(item))
+        if route is None:
+            zones = zm.get_zones()
+            if owning_zone is not None:
+                zones = [owning_zone] + [z for z in zones if z is not owning_zone]
+
+            return [shards[self.get_shard_index(z)].put(
+                self._create_broadcast_work(z, zone_event, open_hab_events, device, item, owning_zone))
+                for z in zones]
+
+        futures = []
+        for zone, actions in self._group_by_zone(route):
+            event_info = EventInfo(zone_event, item, zone, zm, open_hab_events, owning_zone, device)
+            futures.append(shards[self.get_shard_index(zone)].put(self._create_work(actions, event_info)))
+
+        return futures
+
+    def _create_broadcast_work(self, zone: Zone, zone_event: ZoneEvent, open_hab_events, device: Device, item,
+                               owning_zone: Zone) -> Callable[[], bool]:
+        zm = self._zone_manager
+        if type(zone).dispatch_event is not Zone.dispatch_event:
+            # The actions receiving the event aren't known in advance; they are invoked without their locks.
+            return lambda: zone.dispatch_event(zone_event, open_hab_events, device, item, zm, owning_zone)
+
+        event_info = EventInfo(zone_event, item, zone, zm, open_hab_events, owning_zone, device)
+        return self._create_work(self._get_actions(zone, zone_event), event_info)
+
+    def _create_work(self, actions: List['Action'], event_info: EventInfo) -> Callable[[], bool]:
+        zone_event = event_info.get_event_type()
+
+        def work():
+            processed = False
+            for a in actions:
+                with self.get_action_lock(a):
+                    if zone_event == ZoneEvent.STARTUP:
+                        a.on_startup(event_info)
+                        processed = True
+                    elif zone_event == ZoneEvent.DESTROY:
+                        a.on_destroy(event_info)
+                        processed = True
+                    elif Zone.invoke_action(a, event_info):
+                        processed = True
+
+            return processed
+
+        return work
+
+    @staticmethod
+    def _get_actions(zone: Zone, zone_event: ZoneEvent) -> List['Action']:
+        """ Returns the actions invoked by :meth:`Zone.dispatch_event` for the event, in invocation order. """
+        if zone_event in [ZoneEvent.STARTUP, ZoneEvent.DESTROY]:
+            # noinspection PyProtectedMember
+            return zone._unique_actions()
+
+        return zone.get_actions(zone_event)
+
+    @staticmethod
+    def _group_by_zone(route: Tuple[Tuple[Zone, 'Action'], ...]) -> List[Tuple[Zone, List['Action']]]:
+        """ Splits the route into (zone, actions) groups; the pairs of a zone are contiguous in a route. """
+        groups: List[Tuple[Zone, List['Action']]] = []
+        for zone, a in route:
+            if len(groups) == 0 or groups[-1][0] is not zone:
+                groups.append((zone, []))
+            groups[-1][1].append(a)
+
+        return groups
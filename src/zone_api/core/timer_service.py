@@ -0,0 +1,326 @@
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Tuple, Union
+
+from zone_api import platform_encapsulator as pe
+
+
+class Timer:
+    """
+    A drop-in replacement for threading.Timer backed by a shared :class:`TimerService`; the timer doesn't own a
+    thread. As with threading.Timer, the timer is armed by :meth:`start`, and :meth:`is_alive` returns True until the
+    function has completed or the timer has been cancelled.
+
+    A function that may block (e.g. sending an alert, playing an audio message or dispatching an event to the
+    actions) must be run by a blocking timer; see :class:`TimerService`.
+    """
+
+    _NEW = 0
+    _SCHEDULED = 1
+    _RUNNING = 2
+    _FINISHED = 3
+
+    def __init__(self, interval: float, function: Callable, args=None, kwargs=None,
+                 timer_service: Union['TimerService', None] = None, blocking: bool = False):
+        """
+        :param float interval: the delay in seconds before the function is invoked.
+        :param function: the function to invoke.
+        :param TimerService timer_service: the service running the timer; defaults to the shared instance.
+        :param bool blocking: if set, the function may block for a long time; it is run on its own thread instead of
+            the worker pool of the service.
+        """
+        self.interval = interval
+        self.function = function
+        self.args = args if args is not None else []
+        self.kwargs = kwargs if kwargs is not None else {}
+        self.blocking = blocking
+
+        self._timer_service = timer_service
+        self._state = Timer._NEW
+        self._deadline: float = 0
+
+    def start(self):
+        """ Arms the timer. """
+        if self._state != Timer._NEW:
+            raise RuntimeError('timers can only be started once')
+
+        service = self._timer_service if self._timer_service is not None else get_timer_service()
+        self._timer_service = service
+        service.schedule_timer(self, self.interval)
+
+    def cancel(self):
+        """ Stops the timer if it hasn't fired yet; the function won't be invoked. """
+        service = self._timer_service
+        if service is None:
+            if self._state == Timer._NEW:
+                self._state = Timer._FINISHED
+        else:
+            service.cancel_timer(self)
+
+    def renew(self, interval: Union[float, None] = None):
+        """
+        Pushes the deadline to ``interval`` (or the original interval) seconds from now. If the timer isn't
+        scheduled anymore (never started, fired or cancelled), it is rescheduled.
+        """
+        if interval is not None:
+            self.interval = interval
+
+        service = self._timer_service if self._timer_service is not None else get_timer_service()
+        self._timer_service = service
+        service.renew_timer(self, self.interval)
+
+    def is_alive(self) -> bool:
+        """ Returns True if the timer is scheduled, or its function is running. """
+        return self._state in (Timer._SCHEDULED, Timer._RUNNING)
+
+    def is_scheduled(self) -> bool:
+        """ Returns True if the timer is waiting for its deadline. """
+        return self._state == Timer._SCHEDULED
+
+    def _run(self):
+        try:
+            self.function(*self.args, **self.kwargs)
+        except Exception:
+            pe.log_error("Timer: " + traceback.format_exc())
+        finally:
+            self._timer_service.complete_timer(self)
+
+
+class TimerService:
+    """
+    Runs the :class:`Timer` objects with a single scheduling thread, and a small pool of worker threads executing
+    the expired timer functions (so that a slow function doesn't delay the other timers).
+
+    The pool is only meant for the short functions, such as turning off a switch or resetting the state of an action.
+    The functions of the blocking timers (see :meth:`schedule_blocking`) are run on a thread of their own, as with
+    threading.Timer, so that a few of them (e.g. alerts playing an audio message) can't starve the pool.
+
+    The timers are kept in a heap ordered by deadline. Cancelling a timer only flags it, and renewing it to a later
+    deadline only updates the deadline stored in the timer; the stale heap entry is re-pushed or discarded when it
+    reaches the top. This keeps cancel and renew O(1) for the common case of motion sensors renewing the timers of
+    the switches, while the scheduling thread sleeps until the next deadline instead of ticking.
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, clock_fcn: Callable[[], float] = time.monotonic):
+        if max_workers <= 0:
+            raise ValueError('max_workers must be positive')
+
+        self._max_workers = max_workers
+        self._clock_fcn = clock_fcn
+
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._sequence = itertools.count()
+        self._thread: Union[threading.Thread, None] = None
+        self._executor: Union[ThreadPoolExecutor, None] = None
+        self._stopping = False
+
+    def schedule(self, delay_in_seconds: float, function: Callable, *args: Any, **kwargs: Any) -> Timer:
+        """ Creates, starts and returns a timer invoking the function after the given delay. """
+        timer = Timer(delay_in_seconds, function, args, kwargs, timer_service=self)
+        timer.start()
+        return timer
+
+    def schedule_blocking(self, delay_in_seconds: float, function: Callable, *args: Any, **kwargs: Any) -> Timer:
+        """ Same as :meth:`schedule`, for a function that may block; see :attr:`Timer.blocking`. """
+        timer = Timer(delay_in_seconds, function, args, kwargs, timer_service=self, blocking=True)
+        timer.start()
+        return timer
+
+    def schedule_timer(self, timer: Timer, delay_in_seconds: float):
+        """ Schedules the timer; invoked by :meth:`Timer.start`. """
+        with self._condition:
+            self._ensure_started()
+
+            # noinspection PyProtectedMember
+            timer._deadline = self._clock_fcn() + delay_in_seconds
+            # noinspection PyProtectedMember
+            timer._state = Timer._SCHEDULED
+            self._push(timer)
+
+    def renew_timer(self, timer: Timer, delay_in_seconds: float):
+        """
+        Moves the deadline of a scheduled timer, or reschedules a timer that isn't scheduled anymore; invoked by
+        :meth:`Timer.renew`. The state is checked and updated with the lock held, so a renewal racing with the
+        expiry of the timer either moves the deadline before it expires, or schedules it again after it has fired.
+        """
+        with self._condition:
+            # noinspection PyProtectedMember
+            if timer._state != Timer._SCHEDULED:
+                self._ensure_started()
+
+                # noinspection PyProtectedMember
+                timer._deadline = self._clock_fcn() + delay_in_seconds
+                # noinspection PyProtectedMember
+                timer._state = Timer._SCHEDULED
+                self._push(timer)
+                return
+
+            # noinspection PyProtectedMember
+            previous_deadline = timer._deadline
+            # noinspection PyProtectedMember
+            timer._deadline = self._clock_fcn() + delay_in_seconds
+            # noinspection PyProtectedMember
+            if timer._deadline < previous_deadline:
+                self._push(timer)
+
+    def complete_timer(self, timer: Timer):
+        """ Marks the timer as finished once its function has returned, unless it was renewed in the meantime. """
+        with self._condition:
+            # noinspection PyProtectedMember
+            if timer._state == Timer._RUNNING:
+                # noinspection PyProtectedMember
+                timer._state = Timer._FINISHED
+
+    def cancel_timer(self, timer: Timer):
+        """ Cancels the timer if it hasn't fired yet; invoked by :meth:`Timer.cancel`. """
+        with self._condition:
+            # noinspection PyProtectedMember
+            if timer._state in (Timer._NEW, Timer._SCHEDULED):
+                # noinspection PyProtectedMember
+                timer._state = Timer._FINISHED
+
+    def get_pending_count(self) -> int:
+        """ Returns the number of heap entries, including the ones of the cancelled timers not yet discarded. """
+        with self._condition:
+            return len(self._heap)
+
+    def stop(self):
+        """ Stops the scheduling thread; the pending timers won't fire. """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+
+            self._stopping = True
+            for entry in self._heap:
+                entry[2].cancel()
+            self._heap.clear()
+            self._condition.notify_all()
+
+        thread.join()
+        self._executor.shutdown(wait=False)
+
+        with self._condition:
+            self._thread = None
+            self._executor = None
+            self._stopping = False
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                thread_name_prefix='ZoneApisTimerWorker')
+            self._thread = threading.Thread(target=self._run, name='ZoneApisTimerService', daemon=True)
+            self._thread.start()
+
+    def _push(self, timer: Timer):
+        # noinspection PyProtectedMember
+        heapq.heappush(self._heap, (timer._deadline, next(self._sequence), timer))
+        if self._heap[0][2] is timer:
+            self._condition.notify()
+
+    def _discard_stale_entries(self):
+        """
+        Pops the heap entries of the cancelled timers, and of the renewed timers (re-pushed with the new deadline if
+        it is later), until the top entry is valid. Must be invoked with the condition held.
+        """
+        while len(self._heap) > 0:
+            deadline, _, timer = self._heap[0]
+            # noinspection PyProtectedMember
+            if timer._state == Timer._SCHEDULED and timer._deadline == deadline:
+                return
+
+            heapq.heappop(self._heap)
+            # noinspection PyProtectedMember
+            if timer._state == Timer._SCHEDULED and timer._deadline > deadline:
+                self._push(timer)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                expired_timer = None
+                while expired_timer is None and not self._stopping:
+                    self._discard_stale_entries()
+                    if len(self._heap) == 0:
+                        self._condition.wait()
+                        continue
+
+                    deadline, _, timer = self._heap[0]
+                    wait_time = deadline - self._clock_fcn()
+                    if wait_time > 0:
+                        self._condition.wait(wait_time)
+                        continue
+
+                    heapq.heappop(self._heap)
+                    # noinspection PyProtectedMember
+                    timer._state = Timer._RUNNING
+                    expired_timer = timer
+
+                if self._stopping:
+                    break
+
+                executor = self._executor
+
+            if expired_timer.blocking:
+                # noinspection PyProtectedMember
+                threading.Thread(target=expired_timer._run, name='ZoneApisBlockingTimer', daemon=True).start()
+            else:
+                # noinspection PyProtectedMember
+                executor.submit(expired_timer._run)
+
+
+class VirtualTimerService(TimerService):
+    """
+    A TimerService without threads, for a virtual clock: the expired timers are run synchronously, on the calling
+    thread, by :meth:`run_expired_timers`.
+    """
+
+    def __init__(self, clock_fcn: Callable[[], float]):
+        super().__init__(1, clock_fcn)
+
+    def get_next_deadline(self) -> Union[float, None]:
+        """ Returns the deadline of the next timer, or None if there is no scheduled timer. """
+        with self._condition:
+            self._discard_stale_entries()
+            return self._heap[0][0] if len(self._heap) > 0 else None
+
+    def run_expired_timers(self) -> int:
+        """ Runs the timers whose deadline has passed, in deadline order; returns the number of timers run. """
+        count = 0
+        while True:
+            with self._condition:
+                self._discard_stale_entries()
+                if len(self._heap) == 0 or self._heap[0][0] > self._clock_fcn():
+                    return count
+
+                _, _, timer = heapq.heappop(self._heap)
+                # noinspection PyProtectedMember
+                timer._state = Timer._RUNNING
+
+            # noinspection PyProtectedMember
+            timer._run()
+            count += 1
+
+    def stop(self):
+        """ Cancels the pending timers. """
+        with self._condition:
+            for entry in self._heap:
+                entry[2].cancel()
+            self._heap.clear()
+
+    def _ensure_started(self):
+        pass
+
+
+def get_timer_service() -> TimerService:
+    """
+    Returns the TimerService instance shared by the timers created without an explicit service; this is the service
+    of the platform clock (see platform_encapsulator.get_clock()).
+    """
+    return pe.get_clock().get_timer_service()
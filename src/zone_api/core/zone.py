@@ -1,5 +1,6 @@
 from enum import Enum, unique
-from typing import List, Union
+from types import MappingProxyType
+from typing import List, Union, Tuple
 import traceback
 
 from zone_api.core.action import Action
@@ -9,6 +10,7 @@ from zone_api.core.device import Device
 from zone_api.core.devices.illuminance_sensor import IlluminanceSensor
 from zone_api.core.devices.switch import Light, Switch
 from zone_api.core.neighbor import Neighbor
+from zone_api.core.occupancy_tracker import OccupancyTracker
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.zone_event import ZoneEvent
@@ -41,7 +43,8 @@ class Zone:
     Each zone instance is IMMUTABLE. The various add/remove methods return a new
     Zone object. Note however that the OpenHab item underlying each
     device/sensor is not (the state changes).  See :meth:`add_device`,
-    :meth:`remove_device`, :meth:`add_neighbor()`
+    :meth:`remove_device`, :meth:`add_neighbor()`. To add many devices or
+    actions, use a :class:`.ZoneBuilder` instead.
 
     The zone itself doesn't know how to operate a device/sensor. The sensors
     themselves (all sensors derive from Device class) exposes the possible
@@ -132,6 +135,23 @@ class Zone:
         self.displayIcon = display_icon
         self.displayOrder = display_order
 
+        # map from the name of every item of every device to the devices containing that item, in device order.
+        item_name_to_devices = {}
+        for d in self.devices:
+            for item_name in d.get_all_item_names():
+                item_name_to_devices[item_name] = item_name_to_devices.get(item_name, ()) + (d,)
+        self._item_name_to_devices = MappingProxyType(item_name_to_devices)
+
+        # map from every class in the MRO of every device to the devices of that class, in device order.
+        type_to_devices = {}
+        for d in self.devices:
+            for cls in type(d).__mro__:
+                type_to_devices[cls] = type_to_devices.get(cls, ()) + (d,)
+        self._type_to_devices = type_to_devices
+
+        # built on the first is_occupied call, as most zones (e.g. the intermediate copies) are never checked.
+        self._occupancy_tracker: Union[OccupancyTracker, None] = None
+
     def add_device(self, device):
         """
         Creates a new zone that is an exact copy of this one, but has the
@@ -190,16 +210,23 @@ class Zone:
         """
         return [d for d in self.devices]
 
-    def get_devices_by_type(self, cls: type):
+    def get_devices_by_type(self, cls: type) -> Tuple[Device, ...]:
         """
-        Returns a list of devices matching the given type.
+        Returns a read-only tuple of the devices matching the given type (including its subclasses).
 
         :param type cls: the device type
-        :rtype: list(Device)
+        :rtype: tuple(Device)
         """
         if cls is None:
             raise ValueError('cls must not be None')
-        return [d for d in self.devices if isinstance(d, cls)]
+
+        devices = self._type_to_devices.get(cls)
+        if devices is None:
+            # Not in any device's MRO; fall back to isinstance for virtual subclasses (e.g. ABC.register).
+            devices = tuple(d for d in self.devices if isinstance(d, cls))
+            self._type_to_devices[cls] = devices
+
+        return devices
 
     def get_first_device_by_type(self, cls: type):
         """
@@ -222,8 +249,16 @@ class Zone:
         if event_info is None:
             raise ValueError('eventInfo must not be None')
 
-        return next((d for d in self.devices
-                     if d.contains_item(event_info.get_item())), None)
+        devices = self.get_devices_by_item_name(pe.get_item_name(event_info.get_item()))
+        return devices[0] if len(devices) > 0 else None
+
+    def get_devices_by_item_name(self, item_name: str) -> Tuple[Device, ...]:
+        """
+        Returns the devices containing the item with the given name (as their main item or an additional item).
+
+        :rtype: tuple(Device) an empty tuple if no device contains the item
+        """
+        return self._item_name_to_devices.get(item_name, ())
 
     def add_neighbor(self, neighbor):
         """
@@ -260,8 +295,8 @@ class Zone:
         events = set(action.required_events + action.external_events)
         for zone_event in events:
             if zone_event in new_actions:
-                new_actions[zone_event].append(action)
-                new_actions[zone_event].sort(key=lambda a: a.priority)
+                # a new list, as the current one is shared with this zone.
+                new_actions[zone_event] = sorted(new_actions[zone_event] + [action], key=lambda a: a.priority)
             else:
                 new_actions[zone_event] = [action]
 
@@ -290,6 +325,15 @@ class Zone:
 
         return False
 
+    def compile_action_filter_plans(self):
+        """
+        Compiles the filter plan of each action for this zone. As the zone is immutable, the plans stay valid for
+        the lifetime of this object. See :meth:`.Action.compile_filter_plan`.
+        """
+        for action in self._unique_actions():
+            if isinstance(action, Action):
+                action.compile_filter_plan(self)
+
     def get_id(self):
         """ :rtype: str """
         return self.get_level().value + '_' + self.get_name()
@@ -335,7 +379,8 @@ class Zone:
         """
         :param zone_manager:
         :param list(NeighborType) neighbor_types: optional
-        :return: a list of neighboring zones for the provided neighbor type (optional).
+        :return: a list of neighboring zones for the provided neighbor type (optional); a neighbor id that doesn't
+            resolve to a zone yields None.
         :rtype: list(Zone)
         """
         if neighbor_types is None:
@@ -344,7 +389,14 @@ class Zone:
         if zone_manager is None:
             raise ValueError('zoneManager must not be None')
 
-        if neighbor_types is None or len(neighbor_types) == 0:
+        # Served from the precomputed topology when it covers this zone and all its neighbors.
+        get_zone_topology = getattr(zone_manager, 'get_zone_topology', None)
+        if get_zone_topology is not None:
+            topology = get_zone_topology()
+            if topology.resolves_all_neighbors(self) is True:
+                return list(topology.get_neighbor_zones(self, neighbor_types))
+
+        if len(neighbor_types) == 0:
             zones = [zone_manager.get_zone_by_id(n.get_zone_id())
                      for n in self.neighbors]
         else:
@@ -365,9 +417,11 @@ class Zone:
             search for all devices/sensors.
         :rtype: bool
         """
-        sensors = self.get_devices() if sensor_type is None \
-            else self.get_devices_by_type(sensor_type)
-        return any(s.contains_item(item) for s in sensors)
+        devices = self.get_devices_by_item_name(pe.get_item_name(item))
+        if sensor_type is None:
+            return len(devices) > 0
+        else:
+            return any(isinstance(d, sensor_type) for d in devices)
 
     def get_illuminance_level(self):
         """
@@ -392,20 +446,20 @@ class Zone:
         If the first list item is True, then the second value is the Device that indicates occupancy; otherwise it i
         None.
 
+        The check is done by an :class:`.OccupancyTracker`; if several devices indicate occupancy, a device with a
+        recent event is returned first.
+
         :param seconds_from_last_event:
         :param list(Device) ignored_device_types: the devices not to be
             considered for the occupancy check.
         :rtype: list(bool, Device)
         """
-        if ignored_device_types is None:
-            ignored_device_types = []
+        tracker = self._occupancy_tracker
+        if tracker is None:
+            tracker = OccupancyTracker(self.devices)
+            self._occupancy_tracker = tracker
 
-        for device in self.get_devices():
-            if not any(isinstance(device, deviceType) for deviceType in ignored_device_types):
-                if device.is_occupied(seconds_from_last_event):
-                    return True, device
-
-        return False, None
+        return tracker.is_occupied(ignored_device_types, seconds_from_last_event)
 
     def is_light_on(self):
         """
@@ -466,7 +520,7 @@ class Zone:
         event_info = EventInfo(ZoneEvent.SWITCH_TURNED_ON, item, self,
                                immutable_zone_manager, events)
 
-        switches = self.get_devices_by_type(Switch)
+        switches = [d for d in self.get_devices_by_item_name(pe.get_item_name(item)) if isinstance(d, Switch)]
         for switch in switches:
             if switch.on_switch_turned_on(events, pe.get_item_name(item)):
                 for a in actions:
@@ -492,7 +546,7 @@ class Zone:
         is_processed = False
         actions = self.get_actions(ZoneEvent.SWITCH_TURNED_OFF)
 
-        switches = self.get_devices_by_type(Switch)
+        switches = [d for d in self.get_devices_by_item_name(pe.get_item_name(item)) if isinstance(d, Switch)]
         for switch in switches:
             if switch.get_item().name == item.name:
                 if switch.on_switch_turned_off(events, pe.get_item_name(item)):
@@ -531,14 +585,25 @@ class Zone:
             processed = True
         else:
             for a in self.get_actions(zone_event):
-                try:
-                    if a.on_action(event_info):
-                        processed = True
-                except Exception as e:
-                    pe.log_error("dispatch_event: " + traceback.format_exc())
+                if Zone.invoke_action(a, event_info):
+                    processed = True
 
         return processed
 
+    @staticmethod
+    def invoke_action(action: Action, event_info: EventInfo) -> bool:
+        """
+        Invokes the action's on_action method. Any exception raised by the action is logged and swallowed so that
+        the other actions still get the event.
+
+        :return: the value returned by the action, or False if the action raised an exception.
+        """
+        try:
+            return bool(action.on_action(event_info))
+        except Exception:
+            pe.log_error("dispatch_event: " + traceback.format_exc())
+            return False
+
     def _unique_actions(self) -> List:
         """ Returns a list of unique actions (the same action might be mapped to multiple events). """
         result = []
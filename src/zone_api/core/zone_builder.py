@@ -0,0 +1,95 @@
+from typing import Dict, Iterable, List
+
+from zone_api.core.device import Device
+from zone_api.core.neighbor import Neighbor
+from zone_api.core.zone import Level, Zone
+from zone_api.core.zone_event import ZoneEvent
+
+
+class ZoneBuilder:
+    """
+    Accumulates the devices, neighbors and actions of a zone, then creates the :class:`.Zone` in one go with
+    :meth:`build`. Adding n devices or actions through the Zone's add methods copies the zone n times, and re-sorts
+    the action list of the event on each action; the builder appends in place, and sorts each action list once.
+
+    The builder is mutable and not thread-safe; the zones it creates are immutable and don't share any list with the
+    builder.
+    """
+
+    def __init__(self, name: str, level: Level = Level.UNDEFINED, external: bool = False, display_icon=None,
+                 display_order: int = 9999):
+        """ See :meth:`.Zone.__init__`. """
+        self._name = name
+        self._level = level
+        self._external = external
+        self._display_icon = display_icon
+        self._display_order = display_order
+        self._devices: List[Device] = []
+        self._neighbors: List[Neighbor] = []
+        self._actions: Dict[ZoneEvent, List] = {}
+
+    @classmethod
+    def from_zone(cls, zone: Zone) -> 'ZoneBuilder':
+        """ Returns a builder initialized with the attributes, devices, neighbors and actions of the zone. """
+        builder = cls(zone.get_name(), zone.get_level(), zone.is_external(), zone.get_display_icon(),
+                      zone.get_display_order())
+        builder._devices = zone.get_devices()
+        builder._neighbors = zone.get_neighbors()
+        builder._actions = {zone_event: list(action_list) for zone_event, action_list in zone.actions.items()}
+
+        return builder
+
+    def get_id(self) -> str:
+        """ Returns the id of the zone being built; see :meth:`.Zone.get_id`. """
+        return self._level.value + '_' + self._name
+
+    def add_device(self, device: Device) -> 'ZoneBuilder':
+        """
+        Adds the device; see :meth:`.Zone.add_device`.
+
+        :raise ValueError: if device is None or is not a subclass of :class:`.Device`
+        """
+        if device is None:
+            raise ValueError('device must not be None')
+
+        if not isinstance(device, Device):
+            raise ValueError('device must be an instance of Device')
+
+        self._devices.append(device)
+        return self
+
+    def add_devices(self, devices: Iterable[Device]) -> 'ZoneBuilder':
+        """ Adds the devices in order; see :meth:`add_device`. """
+        for device in devices:
+            self.add_device(device)
+
+        return self
+
+    def add_neighbor(self, neighbor: Neighbor) -> 'ZoneBuilder':
+        """ Adds the neighbor; see :meth:`.Zone.add_neighbor`. """
+        if neighbor is None:
+            raise ValueError('neighbor must not be None')
+
+        self._neighbors.append(neighbor)
+        return self
+
+    def add_action(self, action) -> 'ZoneBuilder':
+        """
+        Adds the action to the list of each of its required and external events; see :meth:`.Zone.add_action`. The
+        lists are sorted by priority on :meth:`build`, keeping the insertion order of the actions of the same priority.
+        """
+        if len(action.required_events) == 0:
+            raise ValueError('Action must define at least one triggering event')
+
+        for zone_event in set(action.required_events + action.external_events):
+            self._actions.setdefault(zone_event, []).append(action)
+
+        return self
+
+    def build(self) -> Zone:
+        """ Returns a new zone with the accumulated devices, neighbors and actions. """
+        actions = {zone_event: sorted(action_list, key=lambda a: a.priority)
+                   for zone_event, action_list in self._actions.items()}
+
+        return Zone(self._name, self._devices, self._level, self._neighbors, actions, self._external,
+                    self._display_icon, self._display_order)
@@ -1,6 +1,15 @@
 from enum import unique, Enum
 
 
+@unique
+class EventPriority(Enum):
+    """ The priority class of a :class:`ZoneEvent`; events with a lower value are dispatched first when queued. """
+
+    SAFETY = 0  # Life-safety events (gas, water leak, alarms); never shed.
+    NORMAL = 1  # Control events (motion, switches, doors, arm modes, etc...)
+    VALUE_CHANGE = 2  # Periodic sensor value changes; may be coalesced or dropped under backlog.
+
+
 @unique
 class ZoneEvent(Enum):
     """ An enum of triggering zone events. """
@@ -62,6 +71,7 @@ class ZoneEvent(Enum):
     ASTRO_BED_TIME = 82  # Indicates that the time period transitions to bed time.
     VACATION_MODE_ON = 83
     VACATION_MODE_OFF = 84
+    ACTIVITY_TIME_CHANGED = 85  # The current time entered or left the time range of an ActivityTimes activity.
 
     ENTERTAINMENT_ON = 90  # A TV / soundbar is turned on.
     ENTERTAINMENT_OFF = 91
@@ -69,3 +79,31 @@ class ZoneEvent(Enum):
     TIMER = 98  # A timer event is triggered.
     STARTUP = 99  # action startup event
     DESTROY = 100  # action destroy event
+
+    @property
+    def priority(self) -> EventPriority:
+        """ Returns the priority class of this event. """
+        return _EVENT_PRIORITIES.get(self, EventPriority.NORMAL)
+
+
+_EVENT_PRIORITIES = {
+    ZoneEvent.PARTITION_IN_ALARM_STATE_CHANGED: EventPriority.SAFETY,
+    ZoneEvent.PARTITION_FIRE_ALARM_STATE_CHANGED: EventPriority.SAFETY,
+    ZoneEvent.PARTITION_AMBULANCE_ALARM_STATE_CHANGED: EventPriority.SAFETY,
+    ZoneEvent.PARTITION_POLICE_ALARM_STATE_CHANGED: EventPriority.SAFETY,
+    ZoneEvent.MANUALLY_TRIGGER_FIRE_ALARM: EventPriority.SAFETY,
+    ZoneEvent.MANUALLY_TRIGGER_AMBULANCE_ALARM: EventPriority.SAFETY,
+    ZoneEvent.MANUALLY_TRIGGER_POLICE_ALARM: EventPriority.SAFETY,
+    ZoneEvent.CANCEL_PANIC_ALARM: EventPriority.SAFETY,
+    ZoneEvent.GAS_TRIGGER_STATE_CHANGED: EventPriority.SAFETY,
+    ZoneEvent.WATER_LEAK_STATE_CHANGED: EventPriority.SAFETY,
+
+    ZoneEvent.HUMIDITY_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.TEMPERATURE_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.GAS_VALUE_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.COMPUTER_CPU_TEMPERATURE_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.COMPUTER_GPU_TEMPERATURE_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.COMPUTER_GPU_FAN_SPEED_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.WEATHER_TEMPERATURE_CHANGED: EventPriority.VALUE_CHANGE,
+    ZoneEvent.WEATHER_HUMIDITY_CHANGED: EventPriority.VALUE_CHANGE,
+}
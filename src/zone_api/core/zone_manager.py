@@ -1,8 +1,9 @@
-from threading import Timer
-from typing import List, Union, Type
+from typing import Union, Type, Tuple, List
 
 from zone_api import platform_encapsulator as pe
+from zone_api.core.device import Device
 from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+from zone_api.core.inactivity_index import InactivityIndex, InactivityWatch
 from zone_api.core.zone import Zone
 
 
@@ -13,7 +14,19 @@ class ZoneManager:
 
     def __init__(self):
         self.zones = {}  # map from string zoneId to Zone
-        self.auto_report_watch_dog_timer = None
+        self.auto_report_watch_dog: Union[InactivityWatch, None] = None
+        self._type_to_devices = {}  # map from device type to the devices of that type in all zones
+
+        # the auto-report and battery-powered devices ordered by last activation; synced on the first use after the
+        # zones change.
+        self._inactivity_index = InactivityIndex()
+        self._inactivity_index_version = -1
+
+        # immutable snapshots of the zones sorted by display order; rebuilt on mutation.
+        self._sorted_zones: Tuple[Zone, ...] = ()
+        self._internal_zones: Tuple[Zone, ...] = ()
+        self._external_zones: Tuple[Zone, ...] = ()
+        self._version = 0
 
     def add_zone(self, zone: Zone):
         """
@@ -25,6 +38,7 @@ class ZoneManager:
             raise ValueError('zone must not be None')
 
         self.zones[zone.get_id()] = zone
+        self._on_zones_changed()
 
         return self
 
@@ -38,24 +52,56 @@ class ZoneManager:
             raise ValueError('zone must not be None')
 
         self.zones.pop(zone.get_id())
+        self._on_zones_changed()
 
         return self
 
     def remove_all_zones(self):
         """ Removes all zone. """
         self.zones.clear()
+        self._on_zones_changed()
         return self
 
-    def get_zones(self) -> List[Zone]:
+    def _on_zones_changed(self):
+        """ Rebuilds the zone snapshots, drops the device type index and bumps the version. """
+        zones = sorted(self.zones.values(), key=lambda z: z.get_display_order())
+
+        self._sorted_zones = tuple(zones)
+        self._internal_zones = tuple(z for z in zones if z.is_internal())
+        self._external_zones = tuple(z for z in zones if z.is_external())
+        self._type_to_devices = {}
+        self._version += 1
+
+    def get_zones(self) -> Tuple[Zone, ...]:
+        """
+        Returns a read-only tuple of all zones, sorted by display order.
+
+        :rtype: tuple(Zone)
+        """
+        return self._sorted_zones
+
+    def get_internal_zones(self) -> Tuple[Zone, ...]:
+        """
+        Returns a read-only tuple of all internal zones, sorted by display order.
+
+        :rtype: tuple(Zone)
         """
-        Returns a new list contains all zone.
+        return self._internal_zones
 
-        :rtype: list(Zone)
+    def get_external_zones(self) -> Tuple[Zone, ...]:
         """
-        zones = [z for z in self.zones.values()]
-        zones.sort(key=lambda z: z.get_display_order())
+        Returns a read-only tuple of all external zones, sorted by display order.
 
-        return zones
+        :rtype: tuple(Zone)
+        """
+        return self._external_zones
+
+    def get_version(self) -> int:
+        """
+        Returns a counter that is incremented each time the set of zones changes. Callers caching data derived from
+        the zones can compare it to detect changes.
+        """
+        return self._version
 
     def get_zone_by_id(self, zone_id: str) -> Union[None, Zone]:
         """
@@ -68,75 +114,77 @@ class ZoneManager:
         zone = self.zones[zone_id] if zone_id in self.zones else None
         return zone
 
-    def get_devices_by_type(self, cls: Type):
+    def get_devices_by_type(self, cls: Type) -> Tuple[Device, ...]:
         """
-        Returns a list of devices in all zones matching the given type.
+        Returns a read-only tuple of the devices in all zones matching the given type. The result is cached until the
+        next :meth:`add_zone`, :meth:`remove_zone` or :meth:`remove_all_zones` call.
 
         :param Type cls: the device type
-        :rtype: list(Device)
+        :rtype: tuple(Device)
         """
         if cls is None:
             raise ValueError('cls must not be None')
 
-        devices = []
-        for zone in self.zones.values():
-            devices = devices + zone.get_devices_by_type(cls)
+        devices = self._type_to_devices.get(cls)
+        if devices is None:
+            devices = tuple(d for zone in self.zones.values() for d in zone.get_devices_by_type(cls))
+            self._type_to_devices[cls] = devices
 
         return devices
 
+    def get_inactivity_index(self) -> InactivityIndex:
+        """
+        Returns the index of the auto-report (see :meth:`Device.is_auto_report`) and battery-powered devices of all
+        zones, ordered by last activation. The same index is returned for the lifetime of this object; it is
+        updated on the first call after the zones change.
+        """
+        if self._inactivity_index_version != self._version:
+            self._inactivity_index.set_devices(
+                d for z in self.get_zones() for d in z.get_devices() if d.is_auto_report() or d.is_battery_powered())
+            self._inactivity_index_version = self._version
+
+        return self._inactivity_index
+
     def start_auto_report_watch_dog(self, timer_interval_in_seconds=10 * 60,
                                     inactive_interval_in_seconds=10 * 60):
         """
-        Starts a timer that run every timerIntervalInSeconds. When the timer is
-        triggered, it will scan auto-report devices (Devices::isAutoReport),
-        and if any of them hasn't been triggered in the last
-        inactiveIntervalInSeconds, it will reset the item value.
+        Starts watching the auto-report devices (Devices::isAutoReport). When
+        any of them hasn't been triggered in the last inactiveIntervalInSeconds,
+        its item value is reset.
 
-        This method is safe to call multiple times (a new timer will be started
-        and any old timer is cancelled).
+        This method is safe to call multiple times (any old watch is
+        cancelled).
 
-        :param int timer_interval_in_seconds: the timer duration
+        :param int timer_interval_in_seconds: the delay before the first check,
+            giving the devices a chance to report after a restart; afterward,
+            the devices are reset as soon as they become inactive (see
+            :meth:`get_inactivity_index`).
         :param int inactive_interval_in_seconds: the inactive duration after which
             the device's value will be reset.
         :rtype: None
         """
 
-        def reset_failed_auto_report_devices():
-            devices = []
-            for z in self.get_zones():
-                [devices.append(d) for d in z.get_devices()
-                 if d.is_auto_report() and
-                 not d.was_recently_activated(inactive_interval_in_seconds)]
-
-            if len(devices) > 0:
-                item_names = []
-                for d in devices:
-                    item_names.append(d.get_item_name())
-                    d.reset_value_states()
-
-                pe.log_warning(
-                    "AutoReport Watchdog: {} failed auto-report devices: {}".format(
-                        len(devices), item_names))
-            else:
-                pe.log_debug("AutoReport Watchdog: no failed auto-report devices")
+        def reset_failed_auto_report_devices(devices: List[Device]):
+            item_names = []
+            for d in devices:
+                item_names.append(d.get_item_name())
+                d.reset_value_states()
 
-            # restart the timer
-            self.auto_report_watch_dog_timer = Timer(
-                timer_interval_in_seconds, reset_failed_auto_report_devices)
-            self.auto_report_watch_dog_timer.start()
+            pe.log_warning(
+                "AutoReport Watchdog: {} failed auto-report devices: {}".format(
+                    len(devices), item_names))
 
         self.stop_auto_report_watch_dog()
 
-        self.auto_report_watch_dog_timer = Timer(
-            timer_interval_in_seconds, reset_failed_auto_report_devices)
-        self.auto_report_watch_dog_timer.start()
-        pe.log_info("Started auto-report watchdog timer.")
+        self.auto_report_watch_dog = self.get_inactivity_index().add_watch(
+            inactive_interval_in_seconds, reset_failed_auto_report_devices, Device.is_auto_report,
+            timer_interval_in_seconds)
+        pe.log_info("Started auto-report watchdog.")
 
     def stop_auto_report_watch_dog(self):
-        if self.auto_report_watch_dog_timer is not None \
-                and self.auto_report_watch_dog_timer.is_alive():
-            self.auto_report_watch_dog_timer.cancel()
-            self.auto_report_watch_dog_timer = None
+        if self.auto_report_watch_dog is not None:
+            self.auto_report_watch_dog.cancel()
+            self.auto_report_watch_dog = None
 
     def get_immutable_instance(self) -> ImmutableZoneManager:
         """
@@ -145,4 +193,7 @@ class ZoneManager:
         """
         return ImmutableZoneManager(self.get_zones,
                                     self.get_zone_by_id,
-                                    self.get_devices_by_type)
+                                    self.get_devices_by_type,
+                                    get_internal_zones_fcn=self.get_internal_zones,
+                                    get_zones_version_fcn=self.get_version,
+                                    get_inactivity_index_fcn=self.get_inactivity_index)
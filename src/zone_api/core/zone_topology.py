@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Iterable, Tuple, Type, Union
+
+from zone_api.core.neighbor import NeighborType
+from zone_api.core.zone import Zone
+
+
+class ZoneTopology:
+    """
+    The neighbor graph of a fixed set of zones, with the neighbor ids resolved to the Zone objects:
+      1. The adjacency lists, in the order the neighbors are declared and filtered per set of :class:`NeighborType`
+         on first use. The neighbor ids that don't match a zone are dropped.
+      2. The shared sensor relationships (see :meth:`Zone.share_sensor_with`), computed once per sensor type.
+      3. The k-hop neighborhoods.
+
+    The zones are immutable; a topology is built for a zones version and replaced when the zones change (see
+    :meth:`ImmutableZoneManager.get_zone_topology`). The answers are cached for the Zone objects the topology was
+    built from (see :meth:`contains`); for another Zone object (e.g. a copy with an additional neighbor), its own
+    neighbors are resolved on each query.
+    """
+
+    def __init__(self, zones: Iterable[Zone]):
+        zones = list(zones)
+        zones_by_id = {z.get_id(): z for z in zones}
+
+        self._zones_by_id = zones_by_id
+        # map from zone id to the (neighbor type, neighbor zone) pairs.
+        self._adjacency: dict[str, Tuple[Tuple[NeighborType, Zone], ...]] = {
+            z.get_id(): tuple((n.get_type(), zones_by_id[n.get_zone_id()]) for n in z.get_neighbors()
+                              if n.get_zone_id() in zones_by_id)
+            for z in zones}
+
+        # map from (zone id, neighbor types) to the neighbor zones; the neighbor types are a frozenset.
+        self._neighbor_zones: dict[Tuple[str, frozenset], Tuple[Zone, ...]] = {}
+        # map from sensor type to map from zone id to the channels of the sensors of that type.
+        self._channels_by_sensor_type: dict[Type, dict[str, frozenset]] = {}
+        # map from (zone id, sensor type, neighbor types) to the neighbor zones sharing a sensor of that type.
+        self._sharing_zones: dict[Tuple[str, Type, frozenset], Tuple[Zone, ...]] = {}
+
+    def contains(self, zone: Zone) -> bool:
+        """ Returns True if the zone is the Zone object the topology was built from. """
+        return self._zones_by_id.get(zone.get_id()) is zone
+
+    def resolves_all_neighbors(self, zone: Zone) -> bool:
+        """ Returns True if the topology was built from the zone and each of its neighbor ids resolves to a zone. """
+        return self.contains(zone) and len(self._adjacency[zone.get_id()]) == len(zone.get_neighbors())
+
+    def get_neighbor_zones(self, zone: Zone,
+                           neighbor_types: Union[Iterable[NeighborType], None] = None) -> Tuple[Zone, ...]:
+        """
+        Returns the neighbor zones of the given types, or all the neighbor zones if neighbor_types is None or
+        empty.
+        """
+        neighbor_types = frozenset(neighbor_types) if neighbor_types is not None else frozenset()
+        return self._get_neighbor_zones(zone, neighbor_types)
+
+    def get_neighbor_zones_sharing_sensor(self, zone: Zone, sensor_type: Type,
+                                          neighbor_types: Union[Iterable[NeighborType], None] = None) \
+            -> Tuple[Zone, ...]:
+        """
+        Returns the neighbor zones of the given types (or of any type) that share a sensor of the given type with the
+        zone. Two sensors are considered the same if they link to the same channel.
+        """
+        neighbor_types = frozenset(neighbor_types) if neighbor_types is not None else frozenset()
+        contained = self.contains(zone)
+        key = (zone.get_id(), sensor_type, neighbor_types)
+
+        zones = self._sharing_zones.get(key) if contained else None
+        if zones is None:
+            channels_by_zone_id = self._get_channels_by_zone_id(sensor_type)
+            our_channels = channels_by_zone_id[zone.get_id()] if contained else _get_channels(zone, sensor_type)
+            zones = tuple(z for z in self._get_neighbor_zones(zone, neighbor_types)
+                          if not our_channels.isdisjoint(channels_by_zone_id[z.get_id()]))
+            if contained:
+                self._sharing_zones[key] = zones
+
+        return zones
+
+    def get_neighborhood(self, zone: Zone, hops: int,
+                         neighbor_types: Union[Iterable[NeighborType], None] = None) -> Tuple[Zone, ...]:
+        """
+        Returns the zones reachable from the zone in at most the given number of hops through the neighbors of the
+        given types (or of any type), closest first. The zone itself is not included.
+        """
+        if hops < 0:
+            raise ValueError('hops must not be negative')
+
+        neighbor_types = frozenset(neighbor_types) if neighbor_types is not None else frozenset()
+
+        visited = {zone.get_id()}
+        neighborhood = []
+        queue = deque([(zone, 0)])
+        while len(queue) > 0:
+            current_zone, distance = queue.popleft()
+            if distance == hops:
+                continue
+
+            for z in self._get_neighbor_zones(current_zone, neighbor_types):
+                if z.get_id() not in visited:
+                    visited.add(z.get_id())
+                    neighborhood.append(z)
+                    queue.append((z, distance + 1))
+
+        return tuple(neighborhood)
+
+    def _get_neighbor_zones(self, zone: Zone, neighbor_types: frozenset) -> Tuple[Zone, ...]:
+        if not self.contains(zone):
+            return tuple(self._zones_by_id[n.get_zone_id()] for n in zone.get_neighbors()
+                         if n.get_zone_id() in self._zones_by_id
+                         and (len(neighbor_types) == 0 or n.get_type() in neighbor_types))
+
+        key = (zone.get_id(), neighbor_types)
+
+        zones = self._neighbor_zones.get(key)
+        if zones is None:
+            zones = tuple(z for neighbor_type, z in self._adjacency[zone.get_id()]
+                          if len(neighbor_types) == 0 or neighbor_type in neighbor_types)
+            self._neighbor_zones[key] = zones
+
+        return zones
+
+    def _get_channels_by_zone_id(self, sensor_type: Type) -> dict[str, frozenset]:
+        channels_by_zone_id = self._channels_by_sensor_type.get(sensor_type)
+        if channels_by_zone_id is None:
+            channels_by_zone_id = {zone_id: _get_channels(z, sensor_type) for zone_id, z in self._zones_by_id.items()}
+            self._channels_by_sensor_type[sensor_type] = channels_by_zone_id
+
+        return channels_by_zone_id
+
+
+def _get_channels(zone: Zone, sensor_type: Type) -> frozenset:
+    """ Returns the channels the sensors of the given type in the zone are linked to. """
+    return frozenset(s.get_channel() for s in zone.get_devices_by_type(sensor_type) if s.get_channel() is not None)
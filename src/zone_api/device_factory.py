@@ -1,7 +1,9 @@
 import re
-from typing import Union, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from typing import Union, Dict, Any, Callable, Iterator, List, NamedTuple
 
-import HABApp
 from HABApp.core import Items
 from HABApp.core.events import ValueUpdateEventFilter, ValueChangeEventFilter, ValueChangeEvent
 from HABApp.core.events.filter.event import TypeBoundEventFilter
@@ -12,6 +14,7 @@ from HABApp.openhab.items import ColorItem, DimmerItem, NumberItem, SwitchItem,
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.device import Device
+from zone_api.core.event_coalescer import CoalescingPolicy
 from zone_api.core.devices.deferred_auto_report_notification import DeferredAutoReportNotification
 from zone_api.core.devices.alarm_partition import AlarmPartition, AlarmState
 from zone_api.core.devices.astro_sensor import AstroSensor
@@ -46,6 +49,36 @@ This module contains a set of utility functions to create devices from OpenHab i
 captured and transformed into ZoneEvent, and then dispatched.
 """
 
+_ITEM_NAME_PATTERN = re.compile('([^_]+)_([^_]+)_(.+)')  # level_location_deviceName
+
+_listener_recording = threading.local()
+
+
+class ListenerRegistration(NamedTuple):
+    """ An item event listener recorded by :meth:`record_listeners`. """
+    item: BaseItem
+    callback: Callable
+    event_filter: Any
+
+    def register(self):
+        """ Registers the listener with the item; must be called from the thread of the HABApp rule. """
+        self.item.listen_event(self.callback, self.event_filter)
+
+
+@contextmanager
+def record_listeners() -> Iterator[List[ListenerRegistration]]:
+    """
+    Within the block, the item event listeners of the devices created by the current thread are appended to the
+    yielded list instead of being registered. HABApp resolves the rule of a listener from the call stack; this allows
+    creating the devices in worker threads, then registering their listeners from the rule thread, in order.
+    """
+    registrations: List[ListenerRegistration] = []
+    _listener_recording.registrations = registrations
+    try:
+        yield registrations
+    finally:
+        _listener_recording.registrations = None
+
 
 def create_switches(zm: ImmutableZoneManager,
                     item: Union[ColorItem, DimmerItem, NumberItem, SwitchItem]) \
@@ -56,11 +89,10 @@ def create_switches(zm: ImmutableZoneManager,
     :param item: SwitchItem
     :return: Union[None, Dimmer, Light, Fan]
     """
-    device_name_pattern = '([^_]+)_([^_]+)_(.+)'  # level_location_deviceName
     item_name = item.name
     illuminance_threshold_in_lux = 8
 
-    match = re.search(device_name_pattern, item_name)
+    match = _ITEM_NAME_PATTERN.search(item_name)
     if not match:
         return None
 
@@ -71,8 +103,7 @@ def create_switches(zm: ImmutableZoneManager,
     duration_in_minutes_key = 'durationInMinutes'
     # disable_triggering_key = "disableTriggeringFromMotionSensor"
 
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
 
     if device_name.endswith('LightSwitch') or device_name.endswith('FanSwitch') or 'Wled_MasterControls' in device_name:
         duration_in_minutes = int(get_meta_value(metadata, duration_in_minutes_key, -1))
@@ -135,7 +166,7 @@ def create_switches(zm: ImmutableZoneManager,
                 if not zm.on_switch_turned_off(pe.get_event_dispatcher(), device, item):
                     pe.log_debug(f'Switch off event for {item.name} is not processed.')
 
-        item.listen_event(handler, ValueChangeEventFilter())
+        _listen_event(item, handler, ValueChangeEventFilter())
 
     return device
 
@@ -197,11 +228,11 @@ def create_alarm_partition(zm: ImmutableZoneManager, item: SwitchItem) -> AlarmP
     def fire_alarm_state_change_handler(event: ValueChangeEvent):
         dispatch_event(zm, ZoneEvent.PARTITION_FIRE_ALARM_STATE_CHANGED, device, panel_fire_key_alarm_item)
 
-    arm_mode_item.listen_event(arm_mode_value_changed, ValueChangeEventFilter())
-    arm_mode_item.listen_event(arm_mode_value_received, ValueUpdateEventFilter())
+    _listen_event(arm_mode_item, arm_mode_value_changed, ValueChangeEventFilter())
+    _listen_event(arm_mode_item, arm_mode_value_received, ValueUpdateEventFilter())
 
-    item.listen_event(in_alarm_state_change_handler, ValueChangeEventFilter())
-    panel_fire_key_alarm_item.listen_event(fire_alarm_state_change_handler, ValueChangeEventFilter())
+    _listen_event(item, in_alarm_state_change_handler, ValueChangeEventFilter())
+    _listen_event(panel_fire_key_alarm_item, fire_alarm_state_change_handler, ValueChangeEventFilter())
 
     # Wire the DSC key panels to the soft items. See notes in the .items file.
     def wire_soft_panel_events(dsc_item, panel_item):
@@ -212,7 +243,7 @@ def create_alarm_partition(zm: ImmutableZoneManager, item: SwitchItem) -> AlarmP
             if pe.is_in_on_state(dsc_item):
                 pe.set_switch_state(panel_item, True)
 
-        dsc_item.listen_event(handler, ValueChangeEventFilter())
+        _listen_event(dsc_item, handler, ValueChangeEventFilter())
 
     wire_soft_panel_events(BaseItem.get_item(item.name + '_DscPanelFireKeyAlarm'), panel_fire_key_alarm_item)
     wire_soft_panel_events(BaseItem.get_item(item.name + '_DscPanelAmbulanceKeyAlarm'), panel_ambulance_key_alarm_item)
@@ -223,8 +254,7 @@ def create_alarm_partition(zm: ImmutableZoneManager, item: SwitchItem) -> AlarmP
 
 
 def create_chrome_cast(zm: ImmutableZoneManager, item: StringItem) -> ChromeCastAudioSink:
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
 
     sink_name = get_meta_value(metadata, "sinkName", None)
     player_item = BaseItem.get_item(item.name + "Player")
@@ -251,15 +281,14 @@ def create_chrome_cast(zm: ImmutableZoneManager, item: StringItem) -> ChromeCast
         def __init__(self):
             super().__init__(ItemCommandEvent)
 
-    player_item.listen_event(player_command_event, ItemCommandEventFilter())
+    _listen_event(player_item, player_command_event, ItemCommandEventFilter())
 
    # noinspection PyTypeChecker
     return device
 
 
 def create_mpd_chrome_cast(zm: ImmutableZoneManager, item: StringItem) -> MpdChromeCastAudioSink:
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
 
     sink_name = get_meta_value(metadata, "sinkName", None)
     player_item = BaseItem.get_item(item.name + "Player")
@@ -282,7 +311,7 @@ def create_mpd_chrome_cast(zm: ImmutableZoneManager, item: StringItem) -> MpdChr
         def __init__(self):
             super().__init__(ItemCommandEvent)
 
-    player_item.listen_event(player_command_event, ItemCommandEventFilter())
+    _listen_event(player_item, player_command_event, ItemCommandEventFilter())
 
     def player_pause_and_play_event(event):
         event_map = {'PLAY': ZoneEvent.PLAYER_PLAY,
@@ -292,7 +321,7 @@ def create_mpd_chrome_cast(zm: ImmutableZoneManager, item: StringItem) -> MpdChr
             event = event_map[event.value]
             dispatch_event(zm, event, device, player_item)
 
-    player_item.listen_event(player_pause_and_play_event, ValueChangeEventFilter())
+    _listen_event(player_item, player_pause_and_play_event, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return device
@@ -309,9 +338,7 @@ def get_meta_value(metadata: Dict[str, Any], key, default_value=None) -> str:
 
 def get_zone_id_from_item_name(item_name: str) -> Union[str, None]:
     """ Extract and return the zone id from the the item name. """
-    pattern = '([^_]+)_([^_]+)_(.+)'
-
-    match = re.search(pattern, item_name)
+    match = _ITEM_NAME_PATTERN.search(item_name)
     if not match:
         return None
 
@@ -364,8 +391,7 @@ def create_motion_sensor(zm: ImmutableZoneManager, item) -> MotionSensor:
         battery_percentage_item = Items.get_item(battery_percentage_name)
 
     key_disable_triggering_switches = "disableTriggeringSwitches"
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
     can_trigger_switches = False if "true" == get_meta_value(metadata, key_disable_triggering_switches) else True
 
     sensor = _configure_device(
@@ -373,10 +399,11 @@ def create_motion_sensor(zm: ImmutableZoneManager, item) -> MotionSensor:
 
     # noinspection PyUnusedLocal
     def handler(event: ValueChangeEvent):
+        received_time = time.perf_counter()
         if pe.is_in_on_state(item):
-            dispatch_event(zm, ZoneEvent.MOTION, sensor, item)
+            dispatch_event(zm, ZoneEvent.MOTION, sensor, item, received_time)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -389,12 +416,13 @@ def create_humidity_sensor(zm: ImmutableZoneManager, item) -> HumiditySensor:
     :param item: SwitchItem
     """
     sensor = _configure_device(HumiditySensor(item), zm)
+    _configure_event_coalescing(zm, item)
 
     # noinspection PyUnusedLocal
     def handler(event: ValueChangeEvent):
-        dispatch_event(zm, ZoneEvent.HUMIDITY_CHANGED, sensor, item)
+        coalesce_event(zm, ZoneEvent.HUMIDITY_CHANGED, sensor, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -436,7 +464,7 @@ def create_ikea_remote_control(brightness_up_hold_event: ZoneEvent = None,
                         dispatch_event(zm, mapped_zone_event, sensor, control_item)
                         sensor.reset_value_states()  # Set the switch to off to wait for the next triggering event.
 
-                control_item.listen_event(handler, ValueChangeEventFilter())
+                _listen_event(control_item, handler, ValueChangeEventFilter())
 
         register_event(brightness_up_hold_item, brightness_up_hold_event)
         register_event(brightness_down_hold_item, brightness_down_hold_event)
@@ -462,7 +490,7 @@ def create_network_presence_device(zm: ImmutableZoneManager, item) -> NetworkPre
 
         dispatch_event(zm, ZoneEvent.NETWORK_PRESENCE_CHANGED, sensor, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -481,9 +509,10 @@ def create_temperature_sensor(zm: ImmutableZoneManager, item) -> TemperatureSens
 
     sensor = _configure_device(
         TemperatureSensor(temperature_item=item, battery_percentage_item=battery_percentage_item), zm)
+    _configure_event_coalescing(zm, item)
 
-    item.listen_event(lambda event: dispatch_event(zm, ZoneEvent.TEMPERATURE_CHANGED, sensor, item),
-                      ValueChangeEventFilter())
+    _listen_event(item, lambda event: coalesce_event(zm, ZoneEvent.TEMPERATURE_CHANGED, sensor, item),
+                  ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -507,8 +536,7 @@ def create_plug(zm: ImmutableZoneManager, item) -> Plug:
     else:
         power_item = None
 
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
     always_on = True if "true" == get_meta_value(metadata, "alwaysOn") else False
     reversed_control = True if "true" == get_meta_value(metadata, "reversedSecurityControl") else False
 
@@ -525,6 +553,7 @@ def create_gas_sensor(cls):
         state_item = BaseItem.get_item(item.name + 'State')
 
         sensor = _configure_device(cls(item, state_item), zm)
+        _configure_event_coalescing(zm, item)
 
         # noinspection PyUnusedLocal
         def state_change_handler(event: ValueChangeEvent):
@@ -532,10 +561,10 @@ def create_gas_sensor(cls):
 
         # noinspection PyUnusedLocal
         def value_change_handler(event: ValueChangeEvent):
-            dispatch_event(zm, ZoneEvent.GAS_VALUE_CHANGED, sensor, item)
+            coalesce_event(zm, ZoneEvent.GAS_VALUE_CHANGED, sensor, item)
 
-        item.listen_event(value_change_handler, ValueChangeEventFilter())
-        state_item.listen_event(state_change_handler, ValueChangeEventFilter())
+        _listen_event(item, value_change_handler, ValueChangeEventFilter())
+        _listen_event(state_item, state_change_handler, ValueChangeEventFilter())
 
         # noinspection PyTypeChecker
         return sensor
@@ -563,7 +592,7 @@ def create_door(zm: ImmutableZoneManager, item) -> Door:
         else:
             dispatch_event(zm, ZoneEvent.DOOR_CLOSED, sensor, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -584,7 +613,7 @@ def create_window(zm: ImmutableZoneManager, item) -> Window:
         else:
             dispatch_event(zm, ZoneEvent.WINDOW_CLOSED, sensor, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -598,8 +627,8 @@ def create_water_leak_sensor(zm: ImmutableZoneManager, item) -> WaterLeakSensor:
     :return: WaterLeakSensor
     """
     sensor = _configure_device(WaterLeakSensor(item), zm)
-    item.listen_event(lambda event: dispatch_event(zm, ZoneEvent.WATER_LEAK_STATE_CHANGED, sensor, item),
-                      ValueChangeEventFilter())
+    _listen_event(item, lambda event: dispatch_event(zm, ZoneEvent.WATER_LEAK_STATE_CHANGED, sensor, item),
+                  ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -608,8 +637,7 @@ def create_water_leak_sensor(zm: ImmutableZoneManager, item) -> WaterLeakSensor:
 def create_illuminance_sensor(zm: ImmutableZoneManager, item: BaseItem) -> IlluminanceSensor:
     """ Create an illuminance sensor. """
     if 'FixedValue' in item.name:
-        item_def = HABApp.openhab.interface_sync.get_item(item.name)
-        metadata = item_def.metadata
+        metadata = pe.get_item_metadata(item.name)
         luminance_value = float(get_meta_value(metadata, 'luminanceValue', 5))
 
         # noinspection PyTypeChecker
@@ -646,7 +674,7 @@ def create_ecobee_thermostat(zm: ImmutableZoneManager, item) -> EcobeeThermostat
             if pe.has_item(display_item_name):
                 pe.set_switch_state(display_item_name, False)
 
-    event_item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(event_item, handler, ValueChangeEventFilter())
 
     # Set to the correct state on start-up.
     pe.set_switch_state(display_item_name, device.is_in_vacation())
@@ -671,7 +699,7 @@ def create_astro_sensor(zm: ImmutableZoneManager, item) -> AstroSensor:
         if device.is_bed_time(event.value):
             dispatch_event(zm, ZoneEvent.ASTRO_BED_TIME, device, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return device
@@ -686,7 +714,7 @@ def create_television_device(zm: ImmutableZoneManager, item) -> Tv:
         zone_event = ZoneEvent.ENTERTAINMENT_ON if pe.is_in_on_state(item) else ZoneEvent.ENTERTAINMENT_OFF
         dispatch_event(zm, zone_event, sensor, item)
 
-    item.listen_event(handler, ValueChangeEventFilter())
+    _listen_event(item, handler, ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
     return sensor
@@ -694,8 +722,7 @@ def create_television_device(zm: ImmutableZoneManager, item) -> Tv:
 
 def create_computer(zm: ImmutableZoneManager, item) -> Computer:
     """ Create an computer device. """
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
 
     name = get_meta_value(metadata, "name", None)
     always_on = True if get_meta_value(metadata, "alwaysOn", None) == "true" else False
@@ -712,19 +739,28 @@ def create_computer(zm: ImmutableZoneManager, item) -> Computer:
     device = _configure_device(Computer(
         name, cpu_temperature_item, gpu_temperature_item, gpu_fan_speed_item, always_on), zm)
 
+    policy = _create_coalescing_policy(metadata)
+    if policy is not None:
+        for value_item in [cpu_temperature_item, gpu_temperature_item, gpu_fan_speed_item]:
+            if value_item is not None:
+                zm.get_event_coalescer().set_item_policy(value_item.name, policy)
+
     if cpu_temperature_item is not None:
-        cpu_temperature_item.listen_event(
-            lambda event: dispatch_event(zm, ZoneEvent.COMPUTER_CPU_TEMPERATURE_CHANGED, device, cpu_temperature_item),
+        _listen_event(
+            cpu_temperature_item,
+            lambda event: coalesce_event(zm, ZoneEvent.COMPUTER_CPU_TEMPERATURE_CHANGED, device, cpu_temperature_item),
             ValueChangeEventFilter())
 
     if gpu_temperature_item is not None:
-        gpu_temperature_item.listen_event(
-            lambda event: dispatch_event(zm, ZoneEvent.COMPUTER_GPU_TEMPERATURE_CHANGED, device, gpu_temperature_item),
+        _listen_event(
+            gpu_temperature_item,
+            lambda event: coalesce_event(zm, ZoneEvent.COMPUTER_GPU_TEMPERATURE_CHANGED, device, gpu_temperature_item),
             ValueChangeEventFilter())
 
     if gpu_fan_speed_item is not None:
-        gpu_fan_speed_item.listen_event(
-            lambda event: dispatch_event(zm, ZoneEvent.COMPUTER_GPU_FAN_SPEED_CHANGED, device, gpu_fan_speed_item),
+        _listen_event(
+            gpu_fan_speed_item,
+            lambda event: coalesce_event(zm, ZoneEvent.COMPUTER_GPU_FAN_SPEED_CHANGED, device, gpu_fan_speed_item),
             ValueChangeEventFilter())
 
     # noinspection PyTypeChecker
@@ -761,20 +797,26 @@ def create_weather(zm: ImmutableZoneManager, temperature_item: NumberItem) -> Un
     device = Weather(temperature_item, humidity_item, condition_item, alert_title_item, alert_datetime_item,
                      forecast_min_temp_item, forecast_max_temp_item)
     device = _configure_device(device, zm)
+    _configure_event_coalescing(zm, temperature_item)
+    _configure_event_coalescing(zm, humidity_item)
 
-    temperature_item.listen_event(
-        lambda event: dispatch_event(
+    _listen_event(
+        temperature_item,
+        lambda event: coalesce_event(
             zm, ZoneEvent.WEATHER_TEMPERATURE_CHANGED, device, temperature_item), ValueChangeEventFilter())
 
-    humidity_item.listen_event(
-        lambda event: dispatch_event(
+    _listen_event(
+        humidity_item,
+        lambda event: coalesce_event(
             zm, ZoneEvent.WEATHER_HUMIDITY_CHANGED, device, humidity_item), ValueChangeEventFilter())
 
-    condition_item.listen_event(
+    _listen_event(
+        condition_item,
         lambda event: dispatch_event(
             zm, ZoneEvent.WEATHER_CONDITION_CHANGED, device, condition_item), ValueChangeEventFilter())
 
-    alert_title_item.listen_event(
+    _listen_event(
+        alert_title_item,
         lambda event: dispatch_event(
             zm, ZoneEvent.WEATHER_ALERT_CHANGED, device, alert_title_item), ValueChangeEventFilter())
 
@@ -800,7 +842,8 @@ def create_auto_report_notification_setting(zm: ImmutableZoneManager, device_nam
     device = DeferredAutoReportNotification(device_name_item, duration_item)
     device = _configure_device(device, zm)
 
-    device_name_item.listen_event(
+    _listen_event(
+        device_name_item,
         lambda event: dispatch_event(
             zm, ZoneEvent.DEFERRED_NOTIFICATION_DEVICE_NAME_CHANGED, device, device_name_item),
         ValueChangeEventFilter())
@@ -818,8 +861,7 @@ def create_mpd_controller(zm: ImmutableZoneManager, item: BaseItem) -> MpdDevice
     predefined_category_item = BaseItem.get_item(item.name + "_PredefinedCategory")
     custom_category_item = BaseItem.get_item(item.name + "_CustomCategory")
 
-    item_def = HABApp.openhab.interface_sync.get_item(item.name)
-    metadata = item_def.metadata
+    metadata = pe.get_item_metadata(item.name)
 
     host = get_meta_value(metadata, "host", '')
     port = int(get_meta_value(metadata, "port", ''))
@@ -829,7 +871,7 @@ def create_mpd_controller(zm: ImmutableZoneManager, item: BaseItem) -> MpdDevice
     def dispatch_play_event(event):
         dispatch_event(zm, ZoneEvent.PLAYER_PLAY, device, item)
 
-    predefined_category_item.listen_event(dispatch_play_event, ValueChangeEventFilter())
+    _listen_event(predefined_category_item, dispatch_play_event, ValueChangeEventFilter())
 
     def player_pause_and_play_event(event):
         event_map = {'PLAY': ZoneEvent.PLAYER_PLAY,
@@ -854,23 +896,63 @@ def create_mpd_controller(zm: ImmutableZoneManager, item: BaseItem) -> MpdDevice
         def __init__(self):
             super().__init__(ItemCommandEvent)
 
-    item.listen_event(player_pause_and_play_event, ValueChangeEventFilter())
-    item.listen_event(player_next_and_prev_event, ItemCommandEventFilter())
+    _listen_event(item, player_pause_and_play_event, ValueChangeEventFilter())
+    _listen_event(item, player_next_and_prev_event, ItemCommandEventFilter())
 
     # noinspection PyTypeChecker
     return device
 
 
-def dispatch_event(zm: ImmutableZoneManager, zone_event: ZoneEvent, device: Device, item: BaseItem):
+def dispatch_event(zm: ImmutableZoneManager, zone_event: ZoneEvent, device: Device, item: BaseItem,
+                   received_time: Union[float, None] = None):
     """
     Dispatches an event to the ZoneManager. If the event is not processed,
     create a debug log.
+
+    :param received_time: see :meth:`ImmutableZoneManager.dispatch_event`.
     """
     # pe.log_info(f"Dispatching event {zone_event.name} for {item.name}")
-    if not zm.dispatch_event(zone_event, pe.get_event_dispatcher(), device, item):
+    if not zm.dispatch_event(zone_event, pe.get_event_dispatcher(), device, item, received_time):
         pe.log_debug(f'Event {zone_event} for item {item.name} is not processed.')
 
 
+def coalesce_event(zm: ImmutableZoneManager, zone_event: ZoneEvent, device: Device, item: BaseItem):
+    """
+    Dispatches a numeric value change event through the zone manager's EventCoalescer; the event might be held back
+    and flushed later depending on the coalescing policy of the item.
+    """
+    zm.get_event_coalescer().on_event(zone_event, pe.get_event_dispatcher(), device, item)
+
+
+def _configure_event_coalescing(zm: ImmutableZoneManager, item: BaseItem):
+    """
+    Sets the coalescing policy of the item from its 'eventCoalescing' metadata, if present. Otherwise, the policy of
+    the device class in the 'event-coalescing' system configuration (if any) applies. Example:
+      eventCoalescing="on"[minIntervalInSeconds="10", deadband="0.5", flushDelayInSeconds="120"]
+    """
+    policy = _create_coalescing_policy(pe.get_item_metadata(item.name))
+    if policy is not None:
+        zm.get_event_coalescer().set_item_policy(item.name, policy)
+
+
+def _create_coalescing_policy(metadata: Dict[str, Any]) -> Union[CoalescingPolicy, None]:
+    """ Returns the policy specified by the 'eventCoalescing' metadata, or None if the key is absent. """
+    key = 'eventCoalescing'
+    if key not in metadata:
+        return None
+
+    return CoalescingPolicy.from_config(metadata.get(key).get('config', {}))
+
+
+def _listen_event(item: BaseItem, callback: Callable, event_filter):
+    """ Registers the item event listener, or records it if called within :meth:`record_listeners`. """
+    registrations = getattr(_listener_recording, 'registrations', None)
+    if registrations is None:
+        item.listen_event(callback, event_filter)
+    else:
+        registrations.append(ListenerRegistration(item, callback, event_filter))
+
+
 def _configure_device(device: Device, zm: ImmutableZoneManager) -> Device:
     """
     - Set a few properties on the device. Note that each setter returns a new device instance, and as such, this method
@@ -890,6 +972,6 @@ def _configure_device(device: Device, zm: ImmutableZoneManager) -> Device:
 
     if not isinstance(device, MotionSensor) and not isinstance(device, NetworkPresence):
         for item in device.get_all_items():
-            item.listen_event(lambda event: device.update_last_activated_timestamp(), ItemStateUpdatedEventFilter())
+            _listen_event(item, lambda event: device.update_last_activated_timestamp(), ItemStateUpdatedEventFilter())
 
     return device
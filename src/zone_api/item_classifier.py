@@ -0,0 +1,53 @@
+import re
+from typing import Any, Callable, Dict, NamedTuple, Tuple, Union
+
+
+class ItemClassification(NamedTuple):
+    """ The result of :meth:`ItemClassifier.classify`. """
+
+    factories: Tuple[Callable, ...]
+    """ The factories whose pattern matches the item name, in the order of the mappings. """
+
+    zone_id: Union[str, None]
+    """ The 'level_location' part of the item name, or None if the name doesn't follow that convention. """
+
+    device_name: Union[str, None]
+    """ The part of the item name following the zone id, or None if the name doesn't follow that convention. """
+
+
+class ItemClassifier:
+    """
+    Matches an item name against all the patterns of an ordered device factory mapping in a single pass, and extracts
+    the zone id and device name (level_location_deviceName) in the same pass.
+
+    The patterns are combined into one regular expression made of an optional lookahead per pattern; each lookahead
+    is anchored at the start of the name and captures in its own named group. As the lookaheads don't consume any
+    character, the combined expression always matches, and a group is set if and only if ``re.match(pattern, name)``
+    would succeed. The results are thus identical to matching each pattern in turn.
+    """
+
+    # Same as re.search('([^_]+)_([^_]+)_(.+)', name): the lazy prefix finds the leftmost start.
+    _ZONE_ID_LOOKAHEAD = '(?:(?=.*?(?P<level>[^_]+)_(?P<location>[^_]+)_(?P<device_name>.+)))?'
+
+    def __init__(self, mappings: Dict[str, Callable[..., Any]]):
+        """
+        :param mappings: the item name patterns (see re.match) to the device factories; the iteration order is the
+            order of the factories in the classifications.
+        """
+        self._factories = tuple(mappings.values())
+
+        lookaheads = [f'(?:(?=(?P<p{index}>{pattern})))?' for index, pattern in enumerate(mappings.keys())]
+        self._regex = re.compile(''.join(lookaheads) + ItemClassifier._ZONE_ID_LOOKAHEAD)
+        self._group_names = tuple(f'p{index}' for index in range(len(self._factories)))
+
+    def classify(self, item_name: str) -> ItemClassification:
+        """ Returns the factories matching the item name, together with the item zone id and device name. """
+        groups = self._regex.match(item_name).groupdict()
+        factories = tuple(factory for factory, group_name in zip(self._factories, self._group_names)
+                          if groups[group_name] is not None)
+
+        level = groups['level']
+        if level is None:
+            return ItemClassification(factories, None, None)
+
+        return ItemClassification(factories, level + '_' + groups['location'], groups['device_name'])
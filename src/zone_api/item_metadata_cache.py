@@ -0,0 +1,42 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Union
+
+from HABApp.openhab.definitions.rest import ItemResp
+
+
+class ItemMetadataCache:
+    """
+    The metadata of the openHAB items, keyed by item name. :meth:`prefetch` loads the metadata of all the items with a
+    single REST call (GET /rest/items?metadata=.+) instead of one call per item.
+
+    The cache is thread-safe; the metadata dictionaries must not be modified.
+    """
+
+    def __init__(self, get_items_fcn: Callable[[], Iterable[ItemResp]]):
+        """
+        :param get_items_fcn: returns the definitions of all the items, including their metadata.
+        """
+        self._get_items_fcn = get_items_fcn
+        self._metadata_by_item_name: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self):
+        """ Replaces the cache content with the metadata of all the items. """
+        metadata_by_item_name = {item_def.name: item_def.metadata for item_def in self._get_items_fcn()}
+        with self._lock:
+            self._metadata_by_item_name = metadata_by_item_name
+
+    def get_metadata(self, item_name: str) -> Union[Dict[str, Any], None]:
+        """
+        Returns the metadata of the item, keyed by namespace; each value is a dictionary with the 'value' and
+        optionally the 'config' keys. Returns None if the item isn't in the cache (e.g. created after the prefetch).
+        """
+        return self._metadata_by_item_name.get(item_name)
+
+    def clear(self):
+        """ Discards the cached metadata. """
+        with self._lock:
+            self._metadata_by_item_name = {}
+
+    def __len__(self):
+        return len(self._metadata_by_item_name)
@@ -7,17 +7,21 @@ from email.message import EmailMessage
 from email.utils import make_msgid
 import mimetypes
 
-from typing import List, Union, Any, TYPE_CHECKING
+from typing import List, Union, Any, TYPE_CHECKING, Dict
 
 import HABApp
+from HABApp.core.asyncio import run_coro_from_thread
 from HABApp.core.items import Item
+from HABApp.openhab.connection.handler.func_async import async_get_items
 from HABApp.openhab.errors import ItemNotFoundError
 from HABApp.openhab.items import ColorItem, ContactItem, DatetimeItem, DimmerItem, NumberItem, StringItem, SwitchItem, \
     PlayerItem
 from HABApp.core.types.color import RGB
 from HABApp.rule import in_thread
 
+from zone_api.core.clock import Clock, RealClock
 from zone_api.core.immutable_zone_manager import EmailSettings, ImmutableZoneManager
+from zone_api.item_metadata_cache import ItemMetadataCache
 
 if TYPE_CHECKING:
     from zone_api.core.immutable_zone_manager import EmailSettings, ImmutableZoneManager
@@ -37,6 +41,11 @@ ZONE_MANAGER: Union['ImmutableZoneManager', None] = None
 
 _in_unit_tests = False
 
+_real_clock = RealClock()
+_clock: Clock = _real_clock
+
+_item_metadata_cache: Union[ItemMetadataCache, None] = None
+
 
 def is_in_hab_app() -> bool:
     return True
@@ -306,15 +315,55 @@ def get_channel(item) -> Union[str, None]:
         return None
     else:
         try:
-            item_def: HABApp.openhab.definitions.rest.items.ItemResp = HABApp.openhab.interface_sync.get_item(item.name)
-            if item_def:
-                metadata = item_def.metadata
-                value = metadata.get("channel")
-                return value['value'] if value is not None else None
+            value = get_item_metadata(item.name).get("channel")
+            return value['value'] if value is not None else None
         except ItemNotFoundError:
             return None
 
 
+def get_item_metadata(item_name: str) -> Dict[str, Any]:
+    """
+    Returns the OpenHab metadata of the item, keyed by namespace. Served from the cache filled by
+    :meth:`prefetch_item_metadata` if it contains the item; otherwise, makes a REST call for the item.
+
+    :raise ItemNotFoundError: if the item doesn't exist.
+    """
+    cache = _item_metadata_cache
+    if cache is not None:
+        metadata = cache.get_metadata(item_name)
+        if metadata is not None:
+            return metadata
+
+    item_def = HABApp.openhab.interface_sync.get_item(item_name)
+    if item_def is None:
+        raise ItemNotFoundError.from_name(item_name)
+
+    return item_def.metadata
+
+
+def prefetch_item_metadata(cache: Union[ItemMetadataCache, None] = None) -> ItemMetadataCache:
+    """
+    Fetches the metadata of all the items with a single REST call, and serves :meth:`get_item_metadata` from it until
+    :meth:`clear_item_metadata` is called.
+
+    :param cache: the cache to fill; defaults to one backed by the OpenHab REST API.
+    """
+    global _item_metadata_cache
+
+    if cache is None:
+        cache = ItemMetadataCache(lambda: run_coro_from_thread(async_get_items(), calling=prefetch_item_metadata))
+    cache.prefetch()
+    _item_metadata_cache = cache
+
+    return cache
+
+
+def clear_item_metadata():
+    """ Discards the cache filled by :meth:`prefetch_item_metadata`. """
+    global _item_metadata_cache
+    _item_metadata_cache = None
+
+
 @in_thread
 def get_event_dispatcher():
     if not is_in_unit_tests():
@@ -364,6 +413,21 @@ def is_in_unit_tests():
     return _in_unit_tests
 
 
+def get_clock() -> Clock:
+    """ Returns the clock providing the current time and running the timers; see :class:`.Clock`. """
+    return _clock
+
+
+def set_clock(clock: Union[Clock, None]):
+    """
+    Replaces the clock (e.g. with a :class:`.VirtualClock` in the tests and the simulations); None restores the wall
+    clock. The clock must be set before the zone manager and the devices are created, as they may hold on to the
+    timer service of the clock.
+    """
+    global _clock
+    _clock = clock if clock is not None else _real_clock
+
+
 @in_thread
 def play_local_audio_file(sink_name: str, file_location: str):
     """ Plays a local audio file on the given audio sink. """
@@ -17,33 +17,21 @@ def is_armed_away(zm: ImmutableZoneManager):
     """
     :return: True if at least one zone is armed-away
     """
-    partition = _get_partition(zm)
-    if partition is not None:
-        return AlarmState.ARM_AWAY == partition.get_arm_mode()
-
-    return False
+    return AlarmState.ARM_AWAY == _get_arm_mode(zm)
 
 
 def is_armed_stay(zm: ImmutableZoneManager):
     """
     :return: True if at least one zone is armed-stay
     """
-    partition = _get_partition(zm)
-    if partition is not None:
-        return AlarmState.ARM_STAY == partition.get_arm_mode()
-
-    return False
+    return AlarmState.ARM_STAY == _get_arm_mode(zm)
 
 
 def is_unarmed(zm: ImmutableZoneManager):
     """
     :return: True if at least one zone is unarmed.
     """
-    partition = _get_partition(zm)
-    if partition is not None:
-        return AlarmState.UNARMED == partition.get_arm_mode()
-
-    return False
+    return AlarmState.UNARMED == _get_arm_mode(zm)
 
 
 def arm_away(zm: ImmutableZoneManager, events):
@@ -73,7 +61,20 @@ def disarm(zm: ImmutableZoneManager, events):
     partition.disarm(events)
 
 
+def _get_arm_mode(zm: ImmutableZoneManager) -> Union[AlarmState, None]:
+    house_state = zm.get_house_state()
+    if house_state is not None:
+        return house_state.get_arm_mode()
+
+    partition = _get_partition(zm)
+    return partition.get_arm_mode() if partition is not None else None
+
+
 def _get_partition(zm: ImmutableZoneManager) -> Union[AlarmPartition, None]:
+    house_state = zm.get_house_state()
+    if house_state is not None:
+        return house_state.get_partition()
+
     security_partitions = zm.get_devices_by_type(AlarmPartition)
     if len(security_partitions) > 0:
         return security_partitions[0]
@@ -2,7 +2,174 @@
 Utility class containing a set of time related functions.
 """
 
+import functools
 import time
+from typing import List, Union
+
+from zone_api import platform_encapsulator as pe
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class TimeRangeSet:
+    """
+    A compiled time range string: a bitmap with one bit per minute of the day, set if the minute is in one of the time
+    ranges. The bitmap is built once (wrap around ranges included), so that :meth:`contains` is a bit test, and
+    :meth:`next_transition` is a table look-up. The sets support the union (|), intersection (&), difference (-) and
+    complement (~) operations.
+    """
+
+    _FULL_BITMAP = (1 << MINUTES_PER_DAY) - 1
+
+    def __init__(self, time_ranges_string: str):
+        """
+        :param str time_ranges_string: one or multiple time range in 24-hour format; see :meth:`is_in_time_range`.
+        :raise: ValueError if the time range string is invalid
+        """
+        if time_ranges_string is None or 0 == len(time_ranges_string):
+            raise ValueError('Must have at least one time range.')
+
+        time_ranges = string_to_time_range_lists(time_ranges_string)
+        bitmap = 0
+        for minute_of_day in range(MINUTES_PER_DAY):
+            if _is_in_time_ranges(time_ranges, minute_of_day // 60, minute_of_day % 60):
+                bitmap |= 1 << minute_of_day
+
+        self._init_bitmap(bitmap)
+
+    @classmethod
+    def from_bitmap(cls, bitmap: int) -> 'TimeRangeSet':
+        """ Returns a set from a minute-of-day bitmap; bit i represents the minute i after midnight. """
+        time_range_set = cls.__new__(cls)
+        time_range_set._init_bitmap(bitmap & TimeRangeSet._FULL_BITMAP)
+        return time_range_set
+
+    def _init_bitmap(self, bitmap: int):
+        self._bitmap = bitmap
+        # Lazily computed; see _get_transition_deltas().
+        self._transition_deltas: Union[List[int], None] = None
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    def is_empty(self) -> bool:
+        return self._bitmap == 0
+
+    def contains_minute(self, minute_of_day: int) -> bool:
+        """ Returns True if the minute of the day (0 to 1439) is in the set. """
+        return (self._bitmap >> minute_of_day) & 1 == 1
+
+    def contains(self, epoch_seconds=None) -> bool:
+        """
+        Returns True if the current time (or the given time) is in the set.
+
+        :param int epoch_seconds: seconds since epoch, optional
+        """
+        time_struct = pe.get_clock().localtime(epoch_seconds)
+        return self.contains_minute(time_struct[3] * 60 + time_struct[4])
+
+    def next_transition(self, epoch_seconds=None) -> Union[int, None]:
+        """
+        Returns the epoch second of the next minute at which :meth:`contains` changes, i.e. when the current time
+        enters or leaves the set.
+
+        :param int epoch_seconds: seconds since epoch, optional
+        :return: the epoch second of the transition, or None if the set is empty or covers the whole day.
+        """
+        deltas = self._get_transition_deltas()
+        if deltas is None:
+            return None
+
+        if epoch_seconds is None:
+            epoch_seconds = pe.get_clock().time()
+
+        time_struct = pe.get_clock().localtime(epoch_seconds)
+        minute_of_day = time_struct[3] * 60 + time_struct[4]
+        delta = deltas[minute_of_day]
+        transition_time = (int(epoch_seconds) // 60 + delta) * 60
+
+        time_struct = pe.get_clock().localtime(transition_time)
+        if time_struct[3] * 60 + time_struct[4] == (minute_of_day + delta) % MINUTES_PER_DAY:
+            return transition_time
+
+        # A DST change occurs before the transition; step through the minutes so that localtime handles it.
+        current_value = self.contains_minute(minute_of_day)
+        minute_start = (int(epoch_seconds) // 60 + 1) * 60
+        for i in range(25 * 60):
+            candidate = minute_start + i * 60
+            if self.contains(candidate) != current_value:
+                return candidate
+
+        return None
+
+    def _get_transition_deltas(self) -> Union[List[int], None]:
+        """
+        Returns, for each minute of the day, the number of minutes until the value of the bitmap changes, or None if
+        the bitmap never changes.
+        """
+        if self._bitmap == 0 or self._bitmap == TimeRangeSet._FULL_BITMAP:
+            return None
+
+        deltas = self._transition_deltas
+        if deltas is None:
+            values = [self.contains_minute(m) for m in range(MINUTES_PER_DAY)]
+
+            # Walk backward once around the day, starting from a minute followed by a change.
+            last_minute = next(m for m in range(MINUTES_PER_DAY) if values[m] != values[(m + 1) % MINUTES_PER_DAY])
+            deltas = [0] * MINUTES_PER_DAY
+            deltas[last_minute] = 1
+            minute = last_minute
+            for _ in range(MINUTES_PER_DAY - 1):
+                next_minute = minute
+                minute = (minute - 1) % MINUTES_PER_DAY
+                deltas[minute] = 1 if values[minute] != values[next_minute] else deltas[next_minute] + 1
+
+            self._transition_deltas = deltas
+
+        return deltas
+
+    def __or__(self, other: 'TimeRangeSet') -> 'TimeRangeSet':
+        return TimeRangeSet.from_bitmap(self._bitmap | other._bitmap)
+
+    def __and__(self, other: 'TimeRangeSet') -> 'TimeRangeSet':
+        return TimeRangeSet.from_bitmap(self._bitmap & other._bitmap)
+
+    def __sub__(self, other: 'TimeRangeSet') -> 'TimeRangeSet':
+        return TimeRangeSet.from_bitmap(self._bitmap & ~other._bitmap)
+
+    def __invert__(self) -> 'TimeRangeSet':
+        return TimeRangeSet.from_bitmap(~self._bitmap)
+
+    def __eq__(self, other):
+        return isinstance(other, TimeRangeSet) and self._bitmap == other._bitmap
+
+    def __hash__(self):
+        return hash(self._bitmap)
+
+    def __str__(self):
+        ranges = []
+        minute = 0
+        while minute < MINUTES_PER_DAY:
+            if self.contains_minute(minute):
+                start = minute
+                while minute < MINUTES_PER_DAY and self.contains_minute(minute):
+                    minute += 1
+                ranges.append(f"{start // 60}:{start % 60:02d} - {(minute - 1) // 60}:{(minute - 1) % 60:02d}")
+            else:
+                minute += 1
+
+        return ', '.join(ranges)
+
+
+@functools.lru_cache(maxsize=128)
+def compile_time_ranges(time_ranges_string: str) -> TimeRangeSet:
+    """
+    Returns the (cached) :class:`TimeRangeSet` of the time range string.
+
+    :raise: ValueError if the time range string is invalid
+    """
+    return TimeRangeSet(time_ranges_string)
 
 
 def is_in_time_range(time_ranges_string, epoch_seconds=None):
@@ -19,11 +186,33 @@ def is_in_time_range(time_ranges_string, epoch_seconds=None):
     if time_ranges_string is None or 0 == len(time_ranges_string):
         raise ValueError('Must have at least one time range.')
 
-    time_struct = time.localtime(epoch_seconds)
-    hour = time_struct[3]
-    minute = time_struct[4]
+    return compile_time_ranges(time_ranges_string).contains(epoch_seconds)
+
 
-    for time_range in string_to_time_range_lists(time_ranges_string):
+def get_next_transition_time(time_ranges_string, epoch_seconds=None):
+    """
+    Returns the epoch second of the next minute at which the result of :meth:`is_in_time_range` changes, i.e. when the
+    current time enters or leaves the time ranges.
+
+    :param str time_ranges_string: one or multiple time range in 24-hour format; see :meth:`is_in_time_range`.
+    :param int epoch_seconds: seconds since epoch, optional
+    :return: the epoch second of the transition, or None if the time ranges cover the whole day.
+    :rtype: int
+    :raise: ValueError if the time range string is invalid
+    """
+    if time_ranges_string is None or 0 == len(time_ranges_string):
+        raise ValueError('Must have at least one time range.')
+
+    return compile_time_ranges(time_ranges_string).next_transition(epoch_seconds)
+
+
+def _is_in_time_ranges(time_ranges, hour, minute):
+    """
+    Determines if the hour and minute is in one of the time ranges returned by :meth:`string_to_time_range_lists`.
+
+    :rtype: boolean
+    """
+    for time_range in time_ranges:
         start_hour, start_minute, end_hour, end_minute = time_range
         if start_hour <= end_hour:
             if hour < start_hour:
@@ -1,26 +1,29 @@
 import re
-from typing import List, Dict, Type, Hashable, Any
-import pkgutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Type, Hashable, Any, Callable, Collection, NamedTuple, Sequence, Tuple, Union
 import inspect
 import importlib
 
-import HABApp
 from HABApp.core import Items
 from HABApp.core.internals.item_registry import ItemRegistryItem
 
 import zone_api.core.actions as actions
 from zone_api import platform_encapsulator as pe
 from zone_api import device_factory as df
+from zone_api.action_manifest import get_action_manifest
 from zone_api.alert_manager import AlertManager
 from zone_api.core.action import Action
+from zone_api.core.device import Device
 from zone_api.core.devices.gas_sensor import NaturalGasSensor, SmokeSensor, Co2GasSensor, RadonGasSensor
 from zone_api.core.immutable_zone_manager import ImmutableZoneManager
 from zone_api.core.map_parameters import MapParameters
 from zone_api.core.parameters import Parameters
 from zone_api.core.zone import Zone, Level
 from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_builder import ZoneBuilder
 from zone_api.core.zone_manager import ZoneManager
 from zone_api.core.neighbor import NeighborType, Neighbor
+from zone_api.item_classifier import ItemClassifier
 
 """
 This module contains functions to construct an ImmutableZoneManager using the following convention
@@ -44,17 +47,140 @@ for the OpenHab items.
 
 
 def parse(config: dict[Hashable, Any], actions_package: str = "zone_api.core.actions",
-          actions_path: List[str] = actions.__path__) -> ImmutableZoneManager:
+          actions_path: List[str] = actions.__path__, device_creation_workers: int = 1) -> ImmutableZoneManager:
     """
-    - Parses the zones and devices from the remote OpenHab items (via the REST API).
-    - Adds devices to the zones.
+    - Parses the zones and devices from the remote OpenHab items (via the REST API). The item metadata is fetched in
+      a single REST call up front rather than once per item.
+    - Adds devices to the zones; each item is classified against all the device mappings in a single pass (see
+      :class:`ItemClassifier`). The devices may be created by a thread pool; see :meth:`create_devices`.
     - Adds default actions to the zones.
     - For each action, invoke Action::on_startup method.
     - Start the scheduler service.
 
+    :param int device_creation_workers: the number of threads creating the devices; 1 creates them on the calling
+        thread.
     :return:
     """
-    mappings = {
+    action_parameters: Parameters = _read_zone_api_configurations(config)
+
+    zm: ZoneManager = ZoneManager()
+    immutable_zm = zm.get_immutable_instance()
+    immutable_zm = immutable_zm.set_system_config(config)
+    immutable_zm = immutable_zm.set_alert_manager(AlertManager(config))
+
+    try:
+        try:
+            pe.prefetch_item_metadata()
+        except Exception as e:
+            pe.log_warning(f"Can't prefetch the item metadata; falling back to per-item requests: {e}")
+
+        zone_builders: Dict[str, ZoneBuilder] = {}
+        for zone in _parse_zones():
+            zone_builders[zone.get_id()] = ZoneBuilder.from_zone(zone)
+
+        items: tuple[ItemRegistryItem] = Items.get_items()
+        for item_devices in create_devices(immutable_zm, items, ItemClassifier(get_device_mappings()),
+                                           device_creation_workers):
+            for registration in item_devices.listeners:
+                registration.register()
+
+            for device in item_devices.devices:
+                if device is not None:
+                    zone_id = item_devices.zone_id
+                    if zone_id is None:
+                        pe.log_warning("Can't get zone id from item name '{}'".format(item_devices.item.name))
+                        continue
+
+                    if zone_id not in zone_builders.keys():
+                        pe.log_warning("Invalid zone id '{}'".format(zone_id))
+                        continue
+
+                    zone_builders[zone_id].add_device(device)
+    finally:
+        pe.clear_item_metadata()
+
+    zone_mappings = {zone_id: builder.build() for zone_id, builder in zone_builders.items()}
+
+    # Add specific devices to the Virtual Zone
+    zone = next((z for z in zone_mappings.values() if z.get_name() == 'Virtual'), None)
+    if zone is not None:
+        zone = zone.add_device(immutable_zm.activity_times)
+        zone_mappings[zone.get_id()] = zone
+
+    disabled_action_names = get_disabled_action_names(config, actions_path)
+    action_classes = get_action_classes(actions_package, actions_path, disabled_action_names)
+    zone_mappings = add_actions(zone_mappings, action_classes, action_parameters, disabled_action_names)
+
+    for z in zone_mappings.values():
+        zm.add_zone(z)
+
+    immutable_zm.start()
+
+    return immutable_zm
+
+
+class ItemDevices(NamedTuple):
+    """ The devices created for an item by :meth:`create_devices`. """
+    item: ItemRegistryItem
+    zone_id: Union[str, None]
+    devices: List[Union[Device, None]]
+    """ The result of each factory matching the item, in mapping order; None if the factory skipped the item. """
+    listeners: List[df.ListenerRegistration]
+    """ The item event listeners of the devices, not registered yet. """
+
+
+def create_devices(zm: ImmutableZoneManager, items: Sequence[ItemRegistryItem], classifier: ItemClassifier,
+                   max_workers: int = 1) -> List[ItemDevices]:
+    """
+    Creates the devices of the items matching the classifier's mappings, in item order.
+
+    The factories are mostly waiting on the OpenHab REST API; with max_workers > 1, the items are spread across a
+    thread pool of that size, the factories of an item running in order on the same thread. The item event listeners
+    of the devices are recorded rather than registered (see :meth:`device_factory.record_listeners`); the caller
+    registers them in the returned order, which is the same as the order without a thread pool.
+
+    :raise ValueError: if any factory fails; the message lists the error of each failed item.
+    """
+    classified_items = [(item, classifier.classify(item.name)) for item in items]
+    classified_items = [(item, classification) for item, classification in classified_items
+                        if len(classification.factories) > 0]
+
+    def create_item_devices(item, factories) -> Tuple[List[Union[Device, None]], List[df.ListenerRegistration]]:
+        with df.record_listeners() as registrations:
+            return [factory(zm, item) for factory in factories], registrations
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='DeviceFactory') as executor:
+            futures = [executor.submit(create_item_devices, item, classification.factories)
+                       for item, classification in classified_items]
+        outcomes = [_get_outcome(future.result) for future in futures]
+    else:
+        outcomes = [_get_outcome(create_item_devices, item, classification.factories)
+                    for item, classification in classified_items]
+
+    errors = [f"{item.name}: {error!r}" for (item, _), (_, error) in zip(classified_items, outcomes)
+              if error is not None]
+    if len(errors) > 0:
+        raise ValueError("Can't create the devices of {} item(s):\n".format(len(errors)) + "\n".join(errors))
+
+    return [ItemDevices(item, classification.zone_id, *result)
+            for (item, classification), (result, _) in zip(classified_items, outcomes)]
+
+
+def _get_outcome(fcn: Callable, *args) -> Tuple[Any, Union[Exception, None]]:
+    """ Returns (result, None) if the call succeeds, or (None, exception) if it raises. """
+    try:
+        return fcn(*args), None
+    except Exception as e:
+        return None, e
+
+
+def get_device_mappings() -> Dict[str, Callable[[ImmutableZoneManager, ItemRegistryItem], Any]]:
+    """
+    Returns the item name patterns (see re.match) to the device factories. An item matching several patterns gets a
+    device from each factory, in this order; a factory may return None to skip the item.
+    """
+    return {
         '.*AlarmPartition$': df.create_alarm_partition,
         '.*_ChromeCast$': df.create_chrome_cast,
         '.*_MpdChromeCast$': df.create_mpd_chrome_cast,
@@ -89,54 +215,6 @@ def parse(config: dict[Hashable, Any], actions_package: str = "zone_api.core.act
         '.*_MpdStreamPlayer$': df.create_mpd_controller,
     }
 
-    action_parameters: Parameters = _read_zone_api_configurations(config)
-
-    zm: ZoneManager = ZoneManager()
-    immutable_zm = zm.get_immutable_instance()
-    immutable_zm = immutable_zm.set_system_config(config)
-    immutable_zm = immutable_zm.set_alert_manager(AlertManager(config))
-
-    zone_mappings = {}
-    for zone in _parse_zones():
-        zone_mappings[zone.get_id()] = zone
-
-    items: tuple[ItemRegistryItem] = Items.get_items()
-    for item in items:
-        for pattern in mappings.keys():
-
-            device = None
-            if re.match(pattern, item.name) is not None:
-                device = mappings[pattern](immutable_zm, item)
-
-            if device is not None:
-                zone_id = df.get_zone_id_from_item_name(item.name)
-                if zone_id is None:
-                    pe.log_warning("Can't get zone id from item name '{}'".format(item.name))
-                    continue
-
-                if zone_id not in zone_mappings.keys():
-                    pe.log_warning("Invalid zone id '{}'".format(zone_id))
-                    continue
-
-                zone = zone_mappings[zone_id].add_device(device)
-                zone_mappings[zone_id] = zone
-
-    # Add specific devices to the Virtual Zone
-    zone = next((z for z in zone_mappings.values() if z.get_name() == 'Virtual'), None)
-    if zone is not None:
-        zone = zone.add_device(immutable_zm.activity_times)
-        zone_mappings[zone.get_id()] = zone
-
-    action_classes = get_action_classes(actions_package, actions_path)
-    zone_mappings = add_actions(zone_mappings, action_classes, action_parameters)
-
-    for z in zone_mappings.values():
-        zm.add_zone(z)
-
-    immutable_zm.start()
-
-    return immutable_zm
-
 
 def _parse_zones() -> List[Zone]:
     """
@@ -153,15 +231,14 @@ def _parse_zones() -> List[Zone]:
             continue
 
         zone_name = match.group(1)
-        item_def = HABApp.openhab.interface_sync.get_item(item.name)
-        metadata = item_def.metadata
+        metadata = pe.get_item_metadata(item.name)
 
         level = Level(df.get_meta_value(metadata, "level"))
         external = df.get_meta_value(metadata, "external", False)
         display_icon = df.get_meta_value(metadata, "displayIcon", '')
         display_order = int(df.get_meta_value(metadata, "displayOrder", 9999))
 
-        zone = Zone(zone_name, [], level, [], {}, external, display_icon, display_order)
+        builder = ZoneBuilder(zone_name, level, external, display_icon, display_order)
 
         neighbor_type_mappings = {
             'closeSpaceNeighbors': NeighborType.CLOSED_SPACE,
@@ -176,46 +253,53 @@ def _parse_zones() -> List[Zone]:
                     neighbor_id = neighbor_id.strip()
                     neighbor = Neighbor(neighbor_id, neighbor_type_mappings[neighbor_type_str])
 
-                    zone = zone.add_neighbor(neighbor)
+                    builder.add_neighbor(neighbor)
 
-        zones.append(zone)
+        zones.append(builder.build())
 
     return zones
 
 
-def add_actions(zone_mappings: Dict, action_classes: List[Type], parameters: Parameters) -> Dict:
+def add_actions(zone_mappings: Dict, action_classes: List[Type], parameters: Parameters,
+                disabled_action_names: Collection[str] = ()) -> Dict:
     """
     Create action instances from action_classes and add them to the zones.
     A set of filters are applied to ensure that only the application actions are added to each zone.
-    As the Zone class is immutable, a new Zone instance is created after adding an action. As such, a zone_mappings
-    dictionary must be provided.
+    As the Zone class is immutable, the actions are accumulated in a :class:`ZoneBuilder` per zone, and a new Zone
+    instance is created once per zone. As such, a zone_mappings dictionary must be provided.
 
     :param str zone_mappings: mappings from zone_id string to a Zone instance.
     :param str action_classes: the list of action types.
     :param Parameters parameters: the Parameter implementation
+    :param disabled_action_names: the names of the disabled actions left out of action_classes; their parameters
+        are not validated.
     :raise ValueError: if there are invalid parameters
     """
-    (validated, errors) = parameters.validate(action_classes)
+    (validated, errors) = parameters.validate(action_classes, disabled_action_names)
     if not validated:
         raise ValueError("\n".join(errors))
 
+    # The filters only depend on the zone attributes and devices, which the actions don't change.
+    zone_builders = {zone_id: ZoneBuilder.from_zone(zone) for zone_id, zone in zone_mappings.items()}
+
     for clazz in action_classes:
         action: Action = clazz(parameters)
 
         if action.get_parameter('disabled', False):
             continue
 
-        for zone in zone_mappings.values():
+        for zone_id, zone in zone_mappings.items():
             if not _can_add_action_to_zone(zone, action):
                 continue
 
             if action.must_be_unique_instance:
                 local_action: Action = clazz(parameters)
-                zone = zone.add_action(local_action)
+                zone_builders[zone_id].add_action(local_action)
             else:
-                zone = zone.add_action(action)
+                zone_builders[zone_id].add_action(action)
 
-            zone_mappings[zone.get_id()] = zone
+    for zone_id, builder in zone_builders.items():
+        zone_mappings[zone_id] = builder.build()
 
     return zone_mappings
 
@@ -249,7 +333,8 @@ def _can_add_action_to_zone(zone: Zone, action: Action) -> bool:
 
 
 def get_action_classes(actions_package: str = "zone_api.core.actions",
-                       actions_path: List[str] = actions.__path__) -> List[Type]:
+                       actions_path: List[str] = actions.__path__,
+                       excluded_action_names: Collection[str] = ()) -> List[Type]:
     """
     Retrieve a list of action class types defined in the actions_path with the given actions_package.
 
@@ -257,32 +342,49 @@ def get_action_classes(actions_package: str = "zone_api.core.actions",
     are used:
       1. The normalized action name must be the same as the normalized module name.
          e.g. action 'ManagePlugs' is defined in the file 'manage_plugs.py'.
-      2. The class defined in the module must be an instance of 'Action'.
+      2. The class defined in the module must be a subclass of 'Action'.
+
+    The candidate classes come from the action manifest (see :mod:`action_manifest`), built without importing the
+    modules; only the modules of the returned classes are imported.
 
     :param str actions_package: the package of the action classes.
     :param str actions_path: the absolute path to the action classes.
+    :param excluded_action_names: the names of the action classes to skip without importing their modules.
     """
     classes = []
 
-    for importer, module_name, is_pkg in pkgutil.iter_modules(actions_path):
-        module = importlib.import_module(f"{actions_package}.{module_name}")
-
-        for (name, value) in inspect.getmembers(module, lambda member: inspect.isclass(member)):
-            normalized_module_name = module_name.replace('_', '').lower()
-            if name.lower() == normalized_module_name:
-                try:
-                    clazz = getattr(module, name)
-                    obj = clazz(MapParameters({}))
-                    if isinstance(obj, Action):
-                        classes.append(clazz)
-                except AttributeError:
-                    pass
-                except TypeError:
-                    pass
+    for entry in get_action_manifest(actions_path):
+        if entry.class_name in excluded_action_names:
+            continue
+
+        module = importlib.import_module(f"{actions_package}.{entry.module_name}")
+        clazz = getattr(module, entry.class_name, None)
+        if inspect.isclass(clazz) and issubclass(clazz, Action):
+            classes.append(clazz)
 
     return classes
 
 
+def get_disabled_action_names(config: dict[Hashable, Any], actions_path: List[str] = actions.__path__) -> List[str]:
+    """
+    Returns the names of the actions with the 'disabled' parameter set to true (or 'true') in the 'action-parameters'.
+    The names that aren't in the action manifest are left out, so that they are still reported as unsupported action
+    types by the parameter validation.
+
+    :param str actions_path: the absolute path to the action classes.
+    """
+    all_action_params = config.get('action-parameters') or {}
+    class_names = set(entry.class_name for entry in get_action_manifest(actions_path))
+
+    return [action_name for action_name, action_params in all_action_params.items()
+            if action_params is not None and action_name in class_names
+            and _is_true(action_params.get('disabled'))]
+
+
+def _is_true(value: Any) -> bool:
+    return value is True or (isinstance(value, str) and value.strip().lower() == 'true')
+
+
 def _read_zone_api_configurations(config: dict[Hashable, Any]) -> MapParameters:
     flat_map = {}
 
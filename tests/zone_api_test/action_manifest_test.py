@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+
+from zone_api import action_manifest
+from zone_api.action_manifest import ActionManifestEntry, get_action_manifest
+
+ACTION_MODULE = """
+from zone_api.core.action import action, Action
+from zone_api.core.zone_event import ZoneEvent
+
+
+@action(events=[ZoneEvent.MOTION])
+class TurnOnLights:
+    def on_action(self, event_info):
+        return True
+"""
+
+UNDECORATED_ACTION_MODULE = """
+from zone_api.core.action import Action
+
+
+class PlayBell(Action):
+    pass
+"""
+
+HELPER_MODULE = """
+class RangeAlert:
+    pass
+"""
+
+MISMATCHED_NAME_MODULE = """
+from zone_api.core.action import action
+
+
+@action()
+class AnotherName:
+    pass
+"""
+
+
+class ActionManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        self.manifest_file = os.path.join(self.path, 'manifest.json')
+
+        self._write_module('turn_on_lights', ACTION_MODULE)
+        self._write_module('play_bell', UNDECORATED_ACTION_MODULE)
+        self._write_module('range_alert', HELPER_MODULE)
+        self._write_module('mismatched_name', MISMATCHED_NAME_MODULE)
+        self._write_module('broken', 'class Broken(:')
+
+    def tearDown(self):
+        action_manifest.set_cache_directory(None)
+        self.directory.cleanup()
+
+    def testGetActionManifest_modules_returnsActionClassesWithoutImport(self):
+        manifest = get_action_manifest([self.path], self.manifest_file)
+
+        self.assertEqual([ActionManifestEntry('play_bell', 'PlayBell'),
+                          ActionManifestEntry('turn_on_lights', 'TurnOnLights')], manifest)
+        self.assertTrue(os.path.exists(self.manifest_file))
+
+    def testGetActionManifest_unchangedModules_returnsCachedManifest(self):
+        manifest = get_action_manifest([self.path], self.manifest_file)
+
+        self.assertIs(manifest, get_action_manifest([self.path], self.manifest_file))
+
+        action_manifest._manifests.clear()
+        self.assertEqual(manifest, get_action_manifest([self.path], self.manifest_file))
+
+    def testGetActionManifest_moduleAdded_rebuildsManifest(self):
+        get_action_manifest([self.path], self.manifest_file)
+
+        self._write_module('send_alert', ACTION_MODULE.replace('TurnOnLights', 'SendAlert'))
+
+        self.assertIn(ActionManifestEntry('send_alert', 'SendAlert'),
+                      get_action_manifest([self.path], self.manifest_file))
+
+    def testGetActionManifest_invalidManifestFile_rebuildsManifest(self):
+        with open(self.manifest_file, 'w') as file:
+            file.write('not json')
+
+        self.assertEqual(2, len(get_action_manifest([self.path], self.manifest_file)))
+
+    def testGetActionManifest_defaultManifestFile_writtenToCacheDirectory(self):
+        cache_directory = os.path.join(self.path, 'cache')
+        action_manifest.set_cache_directory(cache_directory)
+
+        get_action_manifest([self.path])
+
+        self.assertEqual(1, len(os.listdir(cache_directory)))
+        self.assertTrue(os.listdir(cache_directory)[0].startswith(action_manifest.MANIFEST_FILE_PREFIX))
+        self.assertFalse(os.path.exists(os.path.join(self.path, '__pycache__')))
+
+    def testGetActionManifest_unwritableCacheDirectory_returnsManifest(self):
+        not_a_directory = os.path.join(self.path, 'turn_on_lights.py')
+        action_manifest.set_cache_directory(not_a_directory)
+
+        self.assertEqual(2, len(get_action_manifest([self.path])))
+
+    def testGetActionManifest_invalidPath_returnsEmptyManifestWithoutWritingFile(self):
+        invalid_path = os.path.join(self.path, 'an invalid path')
+
+        self.assertEqual([], get_action_manifest([invalid_path]))
+        self.assertFalse(os.path.exists(invalid_path))
+
+    def _write_module(self, module_name: str, content: str):
+        with open(os.path.join(self.path, module_name + '.py'), 'w') as file:
+            file.write(content)
@@ -1,14 +1,19 @@
+import gc
+import itertools
 import unittest
 from unittest.mock import MagicMock, PropertyMock
 
+from zone_api import platform_encapsulator as pe
+
 from zone_api.core.devices.activity_times import ActivityType, ActivityTimes
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.event_info import EventInfo
 from zone_api.core.immutable_zone_manager import ImmutableZoneManager
 from zone_api.core.parameters import Parameters
-from zone_api.core.zone import Level
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Level, Zone
 from zone_api.core.zone_event import ZoneEvent
-from zone_api.core.action import validate, action, Action
+from zone_api.core.action import validate, action, Action, FilterPlan
 
 
 class ActionTest(unittest.TestCase):
@@ -300,6 +305,84 @@ class ActionTest(unittest.TestCase):
 
         self.assertEqual(TestAction().priority, 100)
 
+    def testFilterPlan_zoneNotMatchingStaticCriteria_rejectsInternalEventsOnly(self):
+        @action(events=[ZoneEvent.MOTION], external_events=[ZoneEvent.DOOR_OPEN], levels=[Level.SECOND_FLOOR])
+        class TestAction(Action):
+            def on_action(self, event_info):
+                return True
+
+        plan = FilterPlan(TestAction(MapParameters({})), Zone('Office', [], Level.FIRST_FLOOR))
+
+        self.assertFalse(plan.zone_matched)
+        self.assertFalse(plan.accepts_event_type(ZoneEvent.MOTION, True))
+        self.assertTrue(plan.accepts_event_type(ZoneEvent.DOOR_OPEN, False))
+
+    def testCompileFilterPlan_zoneWithPlan_wrapperUsesPlan(self):
+        @action(events=[ZoneEvent.MOTION])
+        class TestAction(Action):
+            def on_action(self, event_info):
+                return True
+
+        test_action = TestAction(MapParameters({}))
+        motion_item = pe.create_switch_item('FilterPlanMotionSensor')
+        zone = Zone('Office', [MotionSensor(motion_item)], Level.FIRST_FLOOR).add_action(test_action)
+        event_info = EventInfo(ZoneEvent.MOTION, motion_item, zone, MagicMock(), MagicMock())
+
+        plan = test_action.compile_filter_plan(zone)
+        self.assertIs(plan, test_action.get_filter_plan(zone))
+        self.assertTrue(test_action.on_action(event_info))
+
+        plan._zone_matched = False
+        self.assertFalse(test_action.on_action(event_info))
+
+    def testCompileFilterPlan_zoneDiscarded_planDiscarded(self):
+        @action(events=[ZoneEvent.MOTION])
+        class TestAction(Action):
+            def on_action(self, event_info):
+                return True
+
+        test_action = TestAction(MapParameters({}))
+        zone = Zone('Office', [], Level.FIRST_FLOOR).add_action(test_action)
+        test_action.compile_filter_plan(zone)
+        # noinspection PyProtectedMember
+        self.assertEqual(1, len(test_action._filter_plans))
+
+        del zone
+        gc.collect()
+        # noinspection PyProtectedMember
+        self.assertEqual(0, len(test_action._filter_plans))
+
+    def testFilterPlan_allCriteriaCombinations_sameResultAsUncompiledValidation(self):
+        motion_item = pe.create_switch_item('FilterPlanMotionSensor')
+        other_item = pe.create_switch_item('FilterPlanOtherItem')
+        zones = [Zone('Foyer', [MotionSensor(motion_item)], Level.FIRST_FLOOR),
+                 Zone('Office', [], Level.SECOND_FLOOR),
+                 Zone.create_external_zone('Porch')]
+        decorator_params = [
+            dict(events=[ZoneEvent.MOTION]),
+            dict(events=[ZoneEvent.MOTION], devices=[MotionSensor]),
+            dict(events=[ZoneEvent.MOTION, ZoneEvent.DOOR_OPEN], external_events=[ZoneEvent.DOOR_OPEN]),
+            dict(events=[ZoneEvent.DOOR_OPEN], internal=False, external=True),
+            dict(events=[ZoneEvent.MOTION], levels=[Level.SECOND_FLOOR], external_events=[ZoneEvent.MOTION]),
+            dict(events=[ZoneEvent.MOTION], zone_name_pattern='Foy.*'),
+        ]
+
+        for params, zone, event, item in itertools.product(
+                decorator_params, zones, [ZoneEvent.MOTION, ZoneEvent.DOOR_OPEN, ZoneEvent.TIMER],
+                [motion_item, other_item]):
+            @action(**params)
+            class TestAction(Action):
+                def on_action(self, event_info):
+                    return True
+
+            test_action = TestAction(MapParameters({}))
+            event_info = EventInfo(event, item, zone, MagicMock(), MagicMock())
+
+            expected = test_action.on_action(event_info)
+            test_action.compile_filter_plan(zone)
+            self.assertEqual(expected, test_action.on_action(event_info),
+                             f"{params}, {zone.get_name()}, {event.name}, {item.name}")
+
     @staticmethod
     def create_action():
         """ Creates a mocked action that enables filtering and having no specified zone name pattern. """
@@ -80,3 +80,24 @@ class ArmIfNoMovementTest(DeviceTest):
         value = self.action.on_action(event_info)
         self.assertFalse(value)
         self.assertTrue(self.alarmPartition.is_unarmed())
+
+    def testOnStartup_startsTimer(self):
+        event_info = EventInfo(ZoneEvent.STARTUP, None,
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        try:
+            self.action.on_startup(event_info)
+            # noinspection PyProtectedMember
+            self.assertTrue(self.action._timer.is_scheduled())
+        finally:
+            self.action.on_destroy(event_info)
+
+        # noinspection PyProtectedMember
+        self.assertIsNone(self.action._timer)
+
+    def testOnAction_disarmedBeforeStartup_noTimer(self):
+        event_info = EventInfo(ZoneEvent.PARTITION_DISARMED_FROM_STAY, self.alarmPartition.get_item(),
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        self.assertTrue(self.action.on_action(event_info))
+        # noinspection PyProtectedMember
+        self.assertIsNone(self.action._timer)
+        self.assertTrue(self.alarmPartition.is_unarmed())
@@ -30,6 +30,10 @@ class ArmStayInTheNightTest(DeviceTest):
 
         self.mockZoneManager = create_zone_manager([self.zone1])
 
+    def tearDown(self):
+        self.action.on_destroy(None)
+        super(ArmStayInTheNightTest, self).tearDown()
+
     def testOnAction_timerTriggeredInRightPeriod_armStay(self):
         event_info = EventInfo(ZoneEvent.TIMER, None,
                                self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
@@ -48,3 +52,46 @@ class ArmStayInTheNightTest(DeviceTest):
         value = self.action.on_action(event_info)
         self.assertFalse(value)
         self.assertTrue(self.alarm_partition.is_unarmed())
+
+    def testOnAction_activityTimeChangedInRightPeriod_armStay(self):
+        event_info = EventInfo(ZoneEvent.ACTIVITY_TIME_CHANGED, self.activity_times.get_item(),
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        value = self.action.on_action(event_info)
+        self.assertTrue(value)
+        self.assertTrue(self.alarm_partition.is_armed_stay())
+
+    def testOnAction_disarmedInRightPeriod_startsRearmTimer(self):
+        event_info = EventInfo(ZoneEvent.PARTITION_DISARMED_FROM_STAY, self.alarm_partition.get_item(),
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        try:
+            value = self.action.on_action(event_info)
+            self.assertTrue(value)
+            self.assertTrue(self.alarm_partition.is_unarmed())
+            # noinspection PyProtectedMember
+            self.assertTrue(self.action._timer.is_scheduled())
+        finally:
+            self.action.on_destroy(event_info)
+
+    def testOnAction_timerTriggeredInRightPeriod_checksAgainLater(self):
+        event_info = EventInfo(ZoneEvent.TIMER, None,
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        self.assertTrue(self.action.on_action(event_info))
+        # noinspection PyProtectedMember
+        self.assertTrue(self.action._timer.is_scheduled())
+
+        # Already armed; still checked again later in case the house is disarmed.
+        self.assertFalse(self.action.on_action(event_info))
+        # noinspection PyProtectedMember
+        self.assertTrue(self.action._timer.is_scheduled())
+
+    def testOnAction_timerTriggeredNotInRightPeriod_notCheckedAgain(self):
+        self.activity_times = ActivityTimes({ActivityType.AUTO_ARM_STAY: self.create_outside_time_range()})
+        self.zone1 = Zone('foyer', [self.alarm_partition, self.activity_times]) \
+            .add_action(self.action)
+        self.mockZoneManager = create_zone_manager([self.zone1])
+
+        event_info = EventInfo(ZoneEvent.TIMER, None,
+                               self.zone1, self.mockZoneManager, pe.get_event_dispatcher())
+        self.assertFalse(self.action.on_action(event_info))
+        # noinspection PyProtectedMember
+        self.assertIsNone(self.action._timer)
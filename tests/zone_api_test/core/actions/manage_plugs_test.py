@@ -67,6 +67,38 @@ class ManagePlugsTest(DeviceTest):
         self.assertTrue(value)
         self.assertTrue(self.plug.is_on())
 
+    def testOnAction_timerTriggeredInRightPeriodInOccupiedZone_checksAgainLater(self):
+        self.plug.turn_on(pe.get_event_dispatcher())
+        pe.set_switch_state(self.motionSensor.get_item(), True)
+        self.zm = self._setup_zone_manager({ActivityType.TURN_OFF_PLUGS: '0:00 - 23:59', })
+
+        event_info = EventInfo(ZoneEvent.TIMER, None,
+                               self.zone1, self.zm, pe.get_event_dispatcher())
+        try:
+            self.assertTrue(self.action.on_action(event_info))
+            self.assertTrue(self.plug.is_on())
+            # noinspection PyProtectedMember
+            self.assertTrue(self.action._timer.is_scheduled())
+
+            pe.set_switch_state(self.motionSensor.get_item(), False)
+            # noinspection PyProtectedMember
+            timer = self.action._timer
+            self.assertTrue(self.action.on_action(event_info))
+            self.assertFalse(self.plug.is_on())
+            self.assertFalse(timer.is_scheduled())
+        finally:
+            self.action.on_destroy(event_info)
+
+    def testOnAction_timerTriggeredInRightPeriodInUnoccupiedZone_doesNotCheckAgain(self):
+        self.plug.turn_on(pe.get_event_dispatcher())
+        self.zm = self._setup_zone_manager({ActivityType.TURN_OFF_PLUGS: '0:00 - 23:59', })
+
+        event_info = EventInfo(ZoneEvent.TIMER, None,
+                               self.zone1, self.zm, pe.get_event_dispatcher())
+        self.assertTrue(self.action.on_action(event_info))
+        # noinspection PyProtectedMember
+        self.assertIsNone(self.action._timer)
+
     def testOnAction_timerTriggeredNotInRightPeriod_armStay(self):
         self.plug.turn_on(pe.get_event_dispatcher())
         self.zm = self._setup_zone_manager({ActivityType.TURN_OFF_PLUGS: self.create_outside_time_range()})
@@ -0,0 +1,63 @@
+from datetime import datetime, time
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.actions.set_time_of_day import SetTimeOfDay
+from zone_api.core.devices.astro_sensor import AstroSensor
+from zone_api.core.event_info import EventInfo
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+from zone_api_test.core.device_test import DeviceTest, create_zone_manager
+
+
+class SetTimeOfDayTest(DeviceTest):
+    """ Unit tests for SetTimeOfDay. """
+
+    def setUp(self):
+        items = [pe.create_string_item('AstroSensorName'), pe.create_datetime_item('vSunrise_Time'),
+                 pe.create_datetime_item('vSunset_Time'), pe.create_datetime_item('vEvening_Time')]
+        self.set_items(items)
+        super(SetTimeOfDayTest, self).setUp()
+
+        today = datetime.now().date()
+        for item, hour in zip(items[1:], [7, 19, 16]):
+            item.post_value(datetime.combine(today, time(hour=hour)))
+
+        self.astro_sensor = AstroSensor(items[0])
+        self.action = None
+
+    def tearDown(self):
+        if self.action is not None:
+            self.action.on_destroy(None)
+        super(SetTimeOfDayTest, self).tearDown()
+
+    def testOnStartup_calledTwice_previousTimerCancelled(self):
+        event_info = self._create_startup_event_info(MapParameters({}))
+
+        self.action.on_startup(event_info)
+        # noinspection PyProtectedMember
+        timer = self.action._timer
+        self.action.on_startup(event_info)
+
+        self.assertFalse(timer.is_scheduled())
+        # noinspection PyProtectedMember
+        self.assertTrue(self.action._timer.is_scheduled())
+        self.assertNotEqual('', self.astro_sensor.current_period())
+
+    def testGetNextCheckDelay_defaultParameters_cappedAtMaxCheckDelay(self):
+        self._create_startup_event_info(MapParameters({}))
+
+        # noinspection PyProtectedMember
+        self.assertLessEqual(self.action._get_next_check_delay_in_seconds(), 60 * 60)
+
+    def testGetNextCheckDelay_checkPeriod_cappedAtCheckPeriod(self):
+        self._create_startup_event_info(MapParameters({'SetTimeOfDay.checkPeriodInMinutes': 1,
+                                                       'SetTimeOfDay.maxCheckDelayInMinutes': 30}))
+
+        # noinspection PyProtectedMember
+        self.assertLessEqual(self.action._get_next_check_delay_in_seconds(), 60)
+
+    def _create_startup_event_info(self, parameters: MapParameters) -> EventInfo:
+        self.action = SetTimeOfDay(parameters)
+        zone = Zone('Virtual', [self.astro_sensor]).add_action(self.action)
+        return EventInfo(ZoneEvent.STARTUP, None, zone, create_zone_manager([zone]), pe.get_event_dispatcher())
@@ -0,0 +1,192 @@
+import threading
+from unittest.mock import MagicMock
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.actions.alert_on_external_window_open import AlertOnExternalWindowOpen
+from zone_api.core.async_dispatcher import AsyncDispatcher
+from zone_api.core.devices.contact import Window
+from zone_api.core.devices.gas_sensor import NaturalGasSensor
+from zone_api.core.event_queue import SheddingMode, SheddingPolicy
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+from zone_api_test.core.device_test import DeviceTest
+
+TIMEOUT_IN_SECONDS = 5
+
+
+class AsyncDispatcherTest(DeviceTest):
+    """ Unit tests for async_dispatcher.py. """
+
+    def setUp(self):
+        self.motion_item = pe.create_switch_item('FF_Foyer_MotionSensor')
+        self.window_item = pe.create_switch_item('FF_Patio_Window')
+        self.set_items([self.motion_item, self.window_item])
+        super(AsyncDispatcherTest, self).setUp()
+
+        self.motion_sensor = MotionSensor(self.motion_item)
+        self.window = Window(self.window_item)
+
+        self.release_blocking_action = threading.Event()
+        self.blocking_action_started = threading.Event()
+        self.inline_action_invoked = threading.Event()
+        self.invoking_threads = {}
+
+        test = self
+
+        @action(events=[ZoneEvent.MOTION], blocking=True, priority=1)
+        class BlockingAction(Action):
+            def on_action(self, event_info):
+                test.invoking_threads['blocking'] = threading.current_thread().name
+                test.blocking_action_started.set()
+                return test.release_blocking_action.wait(TIMEOUT_IN_SECONDS)
+
+        @action(events=[ZoneEvent.MOTION], priority=0)
+        class InlineAction(Action):
+            def on_action(self, event_info):
+                test.invoking_threads['inline'] = threading.current_thread().name
+                test.inline_action_invoked.set()
+                return True
+
+        self.blocking_action = BlockingAction(MapParameters({}))
+        self.inline_action = InlineAction(MapParameters({}))
+
+        zone = Zone('Foyer', [self.motion_sensor], Level.FIRST_FLOOR) \
+            .add_action(self.blocking_action).add_action(self.inline_action)
+        self.zm = ZoneManager().add_zone(zone).get_immutable_instance().set_async_dispatch(2)
+        self.zm.start()
+
+    def tearDown(self):
+        self.release_blocking_action.set()
+        self.zm.stop()
+        super(AsyncDispatcherTest, self).tearDown()
+
+    def testCtor_invalidWorkerCount_throwsException(self):
+        with self.assertRaises(ValueError):
+            AsyncDispatcher(self.zm, 0)
+
+    def testBlockingFlag_decoratedActions_returnsDeclaredValue(self):
+        self.assertTrue(self.blocking_action.blocking)
+        self.assertFalse(self.inline_action.blocking)
+
+    def testDispatchEvent_blockingActionStillRunning_inlineActionNotDelayed(self):
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item))
+
+        self.assertTrue(self.blocking_action_started.wait(TIMEOUT_IN_SECONDS))
+        self.assertTrue(self.inline_action_invoked.wait(TIMEOUT_IN_SECONDS))
+        self.assertFalse(self.release_blocking_action.is_set())
+
+        self.assertEqual('ZoneApisDispatcher', self.invoking_threads['inline'])
+        self.assertTrue(self.invoking_threads['blocking'].startswith('ZoneApisBlockingAction'))
+
+    def testDispatchEvent_actionAfterBlockingAction_runsAfterItOnTheSameThread(self):
+        self.zm.stop()
+
+        invocations = []
+
+        @action(events=[ZoneEvent.MOTION], priority=2)
+        class LowPriorityAction(Action):
+            def on_action(self, event_info):
+                invocations.append(('low priority', threading.current_thread().name))
+                return True
+
+        zone = Zone('Foyer', [self.motion_sensor], Level.FIRST_FLOOR) \
+            .add_action(self.blocking_action).add_action(LowPriorityAction(MapParameters({})))
+        self.zm = ZoneManager().add_zone(zone).get_immutable_instance().set_async_dispatch(2)
+        self.zm.start()
+
+        # noinspection PyProtectedMember
+        future = self.zm._async_dispatcher.submit(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item)
+        self.assertTrue(self.blocking_action_started.wait(TIMEOUT_IN_SECONDS))
+        self.assertEqual([], invocations)
+
+        self.release_blocking_action.set()
+        self.assertTrue(future.result(TIMEOUT_IN_SECONDS))
+        self.assertEqual([('low priority', self.invoking_threads['blocking'])], invocations)
+
+    def testSubmit_blockingActionReleased_futureResolvesToProcessed(self):
+        # noinspection PyProtectedMember
+        future = self.zm._async_dispatcher.submit(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item)
+
+        self.assertTrue(self.inline_action_invoked.wait(TIMEOUT_IN_SECONDS))
+        self.assertFalse(future.done())
+
+        self.release_blocking_action.set()
+        self.assertTrue(future.result(TIMEOUT_IN_SECONDS))
+
+    def testStop_started_dispatchesInCallingThreadAgain(self):
+        self.zm.stop()
+        self.release_blocking_action.set()
+
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item))
+        self.assertEqual(threading.current_thread().name, self.invoking_threads['inline'])
+        self.assertEqual(threading.current_thread().name, self.invoking_threads['blocking'])
+
+    def testDispatchEvent_slowAlertAction_motionEventNotDelayed(self):
+        self.zm.stop()
+
+        release_alert = threading.Event()
+        alert_started = threading.Event()
+
+        def process_alert(alert, zone_manager):
+            alert_started.set()
+            return release_alert.wait(2 * TIMEOUT_IN_SECONDS)  # e.g. the TTS playback of a warning alert
+
+        alert_manager = MagicMock()
+        alert_manager.process_alert.side_effect = process_alert
+
+        foyer = Zone('Foyer', [self.motion_sensor], Level.FIRST_FLOOR).add_action(self.inline_action)
+        patio = Zone('Patio', [self.window], Level.FIRST_FLOOR, external=True) \
+            .add_action(AlertOnExternalWindowOpen(MapParameters({})))
+        self.zm = ZoneManager().add_zone(foyer).add_zone(patio).get_immutable_instance() \
+            .set_alert_manager(alert_manager).set_async_dispatch(2)
+        self.zm.start()
+
+        try:
+            self.assertTrue(self.zm.dispatch_event(
+                ZoneEvent.WINDOW_OPEN, pe.get_event_dispatcher(), self.window, self.window_item))
+            self.assertTrue(alert_started.wait(TIMEOUT_IN_SECONDS))
+
+            self.assertTrue(self.zm.dispatch_event(
+                ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item))
+            self.assertTrue(self.inline_action_invoked.wait(TIMEOUT_IN_SECONDS))
+            self.assertFalse(release_alert.is_set())
+        finally:
+            release_alert.set()
+
+    def testDispatchEvent_eventQueueAndBlockingActionRunning_safetyEventNotDelayed(self):
+        self.zm.stop()
+
+        gas_value_item = pe.create_number_item('BM_Utility_GasValue')
+        gas_state_item = pe.create_switch_item('BM_Utility_GasState')
+        gas_sensor = NaturalGasSensor(gas_value_item, gas_state_item)
+        safety_action_invoked = threading.Event()
+
+        @action(events=[ZoneEvent.GAS_TRIGGER_STATE_CHANGED])
+        class SafetyAction(Action):
+            def on_action(self, event_info):
+                safety_action_invoked.set()
+                return True
+
+        foyer = Zone('Foyer', [self.motion_sensor], Level.FIRST_FLOOR).add_action(self.blocking_action)
+        utility = Zone('Utility', [gas_sensor], Level.BASEMENT).add_action(SafetyAction(MapParameters({})))
+        self.zm = ZoneManager().add_zone(foyer).add_zone(utility).get_immutable_instance() \
+            .set_async_dispatch(2).set_event_queue(SheddingPolicy(SheddingMode.NONE))
+        self.zm.start()
+
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor, self.motion_item))
+        self.assertTrue(self.blocking_action_started.wait(TIMEOUT_IN_SECONDS))
+
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.GAS_TRIGGER_STATE_CHANGED, pe.get_event_dispatcher(), gas_sensor, gas_state_item))
+        self.assertTrue(safety_action_invoked.wait(TIMEOUT_IN_SECONDS))
+        self.assertFalse(self.release_blocking_action.is_set())
@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.actions.arm_stay_in_the_night import ArmStayInTheNight
+from zone_api.core.actions.manage_plugs import ManagePlugs
+from zone_api.core.clock import VirtualClock
+from zone_api.core.deadline_scheduler import DeadlineScheduler
+from zone_api.core.devices.activity_times import ActivityTimes, ActivityType
+from zone_api.core.devices.plug import Plug
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.timer_service import Timer, get_timer_service
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+from zone_api_test.core.device_test import DeviceTest, create_zone_manager
+
+START_TIME = datetime(2021, 2, 8, 12, 0)
+
+
+class ClockTest(DeviceTest):
+    """ Unit tests for clock.py, including a simulated day of the house running on a virtual clock. """
+
+    def setUp(self):
+        self.alarm_partition, items = self.create_alarm_partition()
+        items = items + [pe.create_switch_item('_Plug1')]
+        self.set_items(items)
+        super(ClockTest, self).setUp()
+
+        self.clock = VirtualClock(START_TIME)
+        pe.set_clock(self.clock)
+
+        self.plug = Plug(items[-1])
+        self.fired_values = []
+
+    def tearDown(self):
+        pe.set_clock(None)
+        super(ClockTest, self).tearDown()
+
+    def testGetTimerService_virtualClock_returnsVirtualService(self):
+        self.assertIs(self.clock.get_timer_service(), get_timer_service())
+
+    def testNow_virtualClock_returnsStartTime(self):
+        self.assertEqual(START_TIME, self.clock.now())
+        self.assertEqual(START_TIME.timestamp(), self.clock.time())
+
+    def testAdvance_timersDue_firedInDeadlineOrder(self):
+        Timer(20, lambda: self.fired_values.append(('second', self.clock.now()))).start()
+        Timer(10, lambda: self.fired_values.append(('first', self.clock.now()))).start()
+        Timer(60, lambda: self.fired_values.append(('third', self.clock.now()))).start()
+
+        self.clock.advance(30)
+
+        self.assertEqual([('first', START_TIME + timedelta(seconds=10)),
+                          ('second', START_TIME + timedelta(seconds=20))], self.fired_values)
+        self.assertEqual(START_TIME + timedelta(seconds=30), self.clock.now())
+
+    def testAdvance_timerRenewedByHandler_firedAgain(self):
+        timer = None
+
+        def handler():
+            self.fired_values.append(self.clock.now())
+            if len(self.fired_values) < 3:
+                timer.renew(60)
+
+        timer = Timer(60, handler)
+        timer.start()
+        self.clock.advance(3600)
+
+        self.assertEqual([START_TIME + timedelta(minutes=i) for i in range(1, 4)], self.fired_values)
+
+    def testAdvance_cancelledTimer_notFired(self):
+        timer = Timer(10, lambda: self.fired_values.append('fired'))
+        timer.start()
+        timer.cancel()
+
+        self.clock.advance(30)
+        self.assertEqual([], self.fired_values)
+
+    def testAdvance_negativeSeconds_throwsException(self):
+        with self.assertRaises(ValueError):
+            self.clock.advance(-1)
+
+    def testAdvanceTo_timeInThePast_throwsException(self):
+        with self.assertRaises(ValueError):
+            self.clock.advance_to(START_TIME - timedelta(minutes=1))
+
+    def testAdvance_schedulerJobs_runInVirtualTime(self):
+        scheduler = DeadlineScheduler()
+        scheduler.every(15).minutes.do(lambda: self.fired_values.append(self.clock.now()))
+        scheduler.every().day.at('18:30').do(lambda: self.fired_values.append('dinner'))
+        self.clock.add_scheduler(scheduler)
+
+        self.clock.advance_to(START_TIME + timedelta(hours=7))
+
+        self.assertEqual(7 * 4 + 1, len(self.fired_values))
+        self.assertEqual(START_TIME + timedelta(minutes=15), self.fired_values[0])
+        self.assertEqual('dinner', self.fired_values[-3])
+        self.assertEqual(START_TIME + timedelta(hours=7), self.fired_values[-1])
+
+    def testAdvance_oneDay_houseArmedAndPlugsTurnedOffOnTime(self):
+        activity_times = ActivityTimes({
+            ActivityType.AUTO_ARM_STAY: '20:00 - 2:00',
+            ActivityType.TURN_OFF_PLUGS: '23:00 - 2:00',
+        })
+        arm_stay_action = ArmStayInTheNight(MapParameters({}))
+        zone = Zone('Virtual', [self.alarm_partition, self.plug, activity_times]) \
+            .add_action(arm_stay_action) \
+            .add_action(ManagePlugs(MapParameters({})))
+
+        self.alarm_partition.disarm(pe.get_event_dispatcher())
+        self.plug.turn_on(pe.get_event_dispatcher())
+
+        zm = create_zone_manager([zone])
+        zm.start()
+        try:
+            # noinspection PyProtectedMember
+            zm._schedule_activity_transition()
+
+            self.clock.advance_to(datetime(2021, 2, 8, 19, 59))
+            self.assertTrue(self.alarm_partition.is_unarmed())
+
+            self.clock.advance_to(datetime(2021, 2, 8, 20, 1))
+            self.assertTrue(self.alarm_partition.is_armed_stay())
+            self.assertTrue(self.plug.is_on())
+
+            # The house is disarmed during the auto-arm period; it is re-armed after the re-arm delay.
+            self.alarm_partition.disarm(pe.get_event_dispatcher())
+            zm.dispatch_event(ZoneEvent.PARTITION_DISARMED_FROM_STAY, pe.get_event_dispatcher(),
+                              self.alarm_partition, self.alarm_partition.get_item())
+            self.clock.advance(ArmStayInTheNight.REARM_DELAY_IN_SECONDS - 60)
+            self.assertTrue(self.alarm_partition.is_unarmed())
+            self.clock.advance(60)
+            self.assertTrue(self.alarm_partition.is_armed_stay())
+
+            self.clock.advance_to(datetime(2021, 2, 8, 22, 59))
+            self.assertTrue(self.plug.is_on())
+
+            self.clock.advance_to(datetime(2021, 2, 8, 23, 1))
+            self.assertFalse(self.plug.is_on())
+
+            self.clock.advance_to(START_TIME + timedelta(days=1))
+            # noinspection PyProtectedMember
+            self.assertTrue(zm._activity_transition_timer.is_scheduled())
+        finally:
+            zm.stop()
+            arm_stay_action.on_destroy(None)
@@ -0,0 +1,90 @@
+import datetime
+import threading
+import time
+import unittest
+
+import schedule
+
+from zone_api.core.deadline_scheduler import DeadlineScheduler
+
+TIMEOUT_IN_SECONDS = 5
+
+
+class DeadlineSchedulerTest(unittest.TestCase):
+    """ Unit tests for deadline_scheduler.py. """
+
+    def setUp(self):
+        self.scheduler = DeadlineScheduler()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def tearDown(self):
+        self.stop_event.set()
+        self.scheduler.wake()
+        if self.thread is not None:
+            self.thread.join(TIMEOUT_IN_SECONDS)
+
+    def startRunLoop(self):
+        self.thread = threading.Thread(target=self.scheduler.run_until, args=(self.stop_event,), daemon=True)
+        self.thread.start()
+
+    def testCtor_default_scheduleModuleNotPatched(self):
+        self.assertIs(datetime, schedule.datetime)
+
+    def testRunUntil_jobAddedWhileSleeping_wakesUpAndRunsJob(self):
+        self.startRunLoop()
+        time.sleep(0.05)  # the loop is now sleeping with no job
+
+        job_ran = threading.Event()
+        self.scheduler.every(1).seconds.do(job_ran.set)
+
+        self.assertTrue(job_ran.wait(TIMEOUT_IN_SECONDS))
+
+    def testRunUntil_stopEventSet_returns(self):
+        self.startRunLoop()
+        time.sleep(0.05)
+
+        self.stop_event.set()
+        self.scheduler.wake()
+        self.thread.join(TIMEOUT_IN_SECONDS)
+        self.assertFalse(self.thread.is_alive())
+
+    def testCancelJob_jobNotRun(self):
+        job_ran = threading.Event()
+        job = self.scheduler.every(1).seconds.do(job_ran.set)
+        self.startRunLoop()
+
+        self.scheduler.cancel_job(job)
+        self.assertFalse(job_ran.wait(1.5))
+
+    def testClear_taggedAndAllJobs_wakesRunLoop(self):
+        self.scheduler.every(1).hours.do(lambda: None).tag('hourly')
+        self.scheduler.every(2).hours.do(lambda: None)
+
+        for tag in ['hourly', None]:
+            # noinspection PyProtectedMember
+            self.scheduler._wake_pending = False
+            self.scheduler.clear(tag)
+            # noinspection PyProtectedMember
+            self.assertTrue(self.scheduler._wake_pending)
+
+        self.assertEqual(0, len(self.scheduler.get_jobs()))
+
+    def testGetJobStatistics_taggedJobRan_recordsDurationByTag(self):
+        self.scheduler.every(1).seconds.do(lambda: time.sleep(0.01)).tag('slow-job')
+        self.scheduler.run_all()
+
+        statistics = self.scheduler.get_job_statistics()
+        self.assertEqual(['slow-job'], list(statistics.keys()))
+        self.assertEqual(1, statistics['slow-job'].run_count)
+        self.assertGreaterEqual(statistics['slow-job'].max_duration_in_seconds, 0.01)
+
+    def testGetJobStatistics_untaggedJob_keyedByFunctionName(self):
+        def refresh():
+            pass
+
+        self.scheduler.every(1).seconds.do(refresh)
+        self.scheduler.run_all()
+
+        self.assertIn('DeadlineSchedulerTest.testGetJobStatistics_untaggedJob_keyedByFunctionName.<locals>.refresh',
+                      self.scheduler.get_job_statistics())
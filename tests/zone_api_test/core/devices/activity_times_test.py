@@ -82,3 +82,35 @@ class ActivityTimesTest(DeviceTest):
             # noinspection PyTypeChecker
             self.assertTrue(self.activity.is_at_activity_time(None))
         self.assertEqual("Invalid activity type None", cm.exception.args[0])
+
+    def testGetActiveActivityTypes_lunchTime_returnsLunch(self):
+        dt = datetime.datetime(2020, 2, 8, 12, 30)
+        self.assertEqual([ActivityType.LUNCH],
+                         self.activity.get_active_activity_types(time.mktime(dt.timetuple())))
+
+    def testGetNextTransitionTime_inActivity_returnsEndTime(self):
+        dt = datetime.datetime(2020, 2, 8, 7, 10)
+        transition_time = self.activity.get_next_transition_time(ActivityType.WAKE_UP, time.mktime(dt.timetuple()))
+        self.assertEqual(datetime.datetime(2020, 2, 8, 9, 0), datetime.datetime.fromtimestamp(transition_time))
+
+    def testGetNextTransitionTime_notInActivity_returnsStartTime(self):
+        dt = datetime.datetime(2020, 2, 8, 10, 0)
+        transition_time = self.activity.get_next_transition_time(ActivityType.DINNER, time.mktime(dt.timetuple()))
+        self.assertEqual(datetime.datetime(2020, 2, 8, 17, 50), datetime.datetime.fromtimestamp(transition_time))
+
+    def testGetNextTransitionTime_startTimeOnNextDay_returnsStartTime(self):
+        dt = datetime.datetime(2020, 2, 8, 21, 0)
+        transition_time = self.activity.get_next_transition_time(ActivityType.WAKE_UP, time.mktime(dt.timetuple()))
+        self.assertEqual(datetime.datetime(2020, 2, 9, 6, 0), datetime.datetime.fromtimestamp(transition_time))
+
+    def testGetNextTransitionTime_anyActivity_returnsEarliestTransition(self):
+        dt = datetime.datetime(2020, 2, 8, 10, 0)
+        transition_time = self.activity.get_next_transition_time(epoch_seconds=time.mktime(dt.timetuple()))
+        self.assertEqual(datetime.datetime(2020, 2, 8, 12, 0), datetime.datetime.fromtimestamp(transition_time))
+
+    def testGetNextTransitionTime_notConfiguredActivity_returnsNone(self):
+        self.assertIsNone(self.activity.get_next_transition_time(ActivityType.AUTO_ARM_STAY))
+
+    def testGetNextTransitionTime_wholeDayActivity_returnsNone(self):
+        activity = ActivityTimes({ActivityType.TURN_OFF_PLUGS: '0:00 - 23:59'})
+        self.assertIsNone(activity.get_next_transition_time(ActivityType.TURN_OFF_PLUGS))
@@ -0,0 +1,165 @@
+from zone_api import platform_encapsulator as pe
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.temperature_sensor import TemperatureSensor
+from zone_api.core.event_coalescer import EventCoalescer, CoalescingPolicy
+from zone_api.core.zone_event import ZoneEvent
+
+from zone_api_test.core.device_test import DeviceTest
+
+
+class VirtualTimer:
+    """ A timer fired manually by the test when the virtual clock reaches its deadline. """
+
+    def __init__(self, deadline, callback):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class EventCoalescerTest(DeviceTest):
+    """ Unit tests for event_coalescer.py. """
+
+    def setUp(self):
+        self.temperature_item = pe.create_number_item('FF_Office_Temperature')
+        self.motion_item = pe.create_switch_item('FF_Office_MotionSensor')
+        self.set_items([self.temperature_item, self.motion_item])
+        super(EventCoalescerTest, self).setUp()
+
+        self.sensor = TemperatureSensor(self.temperature_item)
+        self.now = 0.0
+        self.timers = []
+        self.dispatched_values = []
+
+        self.coalescer = EventCoalescer(self.dispatch, lambda: self.now, self.start_timer)
+        self.coalescer.set_device_policy(
+            TemperatureSensor, CoalescingPolicy(min_interval_in_seconds=10, deadband=0.5, flush_delay_in_seconds=30))
+
+    def dispatch(self, zone_event, open_hab_events, device, item):
+        self.dispatched_values.append(item.get_value())
+        return True
+
+    def start_timer(self, delay, callback):
+        timer = VirtualTimer(self.now + delay, callback)
+        self.timers.append(timer)
+        return timer
+
+    def advanceClock(self, seconds):
+        self.now += seconds
+        for timer in list(self.timers):
+            if not timer.cancelled and timer.deadline <= self.now:
+                self.timers.remove(timer)
+                timer.callback()
+
+    def sendValue(self, value) -> bool:
+        pe.set_number_value(self.temperature_item, value)
+        return self.coalescer.on_event(ZoneEvent.TEMPERATURE_CHANGED, None, self.sensor, self.temperature_item)
+
+    def testCtor_invalidValues_throwsException(self):
+        with self.assertRaises(ValueError):
+            CoalescingPolicy(min_interval_in_seconds=-1)
+        with self.assertRaises(ValueError):
+            CoalescingPolicy(deadband=-1)
+        with self.assertRaises(ValueError):
+            CoalescingPolicy(flush_delay_in_seconds=0)
+
+    def testOnEvent_noPolicy_dispatchesRightAway(self):
+        motion_sensor = MotionSensor(self.motion_item)
+        self.assertIsNone(self.coalescer.get_policy(motion_sensor, 'FF_Office_MotionSensor'))
+        self.assertTrue(self.coalescer.on_event(ZoneEvent.MOTION, None, motion_sensor, self.motion_item))
+
+    def testGetPolicy_newCoalescer_noPolicy(self):
+        coalescer = EventCoalescer(self.dispatch, lambda: self.now, self.start_timer)
+        self.assertIsNone(coalescer.get_policy(self.sensor, 'FF_Office_Temperature'))
+
+    def testSetDevicePolicy_className_appliesToDevice(self):
+        coalescer = EventCoalescer(self.dispatch, lambda: self.now, self.start_timer)
+        policy = CoalescingPolicy.from_config({'deadband': '0.3', 'flushDelayInSeconds': 300})
+        coalescer.set_device_policy('TemperatureSensor', policy)
+
+        self.assertIs(policy, coalescer.get_policy(self.sensor, 'FF_Office_Temperature'))
+        self.assertEqual((0, 0.3, 300), (policy.min_interval_in_seconds, policy.deadband,
+                                         policy.flush_delay_in_seconds))
+
+        coalescer.set_device_policy(TemperatureSensor, None)
+        self.assertIsNone(coalescer.get_policy(self.sensor, 'FF_Office_Temperature'))
+
+    def testSetDispatchFcn_heldBackEvent_flushedToNewFunction(self):
+        self.sendValue(20)
+        self.sendValue(20.3)
+
+        flushed_values = []
+        self.coalescer.set_dispatch_fcn(lambda zone_event, open_hab_events, device, item:
+                                        flushed_values.append(item.get_value()))
+        self.advanceClock(30)
+
+        self.assertEqual([20], self.dispatched_values)
+        self.assertEqual([20.3], flushed_values)
+
+    def testOnEvent_firstEvent_dispatchesRightAway(self):
+        self.assertTrue(self.sendValue(20))
+        self.assertEqual([20], self.dispatched_values)
+
+    def testOnEvent_withinDeadband_heldBackThenFlushed(self):
+        self.sendValue(20)
+        self.advanceClock(15)
+        self.assertFalse(self.sendValue(20.1))
+        self.assertFalse(self.sendValue(20.2))
+        self.assertEqual([20], self.dispatched_values)
+
+        self.advanceClock(15)
+        self.assertEqual([20, 20.2], self.dispatched_values)
+
+    def testOnEvent_withinMinInterval_heldBackThenFlushedAtMinInterval(self):
+        self.sendValue(20)
+        self.advanceClock(1)
+        self.assertFalse(self.sendValue(25))
+
+        self.advanceClock(8)
+        self.assertEqual([20], self.dispatched_values)
+
+        self.advanceClock(1)
+        self.assertEqual([20, 25], self.dispatched_values)
+
+    def testOnEvent_significantChangeAfterHeldBackEvent_flushedAtMinInterval(self):
+        self.sendValue(20)
+        self.advanceClock(1)
+        self.assertFalse(self.sendValue(20.1))
+        self.advanceClock(4)
+        self.assertFalse(self.sendValue(25))
+
+        self.advanceClock(5)
+        self.assertEqual([20, 25], self.dispatched_values)
+
+    def testOnEvent_significantChange_dispatchesAndCancelsFlush(self):
+        self.sendValue(20)
+        self.advanceClock(5)
+        self.sendValue(20.1)
+
+        self.advanceClock(5)
+        self.assertTrue(self.sendValue(21))
+        self.assertEqual([20, 21], self.dispatched_values)
+        self.assertTrue(all(t.cancelled for t in self.timers))
+
+    def testSetItemPolicy_overridesDevicePolicy(self):
+        self.coalescer.set_item_policy('FF_Office_Temperature', CoalescingPolicy())
+        self.sendValue(20)
+        self.assertTrue(self.sendValue(20.1))
+        self.assertEqual([20, 20.1], self.dispatched_values)
+
+    def testFlush_heldBackEvent_dispatchesLatestValue(self):
+        self.sendValue(20)
+        self.sendValue(20.3)
+        self.coalescer.flush()
+
+        self.assertEqual([20, 20.3], self.dispatched_values)
+
+    def testCancel_heldBackEvent_discarded(self):
+        self.sendValue(20)
+        self.sendValue(20.3)
+        self.coalescer.cancel()
+
+        self.advanceClock(60)
+        self.assertEqual([20], self.dispatched_values)
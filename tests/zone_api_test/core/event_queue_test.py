@@ -0,0 +1,93 @@
+import threading
+import unittest
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.event_queue import EventQueue, SheddingMode, SheddingPolicy
+from zone_api.core.zone_event import EventPriority, ZoneEvent
+
+TIMEOUT_IN_SECONDS = 5
+
+
+class EventQueueTest(unittest.TestCase):
+    """ Unit tests for event_queue.py. """
+
+    def setUp(self):
+        pe.set_in_unit_tests()
+
+        self.temperature_item = pe.create_number_item('FF_Office_Temperature')
+        self.humidity_item = pe.create_number_item('FF_Office_Humidity')
+        self.gas_item = pe.create_switch_item('BM_Utility_GasState')
+        self.motion_item = pe.create_switch_item('FF_Office_MotionSensor')
+
+        self.dispatched = []
+        self.all_dispatched = threading.Event()
+        self.expected_dispatch_count = 0
+
+    def tearDown(self):
+        if hasattr(self, 'queue'):
+            self.queue.stop()
+
+    def dispatch(self, zone_event, open_hab_events, device, item):
+        self.dispatched.append((zone_event, pe.get_item_name(item), open_hab_events))
+        if len(self.dispatched) == self.expected_dispatch_count:
+            self.all_dispatched.set()
+        return True
+
+    def startAndWait(self, expected_dispatch_count):
+        self.expected_dispatch_count = expected_dispatch_count
+        self.queue.start()
+        self.assertTrue(self.all_dispatched.wait(TIMEOUT_IN_SECONDS))
+
+    def testPriority_safetyEvents_returnsSafety(self):
+        self.assertEqual(EventPriority.SAFETY, ZoneEvent.GAS_TRIGGER_STATE_CHANGED.priority)
+        self.assertEqual(EventPriority.SAFETY, ZoneEvent.PARTITION_FIRE_ALARM_STATE_CHANGED.priority)
+        self.assertEqual(EventPriority.VALUE_CHANGE, ZoneEvent.COMPUTER_GPU_TEMPERATURE_CHANGED.priority)
+        self.assertEqual(EventPriority.NORMAL, ZoneEvent.MOTION.priority)
+
+    def testCtor_negativeBacklogThreshold_throwsException(self):
+        with self.assertRaises(ValueError):
+            SheddingPolicy(SheddingMode.DROP, -1)
+
+    def testPut_mixedPriorities_dispatchesSafetyFirst(self):
+        self.queue = EventQueue(self.dispatch, SheddingPolicy(SheddingMode.NONE))
+        self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, None, None, self.temperature_item)
+        self.queue.put(ZoneEvent.MOTION, None, None, self.motion_item)
+        self.queue.put(ZoneEvent.GAS_TRIGGER_STATE_CHANGED, None, None, self.gas_item)
+        self.queue.put(ZoneEvent.HUMIDITY_CHANGED, None, None, self.humidity_item)
+
+        self.startAndWait(4)
+        self.assertEqual([ZoneEvent.GAS_TRIGGER_STATE_CHANGED, ZoneEvent.MOTION, ZoneEvent.TEMPERATURE_CHANGED,
+                          ZoneEvent.HUMIDITY_CHANGED], [d[0] for d in self.dispatched])
+
+    def testPut_backloggedCoalesce_mergesIntoPendingEvent(self):
+        self.queue = EventQueue(self.dispatch, SheddingPolicy(SheddingMode.COALESCE, 1))
+        self.assertTrue(self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, 'first', None, self.temperature_item))
+        self.assertTrue(self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, 'second', None, self.temperature_item))
+        self.assertTrue(self.queue.put(ZoneEvent.HUMIDITY_CHANGED, None, None, self.humidity_item))
+        self.assertEqual(2, self.queue.get_pending_count())
+
+        self.startAndWait(2)
+        self.assertEqual((ZoneEvent.TEMPERATURE_CHANGED, 'FF_Office_Temperature', 'second'), self.dispatched[0])
+        self.assertEqual({ZoneEvent.TEMPERATURE_CHANGED: 1}, self.queue.get_coalesced_counts())
+        self.assertEqual({}, self.queue.get_dropped_counts())
+
+    def testPut_backloggedDrop_dropsValueChangesButNotSafetyEvents(self):
+        self.queue = EventQueue(self.dispatch, SheddingPolicy(SheddingMode.DROP, 1))
+        self.assertTrue(self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, None, None, self.temperature_item))
+        self.assertFalse(self.queue.put(ZoneEvent.HUMIDITY_CHANGED, None, None, self.humidity_item))
+        self.assertTrue(self.queue.put(ZoneEvent.GAS_TRIGGER_STATE_CHANGED, None, None, self.gas_item))
+        self.assertTrue(self.queue.put(ZoneEvent.GAS_TRIGGER_STATE_CHANGED, None, None, self.gas_item))
+
+        self.startAndWait(3)
+        self.assertEqual([ZoneEvent.GAS_TRIGGER_STATE_CHANGED, ZoneEvent.GAS_TRIGGER_STATE_CHANGED,
+                          ZoneEvent.TEMPERATURE_CHANGED], [d[0] for d in self.dispatched])
+        self.assertEqual({ZoneEvent.HUMIDITY_CHANGED: 1}, self.queue.get_dropped_counts())
+
+    def testPut_notBacklogged_doesNotShed(self):
+        self.queue = EventQueue(self.dispatch, SheddingPolicy(SheddingMode.DROP, 10))
+        self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, None, None, self.temperature_item)
+        self.queue.put(ZoneEvent.TEMPERATURE_CHANGED, None, None, self.temperature_item)
+
+        self.startAndWait(2)
+        self.assertEqual({}, self.queue.get_coalesced_counts())
+        self.assertEqual({}, self.queue.get_dropped_counts())
@@ -0,0 +1,116 @@
+from zone_api import platform_encapsulator as pe
+from zone_api import security_manager as sm
+from zone_api.core.devices.alarm_partition import AlarmState
+from zone_api.core.devices.astro_sensor import AstroSensor
+from zone_api.core.devices.thermostat import EcobeeThermostat
+from zone_api.core.house_state import HouseState, HouseStateSnapshot
+from zone_api.core.zone import Zone
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+from zone_api_test.core.device_test import DeviceTest, create_zone_manager
+
+
+class HouseStateTest(DeviceTest):
+    """ Unit tests for house_state.py. """
+
+    def setUp(self):
+        self.partition, partition_items = self.create_alarm_partition()
+        items = partition_items + [pe.create_string_item('EcobeeName'), pe.create_string_item('EcobeeEventType'),
+                                   pe.create_string_item('AstroSensorName')]
+        self.set_items(items)
+        super(HouseStateTest, self).setUp()
+
+        self.arm_mode_item = partition_items[1]
+        self.ecobee_event_type_item = items[5]
+        self.astro_sensor_item = items[6]
+
+        self.thermostat = EcobeeThermostat(items[4], self.ecobee_event_type_item)
+        self.astro_sensor = AstroSensor(self.astro_sensor_item)
+
+        pe.set_number_value(self.arm_mode_item, AlarmState.UNARMED.value)
+        pe.set_string_value(self.astro_sensor_item, 'MORNING')
+
+        self.zones = [Zone('Foyer', [self.partition]), Zone('Virtual', [self.thermostat, self.astro_sensor])]
+
+    def testResolve_noDevice_returnsDefaultStates(self):
+        house_state = HouseState.resolve([Zone('Foyer')])
+
+        self.assertEqual(HouseStateSnapshot(False, None, None), house_state.get_snapshot())
+        self.assertIsNone(house_state.get_partition())
+
+    def testResolve_readsCurrentStates(self):
+        pe.set_string_value(self.ecobee_event_type_item, EcobeeThermostat.VACATION_EVENT_TYPE)
+        pe.set_string_value(self.astro_sensor_item, AstroSensor.LIGHT_ON_TIMES[0])
+        pe.set_number_value(self.arm_mode_item, AlarmState.ARM_AWAY.value)
+
+        house_state = HouseState.resolve(self.zones)
+
+        self.assertEqual(HouseStateSnapshot(True, True, AlarmState.ARM_AWAY), house_state.get_snapshot())
+        self.assertIs(self.partition, house_state.get_partition())
+
+    def testOnEvent_stateEvents_updatesStatesWithoutReadingItems(self):
+        house_state = HouseState.resolve(self.zones)
+
+        house_state.on_event(ZoneEvent.VACATION_MODE_ON, self.thermostat)
+        house_state.on_event(ZoneEvent.ASTRO_LIGHT_ON, self.astro_sensor)
+        house_state.on_event(ZoneEvent.PARTITION_ARMED_STAY, self.partition)
+        self.assertEqual(HouseStateSnapshot(True, True, AlarmState.ARM_STAY), house_state.get_snapshot())
+
+        house_state.on_event(ZoneEvent.VACATION_MODE_OFF, self.thermostat)
+        house_state.on_event(ZoneEvent.ASTRO_LIGHT_OFF, self.astro_sensor)
+        house_state.on_event(ZoneEvent.PARTITION_DISARMED_FROM_STAY, self.partition)
+        self.assertEqual(HouseStateSnapshot(False, False, AlarmState.UNARMED), house_state.get_snapshot())
+
+    def testOnEvent_armCommandReceived_armModeUnchanged(self):
+        house_state = HouseState.resolve(self.zones)
+        house_state.on_event(ZoneEvent.PARTITION_RECEIVE_ARM_AWAY, self.partition)
+
+        self.assertEqual(AlarmState.UNARMED, house_state.get_arm_mode())
+
+    def testOnEvent_otherEvent_snapshotNotReplaced(self):
+        house_state = HouseState.resolve(self.zones)
+        snapshot = house_state.get_snapshot()
+
+        house_state.on_event(ZoneEvent.MOTION, self.astro_sensor)
+        self.assertIs(snapshot, house_state.get_snapshot())
+
+    def testDispatchEvent_startedZoneManager_keepsHouseStateCurrent(self):
+        zm = create_zone_manager(self.zones)
+        self.assertIsNone(zm.get_house_state())
+
+        zm.start()
+        try:
+            self.assertFalse(zm.is_light_on_time())
+            self.assertTrue(sm.is_unarmed(zm))
+
+            zm.dispatch_event(ZoneEvent.ASTRO_BED_TIME, pe.get_event_dispatcher(), self.astro_sensor,
+                              self.astro_sensor_item)
+            zm.dispatch_event(ZoneEvent.PARTITION_ARMED_AWAY, pe.get_event_dispatcher(), self.partition,
+                              self.partition.get_item())
+            zm.dispatch_event(ZoneEvent.VACATION_MODE_ON, pe.get_event_dispatcher(), self.thermostat,
+                              self.ecobee_event_type_item)
+
+            self.assertTrue(zm.is_light_on_time())
+            self.assertTrue(zm.is_in_vacation())
+            self.assertTrue(sm.is_armed_away(zm))
+            self.assertFalse(sm.is_unarmed(zm))
+        finally:
+            zm.stop()
+
+        self.assertIsNone(zm.get_house_state())
+
+    def testGetHouseState_zoneAddedAfterStart_resolvesHouseStateAgain(self):
+        zm = ZoneManager().add_zone(self.zones[0])
+        izm = zm.get_immutable_instance()
+        izm.start()
+        try:
+            self.assertIsNone(izm.is_light_on_time())
+
+            pe.set_string_value(self.astro_sensor_item, AstroSensor.LIGHT_ON_TIMES[0])
+            zm.add_zone(self.zones[1])
+
+            self.assertTrue(izm.is_light_on_time())
+            self.assertIs(izm.get_house_state(), izm.get_house_state())
+        finally:
+            izm.stop()
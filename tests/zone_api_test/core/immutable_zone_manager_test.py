@@ -1,10 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
+from unittest.mock import MagicMock
 
+from zone_api.core.action import action, Action
 from zone_api.core.device import Device
-from zone_api.core.devices.activity_times import ActivityType
+from zone_api.core.devices.activity_times import ActivityTimes, ActivityType
 from zone_api.core.devices.astro_sensor import AstroSensor
 from zone_api.core.devices.thermostat import EcobeeThermostat
+from zone_api.core.event_queue import SheddingPolicy
 from zone_api.core.immutable_zone_manager import ImmutableZoneManager
+from zone_api.core.map_parameters import MapParameters
 from zone_api.core.neighbor import Neighbor
 from zone_api.core.zone_manager import ZoneManager
 from zone_api import platform_encapsulator as pe
@@ -170,7 +175,7 @@ class ImmutableZoneManagerTest(DeviceTest):
               activity-times:
                 {ActivityType.WAKE_UP.value}: '6:35 - 9'
                 {ActivityType.LUNCH.value}: '12:00 - 13:30'
-                {ActivityType.QUIET.value}: '14:00 - 16:00 20:00 - 22:59'
+                {ActivityType.QUIET.value}: '14:00 - 16:00, 20:00 - 22:59'
                 {ActivityType.DINNER.value}: '17:50 - 20:00'
                 {ActivityType.SLEEP.value}: '23:00 - 7:00'
                 {ActivityType.AUTO_ARM_STAY.value}: '20:00 - 2:00'
@@ -182,3 +187,238 @@ class ImmutableZoneManagerTest(DeviceTest):
 
         activity_times = ImmutableZoneManager._create_activity_times(config)
         self.assertTrue(activity_times is not None)
+
+    def testDispatch_routingTable_onlyAcceptingActionsInvokedInOrder(self):
+        invocations = []
+        owning_zone = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'internal', events=[ZoneEvent.MOTION]))
+        other_zone = Zone('Kitchen', [self.light], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'not-containing-item', events=[ZoneEvent.MOTION]))
+        listening_zone = Zone('Office', [self.fan], Level.FIRST_FLOOR, display_order=0) \
+            .add_action(self._create_recording_action(
+                invocations, 'external', events=[ZoneEvent.DOOR_OPEN], external_events=[ZoneEvent.MOTION]))
+
+        izm = ZoneManager().add_zone(owning_zone).add_zone(other_zone).add_zone(listening_zone) \
+            .get_immutable_instance()
+        izm.start()
+
+        self.assertTrue(izm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motionSensor, self.motionSensorItem))
+        self.assertEqual(['internal', 'external'], invocations)
+
+        route = izm._get_event_route(ZoneEvent.MOTION, self.motionSensorItem.name)
+        self.assertEqual([owning_zone, listening_zone], [z for z, a in route])
+
+        izm.stop()
+
+    def testGetEventRoute_concurrentLookups_sameRouteInstance(self):
+        zone = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action([], 'internal', events=[ZoneEvent.MOTION]))
+        izm = ZoneManager().add_zone(zone).get_immutable_instance()
+        izm.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                routes = list(executor.map(
+                    lambda _: izm._get_event_route(ZoneEvent.MOTION, self.motionSensorItem.name), range(32)))
+
+            self.assertEqual(1, len(routes[0]))
+            self.assertTrue(all(route is routes[0] for route in routes))
+        finally:
+            izm.stop()
+
+    def testDispatch_zoneAddedAfterStart_routingTableRebuilt(self):
+        invocations = []
+        zone = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'internal', events=[ZoneEvent.MOTION]))
+        zm = ZoneManager().add_zone(zone)
+        izm = zm.get_immutable_instance()
+        izm.start()
+
+        try:
+            self.assertTrue(izm.dispatch_event(
+                ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motionSensor, self.motionSensorItem))
+
+            zm.add_zone(Zone('Office', [self.fan], Level.FIRST_FLOOR).add_action(self._create_recording_action(
+                invocations, 'external', events=[ZoneEvent.DOOR_OPEN], external_events=[ZoneEvent.MOTION])))
+            invocations.clear()
+
+            self.assertTrue(izm.dispatch_event(
+                ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motionSensor, self.motionSensorItem))
+            self.assertEqual(['internal', 'external'], invocations)
+            self.assertEqual([('Office', self.fan)],
+                             [(z.get_name(), d) for z, d in izm.get_zone_devices_by_item_name(self.fanItem.name)])
+        finally:
+            izm.stop()
+
+    def testDispatch_routingTableItemNotInAnyZone_onlyExternalActionsInvoked(self):
+        invocations = []
+        zone = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'internal', events=[ZoneEvent.MOTION])) \
+            .add_action(self._create_recording_action(
+                invocations, 'external', events=[ZoneEvent.DOOR_OPEN], external_events=[ZoneEvent.MOTION]))
+
+        izm = ZoneManager().add_zone(zone).get_immutable_instance()
+        izm.start()
+
+        self.assertTrue(izm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.illuminanceSensor, self.illuminanceSensorItem))
+        self.assertEqual(['external'], invocations)
+
+        izm.stop()
+
+    def testDispatch_notStarted_broadcastsToAllZones(self):
+        invocations = []
+        zone = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'internal', events=[ZoneEvent.MOTION]))
+
+        izm = ZoneManager().add_zone(zone).get_immutable_instance()
+
+        self.assertIsNone(izm._get_event_route(ZoneEvent.MOTION, self.motionSensorItem.name))
+        self.assertTrue(izm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motionSensor, self.motionSensorItem))
+        self.assertEqual(['internal'], invocations)
+
+    def testDispatch_zoneOverridesDispatchEvent_routingTableNotBuilt(self):
+        self.assertIsNone(self.immutable_zm._get_event_route(ZoneEvent.MOTION, self.lightItem.name))
+
+    def testGetZoneDevicesByItemName_started_returnsZoneDevicePairsForAnyItem(self):
+        zone1 = Zone('Foyer', [self.shared_light, self.thermostat], Level.FIRST_FLOOR)
+        zone2 = Zone('Kitchen', [self.light, self.shared_light], Level.FIRST_FLOOR)
+        izm = ZoneManager().add_zone(zone1).add_zone(zone2).get_immutable_instance()
+
+        self.assertIsNone(izm.get_zone_devices_by_item_name(self.shared_light_item.name))
+
+        izm.start()
+        try:
+            self.assertEqual(((zone1, self.shared_light), (zone2, self.shared_light)),
+                             izm.get_zone_devices_by_item_name(self.shared_light_item.name))
+            self.assertEqual(((zone1, self.thermostat),),
+                             izm.get_zone_devices_by_item_name(self.ecobee_event_type.name))
+            self.assertEqual((), izm.get_zone_devices_by_item_name(self.fanItem.name))
+            self.assertTrue(zone1.contains_open_hab_item(self.ecobee_event_type, EcobeeThermostat))
+        finally:
+            izm.stop()
+
+    def testOnSwitchTurnedOn_started_onlyZonesContainingTheSwitchVisited(self):
+        invocations = []
+        zone1 = Zone('Foyer', [self.fan], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'foyer', events=[ZoneEvent.SWITCH_TURNED_ON]))
+        zone2 = Zone('Kitchen', [self.light], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(invocations, 'kitchen', events=[ZoneEvent.SWITCH_TURNED_ON]))
+        izm = ZoneManager().add_zone(zone1).add_zone(zone2).get_immutable_instance()
+
+        izm.start()
+        try:
+            self.assertTrue(izm.on_switch_turned_on(pe.get_event_dispatcher(), self.light, self.lightItem))
+            self.assertEqual(['kitchen'], invocations)
+            self.assertTrue(izm.on_switch_turned_off(pe.get_event_dispatcher(), self.light, self.lightItem))
+        finally:
+            izm.stop()
+            self.light._cancel_timer()
+
+    def testOnActivityTransition_activitiesChanged_dispatchesActivityTimeChangedEvent(self):
+        invocations = []
+        activity_times = ActivityTimes({ActivityType.LUNCH: self.create_outside_time_range()})
+        zone1 = Zone('Virtual', [activity_times], Level.FIRST_FLOOR)
+        zone2 = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(
+                invocations, 'foyer', events=[ZoneEvent.MOTION], external_events=[ZoneEvent.ACTIVITY_TIME_CHANGED]))
+        izm = ZoneManager().add_zone(zone1).add_zone(zone2).get_immutable_instance()
+
+        izm.start()
+        try:
+            # noinspection PyProtectedMember
+            izm._schedule_activity_transition()
+            # noinspection PyProtectedMember
+            self.assertTrue(izm._activity_transition_timer.is_scheduled())
+
+            # noinspection PyProtectedMember
+            izm._on_activity_transition()
+            self.assertEqual([], invocations)
+
+            activity_times.get_active_activity_types = MagicMock(return_value=[ActivityType.LUNCH])
+            # noinspection PyProtectedMember
+            izm._on_activity_transition()
+            self.assertEqual(['foyer'], invocations)
+        finally:
+            izm.stop()
+
+        # noinspection PyProtectedMember
+        self.assertIsNone(izm._activity_transition_timer)
+
+    def testOnActivityTransition_notFullyInitialized_timerRescheduled(self):
+        invocations = []
+        activity_times = ActivityTimes({ActivityType.LUNCH: self.create_outside_time_range()})
+        zone1 = Zone('Virtual', [activity_times], Level.FIRST_FLOOR)
+        zone2 = Zone('Foyer', [self.motionSensor], Level.FIRST_FLOOR) \
+            .add_action(self._create_recording_action(
+                invocations, 'foyer', events=[ZoneEvent.MOTION], external_events=[ZoneEvent.ACTIVITY_TIME_CHANGED]))
+        izm = ZoneManager().add_zone(zone1).add_zone(zone2).get_immutable_instance()
+
+        izm.start()
+        try:
+            # noinspection PyProtectedMember
+            izm._schedule_activity_transition()
+            # noinspection PyProtectedMember
+            timer = izm._activity_transition_timer
+
+            izm.fully_initialized = False
+            activity_times.get_active_activity_types = MagicMock(return_value=[ActivityType.LUNCH])
+            # noinspection PyProtectedMember
+            izm._on_activity_transition()
+            self.assertEqual([], invocations)
+
+            # noinspection PyProtectedMember
+            self.assertIsNot(timer, izm._activity_transition_timer)
+            # noinspection PyProtectedMember
+            self.assertTrue(izm._activity_transition_timer.is_scheduled())
+            self.assertFalse(timer.is_scheduled())
+        finally:
+            izm.stop()
+
+        # noinspection PyProtectedMember
+        izm._on_activity_transition()
+        # noinspection PyProtectedMember
+        self.assertIsNone(izm._activity_transition_timer)
+
+    def testSetMethods_chained_otherSettingsKept(self):
+        alert_manager = MagicMock()
+        policy = SheddingPolicy()
+        zm = ZoneManager()
+        izm = zm.get_immutable_instance().set_alert_manager(alert_manager).set_async_dispatch(3) \
+            .set_sharded_dispatch(2).set_event_queue(policy)
+
+        self.assertIs(alert_manager, izm.get_alert_manager())
+        # noinspection PyProtectedMember
+        self.assertEqual((3, 2, policy), (izm._async_dispatch_workers, izm._dispatch_shards, izm._event_queue_policy))
+        self.assertEqual(zm.get_zones, izm.get_zones_fcn)
+
+    def testSetMethods_copies_eventCoalescerCarriedOver(self):
+        izm = ZoneManager().get_immutable_instance()
+        coalescer = izm.get_event_coalescer()
+        config = {'system': {'email-service': {'smtp-server': 'smtp.gmail.com', 'port': 465, 'sender-email': 'sender',
+                                               'sender-password': 'password'},
+                             'label-mappings': {},
+                             'activity-times': {'lunch': '12:00 - 13:30'},
+                             'event-coalescing': {'Light': {'deadband': 0.5}}}}
+
+        izm = izm.set_system_config(config).set_alert_manager(MagicMock()).set_event_queue(None)
+
+        self.assertIs(coalescer, izm.get_event_coalescer())
+        # noinspection PyProtectedMember
+        self.assertEqual(izm.dispatch_event, coalescer._dispatch_fcn)
+        self.assertEqual(0.5, coalescer.get_policy(self.light, self.lightItem.name).deadband)
+        self.assertIsNone(coalescer.get_policy(self.fan, self.fanItem.name))
+
+    # noinspection PyMethodMayBeStatic
+    def _create_recording_action(self, invocations: List[str], name: str, **kwargs):
+        """ Returns an action instance that appends its name to the invocations list when triggered. """
+
+        @action(**kwargs)
+        class RecordingAction(Action):
+            def on_action(self, event_info):
+                invocations.append(name)
+                return True
+
+        return RecordingAction(MapParameters({}))
@@ -0,0 +1,140 @@
+from datetime import datetime
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.actions.alert_on_inactive_devices import AlertOnInactiveDevices
+from zone_api.core.clock import VirtualClock
+from zone_api.core.device import Device
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.inactivity_index import InactivityIndex
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.zone import Zone
+from zone_api.core.zone_manager import ZoneManager
+from zone_api_test.core.device_test import DeviceTest
+
+
+class InactivityIndexTest(DeviceTest):
+    """ Unit tests for inactivity_index.py. """
+
+    def setUp(self):
+        items = [pe.create_switch_item('motion1'), pe.create_switch_item('motion2'),
+                 pe.create_switch_item('motion3')]
+        self.set_items(items)
+        super(InactivityIndexTest, self).setUp()
+
+        self.clock = VirtualClock(datetime(2021, 2, 8, 12, 0))
+        pe.set_clock(self.clock)
+
+        self.motion1 = MotionSensor(items[0])
+        self.motion2 = MotionSensor(items[1]).set_auto_report(True)
+        self.motion3 = MotionSensor(items[2]).set_auto_report(True)
+        for d in [self.motion1, self.motion2, self.motion3]:
+            d.update_last_activated_timestamp()
+        self.index = InactivityIndex([self.motion1, self.motion2, self.motion3])
+
+        self.reported_devices = []
+
+    def tearDown(self):
+        pe.set_clock(None)
+        super(InactivityIndexTest, self).tearDown()
+
+    def testGetInactiveDevices_noActivation_devicesInactiveAfterThreshold(self):
+        self.assertEqual([], self.index.get_inactive_devices(60))
+
+        self.clock.advance(60)
+        self.assertEqual([self.motion1, self.motion2, self.motion3], self.index.get_inactive_devices(60))
+
+    def testGetInactiveDevices_neverActivated_inactiveRightAway(self):
+        motion4 = MotionSensor(pe.create_switch_item('motion4'))
+        self.index.set_devices([self.motion1, motion4])
+
+        self.assertEqual([motion4, self.motion1], self.index.get_devices())
+        self.assertEqual([motion4], self.index.get_inactive_devices(3600))
+
+        motion4.update_last_activated_timestamp()
+        self.assertEqual([], self.index.get_inactive_devices(3600))
+
+    def testGetInactiveDevices_deviceActivated_movedToTheEnd(self):
+        self.clock.advance(30)
+        self.motion1.update_last_activated_timestamp()
+        self.clock.advance(30)
+
+        self.assertEqual([self.motion2, self.motion3, self.motion1], self.index.get_devices())
+        self.assertEqual([self.motion2, self.motion3], self.index.get_inactive_devices(60))
+        self.assertEqual([self.motion3], self.index.get_inactive_devices(60, lambda d: d is self.motion3))
+
+    def testGetInactiveDevices_olderTimestampAssigned_reordered(self):
+        self.clock.advance(60)
+        self.motion1.update_last_activated_timestamp()
+        self.motion2.update_last_activated_timestamp()
+        self.motion3.last_activated_timestamp = self.clock.time() - 3600
+
+        self.assertEqual([self.motion3, self.motion1, self.motion2], self.index.get_devices())
+        self.assertEqual([self.motion3], self.index.get_inactive_devices(60))
+
+    def testAddWatch_devicesCrossThreshold_reportedWhenInactive(self):
+        self.index.add_watch(60, self.record, Device.is_auto_report)
+
+        self.clock.advance(30)
+        self.motion2.update_last_activated_timestamp()
+
+        self.clock.advance(30)
+        self.assertEqual([[self.motion3]], self.reported_devices)
+
+        self.clock.advance(30)
+        self.assertEqual([[self.motion3], [self.motion2]], self.reported_devices)
+
+        # A device is reported again only after it is activated and becomes inactive again.
+        self.clock.advance(600)
+        self.assertEqual(2, len(self.reported_devices))
+
+        self.motion3.update_last_activated_timestamp()
+        self.clock.advance(60)
+        self.assertEqual([[self.motion3], [self.motion2], [self.motion3]], self.reported_devices)
+
+    def testAddWatch_initialDelay_notReportedBeforeDelay(self):
+        motion4 = MotionSensor(pe.create_switch_item('motion4'))
+        self.index.set_devices([self.motion1, motion4])
+        self.index.add_watch(60, self.record, initial_delay_in_seconds=300)
+
+        self.clock.advance(299)
+        self.assertEqual([], self.reported_devices)
+
+        self.clock.advance(1)
+        self.assertEqual([[motion4, self.motion1]], self.reported_devices)
+
+    def testAddWatch_cancelled_notReported(self):
+        watch = self.index.add_watch(60, self.record)
+        watch.cancel()
+
+        self.clock.advance(120)
+        self.assertEqual([], self.reported_devices)
+
+    def testAddWatch_invalidThreshold_throwsException(self):
+        with self.assertRaises(ValueError):
+            self.index.add_watch(0, self.record)
+
+    def testStartAutoReportWatchDog_deviceInactive_valueStatesReset(self):
+        self.motion2.reset_value_states = lambda: self.reported_devices.append(self.motion2)
+        self.motion3.reset_value_states = lambda: self.reported_devices.append(self.motion3)
+
+        zm = ZoneManager().add_zone(Zone('Foyer', [self.motion1, self.motion2, self.motion3]))
+        zm.start_auto_report_watch_dog(timer_interval_in_seconds=60, inactive_interval_in_seconds=600)
+        try:
+            self.clock.advance(300)
+            self.motion2.update_last_activated_timestamp()
+
+            self.clock.advance(300)
+            self.assertEqual([self.motion3], self.reported_devices)
+            self.assertIs(zm.get_inactivity_index(), zm.get_immutable_instance().get_inactivity_index())
+        finally:
+            zm.stop_auto_report_watch_dog()
+
+    def testGetInactiveBatteryDevices_neverActivatedDevice_reported(self):
+        motion4 = MotionSensor(pe.create_switch_item('motion4'))
+        zm = ZoneManager().add_zone(Zone('Foyer', [self.motion1, motion4])).get_immutable_instance()
+
+        action = AlertOnInactiveDevices(MapParameters({}))
+        self.assertEqual(['Foyer: motion4'], action.get_inactive_battery_devices(zm, 3600))
+
+    def record(self, devices):
+        self.reported_devices.append(devices)
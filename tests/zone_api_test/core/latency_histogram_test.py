@@ -0,0 +1,42 @@
+import unittest
+
+from zone_api.core.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    """ Unit tests for latency_histogram.py. """
+
+    def setUp(self):
+        self.histogram = LatencyHistogram()
+
+    def testGetPercentile_noLatency_returnsZero(self):
+        self.assertEqual(0, self.histogram.get_count())
+        self.assertEqual(0.0, self.histogram.get_percentile(99))
+
+    def testGetPercentile_recordedLatencies_returnsValueWithinBucketError(self):
+        for i in range(1, 101):
+            self.histogram.record(i / 1000.0)
+
+        self.assertEqual(100, self.histogram.get_count())
+        self.assertAlmostEqual(0.050, self.histogram.get_percentile(50), delta=0.050 * 0.13)
+        self.assertAlmostEqual(0.099, self.histogram.get_percentile(99), delta=0.099 * 0.13)
+        self.assertAlmostEqual(0.1, self.histogram.get_percentile(100))
+        self.assertEqual(0.1, self.histogram.get_max())
+
+    def testRecord_outOfRangeLatencies_countedInTheEdgeBuckets(self):
+        self.histogram.record(0)
+        self.histogram.record(1000)
+
+        self.assertEqual(LatencyHistogram.MIN_LATENCY_IN_SECONDS, self.histogram.get_percentile(50))
+        self.assertEqual(1000, self.histogram.get_percentile(100))
+
+    def testGetPercentile_invalidPercentile_throwsException(self):
+        with self.assertRaises(ValueError):
+            self.histogram.get_percentile(0)
+
+    def testReset_recordedLatencies_discardsThem(self):
+        self.histogram.record(0.01)
+        self.histogram.reset()
+
+        self.assertEqual(0, self.histogram.get_count())
+        self.assertEqual("count: 0", str(self.histogram))
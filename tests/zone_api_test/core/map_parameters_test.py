@@ -78,6 +78,13 @@ class MapParameterTest(unittest.TestCase):
         self.assertEqual(len(errors), 1)
         self.assertEqual(errors[0], "Unsupported action types: NotMyAction")
 
+    def testValidate_skippedActionType_returnsTrue(self):
+        params = MapParameters({'MyAction.value1': 2, 'DisabledAction.disabled': True, 'DisabledAction.key': 15})
+        (validated, errors) = params.validate([MapParameterTest.MyAction], ['DisabledAction'])
+
+        self.assertTrue(validated)
+        self.assertEqual(len(errors), 0)
+
     def testValidate_valueNotValidatedDefaultErrorMessage_returnsFalse(self):
         params = MapParameters({'MyAction.value1': -2})
         (validated, errors) = params.validate([MapParameterTest.MyAction])
@@ -0,0 +1,117 @@
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.actions.turn_on_switch import TurnOnSwitch
+from zone_api.core.devices.illuminance_sensor import IlluminanceSensor
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.switch import Light
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.motion_light_path import MotionLightPath
+from zone_api.core.neighbor import Neighbor, NeighborType
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+from zone_api_test.core.device_test import DeviceTest
+
+ILLUMINANCE_THRESHOLD_IN_LUX = 10
+
+
+class MotionLightPathTest(DeviceTest):
+    """ Unit tests for motion_light_path.py. """
+
+    def setUp(self):
+        items = [pe.create_switch_item('GreatRoomLight'), pe.create_switch_item('KitchenLight'),
+                 pe.create_switch_item('GreatRoomMotion'), pe.create_number_item('GreatRoomIlluminance')]
+        self.set_items(items)
+        super(MotionLightPathTest, self).setUp()
+
+        self.great_room_light_item, self.kitchen_light_item, self.motion_sensor_item, illuminance_item = items
+        self.great_room_light = Light(self.great_room_light_item, 30, ILLUMINANCE_THRESHOLD_IN_LUX)
+        self.kitchen_light = Light(self.kitchen_light_item, 30, ILLUMINANCE_THRESHOLD_IN_LUX)
+        self.motion_sensor = MotionSensor(self.motion_sensor_item)
+
+        pe.set_number_value(illuminance_item, ILLUMINANCE_THRESHOLD_IN_LUX - 1)
+
+        self.invocations = []
+        invocations = self.invocations
+
+        @action(events=[ZoneEvent.MOTION], priority=5)
+        class RecordingAction(Action):
+            def on_action(self, event_info):
+                invocations.append('recording')
+                return True
+
+        self.great_room = Zone('great room', [self.great_room_light, self.motion_sensor,
+                                              IlluminanceSensor(illuminance_item)], Level.FIRST_FLOOR) \
+            .add_action(TurnOnSwitch(MapParameters({}))) \
+            .add_action(RecordingAction(MapParameters({})))
+        self.kitchen = Zone('kitchen', [self.kitchen_light], Level.FIRST_FLOOR)
+
+    def tearDown(self):
+        self.great_room_light._cancel_timer()
+        self.kitchen_light._cancel_timer()
+        super(MotionLightPathTest, self).tearDown()
+
+    def testDispatch_started_routeUsesMotionLightPathAndRecordsLatency(self):
+        izm = self._create_started_zone_manager()
+        try:
+            route = izm._get_event_route(ZoneEvent.MOTION, self.motion_sensor_item.name)
+            self.assertEqual(2, len(route))
+            self.assertIsInstance(route[0][1], MotionLightPath)
+
+            self.assertTrue(self._dispatch_motion_event(izm))
+            self.assertTrue(self.great_room_light.is_on())
+            self.assertEqual(['recording'], self.invocations)
+            self.assertEqual(1, izm.get_motion_light_latency().get_count())
+        finally:
+            izm.stop()
+
+    def testDispatch_lightAlreadyOn_noLatencyRecorded(self):
+        pe.set_switch_state(self.great_room_light_item, True)
+
+        izm = self._create_started_zone_manager()
+        try:
+            self.assertTrue(self._dispatch_motion_event(izm))
+            self.assertEqual(0, izm.get_motion_light_latency().get_count())
+        finally:
+            izm.stop()
+
+    def testDispatch_masterZoneLightIsOn_lightNotTurnedOn(self):
+        self.great_room = self.great_room.add_neighbor(Neighbor(self.kitchen.get_id(), NeighborType.OPEN_SPACE_MASTER))
+        pe.set_switch_state(self.kitchen_light_item, True)
+
+        izm = self._create_started_zone_manager()
+        try:
+            self.assertTrue(self._dispatch_motion_event(izm))
+            self.assertFalse(self.great_room_light.is_on())
+            self.assertTrue(self.kitchen_light.is_on())
+        finally:
+            izm.stop()
+
+    def testDispatch_zoneAddedAfterStart_motionLightPathBuilt(self):
+        zm = ZoneManager().add_zone(self.kitchen)
+        izm = zm.get_immutable_instance()
+        izm.start()
+        try:
+            zm.add_zone(self.great_room)
+
+            self.assertTrue(self._dispatch_motion_event(izm))
+            self.assertTrue(self.great_room_light.is_on())
+            self.assertIsInstance(izm._get_event_route(ZoneEvent.MOTION, self.motion_sensor_item.name)[0][1],
+                                  MotionLightPath)
+            self.assertEqual(1, izm.get_motion_light_latency().get_count())
+        finally:
+            izm.stop()
+
+    def testCanReplace_actionWithoutFilterPlan_returnsFalse(self):
+        self.assertFalse(MotionLightPath.can_replace(TurnOnSwitch(MapParameters({})), self.great_room))
+        self.assertFalse(MotionLightPath.can_replace(object(), self.great_room))
+
+    def _create_started_zone_manager(self):
+        izm = ZoneManager().add_zone(self.great_room).add_zone(self.kitchen).get_immutable_instance()
+        izm.start()
+        return izm
+
+    def _dispatch_motion_event(self, izm) -> bool:
+        return izm.dispatch_event(ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motion_sensor,
+                                  self.motion_sensor_item)
@@ -0,0 +1,109 @@
+import random
+from datetime import datetime
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.clock import VirtualClock
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.network_presence import NetworkPresence
+from zone_api.core.devices.plug import Plug
+from zone_api.core.devices.switch import Light, Switch
+from zone_api.core.devices.temperature_sensor import TemperatureSensor
+from zone_api.core.occupancy_tracker import OccupancyTracker
+from zone_api_test.core.device_test import DeviceTest
+
+NUMBER_OF_GENERATED_CASES = 200
+IGNORED_DEVICE_TYPES = [None, [], [MotionSensor], [Light], [Switch], [NetworkPresence, Plug], [Light, MotionSensor]]
+
+
+def legacy_is_occupied(devices, ignored_device_types=None, seconds_from_last_event=5 * 60):
+    """ The device scan that OccupancyTracker replaces; used as the oracle. """
+    if ignored_device_types is None:
+        ignored_device_types = []
+
+    for device in devices:
+        if not any(isinstance(device, deviceType) for deviceType in ignored_device_types):
+            if device.is_occupied(seconds_from_last_event):
+                return True, device
+
+    return False, None
+
+
+class OccupancyTrackerTest(DeviceTest):
+    """ Unit tests for occupancy_tracker.py. """
+
+    def setUp(self):
+        items = [pe.create_switch_item('light1'), pe.create_switch_item('light2'),
+                 pe.create_switch_item('motion1'), pe.create_switch_item('motion2'),
+                 pe.create_switch_item('presence'), pe.create_switch_item('plug'), pe.create_number_item('plug-power'),
+                 pe.create_number_item('temperature')]
+        self.set_items(items)
+        super(OccupancyTrackerTest, self).setUp()
+
+        self.clock = VirtualClock(datetime(2021, 2, 8, 12, 0))
+        pe.set_clock(self.clock)
+
+        self.light1 = Light(items[0], 5)
+        self.light2 = Light(items[1], 5)
+        self.motion1 = MotionSensor(items[2])
+        self.motion2 = MotionSensor(items[3])
+        self.presence = NetworkPresence(items[4])
+        self.plug = Plug(items[5], items[6])
+        self.temperature_sensor = TemperatureSensor(items[7])
+        self.devices = [self.temperature_sensor, self.light1, self.motion1, self.presence, self.plug, self.light2,
+                        self.motion2]
+
+        self.tracker = OccupancyTracker(self.devices)
+
+    def tearDown(self):
+        pe.set_clock(None)
+        super(OccupancyTrackerTest, self).tearDown()
+
+    def testIsOccupied_generatedStates_equivalentToDeviceScan(self):
+        rnd = random.Random(20240317)
+        for i in range(NUMBER_OF_GENERATED_CASES):
+            light1_item, light2_item, motion1_item, motion2_item, presence_item, _, power_item, _ = self.get_items()
+            pe.set_switch_state(light1_item, rnd.random() < 0.2)
+            pe.set_switch_state(light2_item, rnd.random() < 0.2)
+            pe.set_switch_state(motion1_item, rnd.random() < 0.1)
+            pe.set_switch_state(motion2_item, rnd.random() < 0.1)
+            pe.set_switch_state(presence_item, rnd.random() < 0.1)
+            pe.set_number_value(power_item, rnd.choice([0, 1, 50]))
+
+            for device in [self.motion1, self.motion2, self.presence]:
+                if rnd.random() < 0.3:
+                    device.update_last_activated_timestamp()
+            self.clock.advance(rnd.randint(0, 600))
+
+            for ignored_device_types in IGNORED_DEVICE_TYPES:
+                for seconds_from_last_event in [60, 5 * 60]:
+                    expected_occupied, _ = legacy_is_occupied(
+                        self.devices, ignored_device_types, seconds_from_last_event)
+                    occupied, device = self.tracker.is_occupied(ignored_device_types, seconds_from_last_event)
+
+                    message = f"case {i}, ignored: {ignored_device_types}, seconds: {seconds_from_last_event}"
+                    self.assertEqual(expected_occupied, occupied, message)
+                    if occupied:
+                        self.assertTrue(device.is_occupied(seconds_from_last_event), message)
+                        self.assertFalse(any(isinstance(device, t) for t in ignored_device_types or []), message)
+
+    def testIsOccupied_motionSensorActivated_returnsLastActivatedSensor(self):
+        self.motion1.update_last_activated_timestamp()
+        self.clock.advance(10)
+        self.motion2.update_last_activated_timestamp()
+
+        self.assertEqual((True, self.motion2), self.tracker.is_occupied([Light]))
+
+        self.clock.advance(5 * 60 + 1)
+        self.assertEqual((False, None), self.tracker.is_occupied([Light]))
+
+    def testIsOccupied_lastActivationSetBack_usesPreviousActivation(self):
+        self.motion1.update_last_activated_timestamp()
+        self.clock.advance(10)
+        self.motion2.update_last_activated_timestamp()
+        self.motion2.last_activated_timestamp = self.clock.time() - 3600
+
+        self.assertEqual((True, self.motion1), self.tracker.is_occupied([Light]))
+
+    def testIsOccupied_noOccupancyDevice_returnsFalse(self):
+        tracker = OccupancyTracker([self.temperature_sensor])
+        self.assertEqual((False, None), tracker.is_occupied())
@@ -0,0 +1,170 @@
+import threading
+import time
+
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.sharded_dispatcher import ShardedDispatcher
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_event import ZoneEvent
+from zone_api.core.zone_manager import ZoneManager
+
+from zone_api_test.core.device_test import DeviceTest
+
+TIMEOUT_IN_SECONDS = 5
+
+
+class ShardedDispatcherTest(DeviceTest):
+    """ Unit tests for sharded_dispatcher.py. """
+
+    def setUp(self):
+        self.foyer_motion_item = pe.create_switch_item('FF_Foyer_MotionSensor')
+        self.office_motion_item = pe.create_switch_item('FF_Office_MotionSensor')
+        self.set_items([self.foyer_motion_item, self.office_motion_item])
+        super(ShardedDispatcherTest, self).setUp()
+
+        self.foyer_motion_sensor = MotionSensor(self.foyer_motion_item)
+        self.office_motion_sensor = MotionSensor(self.office_motion_item)
+
+        self.release_foyer_action = threading.Event()
+        self.office_action_invoked = threading.Event()
+        self.invocations = []
+        self.invoking_threads = {}
+
+        test = self
+
+        @action(events=[ZoneEvent.MOTION])
+        class FoyerAction(Action):
+            def on_action(self, event_info):
+                test.invoking_threads['foyer'] = threading.current_thread().name
+                test.invocations.append(pe.get_item_name(event_info.get_item()))
+                return test.release_foyer_action.wait(TIMEOUT_IN_SECONDS)
+
+        @action(events=[ZoneEvent.MOTION], external_events=[ZoneEvent.MOTION])
+        class OfficeAction(Action):
+            def on_action(self, event_info):
+                test.invoking_threads['office'] = threading.current_thread().name
+                test.office_action_invoked.set()
+                return True
+
+        self.foyer_action = FoyerAction(MapParameters({}))
+        self.office_action = OfficeAction(MapParameters({}))
+        self.foyer = Zone('Foyer', [self.foyer_motion_sensor], Level.FIRST_FLOOR).add_action(self.foyer_action)
+        self.office = Zone('Office', [self.office_motion_sensor], Level.FIRST_FLOOR).add_action(self.office_action)
+        self.zm = ZoneManager().add_zone(self.foyer).add_zone(self.office).get_immutable_instance() \
+            .set_sharded_dispatch(2)
+        self.zm.start()
+
+        # noinspection PyProtectedMember
+        self.dispatcher = self.zm._sharded_dispatcher
+
+    def tearDown(self):
+        self.release_foyer_action.set()
+        self.zm.stop()
+        super(ShardedDispatcherTest, self).tearDown()
+
+    def testCtor_invalidShardCount_throwsException(self):
+        with self.assertRaises(ValueError):
+            ShardedDispatcher(self.zm, 0)
+
+    def testGetShardIndex_twoZones_assignedToDifferentShards(self):
+        self.assertNotEqual(self.dispatcher.get_shard_index(self.foyer),
+                            self.dispatcher.get_shard_index(self.office))
+        self.assertEqual(self.dispatcher.get_shard_index(self.foyer),
+                         self.dispatcher.get_shard_index(self.foyer))
+
+    def testGetActionLock_sameAction_sameLock(self):
+        self.assertIs(self.dispatcher.get_action_lock(self.foyer_action),
+                      self.dispatcher.get_action_lock(self.foyer_action))
+        self.assertIsNot(self.dispatcher.get_action_lock(self.foyer_action),
+                         self.dispatcher.get_action_lock(self.office_action))
+
+    def testDispatchEvent_otherZoneBusy_zoneNotDelayed(self):
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.foyer_motion_sensor, self.foyer_motion_item))
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.office_motion_sensor, self.office_motion_item))
+
+        self.assertTrue(self.office_action_invoked.wait(TIMEOUT_IN_SECONDS))
+        self.assertFalse(self.release_foyer_action.is_set())
+        self.assertNotEqual(self.invoking_threads['foyer'], self.invoking_threads['office'])
+
+    def testSubmit_externalEvent_routedToTargetZoneShard(self):
+        futures = self.dispatcher.submit(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.foyer_motion_sensor, self.foyer_motion_item)
+        self.assertEqual(2, len(futures))
+
+        self.assertTrue(self.office_action_invoked.wait(TIMEOUT_IN_SECONDS))
+        self.assertEqual(f'ZoneApisShard-{self.dispatcher.get_shard_index(self.office)}',
+                         self.invoking_threads['office'])
+
+        self.release_foyer_action.set()
+        self.assertTrue(all(f.result(TIMEOUT_IN_SECONDS) for f in futures))
+
+    def testSubmit_sameZone_deliveredInOrder(self):
+        futures = []
+        for _ in range(3):
+            futures.extend(self.dispatcher.submit(
+                ZoneEvent.MOTION, pe.get_event_dispatcher(), self.foyer_motion_sensor, self.foyer_motion_item))
+
+        foyer_shard = self.dispatcher.get_shard_index(self.foyer)
+        self.assertGreater(self.dispatcher.get_queue_depths()[foyer_shard], 0)
+
+        self.release_foyer_action.set()
+        for f in futures:
+            f.result(TIMEOUT_IN_SECONDS)
+
+        self.assertEqual(['FF_Foyer_MotionSensor'] * 3, self.invocations)
+
+        statistics = self.zm.get_dispatch_statistics()[foyer_shard]
+        self.assertEqual(3, statistics.processed_count)
+        self.assertEqual(0, statistics.queue_depth)
+        self.assertGreaterEqual(statistics.max_latency_in_seconds, statistics.average_latency_in_seconds)
+
+    def testSubmit_actionSharedByTwoZones_neverInvokedConcurrently(self):
+        self.zm.stop()
+
+        invocations = []
+        active_invocations = []
+        lock = threading.Lock()
+
+        @action(events=[ZoneEvent.MOTION])
+        class SharedAction(Action):
+            def on_action(self, event_info):
+                with lock:
+                    active_invocations.append(event_info.get_zone().get_name())
+                    concurrent = len(active_invocations) > 1
+
+                time.sleep(0.05)
+                with lock:
+                    active_invocations.remove(event_info.get_zone().get_name())
+                    invocations.append((event_info.get_zone().get_name(), concurrent))
+
+                return True
+
+        shared_action = SharedAction(MapParameters({}))
+        foyer = Zone('Foyer', [self.foyer_motion_sensor], Level.FIRST_FLOOR).add_action(shared_action)
+        office = Zone('Office', [self.office_motion_sensor], Level.FIRST_FLOOR).add_action(shared_action)
+        self.zm = ZoneManager().add_zone(foyer).add_zone(office).get_immutable_instance().set_sharded_dispatch(2)
+        self.zm.start()
+        # noinspection PyProtectedMember
+        dispatcher = self.zm._sharded_dispatcher
+
+        futures = dispatcher.submit(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.foyer_motion_sensor, self.foyer_motion_item)
+        futures += dispatcher.submit(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.office_motion_sensor, self.office_motion_item)
+        self.assertTrue(all(f.result(TIMEOUT_IN_SECONDS) for f in futures))
+
+        self.assertNotEqual(dispatcher.get_shard_index(foyer), dispatcher.get_shard_index(office))
+        self.assertCountEqual([('Foyer', False), ('Office', False)], invocations)
+
+    def testStop_started_dispatchesInCallingThreadAgain(self):
+        self.zm.stop()
+        self.release_foyer_action.set()
+
+        self.assertTrue(self.zm.dispatch_event(
+            ZoneEvent.MOTION, pe.get_event_dispatcher(), self.foyer_motion_sensor, self.foyer_motion_item))
+        self.assertEqual(threading.current_thread().name, self.invoking_threads['foyer'])
+        self.assertEqual([], self.zm.get_dispatch_statistics())
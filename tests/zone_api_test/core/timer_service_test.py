@@ -0,0 +1,141 @@
+import threading
+import time
+import unittest
+
+from zone_api.core.timer_service import Timer, TimerService, get_timer_service
+
+TIMEOUT_IN_SECONDS = 5
+
+
+class TimerServiceTest(unittest.TestCase):
+    """ Unit tests for timer_service.py. """
+
+    def setUp(self):
+        self.service = TimerService(max_workers=2)
+        self.fired = threading.Event()
+        self.fired_values = []
+
+    def tearDown(self):
+        self.service.stop()
+
+    def fire(self, value=None):
+        self.fired_values.append(value)
+        self.fired.set()
+
+    def testCtor_invalidWorkerCount_throwsException(self):
+        with self.assertRaises(ValueError):
+            TimerService(max_workers=0)
+
+    def testStart_defaultService_usesSharedInstance(self):
+        timer = Timer(0.01, self.fire)
+        timer.start()
+
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+        # noinspection PyProtectedMember
+        self.assertIs(get_timer_service(), timer._timer_service)
+
+    def testSchedule_argsAndKwargs_passedToFunction(self):
+        timer = self.service.schedule(0.01, self.fire, value='done')
+
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+        self.assertEqual(['done'], self.fired_values)
+        time.sleep(0.01)
+        self.assertFalse(timer.is_alive())
+
+    def testStart_alreadyStarted_throwsException(self):
+        timer = self.service.schedule(10, self.fire)
+        with self.assertRaises(RuntimeError):
+            timer.start()
+
+    def testCancel_scheduledTimer_notFired(self):
+        timer = self.service.schedule(0.05, self.fire)
+        self.assertTrue(timer.is_alive())
+
+        timer.cancel()
+        self.assertFalse(timer.is_alive())
+        self.assertFalse(self.fired.wait(0.1))
+
+    def testSchedule_multipleTimers_firedInDeadlineOrder(self):
+        done = threading.Event()
+        self.service.schedule(0.06, lambda: (self.fired_values.append(3), done.set()))
+        self.service.schedule(0.02, self.fire, 1)
+        self.service.schedule(0.04, self.fire, 2)
+
+        self.assertTrue(done.wait(TIMEOUT_IN_SECONDS))
+        self.assertEqual([1, 2, 3], self.fired_values)
+
+    def testRenew_laterDeadline_firesOnceAfterNewDeadline(self):
+        timer = self.service.schedule(0.05, self.fire)
+        timer.renew(0.2)
+
+        self.assertFalse(self.fired.wait(0.1))
+        self.assertTrue(timer.is_scheduled())
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+
+        time.sleep(0.05)
+        self.assertEqual([None], self.fired_values)
+
+    def testRenew_earlierDeadline_firesOnceAtNewDeadline(self):
+        timer = self.service.schedule(10, self.fire)
+        timer.renew(0.01)
+
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+        time.sleep(0.05)
+        self.assertEqual([None], self.fired_values)
+
+    def testRenew_firedTimer_rescheduled(self):
+        timer = self.service.schedule(0.01, self.fire)
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+        time.sleep(0.01)
+
+        self.fired.clear()
+        timer.renew()
+        self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+        self.assertEqual([None, None], self.fired_values)
+
+    def testStop_pendingTimers_notFired(self):
+        timer = self.service.schedule(0.05, self.fire)
+        self.service.stop()
+
+        self.assertFalse(timer.is_alive())
+        self.assertFalse(self.fired.wait(0.1))
+
+    def testRenew_functionRunning_firesAgainAfterward(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def wait_for_release():
+            started.set()
+            release.wait(TIMEOUT_IN_SECONDS)
+            self.fire()
+
+        timer = self.service.schedule(0.01, wait_for_release)
+        self.assertTrue(started.wait(TIMEOUT_IN_SECONDS))
+
+        timer.renew(0.01)
+        self.assertTrue(timer.is_scheduled())
+        release.set()
+
+        deadline = time.time() + TIMEOUT_IN_SECONDS
+        while len(self.fired_values) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([None, None], self.fired_values)
+
+    def testScheduleBlocking_blockingFunctionsRunning_otherTimersNotDelayed(self):
+        release = threading.Event()
+        thread_names = []
+
+        def block():
+            thread_names.append(threading.current_thread().name)
+            release.wait(TIMEOUT_IN_SECONDS)
+
+        try:
+            for _ in range(3):  # more than the pool size
+                self.assertTrue(self.service.schedule_blocking(0.01, block).blocking)
+            self.service.schedule(0.05, self.fire)
+
+            self.assertTrue(self.fired.wait(TIMEOUT_IN_SECONDS))
+            self.assertFalse(release.is_set())
+            self.assertEqual(['ZoneApisBlockingTimer'] * 3, thread_names)
+        finally:
+            release.set()
@@ -0,0 +1,99 @@
+from zone_api import platform_encapsulator as pe
+from zone_api.core.action import action, Action
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.devices.switch import Light
+from zone_api.core.map_parameters import MapParameters
+from zone_api.core.neighbor import Neighbor, NeighborType
+from zone_api.core.zone import Zone, Level
+from zone_api.core.zone_builder import ZoneBuilder
+from zone_api.core.zone_event import ZoneEvent
+
+from zone_api_test.core.device_test import DeviceTest
+
+
+@action(events=[ZoneEvent.MOTION], priority=5)
+class LowPriorityAction(Action):
+    def on_action(self, event_info):
+        return True
+
+
+@action(events=[ZoneEvent.MOTION, ZoneEvent.SWITCH_TURNED_ON], priority=1)
+class HighPriorityAction(Action):
+    def on_action(self, event_info):
+        return True
+
+
+class ZoneBuilderTest(DeviceTest):
+    """ Unit tests for zone_builder.py. """
+
+    def setUp(self):
+        items = [pe.create_switch_item('TestLightName'), pe.create_switch_item('TestMotionSensorName')]
+        self.set_items(items)
+        super(ZoneBuilderTest, self).setUp()
+
+        self.light = Light(items[0], 2)
+        self.motion_sensor = MotionSensor(items[1])
+        self.neighbor = Neighbor('ff_kitchen', NeighborType.OPEN_SPACE)
+        self.actions = [LowPriorityAction(MapParameters({})), HighPriorityAction(MapParameters({})),
+                        LowPriorityAction(MapParameters({}))]
+
+    def testBuild_sameResultAsChainedAdds(self):
+        zone = Zone('office', [], Level.FIRST_FLOOR, [], {}, True, 'icon', 3) \
+            .add_device(self.light).add_device(self.motion_sensor).add_neighbor(self.neighbor)
+        for a in self.actions:
+            zone = zone.add_action(a)
+
+        builder = ZoneBuilder('office', Level.FIRST_FLOOR, True, 'icon', 3) \
+            .add_devices([self.light, self.motion_sensor]).add_neighbor(self.neighbor)
+        for a in self.actions:
+            builder.add_action(a)
+        built_zone = builder.build()
+
+        self.assertEqual(zone.get_id(), builder.get_id())
+        self.assertEqual(zone.get_id(), built_zone.get_id())
+        self.assertTrue(built_zone.is_external())
+        self.assertEqual('icon', built_zone.get_display_icon())
+        self.assertEqual(3, built_zone.get_display_order())
+        self.assertEqual(zone.get_devices(), built_zone.get_devices())
+        self.assertEqual(zone.get_neighbors(), built_zone.get_neighbors())
+        self.assertEqual((self.light,), built_zone.get_devices_by_type(Light))
+        for zone_event in [ZoneEvent.MOTION, ZoneEvent.SWITCH_TURNED_ON]:
+            self.assertEqual(zone.get_actions(zone_event), built_zone.get_actions(zone_event))
+
+        self.assertEqual([self.actions[1], self.actions[0], self.actions[2]],
+                         built_zone.get_actions(ZoneEvent.MOTION))
+
+    def testBuild_builderModifiedAfterwards_zoneUnchanged(self):
+        builder = ZoneBuilder('office').add_device(self.light).add_action(self.actions[0])
+        zone = builder.build()
+
+        builder.add_device(self.motion_sensor).add_neighbor(self.neighbor).add_action(self.actions[1])
+
+        self.assertEqual([self.light], zone.get_devices())
+        self.assertEqual([], zone.get_neighbors())
+        self.assertEqual([self.actions[0]], zone.get_actions(ZoneEvent.MOTION))
+        self.assertEqual(2, len(builder.build().get_devices()))
+
+    def testFromZone_addAction_originalZoneUnchanged(self):
+        zone = Zone('office', [self.light]).add_action(self.actions[0]).add_neighbor(self.neighbor)
+
+        new_zone = ZoneBuilder.from_zone(zone).add_action(self.actions[1]).build()
+
+        self.assertEqual([self.actions[0]], zone.get_actions(ZoneEvent.MOTION))
+        self.assertEqual([self.actions[1], self.actions[0]], new_zone.get_actions(ZoneEvent.MOTION))
+        self.assertEqual([self.light], new_zone.get_devices())
+        self.assertEqual([self.neighbor], new_zone.get_neighbors())
+
+    def testAddDevice_invalidDevice_throwsException(self):
+        with self.assertRaises(ValueError):
+            ZoneBuilder('office').add_device(None)
+
+        with self.assertRaises(ValueError):
+            ZoneBuilder('office').add_device(self.neighbor)
+
+    def testAddAction_zoneAddAction_originalZoneUnchanged(self):
+        zone = Zone('office').add_action(self.actions[0])
+
+        zone.add_action(self.actions[1])
+
+        self.assertEqual([self.actions[0]], zone.get_actions(ZoneEvent.MOTION))
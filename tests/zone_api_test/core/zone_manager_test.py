@@ -91,6 +91,34 @@ class ZoneManagerTest(DeviceTest):
         self.zm.remove_zone(zone2)
         self.assertEqual(0, len(self.zm.get_zones()))
 
+    def testGetZones_zonesAdded_sortedSnapshotWithInternalExternalSplit(self):
+        zone1 = Zone('ff', display_order=2)
+        zone2 = Zone.create_external_zone('patio').add_device(self.light)
+        zone3 = Zone('sf', display_order=1)
+
+        self.zm.add_zone(zone1).add_zone(zone2).add_zone(zone3)
+
+        self.assertEqual((zone3, zone1, zone2), self.zm.get_zones())
+        self.assertIs(self.zm.get_zones(), self.zm.get_zones())
+        self.assertEqual((zone3, zone1), self.zm.get_internal_zones())
+        self.assertEqual((zone2,), self.zm.get_external_zones())
+
+        immutable_zm = self.zm.get_immutable_instance()
+        self.assertEqual((zone3, zone1), immutable_zm.get_internal_zones())
+
+    def testGetVersion_zonesAddedAndRemoved_versionIncremented(self):
+        zone1 = Zone('ff')
+        immutable_zm = self.zm.get_immutable_instance()
+        version = immutable_zm.get_zones_version()
+
+        self.zm.add_zone(zone1)
+        self.assertEqual(version + 1, immutable_zm.get_zones_version())
+        self.assertEqual(version + 1, self.zm.get_version())
+
+        self.zm.remove_zone(zone1)
+        self.zm.remove_all_zones()
+        self.assertEqual(version + 3, self.zm.get_version())
+
     def testContainingZone_validDevice_returnsCorrectZone(self):
         zone1 = Zone('ff').add_device(self.light)
         zone2 = Zone('sf').add_device(self.fan)
@@ -109,6 +137,38 @@ class ZoneManagerTest(DeviceTest):
         self.assertEqual(None,
                          self.zm.get_immutable_instance().get_containing_zone(self.fan))
 
+    def testContainingZone_started_indexRebuiltWhenZonesChange(self):
+        zone1 = Zone('ff').add_device(self.light)
+        self.zm.add_zone(zone1)
+
+        immutable_zm = self.zm.get_immutable_instance()
+        immutable_zm.start()
+        try:
+            self.assertEqual(zone1, immutable_zm.get_containing_zone(self.light))
+            self.assertEqual(None, immutable_zm.get_containing_zone(self.fan))
+
+            zone2 = Zone('sf').add_device(self.fan)
+            self.zm.add_zone(zone2)
+            self.assertEqual(zone2, immutable_zm.get_containing_zone(self.fan))
+        finally:
+            immutable_zm.stop()
+
+    def testGetZoneByAction_startedAndNotStarted_returnsFirstContainingZone(self):
+        action = TurnOnSwitch(MapParameters({}))
+        zone1 = Zone('ff').add_device(self.light)
+        zone2 = Zone('sf').add_action(action)
+        self.zm.add_zone(zone1).add_zone(zone2)
+
+        immutable_zm = self.zm.get_immutable_instance()
+        self.assertEqual(zone2, action.get_containing_zone(immutable_zm))
+
+        immutable_zm.start()
+        try:
+            self.assertEqual(zone2, immutable_zm.get_zone_by_action(action))
+            self.assertEqual(None, immutable_zm.get_zone_by_action(TurnOnSwitch(MapParameters({}))))
+        finally:
+            immutable_zm.stop()
+
     def testGetDevicesByType_variousScenarios_returnsCorrectList(self):
         zone1 = Zone('ff').add_device(self.light)
         zone2 = Zone('sf').add_device(self.fan)
@@ -122,6 +182,24 @@ class ZoneManagerTest(DeviceTest):
 
         self.assertEqual(0, len(self.zm.get_devices_by_type(Dimmer)))
 
+    def testGetDevicesByType_zonesAddedAndRemoved_cachedTupleInvalidated(self):
+        zone1 = Zone('ff').add_device(self.light)
+        zone2 = Zone('sf').add_device(self.fan)
+
+        self.zm.add_zone(zone1)
+        switches = self.zm.get_devices_by_type(Switch)
+        self.assertEqual((self.light,), switches)
+        self.assertIs(switches, self.zm.get_devices_by_type(Switch))
+
+        self.zm.add_zone(zone2)
+        self.assertEqual((self.light, self.fan), self.zm.get_devices_by_type(Switch))
+
+        self.zm.remove_zone(zone1)
+        self.assertEqual((self.fan,), self.zm.get_devices_by_type(Switch))
+
+        self.zm.remove_all_zones()
+        self.assertEqual((), self.zm.get_devices_by_type(Switch))
+
     def testOnMotionSensorTurnedOn_noZone_returnsFalse(self):
         self.assertFalse(self.zm.get_immutable_instance().dispatch_event(
             ZoneEvent.MOTION, pe.get_event_dispatcher(), self.motionSensor, pe.create_string_item(INVALID_ITEM_NAME)))
@@ -2,6 +2,7 @@ import time
 
 from zone_api import platform_encapsulator as pe
 from zone_api.core.action import Action
+from zone_api.core.device import Device
 from zone_api.core.actions.announce_morning_weather_and_play_music import AnnounceMorningWeatherAndPlayMusic
 from zone_api.core.map_parameters import MapParameters
 
@@ -14,7 +15,7 @@ from zone_api.core.devices.astro_sensor import AstroSensor
 from zone_api.core.devices.dimmer import Dimmer
 from zone_api.core.devices.illuminance_sensor import IlluminanceSensor
 from zone_api.core.devices.motion_sensor import MotionSensor
-from zone_api.core.devices.switch import Fan, Light
+from zone_api.core.devices.switch import Fan, Light, Switch
 
 from zone_api.core.actions.turn_on_switch import TurnOnSwitch
 from zone_api.core.actions.turn_off_adjacent_zones import TurnOffAdjacentZones
@@ -108,6 +109,11 @@ class ZoneTest(DeviceTest):
         zone = Zone('ff', [self.light, self.motionSensor, self.astroSensor])
         self.assertTrue(zone.contains_open_hab_item(self.lightItem, Light))
 
+    def testGetDevicesByItemName_itemSharedByTwoDevices_returnsBothDevicesInOrder(self):
+        zone = Zone('ff', [self.light, self.motionSensor, self.fan])
+        self.assertEqual((self.light, self.fan), zone.get_devices_by_item_name(self.lightItem.name))
+        self.assertEqual((), zone.get_devices_by_item_name(self.fanItem.name))
+
     def testAddDevice_validDevice_deviceAdded(self):
         zone = Zone('ff').add_device(self.light)
         self.assertEqual(1, len(zone.get_devices()))
@@ -124,6 +130,14 @@ class ZoneTest(DeviceTest):
         self.assertEqual(1, len(zone.get_devices_by_type(Light)))
         self.assertEqual(0, len(zone.get_devices_by_type(Dimmer)))
 
+    def testGetDevicesByType_baseClass_returnsSubclassDevicesInDeviceOrder(self):
+        zone = Zone('ff', [self.light, self.motionSensor, self.dimmer, self.illuminanceSensor])
+        self.assertEqual((self.light, self.dimmer), zone.get_devices_by_type(Switch))
+        self.assertEqual((self.light, self.motionSensor, self.dimmer, self.illuminanceSensor),
+                         zone.get_devices_by_type(Device))
+        self.assertEqual((), zone.get_devices_by_type(Fan))
+        self.assertIs(zone.get_devices_by_type(Switch), zone.get_devices_by_type(Switch))
+
     def testGetDeviceByEvent_validEvent_returnsExpectedDevice(self):
         zone = Zone('ff', [self.light])
 
@@ -381,4 +395,23 @@ class ZoneTest(DeviceTest):
 
         zones = zone1.get_neighbor_zones(zm, [NeighborType.OPEN_SPACE_MASTER])
         self.assertEqual(1, len(zones))
-        self.assertEqual(zone3, zones[0])
\ No newline at end of file
+        self.assertEqual(zone3, zones[0])
+
+    def testGetNeighborZones_unresolvedNeighborId_returnsNoneForIt(self):
+        zone1 = Zone('foyer')
+        zone2 = Zone('porch')
+
+        zone1 = zone1.add_neighbor(Neighbor(zone2.get_id(), NeighborType.OPEN_SPACE))
+        zone1 = zone1.add_neighbor(Neighbor('ff_unknown', NeighborType.OPEN_SPACE))
+        zm = create_zone_manager([zone1, zone2])
+
+        self.assertEqual([zone2, None], zone1.get_neighbor_zones(zm))
+
+    def testGetNeighborZones_zoneNotInZoneManager_resolvedThroughZoneManager(self):
+        zone1 = Zone('foyer')
+        zone2 = Zone('porch')
+        zm = create_zone_manager([zone1, zone2])
+
+        zone1 = zone1.add_neighbor(Neighbor(zone2.get_id(), NeighborType.OPEN_SPACE))
+
+        self.assertEqual([zone2], zone1.get_neighbor_zones(zm))
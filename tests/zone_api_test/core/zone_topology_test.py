@@ -0,0 +1,81 @@
+from zone_api import platform_encapsulator as pe
+from zone_api.core.devices.motion_sensor import MotionSensor
+from zone_api.core.neighbor import Neighbor, NeighborType
+from zone_api.core.zone import Zone
+from zone_api.core.zone_manager import ZoneManager
+from zone_api.core.zone_topology import ZoneTopology
+
+from zone_api_test.core.device_test import DeviceTest
+
+
+class ZoneTopologyTest(DeviceTest):
+    """ Unit tests for zone_topology.py. """
+
+    def setUp(self):
+        items = [pe.create_switch_item('GreatRoomMotion'), pe.create_switch_item('KitchenMotion'),
+                 pe.create_switch_item('FoyerMotion')]
+        self.set_items(items)
+        super(ZoneTopologyTest, self).setUp()
+
+        # The great room and the kitchen motion sensors link to the same physical sensor.
+        great_room_sensor = MotionSensor(items[0]).set_channel('zwave:motion:1')
+        kitchen_sensor = MotionSensor(items[1]).set_channel('zwave:motion:1')
+        foyer_sensor = MotionSensor(items[2]).set_channel('zwave:motion:2')
+
+        self.great_room = Zone('great room', [great_room_sensor])
+        self.kitchen = Zone('kitchen', [kitchen_sensor])
+        self.foyer = Zone('foyer', [foyer_sensor])
+        self.porch = Zone('porch')
+
+        self.great_room = self.great_room \
+            .add_neighbor(Neighbor(self.kitchen.get_id(), NeighborType.OPEN_SPACE_SLAVE)) \
+            .add_neighbor(Neighbor(self.foyer.get_id(), NeighborType.OPEN_SPACE)) \
+            .add_neighbor(Neighbor('unknown zone', NeighborType.OPEN_SPACE))
+        self.kitchen = self.kitchen.add_neighbor(Neighbor(self.great_room.get_id(), NeighborType.OPEN_SPACE_MASTER))
+        self.foyer = self.foyer.add_neighbor(Neighbor(self.porch.get_id(), NeighborType.CLOSED_SPACE))
+
+        self.topology = ZoneTopology([self.great_room, self.kitchen, self.foyer, self.porch])
+
+    def testGetNeighborZones_noNeighborTypes_returnsResolvedZonesInDeclarationOrder(self):
+        self.assertEqual((self.kitchen, self.foyer), self.topology.get_neighbor_zones(self.great_room))
+        self.assertEqual((), self.topology.get_neighbor_zones(self.porch))
+
+    def testGetNeighborZones_neighborTypes_returnsMatchingZones(self):
+        self.assertEqual((self.foyer,), self.topology.get_neighbor_zones(self.great_room, [NeighborType.OPEN_SPACE]))
+        self.assertEqual((self.great_room,),
+                         self.topology.get_neighbor_zones(self.kitchen, [NeighborType.OPEN_SPACE_MASTER]))
+
+    def testGetNeighborZones_zoneCopyWithAdditionalNeighbor_usesTheCopyNeighbors(self):
+        porch = self.porch.add_neighbor(Neighbor(self.foyer.get_id(), NeighborType.CLOSED_SPACE))
+
+        self.assertFalse(self.topology.contains(porch))
+        self.assertEqual((self.foyer,), self.topology.get_neighbor_zones(porch))
+
+    def testGetNeighborZonesSharingSensor_sameChannel_returnsNeighbor(self):
+        open_space_types = [NeighborType.OPEN_SPACE, NeighborType.OPEN_SPACE_SLAVE]
+        self.assertEqual((self.kitchen,), self.topology.get_neighbor_zones_sharing_sensor(
+            self.great_room, MotionSensor, open_space_types))
+        self.assertEqual((), self.topology.get_neighbor_zones_sharing_sensor(
+            self.great_room, MotionSensor, [NeighborType.OPEN_SPACE]))
+
+    def testGetNeighborhood_multipleHops_returnsClosestZonesFirst(self):
+        self.assertEqual((), self.topology.get_neighborhood(self.kitchen, 0))
+        self.assertEqual((self.great_room,), self.topology.get_neighborhood(self.kitchen, 1))
+        self.assertEqual((self.great_room, self.foyer, self.porch), self.topology.get_neighborhood(self.kitchen, 3))
+        self.assertEqual((self.great_room, self.foyer), self.topology.get_neighborhood(
+            self.kitchen, 5, [NeighborType.OPEN_SPACE, NeighborType.OPEN_SPACE_MASTER]))
+
+    def testGetNeighborhood_negativeHops_throwsException(self):
+        with self.assertRaises(ValueError):
+            self.topology.get_neighborhood(self.kitchen, -1)
+
+    def testGetZoneTopology_zonesChanged_rebuildsTopology(self):
+        mutable_zm = ZoneManager().add_zone(self.great_room).add_zone(self.kitchen)
+        zm = mutable_zm.get_immutable_instance()
+        topology = zm.get_zone_topology()
+        self.assertIs(topology, zm.get_zone_topology())
+        self.assertEqual((self.kitchen,), topology.get_neighbor_zones(self.great_room))
+
+        mutable_zm.add_zone(self.foyer)
+        self.assertIsNot(topology, zm.get_zone_topology())
+        self.assertEqual((self.kitchen, self.foyer), zm.get_zone_topology().get_neighbor_zones(self.great_room))
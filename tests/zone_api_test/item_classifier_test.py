@@ -0,0 +1,57 @@
+import itertools
+import re
+import unittest
+
+from zone_api import device_factory as df
+from zone_api import zone_parser as zp
+from zone_api.item_classifier import ItemClassifier
+
+LEVELS = ['FF', 'SF', 'BM', 'gFF', 'Out', 'g', '']
+LOCATIONS = ['Office', 'Kitchen', 'Virtual', 'GreatRoom', 'Garage_Side']
+DEVICE_NAMES = [
+    'AlarmPartition', 'ChromeCast', 'MpdChromeCast', 'FrontDoor', 'Door', 'Window', 'gWindow', 'Camera',
+    'MotionSensor', 'LightSwitch', 'LightSwitch_Dimmer', 'gLightSwitch', 'FanSwitch', 'Wled_MasterControls',
+    'Wled_MasterControlsFX', 'Illuminance', 'IlluminanceFixedValue', 'Humidity', 'Weather_Humidity', 'IkeaControl',
+    'NetworkPresence', 'NetworkPresence2', 'Plug', 'Plug2', 'SmartPlug12', 'Plug_Power', 'Co2', 'NaturalGas',
+    'RadonGas', 'Smoke', 'SmokeState', 'Tv', 'Thermostat_EcobeeName', 'Temperature', 'Computer_Dell_GpuTemperature',
+    'Weather_Temperature', 'WaterLeakState', 'TimeOfDay', 'Computer_Dell', 'Computer_Dell_Cpu', 'FlashMessage',
+    'AutoReportDeviceName', 'MpdStreamPlayer', 'Unknown', '',
+]
+ODD_ITEM_NAMES = ['', '_', '__', '_a_b_c', 'a_b', 'NoUnderscore', 'gLightSwitch', 'FF_Virtual_FlashMessage',
+                  'FF_Virtual_FlashMessage2', 'Zone_Office', 'a__b_c', 'FF_Office_LightSwitch\n']
+
+
+class ItemClassifierTest(unittest.TestCase):
+    def setUp(self):
+        self.mappings = zp.get_device_mappings()
+        self.classifier = ItemClassifier(self.mappings)
+
+    def testClassify_deviceMappings_sameResultsAsMatchingEachPatternInOrder(self):
+        item_names = ['_'.join(filter(None, parts)) for parts in itertools.product(LEVELS, LOCATIONS, DEVICE_NAMES)]
+        item_names += ODD_ITEM_NAMES
+
+        self.assertGreater(len(item_names), 1500)
+        for item_name in item_names:
+            classification = self.classifier.classify(item_name)
+
+            expected_factories = tuple(factory for pattern, factory in self.mappings.items()
+                                       if re.match(pattern, item_name) is not None)
+            self.assertEqual(expected_factories, classification.factories, item_name)
+
+            self.assertEqual(df.get_zone_id_from_item_name(item_name), classification.zone_id, item_name)
+            match = re.search('([^_]+)_([^_]+)_(.+)', item_name)
+            self.assertEqual(match.group(3) if match else None, classification.device_name, item_name)
+
+    def testClassify_itemMatchingSeveralPatterns_returnsAllFactoriesInOrder(self):
+        classification = self.classifier.classify('FF_Office_FanSwitch_Plug')
+
+        self.assertEqual((self.mappings['.*FanSwitch.*'], self.mappings['[^g].*_.*Plug(\\d*)$']),
+                         classification.factories)
+        self.assertEqual('FF_Office', classification.zone_id)
+        self.assertEqual('FanSwitch_Plug', classification.device_name)
+
+    def testClassify_noMappings_returnsNoFactory(self):
+        classification = ItemClassifier({}).classify('FF_Office_LightSwitch')
+
+        self.assertEqual((), classification.factories)
+        self.assertEqual('FF_Office', classification.zone_id)
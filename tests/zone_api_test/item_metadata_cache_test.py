@@ -0,0 +1,92 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import HABApp
+
+from HABApp.openhab.definitions.rest import ItemResp
+from HABApp.openhab.definitions.rest.items import ItemRespList
+from HABApp.openhab.errors import ItemNotFoundError
+
+from zone_api import platform_encapsulator as pe
+from zone_api.item_metadata_cache import ItemMetadataCache
+
+
+class FakeRestApi:
+    """ Stands in for the OpenHab items REST end points, counting the requests. """
+
+    def __init__(self, metadata_by_item_name: dict):
+        self.metadata_by_item_name = metadata_by_item_name
+        self.get_items_count = 0
+        self.get_item_names = []
+
+    def get_items(self):
+        """ GET /rest/items?metadata=.+ """
+        self.get_items_count += 1
+        body = json.dumps([self._create_item_json(name) for name in self.metadata_by_item_name.keys()])
+        return ItemRespList.validate_json(body)
+
+    def get_item(self, item_name: str):
+        """ GET /rest/items/{item_name}?metadata=.+ """
+        self.get_item_names.append(item_name)
+        if item_name not in self.metadata_by_item_name:
+            return None
+
+        return ItemResp.model_validate_json(json.dumps(self._create_item_json(item_name)))
+
+    def _create_item_json(self, item_name: str) -> dict:
+        return {'type': 'Switch', 'name': item_name, 'tags': [], 'groupNames': [], 'state': 'NULL',
+                'metadata': self.metadata_by_item_name[item_name]}
+
+
+class ItemMetadataCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.rest_api = FakeRestApi({
+            'Zone_Office': {'level': {'value': 'FF'}, 'displayOrder': {'value': '2'}},
+            'FF_Office_LightSwitch': {'channel': {'value': 'zwave:device:node8:switch_binary'},
+                                      'durationInMinutes': {'value': '15'}},
+        })
+        self.cache = ItemMetadataCache(self.rest_api.get_items)
+
+    def tearDown(self):
+        pe.clear_item_metadata()
+
+    def testGetMetadata_prefetched_noPerItemRequest(self):
+        self.cache.prefetch()
+
+        self.assertEqual(1, self.rest_api.get_items_count)
+        self.assertEqual(2, len(self.cache))
+        self.assertEqual({'value': 'FF'}, self.cache.get_metadata('Zone_Office')['level'])
+        self.assertEqual({'value': 'zwave:device:node8:switch_binary'},
+                         self.cache.get_metadata('FF_Office_LightSwitch')['channel'])
+        self.assertEqual([], self.rest_api.get_item_names)
+
+    def testGetMetadata_itemMissingFromPrefetch_returnsNone(self):
+        self.cache.prefetch()
+
+        self.assertIsNone(self.cache.get_metadata('Unknown'))
+
+    def testClear_prefetched_returnsNone(self):
+        self.cache.prefetch()
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertIsNone(self.cache.get_metadata('Zone_Office'))
+
+    def testGetItemMetadata_prefetchedCache_servedFromCache(self):
+        pe.prefetch_item_metadata(self.cache)
+
+        self.assertEqual({'value': '15'}, pe.get_item_metadata('FF_Office_LightSwitch')['durationInMinutes'])
+        self.assertEqual(1, self.rest_api.get_items_count)
+        self.assertEqual([], self.rest_api.get_item_names)
+
+    def testGetItemMetadata_itemMissingFromCache_fetchesTheItem(self):
+        pe.prefetch_item_metadata(self.cache)
+        self.rest_api.metadata_by_item_name['FF_Office_FanSwitch'] = {'durationInMinutes': {'value': '5'}}
+
+        with patch.object(HABApp.openhab.interface_sync, 'get_item', side_effect=self.rest_api.get_item):
+            self.assertEqual({'value': '5'}, pe.get_item_metadata('FF_Office_FanSwitch')['durationInMinutes'])
+            with self.assertRaises(ItemNotFoundError):
+                pe.get_item_metadata('Unknown')
+
+        self.assertEqual(['FF_Office_FanSwitch', 'Unknown'], self.rest_api.get_item_names)
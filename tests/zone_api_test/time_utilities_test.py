@@ -0,0 +1,136 @@
+import datetime
+import random
+import time
+import unittest
+
+from zone_api import time_utilities
+from zone_api.time_utilities import TimeRangeSet, string_to_time_range_lists
+
+NUMBER_OF_GENERATED_CASES = 200
+
+
+def legacy_is_in_time_range(time_ranges_string, epoch_seconds=None):
+    """ The parser-based implementation of is_in_time_range that TimeRangeSet replaces; used as the oracle. """
+    time_struct = time.localtime(epoch_seconds)
+    hour = time_struct[3]
+    minute = time_struct[4]
+
+    for time_range in string_to_time_range_lists(time_ranges_string):
+        start_hour, start_minute, end_hour, end_minute = time_range
+        if start_hour <= end_hour:
+            if hour < start_hour:
+                continue
+
+        if hour == start_hour and minute < start_minute:
+            continue
+
+        if end_minute == 0:
+            if start_hour <= end_hour:
+                if hour >= end_hour:
+                    continue
+            else:  # wrap around
+                if (hour < start_hour or hour > 23) and (hour < 0 or hour > end_hour):
+                    continue
+        else:  # minutes are > 0
+            if hour > end_hour or minute > end_minute:
+                continue
+
+        return True
+
+    return False
+
+
+def generate_time_ranges_string(rnd: random.Random) -> str:
+    """ Returns a random time range string, with single hours, whole hours, minutes and wrap around ranges. """
+
+    def generate_time():
+        if rnd.random() < 0.5:
+            return str(rnd.randint(0, 23))
+        return f"{rnd.randint(0, 23)}:{rnd.choice([0, 1, 15, 30, 45, 59, rnd.randint(0, 59)]):02d}"
+
+    ranges = []
+    for _ in range(rnd.randint(1, 3)):
+        if rnd.random() < 0.2:
+            ranges.append(str(rnd.randint(0, 23)))
+        else:
+            ranges.append(f"{generate_time()}{rnd.choice(['-', ' - '])}{generate_time()}")
+
+    return ', '.join(ranges)
+
+
+def to_epoch_seconds(*args) -> int:
+    return int(time.mktime(datetime.datetime(*args).timetuple()))
+
+
+class TimeUtilitiesTest(unittest.TestCase):
+    """ Unit tests for time_utilities.py. """
+
+    def testTimeRangeSet_generatedRanges_equivalentToLegacyParser(self):
+        rnd = random.Random(20240301)
+        start = to_epoch_seconds(2021, 1, 1)
+        for _ in range(NUMBER_OF_GENERATED_CASES):
+            time_ranges_string = generate_time_ranges_string(rnd)
+            time_range_set = TimeRangeSet(time_ranges_string)
+
+            for _ in range(20):
+                epoch_seconds = start + rnd.randint(0, 365 * 24 * 3600)
+                self.assertEqual(legacy_is_in_time_range(time_ranges_string, epoch_seconds),
+                                 time_range_set.contains(epoch_seconds),
+                                 f"'{time_ranges_string}' at {time.ctime(epoch_seconds)}")
+
+    def testTimeRangeSet_everyMinuteOfTheDay_equivalentToLegacyParser(self):
+        midnight = to_epoch_seconds(2021, 2, 8)
+        for time_ranges_string in ['10-12', '6-9, 7-7, 8:30 - 14:45', '19 - 8', '23:00 - 7:00', '22:30 - 6:15', '5']:
+            time_range_set = TimeRangeSet(time_ranges_string)
+            for minute in range(24 * 60):
+                epoch_seconds = midnight + minute * 60
+                self.assertEqual(legacy_is_in_time_range(time_ranges_string, epoch_seconds),
+                                 time_range_set.contains(epoch_seconds), f"'{time_ranges_string}' at {minute}")
+
+    def testNextTransition_generatedRanges_matchesMinuteScan(self):
+        rnd = random.Random(20240302)
+        start = to_epoch_seconds(2021, 1, 1)
+        for _ in range(NUMBER_OF_GENERATED_CASES // 4):
+            time_ranges_string = generate_time_ranges_string(rnd)
+            time_range_set = TimeRangeSet(time_ranges_string)
+            epoch_seconds = start + rnd.randint(0, 365 * 24 * 3600)
+
+            expected = None
+            current_value = legacy_is_in_time_range(time_ranges_string, epoch_seconds)
+            minute_start = (epoch_seconds // 60 + 1) * 60
+            for i in range(25 * 60):
+                if legacy_is_in_time_range(time_ranges_string, minute_start + i * 60) != current_value:
+                    expected = minute_start + i * 60
+                    break
+
+            self.assertEqual(expected, time_range_set.next_transition(epoch_seconds),
+                             f"'{time_ranges_string}' at {time.ctime(epoch_seconds)}")
+
+    def testNextTransition_wrapAroundRange_returnsEndOnNextDay(self):
+        time_range_set = TimeRangeSet('19 - 8')
+        self.assertEqual(to_epoch_seconds(2021, 2, 9, 9, 0),
+                         time_range_set.next_transition(to_epoch_seconds(2021, 2, 8, 20, 30, 15)))
+
+    def testNextTransition_wholeDay_returnsNone(self):
+        self.assertIsNone(TimeRangeSet('0:00 - 23:59').next_transition())
+
+    def testSetOperations_returnsExpectedMinutes(self):
+        morning = TimeRangeSet('6 - 12')
+        lunch = TimeRangeSet('11 - 13')
+
+        self.assertEqual(TimeRangeSet('6 - 13'), morning | lunch)
+        self.assertEqual(TimeRangeSet('11 - 12'), morning & lunch)
+        self.assertEqual(TimeRangeSet('6 - 11'), morning - lunch)
+        self.assertEqual(TimeRangeSet('12 - 5'), ~morning)  # wrap around ranges include the end hour
+        self.assertTrue((morning - morning).is_empty())
+
+    def testStr_returnsMinuteRanges(self):
+        self.assertEqual('6:00 - 8:59, 19:00 - 23:59', str(TimeRangeSet('19 - 6, 6-9') - TimeRangeSet('0 - 6')))
+
+    def testCtor_emptyString_throwsException(self):
+        with self.assertRaises(ValueError):
+            TimeRangeSet('')
+
+    def testIsInTimeRange_invalidString_throwsException(self):
+        with self.assertRaises(ValueError):
+            time_utilities.is_in_time_range('25 - 26')
@@ -1,7 +1,12 @@
+import random
+import time
 import unittest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
+from zone_api import device_factory as df
+from zone_api import platform_encapsulator as pe
 from zone_api import zone_parser as zp
+from zone_api.item_classifier import ItemClassifier
 from zone_api.core.devices.motion_sensor import MotionSensor
 from zone_api.core.zone import Zone, Level
 
@@ -112,3 +117,135 @@ class ZoneParserTest(unittest.TestCase):
     def testGetActionClasses_invalidPaths_returnsEmptyTypes(self):
         types = zp.get_action_classes("zone_api.core.actions", ["an invalid path"])
         self.assertEqual(0, len(types))
+
+    def testGetActionClasses_excludedActionNames_returnsOtherTypes(self):
+        import zone_api.core.actions as actions
+        all_types = zp.get_action_classes("zone_api.core.actions", actions.__path__)
+        types = zp.get_action_classes("zone_api.core.actions", actions.__path__, ['TurnOnSwitch', 'ManagePlugs'])
+
+        self.assertEqual(len(all_types) - 2, len(types))
+        self.assertNotIn('TurnOnSwitch', [t.__name__ for t in types])
+        self.assertNotIn('RangeViolationAlert', [t.__name__ for t in all_types])
+
+    def testGetActionClasses_actionsSendingAlertsOrPlayingAudio_declaredBlocking(self):
+        import inspect
+        from zone_api.core.map_parameters import MapParameters
+
+        for clazz in zp.get_action_classes():
+            source = inspect.getsource(clazz.__bases__[0])
+            if any(call in source for call in
+                   ['send_notification(', 'play_message(', 'play_sound_file(', 'RangeViolationAlert(']):
+                self.assertTrue(clazz(MapParameters({})).blocking, f'{clazz.__name__} must be declared blocking')
+
+    def testGetDisabledActionNames_config_returnsDisabledActions(self):
+        config = {'action-parameters': {
+            'TurnOnSwitch': {'disabled': True},
+            'ManagePlugs': {'disabled': False},
+            'AlertOnLowBatteryLevel': {'notificationAudiences': 'administrators'},
+            'AlertOnHighGasLevel': None,
+        }}
+
+        self.assertEqual(['TurnOnSwitch'], zp.get_disabled_action_names(config))
+        self.assertEqual([], zp.get_disabled_action_names({}))
+
+    def testGetDisabledActionNames_stringValue_returnsDisabledAction(self):
+        config = {'action-parameters': {
+            'TurnOnSwitch': {'disabled': 'true'},
+            'ManagePlugs': {'disabled': 'false'},
+        }}
+
+        self.assertEqual(['TurnOnSwitch'], zp.get_disabled_action_names(config))
+
+    def testGetDisabledActionNames_unknownAction_leftOutAndReportedByValidation(self):
+        from zone_api.core.map_parameters import MapParameters
+
+        config = {'action-parameters': {'NoSuchAction': {'disabled': True}}}
+
+        disabled_action_names = zp.get_disabled_action_names(config)
+        self.assertEqual([], disabled_action_names)
+
+        (validated, errors) = MapParameters({'NoSuchAction.disabled': True}).validate([], disabled_action_names)
+        self.assertFalse(validated)
+        self.assertEqual(['Unsupported action types: NoSuchAction'], errors)
+
+    def testCreateDevices_threadPool_sameDevicesAndListenersInItemOrder(self):
+        def create_light(zm, item):
+            time.sleep(random.uniform(0, 0.002))
+            df._listen_event(item, 'light handler', None)
+            return 'light ' + item.name
+
+        def create_plug(zm, item):
+            df._listen_event(item, 'plug handler', None)
+            return None if item.name.endswith('3') else 'plug ' + item.name
+
+        classifier = ItemClassifier({'.*LightSwitch.*': create_light, '.*Plug.*': create_plug})
+        items = [pe.create_switch_item(f'FF_Office_LightSwitch{i}') for i in range(30)]
+        items += [pe.create_switch_item('FF_Office_Door'), pe.create_switch_item('FF_Office_LightSwitch_Plug3')]
+
+        sequential_result = zp.create_devices(None, items, classifier)
+        parallel_result = zp.create_devices(None, items, classifier, 8)
+
+        self.assertEqual(31, len(parallel_result))
+        self.assertEqual(sequential_result, parallel_result)
+        self.assertEqual('FF_Office', parallel_result[0].zone_id)
+        self.assertEqual(['light FF_Office_LightSwitch_Plug3', None], parallel_result[-1].devices)
+        self.assertEqual(['light handler', 'plug handler'], [r.callback for r in parallel_result[-1].listeners])
+
+    def testCreateDevices_failingFactories_raisesErrorListingEachItem(self):
+        def create_light(zm, item):
+            if item.name.endswith('Bad'):
+                raise ValueError(f"Missing durationInMinutes value for {item.name}")
+            return 'light'
+
+        classifier = ItemClassifier({'.*LightSwitch.*': create_light})
+        items = [pe.create_switch_item(name) for name in
+                 ['FF_Office_LightSwitchBad', 'FF_Office_LightSwitch', 'FF_Foyer_LightSwitchBad']]
+
+        for max_workers in [1, 4]:
+            with self.assertRaises(ValueError) as context:
+                zp.create_devices(None, items, classifier, max_workers)
+
+            message = str(context.exception)
+            self.assertIn("2 item(s)", message)
+            self.assertIn("FF_Office_LightSwitchBad: ValueError", message)
+            self.assertIn("FF_Foyer_LightSwitchBad: ValueError", message)
+
+    def testParse_failingFactory_itemMetadataCleared(self):
+        def create_light(zm, item):
+            raise ValueError(f"Missing durationInMinutes value for {item.name}")
+
+        def prefetch_item_metadata():
+            pe._item_metadata_cache = MagicMock()
+
+        items = MagicMock()
+        items.get_items.return_value = [pe.create_switch_item('FF_Office_LightSwitch')]
+
+        with patch.object(pe, 'prefetch_item_metadata', side_effect=prefetch_item_metadata), \
+                patch.object(zp, 'ZoneManager'), patch.object(zp, 'AlertManager'), \
+                patch.object(zp, '_parse_zones', return_value=[]), patch.object(zp, 'Items', items), \
+                patch.object(zp, 'get_device_mappings', return_value={'.*LightSwitch.*': create_light}):
+            with self.assertRaises(ValueError):
+                zp.parse({'action-parameters': {}})
+
+        # noinspection PyProtectedMember
+        self.assertIsNone(pe._item_metadata_cache)
+
+    def testParse_failingPrefetch_fallsBackToPerItemLookups(self):
+        created_item_names = []
+
+        def create_light(zm, item):
+            created_item_names.append(item.name)
+            return None
+
+        items = MagicMock()
+        items.get_items.return_value = [pe.create_switch_item('FF_Office_LightSwitch')]
+
+        with patch.object(pe, 'prefetch_item_metadata', side_effect=ConnectionError('REST API unavailable')), \
+                patch.object(zp, 'ZoneManager'), patch.object(zp, 'AlertManager'), \
+                patch.object(zp, '_parse_zones', return_value=[]), patch.object(zp, 'Items', items), \
+                patch.object(zp, 'get_device_mappings', return_value={'.*LightSwitch.*': create_light}):
+            zp.parse({'action-parameters': {}})
+
+        self.assertEqual(['FF_Office_LightSwitch'], created_item_names)
+        # noinspection PyProtectedMember
+        self.assertIsNone(pe._item_metadata_cache)